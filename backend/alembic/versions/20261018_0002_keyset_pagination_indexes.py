@@ -0,0 +1,34 @@
+"""keyset pagination indexes
+
+Revision ID: 20261018_0002
+Revises: 20231101_0001
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_0002"
+down_revision = "20231101_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_equipment_status_equipment_id", "equipment", ["status", "equipment_id"])
+    op.create_index("ix_equipment_expiry_date_equipment_id", "equipment", ["expiry_date", "equipment_id"])
+    op.create_index("ix_equipment_equipment_name_equipment_id", "equipment", ["equipment_name", "equipment_id"])
+    op.create_index("ix_issue_report_status_issue_id", "issue_report", ["status", "issue_id"])
+    op.create_index("ix_issue_report_date_raised_issue_id", "issue_report", ["date_raised", "issue_id"])
+    op.create_index("ix_vendor_vendor_name_vendor_id", "vendor", ["vendor_name", "vendor_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vendor_vendor_name_vendor_id", table_name="vendor")
+    op.drop_index("ix_issue_report_date_raised_issue_id", table_name="issue_report")
+    op.drop_index("ix_issue_report_status_issue_id", table_name="issue_report")
+    op.drop_index("ix_equipment_equipment_name_equipment_id", table_name="equipment")
+    op.drop_index("ix_equipment_expiry_date_equipment_id", table_name="equipment")
+    op.drop_index("ix_equipment_status_equipment_id", table_name="equipment")
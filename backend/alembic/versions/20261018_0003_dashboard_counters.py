@@ -0,0 +1,60 @@
+"""dashboard counters
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0003"
+down_revision = "20261018_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dashboard_counter = op.create_table(
+        "dashboard_counter",
+        sa.Column("metric", sa.String(length=50), primary_key=True),
+        sa.Column("bucket", sa.String(length=100), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Seed from existing rows so the counters are correct from the first request.
+    bind = op.get_bind()
+    counts: Counter[tuple[str, str]] = Counter()
+    counts[("equipment.total", "all")] = bind.execute(sa.text("SELECT COUNT(*) FROM equipment")).scalar_one()
+    for status, total in bind.execute(sa.text("SELECT CAST(status AS VARCHAR(20)), COUNT(*) FROM equipment GROUP BY status")):
+        counts[("equipment.status", status)] += total
+    for department_id, total in bind.execute(
+        sa.text("SELECT department_id, COUNT(*) FROM equipment GROUP BY department_id")
+    ):
+        counts[("equipment.department", str(department_id))] += total
+    for expiry_date, total in bind.execute(
+        sa.text("SELECT CAST(expiry_date AS VARCHAR(10)), COUNT(*) FROM equipment GROUP BY expiry_date")
+    ):
+        counts[("equipment.expiry_month", expiry_date[:7] if expiry_date else "none")] += total
+    counts[("issue.total", "all")] = bind.execute(sa.text("SELECT COUNT(*) FROM issue_report")).scalar_one()
+    for status, total in bind.execute(
+        sa.text("SELECT CAST(status AS VARCHAR(20)), COUNT(*) FROM issue_report GROUP BY status")
+    ):
+        counts[("issue.status", status)] += total
+    counts[("discard.total", "all")] = bind.execute(sa.text("SELECT COUNT(*) FROM discard_equipment")).scalar_one()
+    counts[("department.total", "all")] = bind.execute(sa.text("SELECT COUNT(*) FROM department")).scalar_one()
+
+    op.bulk_insert(
+        dashboard_counter,
+        [{"metric": metric, "bucket": bucket, "value": value} for (metric, bucket), value in sorted(counts.items())],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_counter")
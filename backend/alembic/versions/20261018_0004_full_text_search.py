@@ -0,0 +1,131 @@
+"""full-text search
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_0004"
+down_revision = "20261018_0003"
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE equipment_fts USING fts5(
+        equipment_name, serial_number, model_no, manufacturer,
+        content='equipment', content_rowid='equipment_id',
+        tokenize="unicode61 tokenchars '-_/.'", prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER equipment_fts_ai AFTER INSERT ON equipment BEGIN
+        INSERT INTO equipment_fts(rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES (new.equipment_id, new.equipment_name, new.serial_number, new.model_no, new.manufacturer);
+    END
+    """,
+    """
+    CREATE TRIGGER equipment_fts_ad AFTER DELETE ON equipment BEGIN
+        INSERT INTO equipment_fts(equipment_fts, rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES ('delete', old.equipment_id, old.equipment_name, old.serial_number, old.model_no, old.manufacturer);
+    END
+    """,
+    """
+    CREATE TRIGGER equipment_fts_au AFTER UPDATE OF
+        equipment_name, serial_number, model_no, manufacturer ON equipment BEGIN
+        INSERT INTO equipment_fts(equipment_fts, rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES ('delete', old.equipment_id, old.equipment_name, old.serial_number, old.model_no, old.manufacturer);
+        INSERT INTO equipment_fts(rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES (new.equipment_id, new.equipment_name, new.serial_number, new.model_no, new.manufacturer);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE issue_report_fts USING fts5(
+        problem_description,
+        content='issue_report', content_rowid='issue_id',
+        prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER issue_report_fts_ai AFTER INSERT ON issue_report BEGIN
+        INSERT INTO issue_report_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER issue_report_fts_ad AFTER DELETE ON issue_report BEGIN
+        INSERT INTO issue_report_fts(issue_report_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER issue_report_fts_au AFTER UPDATE OF problem_description ON issue_report BEGIN
+        INSERT INTO issue_report_fts(issue_report_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+        INSERT INTO issue_report_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    "INSERT INTO equipment_fts(equipment_fts) VALUES ('rebuild')",
+    "INSERT INTO issue_report_fts(issue_report_fts) VALUES ('rebuild')",
+)
+
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS issue_report_fts_au",
+    "DROP TRIGGER IF EXISTS issue_report_fts_ad",
+    "DROP TRIGGER IF EXISTS issue_report_fts_ai",
+    "DROP TABLE IF EXISTS issue_report_fts",
+    "DROP TRIGGER IF EXISTS equipment_fts_au",
+    "DROP TRIGGER IF EXISTS equipment_fts_ad",
+    "DROP TRIGGER IF EXISTS equipment_fts_ai",
+    "DROP TABLE IF EXISTS equipment_fts",
+)
+
+POSTGRES_UPGRADE = (
+    """
+    ALTER TABLE equipment ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(equipment_name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(serial_number, '') || ' ' || coalesce(model_no, '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(manufacturer, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX ix_equipment_search_vector ON equipment USING gin (search_vector)",
+    "CREATE INDEX ix_equipment_serial_prefix ON equipment (upper(serial_number) text_pattern_ops)",
+    """
+    ALTER TABLE issue_report ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(problem_description, ''))
+    ) STORED
+    """,
+    "CREATE INDEX ix_issue_report_search_vector ON issue_report USING gin (search_vector)",
+)
+
+POSTGRES_DOWNGRADE = (
+    "DROP INDEX IF EXISTS ix_issue_report_search_vector",
+    "ALTER TABLE issue_report DROP COLUMN IF EXISTS search_vector",
+    "DROP INDEX IF EXISTS ix_equipment_serial_prefix",
+    "DROP INDEX IF EXISTS ix_equipment_search_vector",
+    "ALTER TABLE equipment DROP COLUMN IF EXISTS search_vector",
+)
+
+
+def _statements(sqlite: tuple[str, ...], postgres: tuple[str, ...]) -> tuple[str, ...]:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite
+    if dialect == "postgresql":
+        return postgres
+    return ()
+
+
+def upgrade() -> None:
+    for statement in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
@@ -0,0 +1,24 @@
+"""discard pagination index
+
+Revision ID: 20261018_0005
+Revises: 20261018_0004
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_0005"
+down_revision = "20261018_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_discard_equipment_date_discard_id", "discard_equipment", ["date", "discard_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_discard_equipment_date_discard_id", table_name="discard_equipment")
@@ -0,0 +1,28 @@
+"""updated_at indexes
+
+Revision ID: 20261018_0007
+Revises: 20261018_0006
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_0007"
+down_revision = "20261018_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_equipment_updated_at", "equipment", ["updated_at"])
+    op.create_index("ix_issue_report_updated_at", "issue_report", ["updated_at"])
+    op.create_index("ix_discard_equipment_updated_at", "discard_equipment", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_discard_equipment_updated_at", table_name="discard_equipment")
+    op.drop_index("ix_issue_report_updated_at", table_name="issue_report")
+    op.drop_index("ix_equipment_updated_at", table_name="equipment")
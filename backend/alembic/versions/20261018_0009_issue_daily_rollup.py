@@ -0,0 +1,44 @@
+"""issue daily rollup
+
+Revision ID: 20261018_0009
+Revises: 20261018_0008
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0009"
+down_revision = "20261018_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_daily_rollup",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("issue_type", sa.String(length=20), primary_key=True),
+        sa.Column("status", sa.String(length=20), primary_key=True),
+        sa.Column("department_id", sa.Integer(), primary_key=True),
+        sa.Column("raised", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("resolved", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("resolution_seconds", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Existing rows are rolled up in batches by the issue_rollup_backfill job (or
+    # scripts.backfill_issue_rollups); issues created from now on are maintained on write.
+    bind = op.get_bind()
+    upper = bind.execute(sa.text("SELECT COALESCE(MAX(issue_id), 0) FROM issue_report")).scalar_one()
+    job_state = sa.table("job_state", sa.column("job_name", sa.String), sa.column("state", sa.JSON))
+    op.bulk_insert(job_state, [{"job_name": "issue_rollup_backfill", "state": {"cursor": 0, "upper": upper}}])
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM job_state WHERE job_name = 'issue_rollup_backfill'")
+    op.drop_table("issue_daily_rollup")
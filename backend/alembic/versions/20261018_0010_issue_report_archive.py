@@ -0,0 +1,106 @@
+"""issue report archive
+
+Revision ID: 20261018_0010
+Revises: 20261018_0009
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261018_0010"
+down_revision = "20261018_0009"
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE issue_report_archive_fts USING fts5(
+        problem_description,
+        content='issue_report_archive', content_rowid='issue_id',
+        prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER issue_report_archive_fts_ai AFTER INSERT ON issue_report_archive BEGIN
+        INSERT INTO issue_report_archive_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER issue_report_archive_fts_ad AFTER DELETE ON issue_report_archive BEGIN
+        INSERT INTO issue_report_archive_fts(issue_report_archive_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+    END
+    """,
+)
+
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER IF EXISTS issue_report_archive_fts_ad",
+    "DROP TRIGGER IF EXISTS issue_report_archive_fts_ai",
+    "DROP TABLE IF EXISTS issue_report_archive_fts",
+)
+
+POSTGRES_UPGRADE = (
+    """
+    ALTER TABLE issue_report_archive ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(problem_description, ''))
+    ) STORED
+    """,
+    "CREATE INDEX ix_issue_report_archive_search_vector ON issue_report_archive USING gin (search_vector)",
+)
+
+
+def upgrade() -> None:
+    # The enum types already exist (created with issue_report).
+    issue_type = postgresql.ENUM(
+        "TECHNICAL", "MECHANICAL", "ELECTRICAL", "USER_OPERATION", name="issue_type", create_type=False
+    )
+    issue_status = postgresql.ENUM("OPEN", "IN_PROGRESS", "RESOLVED", "CLOSED", name="issue_status", create_type=False)
+    op.create_table(
+        "issue_report_archive",
+        sa.Column("issue_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "equipment_id",
+            sa.Integer(),
+            sa.ForeignKey("equipment.equipment_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("issue_type", issue_type, nullable=False),
+        sa.Column("problem_description", sa.Text(), nullable=False),
+        sa.Column("media_url", sa.String(length=500), nullable=True),
+        sa.Column("date_raised", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("status", issue_status, nullable=False),
+        sa.Column("technician", sa.String(length=100), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_issue_report_archive_status_issue_id", "issue_report_archive", ["status", "issue_id"])
+    op.create_index(
+        "ix_issue_report_archive_date_raised_issue_id", "issue_report_archive", ["date_raised", "issue_id"]
+    )
+    op.create_index("ix_issue_report_archive_equipment_id", "issue_report_archive", ["equipment_id"])
+    op.create_index("ix_issue_report_archive_updated_at", "issue_report_archive", ["updated_at"])
+
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE}.get(dialect, ())
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    op.drop_index("ix_issue_report_archive_updated_at", table_name="issue_report_archive")
+    op.drop_index("ix_issue_report_archive_equipment_id", table_name="issue_report_archive")
+    op.drop_index("ix_issue_report_archive_date_raised_issue_id", table_name="issue_report_archive")
+    op.drop_index("ix_issue_report_archive_status_issue_id", table_name="issue_report_archive")
+    op.drop_table("issue_report_archive")
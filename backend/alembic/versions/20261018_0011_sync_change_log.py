@@ -0,0 +1,63 @@
+"""sync change log
+
+Revision ID: 20261018_0011
+Revises: 20261018_0010
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_0011"
+down_revision = "20261018_0010"
+branch_labels = None
+depends_on = None
+
+
+# Synced tables and their primary keys, parents first.
+SYNCED_TABLES = (
+    ("department", "department_id"),
+    ("vendor", "vendor_id"),
+    ("equipment", "equipment_id"),
+    ("issue_report", "issue_id"),
+    ("discard_equipment", "discard_id"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_log",
+        sa.Column("seq", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+        sa.Column("entity", sa.String(length=40), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ux_change_log_entity_entity_id", "change_log", ["entity", "entity_id"], unique=True)
+    op.create_index("ix_change_log_deleted_changed_at", "change_log", ["deleted", "changed_at"])
+    op.create_table(
+        "sync_receipt",
+        sa.Column("client_id", sa.String(length=64), primary_key=True),
+        sa.Column("entity", sa.String(length=40), primary_key=True),
+        sa.Column("client_row_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("server_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Every existing row starts with one change entry, so a client syncing from 0 gets it.
+    for table, column in SYNCED_TABLES:
+        op.execute(
+            f"INSERT INTO change_log (entity, entity_id, deleted) "
+            f"SELECT '{table}', {column}, FALSE FROM {table} ORDER BY {column}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("sync_receipt")
+    op.drop_index("ix_change_log_deleted_changed_at", table_name="change_log")
+    op.drop_index("ux_change_log_entity_entity_id", table_name="change_log")
+    op.drop_table("change_log")
@@ -0,0 +1,53 @@
+"""issue report autoincrement
+
+Revision ID: 20261018_0012
+Revises: 20261018_0011
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_0012"
+down_revision = "20261018_0011"
+branch_labels = None
+depends_on = None
+
+
+def _triggers(table: str) -> list[str]:
+    """The DDL of the triggers on ``table``, as SQLite stored it."""
+
+    result = op.get_bind().exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ? ORDER BY name", (table,)
+    )
+    return [sql for (sql,) in result]
+
+
+def upgrade() -> None:
+    # Without AUTOINCREMENT SQLite reuses the highest rowid once it is deleted, so a new report
+    # could take the id of one just archived. PostgreSQL sequences never go back.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    # The rebuild drops the full-text triggers; recreate them exactly as they were.
+    triggers = _triggers("issue_report")
+    with op.batch_alter_table("issue_report", recreate="always", table_kwargs={"sqlite_autoincrement": True}):
+        pass
+    for statement in triggers:
+        op.execute(statement)
+    # Reports may already have been archived from the top of the id range.
+    op.execute("DELETE FROM sqlite_sequence WHERE name = 'issue_report'")
+    op.execute(
+        """
+        INSERT INTO sqlite_sequence (name, seq) SELECT 'issue_report', max(
+            (SELECT coalesce(max(issue_id), 0) FROM issue_report),
+            (SELECT coalesce(max(issue_id), 0) FROM issue_report_archive)
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    # issue_report keeps AUTOINCREMENT; it is harmless on the older schema.
+    pass
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from app.analytics.reliability import (
+    DEFAULT_MIN_EXPOSURE_DAYS,
+    FAILURE_TYPES,
+    ReliabilityFrame,
+    compute_reliability,
+    get_reliability,
+    load_reliability_frame,
+)
+
+__all__ = [
+    "DEFAULT_MIN_EXPOSURE_DAYS",
+    "FAILURE_TYPES",
+    "ReliabilityFrame",
+    "compute_reliability",
+    "get_reliability",
+    "load_reliability_frame",
+]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+import numpy as np
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.fingerprint import fetch_fingerprint, tables_fingerprint
+from app.models.discard_equipment import DiscardEquipment
+from app.models.enums import IssueType
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+ReliabilityGroup = Literal["equipment", "model", "manufacturer"]
+ReliabilitySort = Literal["failure_rate", "mtbf", "mttr", "failures"]
+
+# Operator errors are reported as issues but say nothing about the device's reliability.
+FAILURE_TYPES = (IssueType.TECHNICAL, IssueType.MECHANICAL, IssueType.ELECTRICAL)
+
+UNKNOWN = "(unknown)"
+_HOUR = 3600.0
+_DAY = 86400.0
+_YEAR = 365.25 * _DAY
+
+# Groups with less time in service are not ranked: one early failure of a unit installed a
+# few days ago would otherwise extrapolate to hundreds of failures a year.
+DEFAULT_MIN_EXPOSURE_DAYS = 90.0
+_FRAME_KEY = "frame"
+
+_cache = TTLCache(max_entries=64)
+
+
+@dataclass(slots=True)
+class ReliabilityFrame:
+    """Columnar snapshot of the inputs: one row per equipment, one per failure report."""
+
+    equipment_id: np.ndarray  # int64, sorted
+    department_id: np.ndarray  # int64
+    exposure_seconds: np.ndarray  # float64: in service from purchase (or creation) to discard (or now)
+    equipment_name: np.ndarray  # object
+    model_no: np.ndarray  # object
+    manufacturer: np.ndarray  # object
+    issue_equipment: np.ndarray  # int64 index into the equipment arrays, issues ordered by unit then time
+    raised: np.ndarray  # float64 epoch seconds
+    resolved: np.ndarray  # float64 epoch seconds, NaN while unresolved
+    loaded_at: datetime
+
+
+def _epoch(column: Any) -> Any:
+    return func.extract("epoch", column)
+
+
+def _columns(result: Any, width: int) -> list[tuple[Any, ...]]:
+    """Transpose a result into per-column tuples (``width`` empty tuples when there are no rows)."""
+
+    return list(zip(*result)) or [()] * width
+
+
+async def load_reliability_frame(session: AsyncSession) -> ReliabilityFrame:
+    """Fetch equipment and failure columns in two queries and convert them to arrays.
+
+    Timestamps are converted to epoch seconds by the database and each result is
+    transposed into columns once, so building the arrays involves no per-row datetime
+    handling.
+    """
+
+    now = time.time()
+    equipment = _columns(
+        await session.execute(
+            select(
+                Equipment.equipment_id,
+                Equipment.department_id,
+                func.coalesce(_epoch(Equipment.purchase_date), _epoch(Equipment.created_at)),
+                _epoch(DiscardEquipment.date),
+                Equipment.equipment_name,
+                Equipment.model_no,
+                Equipment.manufacturer,
+            )
+            .outerjoin(DiscardEquipment, DiscardEquipment.equipment_id == Equipment.equipment_id)
+            .order_by(Equipment.equipment_id)
+        ),
+        7,
+    )
+    # Archived reports are part of each unit's failure history.
+    issues = _columns(
+        await session.execute(
+            union_all(
+                *(
+                    select(model.equipment_id, _epoch(model.date_raised), _epoch(model.resolved_at)).where(
+                        model.issue_type.in_(FAILURE_TYPES)
+                    )
+                    for model in (IssueReport, IssueReportArchive)
+                )
+            )
+        ),
+        3,
+    )
+
+    equipment_id = np.array(equipment[0], dtype=np.int64)
+    issue_equipment = np.searchsorted(equipment_id, np.array(issues[0], dtype=np.int64))
+    raised = np.array(issues[1], dtype=np.float64)
+    resolved = np.array(issues[2], dtype=np.float64)
+    order = np.lexsort((raised, issue_equipment))
+
+    # A unit has been in service at least since its first reported failure, whatever its
+    # recorded purchase date says.
+    started = np.array(equipment[2], dtype=np.float64)
+    np.fmin.at(started, issue_equipment, raised)
+    ended = np.array(equipment[3], dtype=np.float64)
+    ended[np.isnan(ended)] = now
+    exposure = np.clip(np.nan_to_num(ended - started, nan=0.0), 0.0, None)
+
+    def text(values: tuple[Any, ...]) -> np.ndarray:
+        array = np.array(values, dtype=object)
+        array[np.equal(array, None)] = UNKNOWN
+        return array
+
+    return ReliabilityFrame(
+        equipment_id=equipment_id,
+        department_id=np.array(equipment[1], dtype=np.int64),
+        exposure_seconds=exposure,
+        equipment_name=text(equipment[4]),
+        model_no=text(equipment[5]),
+        manufacturer=text(equipment[6]),
+        issue_equipment=issue_equipment[order],
+        raised=raised[order],
+        resolved=resolved[order],
+        loaded_at=datetime.fromtimestamp(now, timezone.utc),
+    )
+
+
+def _group_codes(frame: ReliabilityFrame, group_by: ReliabilityGroup) -> tuple[np.ndarray, np.ndarray]:
+    """Group code per equipment row and the equipment row representing each group."""
+
+    if group_by == "equipment":
+        codes = np.arange(len(frame.equipment_id))
+        return codes, codes
+    if group_by == "model":
+        keys = np.char.add(np.char.add(frame.manufacturer.astype(str), "\x1f"), frame.model_no.astype(str))
+    else:
+        keys = frame.manufacturer.astype(str)
+    _, first, codes = np.unique(keys, return_index=True, return_inverse=True)
+    return codes.reshape(-1), first
+
+
+def _per_group(codes: np.ndarray, size: int, weights: np.ndarray | None = None) -> np.ndarray:
+    return np.bincount(codes, weights=weights, minlength=size)[:size]
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def compute_reliability(
+    frame: ReliabilityFrame,
+    *,
+    group_by: ReliabilityGroup = "equipment",
+    department_id: int | None = None,
+    sort: ReliabilitySort = "failure_rate",
+    min_failures: int = 1,
+    min_exposure_days: float = DEFAULT_MIN_EXPOSURE_DAYS,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """Rank groups by reliability using vectorized group-by over ``frame``.
+
+    * MTTR: mean ``resolved_at - date_raised`` over resolved failures.
+    * MTBF: mean time between consecutive failures of the same unit, pooled over the group.
+    * Failure rate: failures per equipment-year in service.
+
+    Rankings put the least reliable groups first (highest failure rate or MTTR, lowest
+    MTBF). Groups without a value for the sort metric come last. Groups with fewer than
+    ``min_failures`` failures or less than ``min_exposure_days`` of combined time in
+    service are left out, so rates rest on enough observation to compare.
+    """
+
+    codes, representative = _group_codes(frame, group_by)
+    size = len(representative)
+    in_scope = np.ones(len(codes), dtype=bool) if department_id is None else frame.department_id == department_id
+
+    equipment_count = _per_group(codes[in_scope], size)
+    exposure = _per_group(codes[in_scope], size, frame.exposure_seconds[in_scope])
+
+    issue_scope = in_scope[frame.issue_equipment]
+    issue_codes = codes[frame.issue_equipment]
+    failures = _per_group(issue_codes[issue_scope], size)
+
+    repair = frame.resolved - frame.raised
+    repaired = issue_scope & ~np.isnan(repair)
+    repairs = _per_group(issue_codes[repaired], size)
+    repair_seconds = _per_group(issue_codes[repaired], size, np.clip(repair[repaired], 0.0, None))
+
+    # Issues are ordered by unit then time, so consecutive rows of one unit are failure pairs.
+    same_unit = frame.issue_equipment[1:] == frame.issue_equipment[:-1]
+    pairs = same_unit & issue_scope[1:]
+    gaps = np.diff(frame.raised)[pairs]
+    gap_codes = issue_codes[1:][pairs]
+    intervals = _per_group(gap_codes, size)
+    interval_seconds = _per_group(gap_codes, size, gaps)
+
+    mttr = _ratio(repair_seconds, repairs) / _HOUR
+    mtbf = _ratio(interval_seconds, intervals) / _HOUR
+    failure_rate = _ratio(failures, exposure / _YEAR)
+
+    selected = np.flatnonzero(
+        (equipment_count > 0) & (failures >= min_failures) & (exposure >= min_exposure_days * _DAY)
+    )
+    metric = {"failure_rate": -failure_rate, "mtbf": mtbf, "mttr": -mttr, "failures": -failures.astype(float)}[sort]
+    ranked = selected[np.lexsort((selected, metric[selected], np.isnan(metric[selected])))][:limit]
+
+    def number(value: float, digits: int = 2) -> float | None:
+        return None if np.isnan(value) else round(float(value), digits)
+
+    items = []
+    for group in ranked:
+        row = representative[group]
+        if group_by == "equipment":
+            key = {"equipment_id": int(frame.equipment_id[row]), "equipment_name": frame.equipment_name[row]}
+        elif group_by == "model":
+            key = {"manufacturer": frame.manufacturer[row], "model_no": frame.model_no[row]}
+        else:
+            key = {"manufacturer": frame.manufacturer[row]}
+        items.append(
+            {
+                **key,
+                "equipment_count": int(equipment_count[group]),
+                "failures": int(failures[group]),
+                "exposure_years": round(float(exposure[group] / _YEAR), 2),
+                "failure_rate_per_year": number(failure_rate[group], 3),
+                "mtbf_hours": number(mtbf[group], 1),
+                "mttr_hours": number(mttr[group], 1),
+            }
+        )
+    return {
+        "group_by": group_by,
+        "department_id": department_id,
+        "sort": sort,
+        "min_failures": min_failures,
+        "min_exposure_days": min_exposure_days,
+        "failure_types": [issue_type.value for issue_type in FAILURE_TYPES],
+        "computed_at": frame.loaded_at.isoformat(timespec="seconds"),
+        "total_groups": int(len(selected)),
+        "items": items,
+    }
+
+
+async def get_reliability(session: AsyncSession, **params: Any) -> dict[str, Any]:
+    """Return :func:`compute_reliability` for ``params``, cached per parameter set.
+
+    Cached entries are reused while the equipment, issue, archive and discard table versions are
+    unchanged, and for at most ``ANALYTICS_CACHE_SECONDS`` (exposure keeps growing with
+    time even when nothing is written). The loaded frame is shared by all parameter sets.
+    """
+
+    version = await fetch_fingerprint(
+        session, tables_fingerprint(IssueReport, IssueReportArchive, Equipment, DiscardEquipment)
+    )
+    key = "report:" + ":".join(f"{name}={value}" for name, value in sorted(params.items()))
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    expires_at = time.time() + settings.analytics_cache_seconds
+    frame_entry = _cache.get(_FRAME_KEY)
+    if frame_entry is None or frame_entry[0] != version:
+        frame_entry = (version, await load_reliability_frame(session))
+        _cache.set(_FRAME_KEY, frame_entry, expires_at)
+    report = compute_reliability(frame_entry[1], **params)
+    _cache.set(key, (version, report), expires_at)
+    return report
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from app.auth.dependencies import AuthenticatedUser, get_current_user
+from app.auth.passwords import hash_password, shutdown_password_pool, verify_password
+from app.auth.revocation import is_session_revoked, mark_session_revoked
+from app.auth.tokens import (
+    InvalidTokenError,
+    create_access_token,
+    decode_access_token,
+    hash_refresh_token,
+    new_refresh_token,
+)
+
+__all__ = [
+    "AuthenticatedUser",
+    "InvalidTokenError",
+    "create_access_token",
+    "decode_access_token",
+    "get_current_user",
+    "hash_password",
+    "hash_refresh_token",
+    "is_session_revoked",
+    "mark_session_revoked",
+    "new_refresh_token",
+    "shutdown_password_pool",
+    "verify_password",
+]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.revocation import is_session_revoked
+from app.auth.tokens import InvalidTokenError, decode_access_token
+from app.db.session import get_primary_db
+from app.models.enums import UserRole
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+@dataclass(slots=True, frozen=True)
+class AuthenticatedUser:
+    """Caller identity taken from access-token claims, without loading the user row."""
+
+    user_id: int
+    username: str
+    role: UserRole
+    session_id: int
+
+
+def unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    session: AsyncSession = Depends(get_primary_db),
+) -> AuthenticatedUser:
+    """Authenticate the bearer token; cached claims and revocation checks keep this off the DB."""
+
+    if credentials is None:
+        raise unauthorized("Not authenticated")
+    try:
+        claims = decode_access_token(credentials.credentials)
+    except InvalidTokenError as exc:
+        raise unauthorized("Invalid or expired token") from exc
+    if await is_session_revoked(session, claims["sid"]):
+        raise unauthorized("Session has been revoked")
+    return AuthenticatedUser(
+        user_id=int(claims["sub"]),
+        username=claims["username"],
+        role=UserRole(claims["role"]),
+        session_id=claims["sid"],
+    )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+from app.core.config import settings
+
+# bcrypt only reads the first 72 bytes; bcrypt>=5 raises instead of truncating silently.
+_BCRYPT_MAX_BYTES = 72
+
+_executor: ProcessPoolExecutor | None = None
+_slots: asyncio.Semaphore | None = None
+_dummy_hash: str | None = None
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode()[:_BCRYPT_MAX_BYTES], bcrypt.gensalt(rounds)).decode()
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode()[:_BCRYPT_MAX_BYTES], password_hash.encode())
+    except ValueError:  # malformed stored hash
+        return False
+
+
+def _pool() -> tuple[ProcessPoolExecutor, asyncio.Semaphore]:
+    global _executor, _slots
+    if _executor is None:
+        workers = settings.auth_hash_workers or min(4, os.cpu_count() or 1)
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        # Callers beyond this wait on the event loop rather than queueing unbounded work.
+        _slots = asyncio.Semaphore(workers * 4)
+    return _executor, _slots
+
+
+async def _run(function, *args):
+    executor, slots = _pool()
+    async with slots:
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+async def hash_password(password: str) -> str:
+    """Hash ``password`` with bcrypt in the worker process pool."""
+
+    return await _run(_hash, password, settings.auth_bcrypt_rounds)
+
+
+async def verify_password(password: str, password_hash: str | None) -> bool:
+    """Check ``password`` against a bcrypt hash in the worker process pool.
+
+    Pass ``None`` for unknown users: a dummy hash is still checked so response times do not
+    reveal which usernames exist.
+    """
+
+    global _dummy_hash
+    if password_hash is None:
+        if _dummy_hash is None:
+            _dummy_hash = await hash_password("dummy-password")
+        await _run(_verify, password, _dummy_hash)
+        return False
+    return await _run(_verify, password, password_hash)
+
+
+def shutdown_password_pool() -> None:
+    """Stop the worker processes; called on application shutdown."""
+
+    global _executor, _slots
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _slots = None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.refresh_token import RefreshToken
+
+# Negative cache: sessions (refresh token ids) recently confirmed as *not* revoked. A
+# revocation made by this process evicts the entry at once; one made by another worker is
+# noticed within ``settings.auth_revocation_cache_seconds``.
+_not_revoked = TTLCache(settings.auth_claims_cache_size)
+# Revocation is permanent, so confirmed revocations are kept until the session would have expired.
+_revoked = TTLCache(settings.auth_claims_cache_size)
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite returns naive datetimes for timezone-aware columns; values are stored in UTC.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+async def is_session_revoked(session: AsyncSession, session_id: int) -> bool:
+    """Return whether the refresh token ``session_id`` was revoked or has expired.
+
+    Only cache misses read ``refresh_token``.
+    """
+
+    key = str(session_id)
+    if _not_revoked.get(key) is not None:
+        return False
+    if _revoked.get(key) is not None:
+        return True
+    row = (
+        await session.execute(
+            select(RefreshToken.revoked, RefreshToken.expires_at).where(RefreshToken.token_id == session_id)
+        )
+    ).one_or_none()
+    now = time.time()
+    if row is None or row.revoked or _timestamp(row.expires_at) <= now:
+        mark_session_revoked(session_id)
+        return True
+    _not_revoked.set(key, True, min(now + settings.auth_revocation_cache_seconds, _timestamp(row.expires_at)))
+    return False
+
+
+def mark_session_revoked(session_id: int) -> None:
+    """Record a revocation so later checks in this process skip the database."""
+
+    key = str(session_id)
+    _not_revoked.discard(key)
+    _revoked.set(key, True, time.time() + settings.refresh_token_expire_days * 86400)
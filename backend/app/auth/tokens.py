@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from jose import JWTError, jwt
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class InvalidTokenError(Exception):
+    """Raised when an access token is malformed, has a bad signature or has expired."""
+
+
+_claims_cache = TTLCache(settings.auth_claims_cache_size)
+
+
+def create_access_token(user_id: int, username: str, role: str, session_id: int) -> tuple[str, int]:
+    """Return a signed access token and its lifetime in seconds.
+
+    ``session_id`` is the ``RefreshToken.token_id`` the token was issued from, so logging out
+    (revoking that refresh token) also invalidates access tokens derived from it.
+    """
+
+    lifetime = timedelta(minutes=settings.access_token_expire_minutes)
+    now = datetime.now(timezone.utc)
+    claims = {
+        "sub": str(user_id),
+        "username": username,
+        "role": role,
+        "sid": session_id,
+        "type": "access",
+        "iat": now,
+        "exp": now + lifetime,
+        "jti": uuid.uuid4().hex,
+    }
+    token = jwt.encode(claims, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return token, int(lifetime.total_seconds())
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """Validate ``token`` and return its claims, reusing earlier validations until it expires.
+
+    Signature checks and JSON decoding run once per token; later requests carrying the same
+    token are served from a bounded LRU that drops each entry at the token's ``exp``.
+    """
+
+    claims = _claims_cache.get(token)
+    if claims is not None:
+        return claims
+    try:
+        claims = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    except JWTError as exc:
+        raise InvalidTokenError(str(exc)) from exc
+    if claims.get("type") != "access" or "sub" not in claims or "exp" not in claims:
+        raise InvalidTokenError("Not an access token")
+    _claims_cache.set(token, claims, float(claims["exp"]))
+    return claims
+
+
+def new_refresh_token() -> tuple[str, str, datetime]:
+    """Return ``(token, token_hash, expires_at)`` for a new opaque refresh token.
+
+    Refresh tokens are 256-bit random strings, so a SHA-256 digest is a sufficient lookup
+    key; bcrypt would make every refresh pay the password-hash cost for no benefit.
+    """
+
+    token = secrets.token_urlsafe(32)
+    expires_at = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
+    return token, hash_refresh_token(token), expires_at
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
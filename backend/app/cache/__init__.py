@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from app.cache.responses import CachedBody, ResponseCache, cached_json_response, response_cache
+from app.cache.tags import (
+    DEPARTMENTS_TAG,
+    MODEL_TAGS,
+    VENDORS_TAG,
+    DatabaseTagVersions,
+    LocalTagVersions,
+    mark_tags_changed,
+    tag_versions,
+)
+
+__all__ = [
+    "DEPARTMENTS_TAG",
+    "MODEL_TAGS",
+    "VENDORS_TAG",
+    "CachedBody",
+    "DatabaseTagVersions",
+    "LocalTagVersions",
+    "ResponseCache",
+    "cached_json_response",
+    "mark_tags_changed",
+    "response_cache",
+    "tag_versions",
+]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+from app.cache.tags import TagVersions, tag_versions
+from app.core.cache import TTLCache
+from app.core.conditional import Validators, is_not_modified, not_modified, request_variant
+from app.core.config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBody:
+    """A rendered JSON body and the tag versions it was built under."""
+
+    versions: tuple[int, ...]
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """LRU/TTL cache of rendered JSON bodies, invalidated by tag version.
+
+    An entry is served only while every tag it was stored under still has the version
+    read *before* the body was built, so a write that commits during the build leaves a
+    stale entry that the next lookup discards rather than serves.
+    """
+
+    def __init__(self, versions: TagVersions, *, max_entries: int, ttl_seconds: float) -> None:
+        self.versions = versions
+        self.ttl_seconds = ttl_seconds
+        self._entries = TTLCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, key: str, versions: tuple[int, ...]) -> CachedBody | None:
+        entry: CachedBody | None = self._entries.get(key)
+        if entry is not None and entry.versions != versions:
+            self._entries.discard(key)
+            self.invalidations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self, key: str, versions: tuple[int, ...], body: bytes) -> CachedBody:
+        etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        entry = CachedBody(versions=versions, body=body, etag=etag)
+        self._entries.set(key, entry, time.time() + self.ttl_seconds)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        entries = self._entries.stats()
+        return {
+            "size": entries["size"],
+            "max_entries": entries["max_entries"],
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "expirations": entries["expirations"],
+            "evictions": entries["evictions"],
+            "tags": self.versions.status(),
+        }
+
+
+response_cache = ResponseCache(
+    tag_versions,
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_seconds,
+)
+
+
+async def cached_json_response(
+    request: Request,
+    tags: Sequence[str],
+    build: Callable[[], Awaitable[Any]],
+) -> Response:
+    """Serve ``build()`` rendered as JSON from :data:`response_cache`.
+
+    The key is the path plus canonical query string. Hits skip the database entirely, and
+    a matching ``If-None-Match`` gets a 304 whether the body came from the cache or not.
+    ``X-Cache`` reports ``hit`` or ``miss``.
+    """
+
+    key = f"{request.url.path}?{request_variant(request)}"
+    versions = await response_cache.versions.current(tags)
+    entry = response_cache.lookup(key, versions)
+    outcome = "hit"
+    if entry is None:
+        content = await build()
+        body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        entry = response_cache.store(key, versions, body)
+        outcome = "miss"
+    validators = Validators(etag=entry.etag, last_modified=None)
+    if is_not_modified(request, validators):
+        response = not_modified(validators)
+    else:
+        response = Response(entry.body, media_type="application/json", headers=validators.headers())
+    response.headers["X-Cache"] = outcome
+    return response
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.engine import dialect_insert
+from app.db.session import engine
+from app.models.cache_tag import CacheTag
+from app.models.department import Department
+from app.models.vendor import Vendor
+
+DEPARTMENTS_TAG = "departments"
+VENDORS_TAG = "vendors"
+
+# Cache tags invalidated by any ORM insert, update or delete of these models.
+MODEL_TAGS: dict[type, str] = {
+    Department: DEPARTMENTS_TAG,
+    Vendor: VENDORS_TAG,
+}
+
+_PENDING_KEY = "cache_tags"
+
+
+class LocalTagVersions:
+    """Tag versions held in this process; other workers only see changes once entries expire."""
+
+    shared = False
+
+    def __init__(self) -> None:
+        self._versions: dict[str, int] = {}
+
+    async def current(self, tags: Sequence[str]) -> tuple[int, ...]:
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    def committed(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def status(self) -> dict[str, Any]:
+        return {"backend": "local", "versions": dict(self._versions)}
+
+
+class DatabaseTagVersions:
+    """Tag versions stored in ``cache_tag`` and bumped in the writing transaction.
+
+    Every worker re-reads the (tiny) table at most every ``poll_seconds``, so a write made
+    by another worker is seen within that interval; one made by this worker is seen at once.
+    """
+
+    shared = True
+
+    def __init__(self, poll_seconds: float) -> None:
+        self.poll_seconds = poll_seconds
+        self.polls = 0
+        self._versions: dict[str, int] = {}
+        self._fresh_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def current(self, tags: Sequence[str]) -> tuple[int, ...]:
+        if time.monotonic() >= self._fresh_until:
+            async with self._lock:
+                if time.monotonic() >= self._fresh_until:
+                    await self._poll()
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    async def _poll(self) -> None:
+        # Always the primary: a lagging replica would hide a bump that already happened.
+        async with engine.connect() as connection:
+            rows = await connection.execute(select(CacheTag.tag, CacheTag.version))
+        self._versions = dict(rows.all())
+        self._fresh_until = time.monotonic() + self.poll_seconds
+        self.polls += 1
+
+    def committed(self, tags: Iterable[str]) -> None:
+        self._fresh_until = 0.0
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "backend": "database",
+            "poll_seconds": self.poll_seconds,
+            "polls": self.polls,
+            "versions": dict(self._versions),
+        }
+
+
+TagVersions = LocalTagVersions | DatabaseTagVersions
+
+tag_versions: TagVersions = (
+    DatabaseTagVersions(settings.cache_tag_poll_seconds)
+    if settings.cache_tag_backend == "database"
+    else LocalTagVersions()
+)
+
+
+def mark_tags_changed(session: Session, tags: Iterable[str]) -> None:
+    """Invalidate ``tags`` when the current transaction of ``session`` commits.
+
+    The ORM listener below calls this for reference-model writes; code that changes
+    reference tables with Core statements must call it itself (via ``run_sync``).
+    """
+
+    tags = sorted(set(tags))
+    if not tags:
+        return
+    session.info.setdefault(_PENDING_KEY, set()).update(tags)
+    if tag_versions.shared:
+        connection = session.connection()
+        table = CacheTag.__table__
+        statement = dialect_insert(connection.dialect.name)(table).values([{"tag": tag, "version": 1} for tag in tags])
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.tag],
+            set_={"version": table.c.version + 1, "updated_at": func.now()},
+        )
+        connection.execute(statement)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_cache_tags(session: Session, flush_context: Any) -> None:
+    changed = {
+        MODEL_TAGS[type(obj)]
+        for obj in (*session.new, *session.deleted, *session.dirty)
+        if type(obj) in MODEL_TAGS
+        and (obj not in session.dirty or session.is_modified(obj, include_collections=False))
+    }
+    mark_tags_changed(session, changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tags(session: Session) -> None:
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        tag_versions.committed(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_tags(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# ``updated_at`` defaults to CURRENT_TIMESTAMP, which SQLite stores with one-second
+# resolution: a second write within the same second as the first would leave the
+# fingerprint unchanged. Resources touched this recently get no validators, so clients
+# never cache a representation whose version can still change without the fingerprint.
+SETTLE_SECONDS = 1.0
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns; values are stored in UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """ETag and Last-Modified for one representation of a resource."""
+
+    etag: str
+    last_modified: datetime | None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def make_validators(scope: str, fingerprint: Sequence[Any], *, variant: str = "") -> Validators | None:
+    """Derive validators from a fingerprint (counts and ``updated_at`` values).
+
+    ``scope`` names the resource (usually the route path) and ``variant`` anything else that
+    changes the representation, such as filters, sort order and cursor. Returns ``None``
+    while the newest timestamp is within :data:`SETTLE_SECONDS` of now.
+    """
+
+    timestamps = [_as_utc(value) for value in fingerprint if isinstance(value, datetime)]
+    last_modified = max(timestamps, default=None)
+    if last_modified is not None:
+        if last_modified > datetime.now(timezone.utc) - timedelta(seconds=SETTLE_SECONDS):
+            return None
+        last_modified = last_modified.replace(microsecond=0)
+    parts = (value.isoformat() if isinstance(value, datetime) else repr(value) for value in fingerprint)
+    material = "|".join([scope, variant, *parts])
+    digest = hashlib.blake2b(material.encode(), digest_size=12).hexdigest()
+    # Weak: the same version may be serialised differently (e.g. JSON key order across releases).
+    return Validators(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def request_variant(request: Request) -> str:
+    """Canonical form of the query parameters, for :func:`make_validators`."""
+
+    return "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def is_not_modified(request: Request, validators: Validators | None) -> bool:
+    """Evaluate ``If-None-Match`` (or, without it, ``If-Modified-Since``) for a GET."""
+
+    if validators is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return validators.last_modified <= _as_utc(since)
+    return False
+
+
+def not_modified(validators: Validators) -> Response:
+    """Empty ``304 Not Modified`` carrying the current validators."""
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
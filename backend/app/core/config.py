@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import AnyUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,42 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
         description="SQLAlchemy database URL",
     )
+    database_replica_urls: list[str] = Field(
+        default=[],
+        alias="DATABASE_REPLICA_URLS",
+        description="Read-only replica URLs for read-only sessions; empty sends every read to the primary",
+    )
+    db_replica_eject_seconds: float = Field(
+        default=30.0,
+        alias="DB_REPLICA_EJECT_SECONDS",
+        description="How long a replica that failed to connect is skipped",
+    )
+    db_read_your_writes_seconds: float = Field(
+        default=5.0,
+        alias="DB_READ_YOUR_WRITES_SECONDS",
+        description="After a client's write, its reads go to the primary for this long",
+    )
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT", description="Seconds to wait for a connection")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE", description="Seconds before a connection is replaced")
+    db_statement_cache_size: int = Field(
+        default=500,
+        alias="DB_STATEMENT_CACHE_SIZE",
+        description="asyncpg prepared statements cached per connection",
+    )
+    sqlite_busy_timeout_ms: int = Field(default=5000, alias="SQLITE_BUSY_TIMEOUT_MS")
+    sqlite_mmap_size: int = Field(default=256 * 1024 * 1024, alias="SQLITE_MMAP_SIZE")
+    sqlite_cache_size_kib: int = Field(default=64 * 1024, alias="SQLITE_CACHE_SIZE_KIB")
+    sql_echo: bool = Field(default=False, alias="SQL_ECHO", description="Log every SQL statement")
+    sql_instrumentation: bool = Field(default=True, alias="SQL_INSTRUMENTATION")
+    sql_slow_query_ms: float = Field(default=100.0, alias="SQL_SLOW_QUERY_MS")
+    sql_n_plus_one_threshold: int = Field(
+        default=5,
+        alias="SQL_N_PLUS_ONE_THRESHOLD",
+        description="Executions of one statement shape per request that are reported as N+1",
+    )
 
     backend_cors_origins: list[AnyUrl] | str = Field(
         default="http://localhost:3000",
@@ -31,9 +68,174 @@ class Settings(BaseSettings):
     refresh_token_expire_days: int = Field(default=7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
     jwt_secret_key: str = Field(default="change-me", alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
+    auth_bcrypt_rounds: int = Field(default=12, alias="AUTH_BCRYPT_ROUNDS")
+    auth_hash_workers: int = Field(
+        default=0,
+        alias="AUTH_HASH_WORKERS",
+        description="Processes for bcrypt hashing; 0 uses min(4, CPU count)",
+    )
+    auth_claims_cache_size: int = Field(default=10000, alias="AUTH_CLAIMS_CACHE_SIZE")
+    auth_revocation_cache_seconds: int = Field(
+        default=30,
+        alias="AUTH_REVOCATION_CACHE_SECONDS",
+        description="How long a refresh token confirmed as not revoked skips the database check",
+    )
 
     upload_dir: str = Field(default="backend/uploads", alias="UPLOAD_DIR")
     storage_backend: str = Field(default="local", alias="STORAGE_BACKEND")
+    upload_chunk_size: int = Field(
+        default=1024 * 1024,
+        ge=4096,
+        alias="UPLOAD_CHUNK_SIZE",
+        description="Block size for streaming uploads to disk",
+    )
+    upload_max_bytes: int = Field(default=200 * 1024 * 1024, alias="UPLOAD_MAX_BYTES")
+    upload_session_ttl_hours: int = Field(
+        default=72,
+        alias="UPLOAD_SESSION_TTL_HOURS",
+        description="Resumable uploads without a new part for this long are removed by the media GC",
+    )
+
+    scheduler_enabled: bool = Field(
+        default=True,
+        alias="SCHEDULER_ENABLED",
+        description="Run background jobs in this process; enable on exactly one worker",
+    )
+    expiry_scan_interval_minutes: int = Field(default=60, alias="EXPIRY_SCAN_INTERVAL_MINUTES")
+    expiry_scan_chunk_size: int = Field(default=500, alias="EXPIRY_SCAN_CHUNK_SIZE")
+    expiry_lookback_days: int = Field(
+        default=7,
+        alias="EXPIRY_LOOKBACK_DAYS",
+        description="Days before the high-water mark rescanned to catch back-dated expiry edits",
+    )
+    expiry_full_scan_interval_hours: int = Field(
+        default=24,
+        ge=1,
+        alias="EXPIRY_FULL_SCAN_INTERVAL_HOURS",
+        description="How often the scheduled scan reads every expiry date instead of the incremental range",
+    )
+    expiry_alert_windows: list[int] = Field(default=[7, 30, 90], alias="EXPIRY_ALERT_WINDOWS")
+    expiry_alert_limit: int = Field(default=200, alias="EXPIRY_ALERT_LIMIT", description="Items kept per alert window")
+    expiry_alert_cache_seconds: int = Field(default=300, alias="EXPIRY_ALERT_CACHE_SECONDS")
+    issue_rollup_batch_size: int = Field(
+        default=5000,
+        ge=100,
+        alias="ISSUE_ROLLUP_BATCH_SIZE",
+        description="Issue reports rolled up per backfill transaction",
+    )
+    issue_trend_max_days: int = Field(default=1830, alias="ISSUE_TREND_MAX_DAYS")
+    issue_archive_after_months: int = Field(
+        default=12,
+        ge=1,
+        alias="ISSUE_ARCHIVE_AFTER_MONTHS",
+        description="Closed issue reports older than this move to issue_report_archive",
+    )
+    issue_archive_interval_minutes: int = Field(default=60, alias="ISSUE_ARCHIVE_INTERVAL_MINUTES")
+    issue_archive_batch_size: int = Field(default=500, ge=1, alias="ISSUE_ARCHIVE_BATCH_SIZE")
+    issue_archive_pause_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        alias="ISSUE_ARCHIVE_PAUSE_SECONDS",
+        description="Sleep between archive batches so the job never monopolises the writer",
+    )
+    issue_archive_max_batches: int = Field(
+        default=200, ge=1, alias="ISSUE_ARCHIVE_MAX_BATCHES", description="Batches per scheduled run"
+    )
+    media_gc_interval_hours: int = Field(default=24, alias="MEDIA_GC_INTERVAL_HOURS")
+    media_gc_grace_hours: float = Field(
+        default=24.0,
+        ge=0,
+        alias="MEDIA_GC_GRACE_HOURS",
+        description="Unreferenced files modified more recently than this are kept (uploads awaiting their row)",
+    )
+    media_gc_batch_size: int = Field(default=500, ge=1, alias="MEDIA_GC_BATCH_SIZE")
+    media_gc_pause_seconds: float = Field(default=0.2, ge=0, alias="MEDIA_GC_PAUSE_SECONDS")
+    analytics_cache_seconds: int = Field(
+        default=900,
+        alias="ANALYTICS_CACHE_SECONDS",
+        description="Upper bound on reusing reliability analytics while the underlying tables are unchanged",
+    )
+
+    dashboard_push_coalesce_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        alias="DASHBOARD_PUSH_COALESCE_SECONDS",
+        description="Commits within this window are pushed to dashboards as one frame",
+    )
+    dashboard_push_reconcile_seconds: float = Field(
+        default=15.0,
+        gt=0,
+        alias="DASHBOARD_PUSH_RECONCILE_SECONDS",
+        description="How often pushed counters are compared with the database (bulk writes, other workers)",
+    )
+    dashboard_push_heartbeat_seconds: float = Field(default=20.0, gt=0, alias="DASHBOARD_PUSH_HEARTBEAT_SECONDS")
+    dashboard_push_client_queue: int = Field(
+        default=16,
+        ge=1,
+        alias="DASHBOARD_PUSH_CLIENT_QUEUE",
+        description="Frames buffered per client before its backlog is replaced by a snapshot",
+    )
+    dashboard_push_max_clients: int = Field(default=5000, ge=1, alias="DASHBOARD_PUSH_MAX_CLIENTS")
+
+    sync_batch_size: int = Field(
+        default=500, ge=1, le=5000, alias="SYNC_BATCH_SIZE", description="Changes returned per delta sync call"
+    )
+    sync_push_max_rows: int = Field(default=500, ge=1, alias="SYNC_PUSH_MAX_ROWS")
+    sync_tombstone_retention_days: int = Field(
+        default=90,
+        ge=1,
+        alias="SYNC_TOMBSTONE_RETENTION_DAYS",
+        description="Deletions are kept this long; clients offline for longer sync again from scratch",
+    )
+    sync_prune_interval_hours: int = Field(default=24, alias="SYNC_PRUNE_INTERVAL_HOURS")
+
+    equipment_facet_limit: int = Field(
+        default=50, ge=1, alias="EQUIPMENT_FACET_LIMIT", description="Options listed per equipment facet, by count"
+    )
+    equipment_facet_cache_entries: int = Field(default=256, ge=1, alias="EQUIPMENT_FACET_CACHE_ENTRIES")
+    equipment_facet_cache_seconds: int = Field(
+        default=300,
+        alias="EQUIPMENT_FACET_CACHE_SECONDS",
+        description="Upper bound on reusing facet counts for a filter set while the equipment list is unchanged",
+    )
+
+    search_rank_candidates: int = Field(
+        default=1000,
+        alias="SEARCH_RANK_CANDIDATES",
+        description="Newest full-text matches scored for relevance ranking",
+    )
+
+    export_batch_size: int = Field(
+        default=2000,
+        ge=100,
+        alias="EXPORT_BATCH_SIZE",
+        description="Rows fetched from the server-side cursor and encoded per chunk in exports",
+    )
+    export_gzip_level: int = Field(default=6, ge=1, le=9, alias="EXPORT_GZIP_LEVEL")
+
+    equipment_bulk_max_rows: int = Field(default=1000, ge=1, alias="EQUIPMENT_BULK_MAX_ROWS")
+    reference_cache_seconds: int = Field(
+        default=300,
+        alias="REFERENCE_CACHE_SECONDS",
+        description="How long department and vendor id sets used for bulk validation are cached",
+    )
+
+    response_cache_max_entries: int = Field(default=512, ge=1, alias="RESPONSE_CACHE_MAX_ENTRIES")
+    response_cache_seconds: int = Field(
+        default=3600,
+        alias="RESPONSE_CACHE_SECONDS",
+        description="Upper bound on the age of a cached reference-data response; writes invalidate sooner",
+    )
+    cache_tag_backend: Literal["local", "database"] = Field(
+        default="local",
+        alias="CACHE_TAG_BACKEND",
+        description="Where cache tag versions live; 'database' keeps several workers consistent",
+    )
+    cache_tag_poll_seconds: float = Field(
+        default=1.0,
+        alias="CACHE_TAG_POLL_SECONDS",
+        description="How often a worker re-reads shared tag versions, i.e. its worst-case staleness",
+    )
 
 
 @lru_cache
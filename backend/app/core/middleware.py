@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.instrumentation import QueryStats, collect_queries
+from app.db.routing import route_request
+
+logger = logging.getLogger("app.sql")
+
+
+class QueryStatsMiddleware:
+    """Collect per-request SQL statistics, expose them as headers and log slow or N+1 requests.
+
+    Headers are added when the response starts, so statements a streaming response runs
+    while sending its body only appear in the log line.
+    """
+
+    def __init__(self, app: ASGIApp, *, slow_query_ms: float, n_plus_one_threshold: int, headers: bool = True) -> None:
+        self.app = app
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with collect_queries(self.n_plus_one_threshold) as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if self.headers and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Time-Ms"] = f"{stats.total_ms:.1f}"
+                    headers.append("Server-Timing", f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"')
+                    if stats.repeated:
+                        headers["X-DB-N-Plus-One"] = str(len(stats.repeated))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self._log(scope, stats)
+
+    def _log(self, scope: Scope, stats: QueryStats) -> None:
+        if not stats.count:
+            return
+        path = f"{scope['method']} {scope['path']}"
+        for shape, count in stats.repeated.items():
+            logger.warning("possible N+1 in %s: %d executions of %s", path, count, shape)
+        slow = [(ms, statement) for ms, statement in stats.slowest_statements() if ms >= self.slow_query_ms]
+        for ms, statement in slow:
+            logger.warning("slow query in %s (%.1f ms): %s", path, ms, statement)
+        logger.debug("%s: %d statements, %.1f ms", path, stats.count, stats.total_ms)
+
+
+class ReadYourWritesMiddleware:
+    """Route a client's reads to the primary for a short window after it writes.
+
+    A request that commits a write session gets a cookie holding the end of the window;
+    requests carrying an unexpired cookie skip the replicas, so clients see their own
+    writes despite replication lag. The state lives in the cookie, so it holds across
+    workers. Within a request, reads after a commit always go to the primary.
+    """
+
+    def __init__(self, app: ASGIApp, *, window_seconds: float, cookie_name: str = "read_primary_until") -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+        self.cookie_name = cookie_name
+
+    def _read_primary(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                until = cookie_parser(value.decode("latin-1")).get(self.cookie_name)
+                try:
+                    return until is not None and float(until) > time.time()
+                except ValueError:
+                    return False
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with route_request(read_primary=self._read_primary(scope)) as routing:
+
+            async def send_with_cookie(message: Message) -> None:
+                if message["type"] == "http.response.start" and routing.wrote:
+                    cookie: SimpleCookie = SimpleCookie()
+                    cookie[self.cookie_name] = f"{time.time() + self.window_seconds:.3f}"
+                    cookie[self.cookie_name]["max-age"] = int(self.window_seconds) + 1
+                    cookie[self.cookie_name]["path"] = "/"
+                    cookie[self.cookie_name]["httponly"] = True
+                    cookie[self.cookie_name]["samesite"] = "lax"
+                    MutableHeaders(scope=message).append("Set-Cookie", cookie.output(header="").strip())
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    List endpoints return plain dicts built from projected rows through this class, which
+    skips Pydantic validation and ``jsonable_encoder``; dates, datetimes and enums are
+    encoded natively by orjson (UTC as ``Z``, matching Pydantic).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from app.crud.department import list_departments
+from app.crud.discard import (
+    discard_detail_fingerprint,
+    discard_list_fingerprint,
+    discard_rows_statement,
+    get_discard,
+    list_discard_rows,
+)
+from app.crud.equipment import (
+    equipment_detail_fingerprint,
+    equipment_filter_clauses,
+    equipment_list_fingerprint,
+    equipment_rows_statement,
+    get_equipment,
+    list_equipment,
+    list_equipment_rows,
+)
+from app.crud.equipment_bulk import BulkRow, BulkWriteResult, bulk_write_equipment, clear_reference_cache
+from app.crud.equipment_facets import (
+    EquipmentFacets,
+    Facet,
+    FacetValue,
+    count_equipment_facets,
+    get_equipment_facets,
+)
+from app.crud.fingerprint import fetch_fingerprint, list_fingerprint, table_version, tables_fingerprint
+from app.crud.issue_report import (
+    get_issue,
+    issue_detail_fingerprint,
+    issue_list_fingerprint,
+    issue_rows_statement,
+    list_issue_rows,
+    list_issues,
+)
+from app.crud.vendor import list_vendor_refs, list_vendors
+
+__all__ = [
+    "BulkRow",
+    "BulkWriteResult",
+    "EquipmentFacets",
+    "Facet",
+    "FacetValue",
+    "bulk_write_equipment",
+    "clear_reference_cache",
+    "count_equipment_facets",
+    "discard_detail_fingerprint",
+    "discard_list_fingerprint",
+    "discard_rows_statement",
+    "equipment_detail_fingerprint",
+    "equipment_filter_clauses",
+    "equipment_list_fingerprint",
+    "equipment_rows_statement",
+    "fetch_fingerprint",
+    "get_discard",
+    "get_equipment",
+    "get_equipment_facets",
+    "get_issue",
+    "issue_detail_fingerprint",
+    "issue_list_fingerprint",
+    "issue_rows_statement",
+    "list_departments",
+    "list_discard_rows",
+    "list_equipment",
+    "list_equipment_rows",
+    "list_fingerprint",
+    "list_issue_rows",
+    "list_issues",
+    "list_vendor_refs",
+    "list_vendors",
+    "table_version",
+    "tables_fingerprint",
+]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.department import Department
+
+
+async def list_departments(session: AsyncSession) -> list[dict[str, Any]]:
+    """Return every department as ``{department_id, department_name}``, ordered by name."""
+
+    rows = await session.execute(
+        select(Department.department_id, Department.department_name).order_by(Department.department_name)
+    )
+    return [dict(row) for row in rows.mappings()]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.crud.fingerprint import list_fingerprint
+from app.db.pagination import KeysetPage, SortKey, SortOrder, paginate_keyset
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+
+DISCARD_SORT_KEYS: dict[str, SortKey] = {
+    "discard_id": SortKey(DiscardEquipment.discard_id, DiscardEquipment.discard_id),
+    "date": SortKey(DiscardEquipment.date, DiscardEquipment.discard_id),
+}
+
+DISCARD_LIST_COLUMNS = (
+    DiscardEquipment.discard_id,
+    DiscardEquipment.equipment_id,
+    DiscardEquipment.reason,
+    DiscardEquipment.media_url,
+    DiscardEquipment.date,
+    DiscardEquipment.created_at,
+    DiscardEquipment.updated_at,
+    Equipment.equipment_name,
+    Equipment.serial_number,
+    Equipment.department_id,
+    Department.department_name,
+)
+
+
+def discard_row_payload(row: Row) -> dict[str, Any]:
+    """Shape a projected discard row like :class:`app.schemas.discard.DiscardRead`."""
+
+    return {
+        "discard_id": row.discard_id,
+        "equipment_id": row.equipment_id,
+        "reason": row.reason,
+        "media_url": row.media_url,
+        "date": row.date,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "equipment": {
+            "equipment_id": row.equipment_id,
+            "equipment_name": row.equipment_name,
+            "serial_number": row.serial_number,
+            "department": {"department_id": row.department_id, "department_name": row.department_name},
+        },
+    }
+
+
+def discard_rows_statement(*, department_id: int | None = None) -> Select:
+    """Build the filtered :data:`DISCARD_LIST_COLUMNS` projection, without ordering or limits."""
+
+    statement = (
+        select(*DISCARD_LIST_COLUMNS)
+        .join(Equipment, Equipment.equipment_id == DiscardEquipment.equipment_id)
+        .join(Department, Department.department_id == Equipment.department_id)
+    )
+    if department_id is not None:
+        statement = statement.where(Equipment.department_id == department_id)
+    return statement
+
+
+async def list_discard_rows(
+    session: AsyncSession,
+    *,
+    department_id: int | None = None,
+    sort_by: str = "discard_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+) -> KeysetPage[dict[str, Any]]:
+    """Return a keyset-paginated page of discard records projected into response-ready dicts."""
+
+    page = await paginate_keyset(
+        session,
+        discard_rows_statement(department_id=department_id),
+        sort_keys=DISCARD_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+        scalars=False,
+    )
+    return replace(page, items=[discard_row_payload(row) for row in page.items])
+
+
+def discard_list_fingerprint(*, department_id: int | None = None) -> Select:
+    """Version of the records matching the filter and of the equipment and department columns the list embeds."""
+
+    return list_fingerprint(discard_rows_statement(department_id=department_id), Equipment, Department)
+
+
+def discard_detail_fingerprint(discard_id: int) -> Select:
+    """``updated_at`` of one discard record, its equipment and the equipment's department."""
+
+    return (
+        select(DiscardEquipment.updated_at, Equipment.updated_at, Department.updated_at)
+        .select_from(DiscardEquipment)
+        .join(Equipment, Equipment.equipment_id == DiscardEquipment.equipment_id)
+        .join(Department, Department.department_id == Equipment.department_id)
+        .where(DiscardEquipment.discard_id == discard_id)
+    )
+
+
+async def get_discard(session: AsyncSession, discard_id: int) -> DiscardEquipment | None:
+    """Load one discard record with its equipment and the equipment's department."""
+
+    statement = (
+        select(DiscardEquipment)
+        .where(DiscardEquipment.discard_id == discard_id)
+        .options(joinedload(DiscardEquipment.equipment).joinedload(Equipment.department))
+    )
+    return (await session.execute(statement)).scalar_one_or_none()
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.crud.fingerprint import list_fingerprint
+from app.db.pagination import KeysetPage, SortKey, SortOrder, paginate_keyset
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.enums import EquipmentStatus, IssueStatus
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.vendor import Vendor
+from app.search.fts import equipment_match_clause
+
+EQUIPMENT_SORT_KEYS: dict[str, SortKey] = {
+    "equipment_id": SortKey(Equipment.equipment_id, Equipment.equipment_id),
+    "equipment_name": SortKey(Equipment.equipment_name, Equipment.equipment_id),
+    "status": SortKey(Equipment.status, Equipment.equipment_id),
+    "expiry_date": SortKey(Equipment.expiry_date, Equipment.equipment_id),
+}
+
+UNRESOLVED_ISSUE_STATUSES = (IssueStatus.OPEN, IssueStatus.IN_PROGRESS)
+
+# Columns the list response needs; department and vendor names come from joins in the same
+# statement instead of per-row relationship loads.
+EQUIPMENT_LIST_COLUMNS = (
+    Equipment.equipment_id,
+    Equipment.equipment_name,
+    Equipment.serial_number,
+    Equipment.model_no,
+    Equipment.manufacturer,
+    Equipment.department_id,
+    Equipment.purchase_date,
+    Equipment.expiry_date,
+    Equipment.status,
+    Equipment.vendor_id,
+    Equipment.quantity,
+    Equipment.created_at,
+    Equipment.updated_at,
+    Department.department_name,
+    Vendor.vendor_name,
+)
+
+
+# Structured filters grouped by the facet whose options they narrow; see app.crud.equipment_facets.
+EQUIPMENT_FILTER_GROUPS = ("status", "department", "vendor", "purchase_year", "expiry")
+
+
+def equipment_filter_clauses(
+    *,
+    status: EquipmentStatus | None = None,
+    department_id: int | None = None,
+    vendor_id: int | None = None,
+    purchased_from: date | None = None,
+    purchased_to: date | None = None,
+    expires_from: date | None = None,
+    expires_to: date | None = None,
+    expired: bool | None = None,
+    today: date | None = None,
+) -> dict[str, list[ColumnElement[bool]]]:
+    """WHERE clauses of the structured filters, keyed by :data:`EQUIPMENT_FILTER_GROUPS`.
+
+    Date ranges are inclusive. ``expired`` matches the expiry scan: due on or before today.
+    """
+
+    today = today or date.today()
+    clauses: dict[str, list[ColumnElement[bool]]] = {group: [] for group in EQUIPMENT_FILTER_GROUPS}
+    if status is not None:
+        clauses["status"].append(Equipment.status == status)
+    if department_id is not None:
+        clauses["department"].append(Equipment.department_id == department_id)
+    if vendor_id is not None:
+        clauses["vendor"].append(Equipment.vendor_id == vendor_id)
+    if purchased_from is not None:
+        clauses["purchase_year"].append(Equipment.purchase_date >= purchased_from)
+    if purchased_to is not None:
+        clauses["purchase_year"].append(Equipment.purchase_date <= purchased_to)
+    if expires_from is not None:
+        clauses["expiry"].append(Equipment.expiry_date >= expires_from)
+    if expires_to is not None:
+        clauses["expiry"].append(Equipment.expiry_date <= expires_to)
+    if expired is not None:
+        clauses["expiry"].append(
+            Equipment.expiry_date <= today
+            if expired
+            else or_(Equipment.expiry_date.is_(None), Equipment.expiry_date > today)
+        )
+    return clauses
+
+
+def _apply_filters(
+    statement: Select,
+    dialect_name: str,
+    *,
+    search: str | None,
+    **filters: Any,
+) -> Select:
+    for clauses in equipment_filter_clauses(**filters).values():
+        statement = statement.where(*clauses)
+    if search:
+        match = equipment_match_clause(dialect_name, search)
+        if match is not None:
+            statement = statement.where(match)
+    return statement
+
+
+async def list_equipment(
+    session: AsyncSession,
+    *,
+    search: str | None = None,
+    sort_by: str = "equipment_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+    **filters: Any,
+) -> KeysetPage[Equipment]:
+    """Return a keyset-paginated page of equipment ORM instances with department and vendor loaded.
+
+    ``filters`` are the keyword arguments of :func:`equipment_filter_clauses`.
+    """
+
+    statement = select(Equipment).options(selectinload(Equipment.department), selectinload(Equipment.vendor))
+    statement = _apply_filters(statement, session.get_bind().dialect.name, search=search, **filters)
+    return await paginate_keyset(
+        session,
+        statement,
+        sort_keys=EQUIPMENT_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+def equipment_row_payload(row: Row) -> dict[str, Any]:
+    """Shape a projected equipment row like :class:`app.schemas.equipment.EquipmentRead`."""
+
+    return {
+        "equipment_id": row.equipment_id,
+        "equipment_name": row.equipment_name,
+        "serial_number": row.serial_number,
+        "model_no": row.model_no,
+        "manufacturer": row.manufacturer,
+        "department_id": row.department_id,
+        "purchase_date": row.purchase_date,
+        "expiry_date": row.expiry_date,
+        "status": row.status,
+        "vendor_id": row.vendor_id,
+        "quantity": row.quantity,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "department": {"department_id": row.department_id, "department_name": row.department_name},
+        "vendor": None if row.vendor_id is None else {"vendor_id": row.vendor_id, "vendor_name": row.vendor_name},
+    }
+
+
+def equipment_rows_statement(dialect_name: str, *, search: str | None = None, **filters: Any) -> Select:
+    """Build the filtered :data:`EQUIPMENT_LIST_COLUMNS` projection, without ordering or limits."""
+
+    statement = (
+        select(*EQUIPMENT_LIST_COLUMNS)
+        .join(Department, Department.department_id == Equipment.department_id)
+        .outerjoin(Vendor, Vendor.vendor_id == Equipment.vendor_id)
+    )
+    return _apply_filters(statement, dialect_name, search=search, **filters)
+
+
+async def list_equipment_rows(
+    session: AsyncSession,
+    *,
+    search: str | None = None,
+    sort_by: str = "equipment_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+    **filters: Any,
+) -> KeysetPage[dict[str, Any]]:
+    """Like :func:`list_equipment`, but project columns into response-ready dicts.
+
+    One statement, no ORM identity map or unit-of-work bookkeeping; used by the list endpoint.
+    """
+
+    statement = equipment_rows_statement(session.get_bind().dialect.name, search=search, **filters)
+    page = await paginate_keyset(
+        session,
+        statement,
+        sort_keys=EQUIPMENT_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+        scalars=False,
+    )
+    return replace(page, items=[equipment_row_payload(row) for row in page.items])
+
+
+def equipment_list_fingerprint(dialect_name: str, *, search: str | None = None, **filters: Any) -> Select:
+    """Version of the rows matching the filters and of the department and vendor names the list embeds."""
+
+    return list_fingerprint(equipment_rows_statement(dialect_name, search=search, **filters), Department, Vendor)
+
+
+def equipment_detail_fingerprint(equipment_id: int) -> Select:
+    """``updated_at`` of one equipment row and of everything its detail response embeds."""
+
+    return (
+        select(
+            Equipment.updated_at,
+            Department.updated_at,
+            Vendor.updated_at,
+            DiscardEquipment.updated_at,
+            select(func.count()).where(IssueReport.equipment_id == Equipment.equipment_id).scalar_subquery(),
+            select(func.max(IssueReport.updated_at))
+            .where(IssueReport.equipment_id == Equipment.equipment_id)
+            .scalar_subquery(),
+        )
+        .select_from(Equipment)
+        .join(Department, Department.department_id == Equipment.department_id)
+        .outerjoin(Vendor, Vendor.vendor_id == Equipment.vendor_id)
+        .outerjoin(DiscardEquipment, DiscardEquipment.equipment_id == Equipment.equipment_id)
+        .where(Equipment.equipment_id == equipment_id)
+    )
+
+
+async def get_equipment(session: AsyncSession, equipment_id: int) -> Equipment | None:
+    """Load one equipment item with its department, vendor, discard record and unresolved issues."""
+
+    statement = (
+        select(Equipment)
+        .where(Equipment.equipment_id == equipment_id)
+        .options(
+            joinedload(Equipment.department),
+            joinedload(Equipment.vendor),
+            joinedload(Equipment.discard_record),
+            selectinload(Equipment.issue_reports.and_(IssueReport.status.in_(UNRESOLVED_ISSUE_STATUSES))),
+        )
+    )
+    return (await session.execute(statement)).unique().scalar_one_or_none()
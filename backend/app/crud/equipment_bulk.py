@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.dashboard.counters import CounterKey, apply_counter_deltas, equipment_keys
+from app.dashboard.rollups import apply_rollup_deltas, department_move_deltas
+from app.db.engine import dialect_insert
+from app.models.department import Department
+from app.models.equipment import Equipment
+from app.models.vendor import Vendor
+from app.schemas.equipment import EquipmentCreate
+from app.sync.changes import record_changes
+
+BulkMode = Literal["insert", "upsert"]
+
+# Columns written by a bulk insert; on conflict every one except the key is overwritten.
+_WRITE_COLUMNS = (
+    "equipment_name",
+    "serial_number",
+    "model_no",
+    "manufacturer",
+    "department_id",
+    "purchase_date",
+    "expiry_date",
+    "status",
+    "vendor_id",
+    "quantity",
+)
+
+_reference_ids = TTLCache(max_entries=2)
+
+
+@dataclass(slots=True)
+class BulkRow:
+    index: int
+    status: Literal["created", "updated", "rejected"]
+    equipment_id: int | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class BulkWriteResult:
+    results: list[BulkRow] = field(default_factory=list)
+
+    def _count(self, status: str) -> int:
+        return sum(1 for row in self.results if row.status == status)
+
+    @property
+    def created(self) -> int:
+        return self._count("created")
+
+    @property
+    def updated(self) -> int:
+        return self._count("updated")
+
+    @property
+    def rejected(self) -> int:
+        return self._count("rejected")
+
+
+async def _known_ids(session: AsyncSession, column: Any, key: str, wanted: set[int]) -> frozenset[int]:
+    """Return the cached id set for ``column``, reloading it once if ``wanted`` has unknown ids.
+
+    The reload makes departments and vendors created since the last load visible at once;
+    deletions are picked up within ``settings.reference_cache_seconds``.
+    """
+
+    ids = _reference_ids.get(key)
+    if ids is None or not wanted <= ids:
+        ids = frozenset((await session.execute(select(column))).scalars())
+        _reference_ids.set(key, ids, time.time() + settings.reference_cache_seconds)
+    return ids
+
+
+def clear_reference_cache() -> None:
+    """Forget the cached department and vendor ids, e.g. after deleting one."""
+
+    _reference_ids.clear()
+
+
+async def bulk_write_equipment(
+    session: AsyncSession,
+    items: Sequence[EquipmentCreate],
+    *,
+    mode: BulkMode = "insert",
+    atomic: bool = False,
+) -> BulkWriteResult:
+    """Validate and write a batch of equipment in a fixed number of statements.
+
+    Department and vendor ids are checked against cached id sets, serial numbers against
+    the batch itself and then against the table in one ``IN`` query, and accepted rows are
+    written with one multi-row ``INSERT ... RETURNING`` (``ON CONFLICT (serial_number) DO
+    UPDATE`` for ``mode="upsert"``). Rejected rows are reported with a reason; with
+    ``atomic`` any rejection means nothing is written. Dashboard counters and the sync
+    change log are updated in the same transaction; the caller commits.
+    """
+
+    dialect_name = session.get_bind().dialect.name
+    results: list[BulkRow | None] = [None] * len(items)
+    department_ids = await _known_ids(
+        session, Department.department_id, "department", {item.department_id for item in items}
+    )
+    vendor_ids = await _known_ids(
+        session, Vendor.vendor_id, "vendor", {item.vendor_id for item in items if item.vendor_id is not None}
+    )
+
+    first_index: dict[str, int] = {}
+    for index, item in enumerate(items):
+        if item.department_id not in department_ids:
+            results[index] = BulkRow(index, "rejected", error=f"Unknown department_id {item.department_id}")
+        elif item.vendor_id is not None and item.vendor_id not in vendor_ids:
+            results[index] = BulkRow(index, "rejected", error=f"Unknown vendor_id {item.vendor_id}")
+        elif item.serial_number is not None:
+            if item.serial_number in first_index:
+                results[index] = BulkRow(
+                    index,
+                    "rejected",
+                    error=f"Duplicate serial_number in batch (first at index {first_index[item.serial_number]})",
+                )
+            else:
+                first_index[item.serial_number] = index
+
+    serials = [item.serial_number for index, item in enumerate(items) if results[index] is None and item.serial_number]
+    existing: dict[str, Any] = {}
+    if serials:
+        statement = select(
+            Equipment.equipment_id,
+            Equipment.serial_number,
+            Equipment.status,
+            Equipment.department_id,
+            Equipment.expiry_date,
+        ).where(Equipment.serial_number.in_(serials))
+        # Lock matched rows (no-op on SQLite, where the writer queue serialises writers) so
+        # the counter deltas computed from their old values stay exact.
+        rows = (await session.execute(statement.with_for_update())).all()
+        existing = {row.serial_number: row for row in rows}
+    if mode == "insert":
+        for serial, row in existing.items():
+            index = first_index[serial]
+            results[index] = BulkRow(index, "rejected", equipment_id=row.equipment_id, error="serial_number already exists")
+
+    accepted = [index for index, result in enumerate(results) if result is None]
+    if not accepted or (atomic and len(accepted) != len(items)):
+        return BulkWriteResult(
+            [
+                result or BulkRow(index, "rejected", error="Not written: another row in the batch was rejected")
+                for index, result in enumerate(results)
+            ]
+        )
+
+    table = Equipment.__table__
+    values = [items[index].model_dump(include=set(_WRITE_COLUMNS)) for index in accepted]
+    statement = dialect_insert(dialect_name)(table)
+    if mode == "upsert":
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.serial_number],
+            set_={name: statement.excluded[name] for name in _WRITE_COLUMNS if name != "serial_number"}
+            | {"updated_at": func.now()},
+        )
+    # ``sort_by_parameter_order`` would make SQLAlchemy fall back to one INSERT per row on
+    # SQLite, so RETURNING rows are matched up here instead: by serial number (unique within
+    # the batch), and for rows without one by id, which both backends assign in VALUES order.
+    returned = (
+        await session.execute(statement.returning(table.c.equipment_id, table.c.serial_number), values)
+    ).all()
+    by_serial = {row.serial_number: row.equipment_id for row in returned if row.serial_number is not None}
+    unnumbered = iter(sorted(row.equipment_id for row in returned if row.serial_number is None))
+    equipment_ids = [
+        by_serial[items[index].serial_number] if items[index].serial_number else next(unnumbered) for index in accepted
+    ]
+
+    deltas: Counter[CounterKey] = Counter()
+    moves: dict[int, tuple[int, int]] = {}
+    for index, equipment_id in zip(accepted, equipment_ids):
+        item = items[index]
+        previous = existing.get(item.serial_number) if item.serial_number else None
+        if previous is not None:
+            deltas.subtract(equipment_keys(previous.status, previous.department_id, previous.expiry_date))
+            moves[equipment_id] = (previous.department_id, item.department_id)
+        deltas.update(equipment_keys(item.status, item.department_id, item.expiry_date))
+        results[index] = BulkRow(index, "updated" if previous is not None else "created", equipment_id=equipment_id)
+    # Bulk INSERTs bypass the flush listeners that normally maintain the counters, rollups and change log.
+    await session.run_sync(lambda sync_session: apply_counter_deltas(sync_session.connection(), deltas))
+    await session.run_sync(
+        lambda sync_session: apply_rollup_deltas(
+            sync_session.connection(), department_move_deltas(sync_session.connection(), moves)
+        )
+    )
+    await session.run_sync(lambda sync_session: record_changes(sync_session.connection(), Equipment, equipment_ids))
+    return BulkWriteResult(results)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import (
+    CompoundSelect,
+    Integer,
+    Select,
+    Subquery,
+    and_,
+    case,
+    cast,
+    extract,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.types import NullType
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.equipment import EQUIPMENT_FILTER_GROUPS, equipment_filter_clauses, equipment_list_fingerprint
+from app.crud.fingerprint import fetch_fingerprint
+from app.models.department import Department
+from app.models.enums import EquipmentStatus
+from app.models.equipment import Equipment
+from app.models.vendor import Vendor
+from app.search.fts import equipment_match_clause
+
+# Disjoint expiry windows in display order; ``expires_from``/``expires_to`` select one.
+EXPIRY_BUCKETS = ("expired", "due_30_days", "due_90_days", "due_365_days", "later", "no_expiry")
+
+# Facets that always list every option, zero counts included, in this order.
+_FIXED_OPTIONS: dict[str, tuple[Any, ...]] = {"status": tuple(EquipmentStatus), "expiry": EXPIRY_BUCKETS}
+
+_cache = TTLCache(max_entries=settings.equipment_facet_cache_entries)
+
+
+@dataclass(slots=True)
+class FacetValue:
+    value: Any
+    count: int
+    label: str | None = None
+
+
+@dataclass(slots=True)
+class Facet:
+    values: list[FacetValue] = field(default_factory=list)
+    omitted: int = 0
+
+
+@dataclass(slots=True)
+class EquipmentFacets:
+    total: int
+    status: Facet
+    department: Facet
+    vendor: Facet
+    purchase_year: Facet
+    expiry: Facet
+
+
+def _dimensions(today: date) -> dict[str, Any]:
+    return {
+        "status": Equipment.status,
+        "department": Equipment.department_id,
+        "vendor": Equipment.vendor_id,
+        "purchase_year": cast(extract("year", Equipment.purchase_date), Integer),
+        "expiry": case(
+            (Equipment.expiry_date.is_(None), "no_expiry"),
+            (Equipment.expiry_date <= today, "expired"),
+            (Equipment.expiry_date <= today + timedelta(days=30), "due_30_days"),
+            (Equipment.expiry_date <= today + timedelta(days=90), "due_90_days"),
+            (Equipment.expiry_date <= today + timedelta(days=365), "due_365_days"),
+            else_="later",
+        ),
+    }
+
+
+def _scope(dialect_name: str, today: date, search: str | None, filters: dict[str, Any]) -> Subquery:
+    """Facet values of the candidate rows, with one flag per facet: passes every filter but its own."""
+
+    clauses = equipment_filter_clauses(today=today, **filters)
+
+    def passes(excluded: str | None = None) -> Any:
+        kept = [clause for group, group_clauses in clauses.items() if group != excluded for clause in group_clauses]
+        return and_(true(), *kept)
+
+    statement = select(
+        *(expression.label(group) for group, expression in _dimensions(today).items()),
+        *(passes(group).label(f"in_{group}") for group in EQUIPMENT_FILTER_GROUPS),
+        passes().label("in_all"),
+    )
+    active = [group for group, group_clauses in clauses.items() if group_clauses]
+    if len(active) > 1:
+        # Rows failing two filters count nowhere. With one active filter its own facet needs every row.
+        statement = statement.where(or_(*(passes(group) for group in active)))
+    if search:
+        match = equipment_match_clause(dialect_name, search)
+        if match is not None:
+            statement = statement.where(match)
+    return statement.subquery("scope")
+
+
+def _grouping_sets_statement(scope: Subquery) -> Select:
+    dimensions = [scope.c[group] for group in EQUIPMENT_FILTER_GROUPS]
+    return select(
+        func.grouping(*dimensions),
+        *dimensions,
+        *(func.count().filter(scope.c[f"in_{group}"]) for group in EQUIPMENT_FILTER_GROUPS),
+        func.count().filter(scope.c.in_all),
+    ).group_by(func.grouping_sets(*(tuple_(dimension) for dimension in dimensions), tuple_()))
+
+
+def _union_statement(scope: Subquery) -> CompoundSelect:
+    """GROUPING SETS for SQLite: one GROUP BY per facet plus the total, glued with UNION ALL.
+
+    Values come back untyped; the branches mix statuses, ids, years and bucket names.
+    """
+
+    branches = [
+        select(literal(index), type_coerce(scope.c[group], NullType()), func.count().filter(scope.c[f"in_{group}"]))
+        .group_by(scope.c[group])
+        for index, group in enumerate(EQUIPMENT_FILTER_GROUPS)
+    ]
+    branches.append(select(literal(len(EQUIPMENT_FILTER_GROUPS)), null(), func.count().filter(scope.c.in_all)))
+    return union_all(*branches)
+
+
+def _facet(group: str, counts: dict[Any, int], selected: Any) -> Facet:
+    options = _FIXED_OPTIONS.get(group)
+    if options is not None:
+        return Facet(values=[FacetValue(option, counts.get(option, 0)) for option in options])
+    if group == "purchase_year":
+        ordered = sorted(counts, key=lambda year: (year is None, -(year or 0)))
+    else:
+        ordered = sorted(counts, key=lambda value: (-counts[value], value is None, value or 0))
+    listed = ordered[: settings.equipment_facet_limit]
+    if selected is not None and selected in counts and selected not in listed:
+        listed.append(selected)
+    return Facet(
+        values=[FacetValue(value, counts[value]) for value in listed],
+        omitted=len(ordered) - len(listed),
+    )
+
+
+async def count_equipment_facets(
+    session: AsyncSession, *, today: date | None = None, search: str | None = None, **filters: Any
+) -> EquipmentFacets:
+    """Count the options of every equipment facet in one statement.
+
+    A facet's counts apply all filters except its own, so a selected status still shows how
+    many rows every other status would give. PostgreSQL groups with ``GROUPING SETS``,
+    SQLite with a ``UNION ALL`` of per-facet groupings. ``filters`` are the keyword arguments of
+    :func:`app.crud.equipment.equipment_filter_clauses`; ``search`` narrows every facet.
+    """
+
+    today = today or date.today()
+    dialect_name = session.get_bind().dialect.name
+    scope = _scope(dialect_name, today, search, filters)
+    groups = EQUIPMENT_FILTER_GROUPS
+    total_set = len(groups)
+    if dialect_name == "postgresql":
+        # GROUPING() sets the bit of every column the row is not grouped by, first column highest.
+        every_bit = (1 << total_set) - 1
+        set_of = {every_bit ^ (1 << (total_set - 1 - index)): index for index in range(total_set)}
+        set_of[every_bit] = total_set
+        cells = []
+        for row in await session.execute(_grouping_sets_statement(scope)):
+            index = set_of[row[0]]
+            cells.append((index, row[1 + index] if index < total_set else None, row[1 + total_set + index]))
+    else:
+        cells = [tuple(row) for row in await session.execute(_union_statement(scope))]
+        status_set = groups.index("status")
+        # The union is untyped, so statuses arrive as their stored strings.
+        cells = [
+            (index, EquipmentStatus(value) if index == status_set and value is not None else value, count)
+            for index, value, count in cells
+        ]
+
+    total = 0
+    counts: dict[str, dict[Any, int]] = {group: {} for group in groups}
+    for index, value, count in cells:
+        if index == total_set:
+            total = int(count or 0)
+        elif count:
+            counts[groups[index]][value] = int(count)
+
+    selected = {"department": filters.get("department_id"), "vendor": filters.get("vendor_id")}
+    facets = {group: _facet(group, counts[group], selected.get(group)) for group in groups}
+    for group, key, name in (
+        ("department", Department.department_id, Department.department_name),
+        ("vendor", Vendor.vendor_id, Vendor.vendor_name),
+    ):
+        ids = [value.value for value in facets[group].values if value.value is not None]
+        if ids:
+            labels = dict((await session.execute(select(key, name).where(key.in_(ids)))).all())
+            for value in facets[group].values:
+                value.label = labels.get(value.value)
+    return EquipmentFacets(total=total, **facets)
+
+
+def facet_cache_key(today: date, search: str | None, filters: dict[str, Any]) -> str:
+    """Normalise a filter set: unset filters drop out, and searches differing only in case or spacing match."""
+
+    parts = [f"today={today.isoformat()}"]
+    search = " ".join((search or "").split()).casefold()
+    if search:
+        parts.append(f"search={search}")
+    for name, value in sorted(filters.items()):
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, date):
+            value = value.isoformat()
+        parts.append(f"{name}={value}")
+    return "&".join(parts)
+
+
+async def get_equipment_facets(
+    session: AsyncSession,
+    *,
+    version: tuple[Any, ...] | None = None,
+    today: date | None = None,
+    search: str | None = None,
+    **filters: Any,
+) -> EquipmentFacets:
+    """Return :func:`count_equipment_facets`, cached per normalised filter set.
+
+    Entries are reused while the fingerprint of the rows matching ``search`` is unchanged
+    (pass ``version`` when it was already fetched), for at most ``EQUIPMENT_FACET_CACHE_SECONDS``. Sorting
+    and paging are not part of the key, so every page of one listing shares an entry. The
+    key includes ``today``: expiry windows move at midnight even when nothing is written.
+    """
+
+    today = today or date.today()
+    if version is None:
+        statement = equipment_list_fingerprint(session.get_bind().dialect.name, search=search)
+        version = await fetch_fingerprint(session, statement)
+    key = facet_cache_key(today, search, filters)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    facets = await count_equipment_facets(session, today=today, search=search, **filters)
+    _cache.set(key, (version, facets), time.time() + settings.equipment_facet_cache_seconds)
+    return facets
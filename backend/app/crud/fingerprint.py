@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ScalarSelect, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dashboard.counters import (
+    ALL_BUCKET,
+    DEPARTMENT_TOTAL,
+    DISCARD_TOTAL,
+    EQUIPMENT_TOTAL,
+    ISSUE_ARCHIVED,
+    ISSUE_TOTAL,
+)
+from app.models.dashboard_counter import DashboardCounter
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+# Row totals maintained in the same transaction as every write, so reading them is O(1)
+# where COUNT(*) would scan the table.
+_TOTAL_COUNTERS: dict[type, str] = {
+    Equipment: EQUIPMENT_TOTAL,
+    IssueReport: ISSUE_TOTAL,
+    IssueReportArchive: ISSUE_ARCHIVED,
+    DiscardEquipment: DISCARD_TOTAL,
+    Department: DEPARTMENT_TOTAL,
+}
+
+
+def table_version(model: Any) -> tuple[ScalarSelect, ScalarSelect]:
+    """Row count and newest ``updated_at`` of a whole table, as scalar subqueries.
+
+    The pair changes on every insert, delete and ``updated_at``-bumping update. The newest
+    timestamp comes from an ``updated_at`` index and the count from the dashboard counters
+    (``COUNT(*)`` for tables without one, which are small), so both are cheap regardless of
+    table size.
+    """
+
+    metric = _TOTAL_COUNTERS.get(model)
+    if metric is None:
+        count = select(func.count()).select_from(model).scalar_subquery()
+    else:
+        count = (
+            select(DashboardCounter.value)
+            .where(DashboardCounter.metric == metric, DashboardCounter.bucket == ALL_BUCKET)
+            .scalar_subquery()
+        )
+    return count, select(func.max(model.updated_at)).scalar_subquery()
+
+
+def tables_fingerprint(*models: Any) -> Select:
+    """Fingerprint of whole tables, for results computed over all of their rows.
+
+    Any change to one of the tables changes it; the check is O(1) in table size.
+    """
+
+    return select(*(column for model in models for column in table_version(model)))
+
+
+def list_fingerprint(rows: Select, *embedded: Any) -> Select:
+    """Fingerprint for a filtered list: count and newest ``updated_at`` of the rows it selects.
+
+    ``rows`` is the list's filtered projection (it must select an ``updated_at`` column);
+    ``embedded`` are the models whose columns it joins in, versioned by their newest
+    ``updated_at``. Writes to rows outside the filter leave the fingerprint unchanged, and
+    deleting a matching row changes its count even when the counters have drifted.
+    """
+
+    matching = rows.order_by(None).subquery("fingerprint_rows")
+    return select(
+        func.count(),
+        func.max(matching.c.updated_at),
+        *(select(func.max(model.updated_at)).scalar_subquery() for model in embedded),
+    ).select_from(matching)
+
+
+async def fetch_fingerprint(session: AsyncSession, statement: Select) -> tuple[Any, ...] | None:
+    """Run a fingerprint statement; ``None`` means the resource does not exist."""
+
+    row = (await session.execute(statement)).first()
+    return None if row is None else tuple(row)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from sqlalchemy import Row, Select, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.crud.fingerprint import list_fingerprint
+from app.db.pagination import KeysetPage, SortKey, SortOrder, paginate_keyset
+from app.models.department import Department
+from app.models.enums import IssueStatus, IssueType
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.search.fts import issue_match_clause
+
+ISSUE_SORT_KEYS: dict[str, SortKey] = {
+    "issue_id": SortKey(IssueReport.issue_id, IssueReport.issue_id),
+    "status": SortKey(IssueReport.status, IssueReport.issue_id),
+    "date_raised": SortKey(IssueReport.date_raised, IssueReport.issue_id),
+}
+
+
+def _list_columns(model: Any) -> tuple[Any, ...]:
+    return (
+        model.issue_id,
+        model.equipment_id,
+        model.issue_type,
+        model.problem_description,
+        model.media_url,
+        model.date_raised,
+        model.status,
+        model.technician,
+        model.resolved_at,
+        model.created_at,
+        model.updated_at,
+        Equipment.equipment_name,
+        Equipment.serial_number,
+        Equipment.department_id,
+        Department.department_name,
+    )
+
+
+ISSUE_LIST_COLUMNS = _list_columns(IssueReport)
+
+
+def _apply_filters(
+    statement: Select,
+    dialect_name: str,
+    *,
+    status: IssueStatus | None,
+    issue_type: IssueType | None,
+    equipment_id: int | None,
+    search: str | None,
+    model: Any = IssueReport,
+) -> Select:
+    if status is not None:
+        statement = statement.where(model.status == status)
+    if issue_type is not None:
+        statement = statement.where(model.issue_type == issue_type)
+    if equipment_id is not None:
+        statement = statement.where(model.equipment_id == equipment_id)
+    if search:
+        match = issue_match_clause(dialect_name, search, model)
+        if match is not None:
+            statement = statement.where(match)
+    return statement
+
+
+async def list_issues(
+    session: AsyncSession,
+    *,
+    status: IssueStatus | None = None,
+    issue_type: IssueType | None = None,
+    equipment_id: int | None = None,
+    search: str | None = None,
+    sort_by: str = "issue_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+) -> KeysetPage[IssueReport]:
+    """Return a keyset-paginated page of issue reports with their equipment and department loaded."""
+
+    statement = select(IssueReport).options(joinedload(IssueReport.equipment).joinedload(Equipment.department))
+    statement = _apply_filters(
+        statement,
+        session.get_bind().dialect.name,
+        status=status,
+        issue_type=issue_type,
+        equipment_id=equipment_id,
+        search=search,
+    )
+    return await paginate_keyset(
+        session,
+        statement,
+        sort_keys=ISSUE_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+def issue_row_payload(row: Row) -> dict[str, Any]:
+    """Shape a projected issue row like :class:`app.schemas.issue_report.IssueReportRead`."""
+
+    return {
+        "issue_id": row.issue_id,
+        "equipment_id": row.equipment_id,
+        "issue_type": row.issue_type,
+        "problem_description": row.problem_description,
+        "media_url": row.media_url,
+        "date_raised": row.date_raised,
+        "status": row.status,
+        "technician": row.technician,
+        "resolved_at": row.resolved_at,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "equipment": {
+            "equipment_id": row.equipment_id,
+            "equipment_name": row.equipment_name,
+            "serial_number": row.serial_number,
+            "department": {"department_id": row.department_id, "department_name": row.department_name},
+        },
+    }
+
+
+def issue_rows_statement(
+    dialect_name: str,
+    *,
+    status: IssueStatus | None = None,
+    issue_type: IssueType | None = None,
+    equipment_id: int | None = None,
+    search: str | None = None,
+    include_archived: bool = False,
+) -> Select:
+    """Build the filtered :data:`ISSUE_LIST_COLUMNS` projection, without ordering or limits.
+
+    With ``include_archived`` the hot and archive tables are filtered separately and combined
+    with ``UNION ALL``; the result's columns keep the same names.
+    """
+
+    branches = []
+    for model in (IssueReport, IssueReportArchive) if include_archived else (IssueReport,):
+        branch = (
+            select(*_list_columns(model))
+            .join(Equipment, Equipment.equipment_id == model.equipment_id)
+            .join(Department, Department.department_id == Equipment.department_id)
+        )
+        branches.append(
+            _apply_filters(
+                branch,
+                dialect_name,
+                status=status,
+                issue_type=issue_type,
+                equipment_id=equipment_id,
+                search=search,
+                model=model,
+            )
+        )
+    if len(branches) == 1:
+        return branches[0]
+    rows = union_all(*branches).subquery("issue_rows")
+    return select(*rows.c)
+
+
+def issue_sort_keys(statement: Select) -> dict[str, SortKey]:
+    """:data:`ISSUE_SORT_KEYS` for the columns of an :func:`issue_rows_statement` result."""
+
+    columns = statement.selected_columns
+    return {name: SortKey(columns[name], columns.issue_id) for name in ISSUE_SORT_KEYS}
+
+
+async def list_issue_rows(
+    session: AsyncSession,
+    *,
+    status: IssueStatus | None = None,
+    issue_type: IssueType | None = None,
+    equipment_id: int | None = None,
+    search: str | None = None,
+    sort_by: str = "issue_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+    include_archived: bool = False,
+) -> KeysetPage[dict[str, Any]]:
+    """Like :func:`list_issues`, but project columns into response-ready dicts.
+
+    Archived reports are merged in (in sort order) only with ``include_archived``.
+    """
+
+    statement = issue_rows_statement(
+        session.get_bind().dialect.name,
+        status=status,
+        issue_type=issue_type,
+        equipment_id=equipment_id,
+        search=search,
+        include_archived=include_archived,
+    )
+    page = await paginate_keyset(
+        session,
+        statement,
+        sort_keys=issue_sort_keys(statement) if include_archived else ISSUE_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+        scalars=False,
+    )
+    return replace(page, items=[issue_row_payload(row) for row in page.items])
+
+
+def issue_list_fingerprint(
+    dialect_name: str,
+    *,
+    status: IssueStatus | None = None,
+    issue_type: IssueType | None = None,
+    equipment_id: int | None = None,
+    search: str | None = None,
+    include_archived: bool = False,
+) -> Select:
+    """Version of the reports matching the filters and of the equipment and department columns the list embeds."""
+
+    rows = issue_rows_statement(
+        dialect_name,
+        status=status,
+        issue_type=issue_type,
+        equipment_id=equipment_id,
+        search=search,
+        include_archived=include_archived,
+    )
+    return list_fingerprint(rows, Equipment, Department)
+
+
+def issue_detail_fingerprint(issue_id: int, model: Any = IssueReport) -> Select:
+    """``updated_at`` of one issue report (hot or archived), its equipment and the equipment's department."""
+
+    return (
+        select(model.updated_at, Equipment.updated_at, Department.updated_at)
+        .select_from(model)
+        .join(Equipment, Equipment.equipment_id == model.equipment_id)
+        .join(Department, Department.department_id == Equipment.department_id)
+        .where(model.issue_id == issue_id)
+    )
+
+
+async def get_issue(session: AsyncSession, issue_id: int, model: Any = IssueReport) -> Any | None:
+    """Load one issue report (or archived report) with its equipment and the equipment's department."""
+
+    statement = (
+        select(model)
+        .where(model.issue_id == issue_id)
+        .options(joinedload(model.equipment).joinedload(Equipment.department))
+    )
+    return (await session.execute(statement)).scalar_one_or_none()
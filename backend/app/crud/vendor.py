@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.pagination import KeysetPage, SortKey, SortOrder, paginate_keyset
+from app.models.vendor import Vendor
+
+VENDOR_SORT_KEYS: dict[str, SortKey] = {
+    "vendor_id": SortKey(Vendor.vendor_id, Vendor.vendor_id),
+    "vendor_name": SortKey(Vendor.vendor_name, Vendor.vendor_id),
+}
+
+
+async def list_vendors(
+    session: AsyncSession,
+    *,
+    category: str | None = None,
+    sort_by: str = "vendor_id",
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+) -> KeysetPage[Vendor]:
+    """Return a keyset-paginated page of vendors."""
+
+    statement = select(Vendor)
+    if category is not None:
+        statement = statement.where(Vendor.category == category)
+
+    return await paginate_keyset(
+        session,
+        statement,
+        sort_keys=VENDOR_SORT_KEYS,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        cursor=cursor,
+        page_size=page_size,
+    )
+
+
+async def list_vendor_refs(session: AsyncSession) -> list[dict[str, Any]]:
+    """Return every vendor as ``{vendor_id, vendor_name, category}``, ordered by name, for pickers."""
+
+    rows = await session.execute(
+        select(Vendor.vendor_id, Vendor.vendor_name, Vendor.category).order_by(Vendor.vendor_name, Vendor.vendor_id)
+    )
+    return [dict(row) for row in rows.mappings()]
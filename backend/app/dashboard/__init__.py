@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from app.dashboard.counters import apply_counter_deltas, collect_flush_deltas
+from app.dashboard.live import DashboardBroker, dashboard_broker
+from app.dashboard.rollups import apply_rollup_deltas, collect_rollup_deltas, verify_issue_rollups
+from app.dashboard.stats import get_dashboard_stats, rebuild_counters, verify_counters
+from app.dashboard.trends import issue_trend
+
+__all__ = [
+    "DashboardBroker",
+    "apply_counter_deltas",
+    "apply_rollup_deltas",
+    "collect_flush_deltas",
+    "collect_rollup_deltas",
+    "dashboard_broker",
+    "get_dashboard_stats",
+    "issue_trend",
+    "rebuild_counters",
+    "verify_counters",
+    "verify_issue_rollups",
+]
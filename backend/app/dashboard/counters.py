@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+from typing import Any, Iterable
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db.engine import dialect_insert
+from app.models.dashboard_counter import DashboardCounter
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+CounterKey = tuple[str, str]
+
+EQUIPMENT_TOTAL = "equipment.total"
+EQUIPMENT_STATUS = "equipment.status"
+EQUIPMENT_DEPARTMENT = "equipment.department"
+EQUIPMENT_EXPIRY_MONTH = "equipment.expiry_month"
+ISSUE_TOTAL = "issue.total"
+ISSUE_STATUS = "issue.status"
+ISSUE_ARCHIVED = "issue.archived"
+DISCARD_TOTAL = "discard.total"
+DEPARTMENT_TOTAL = "department.total"
+
+ALL_BUCKET = "all"
+NO_EXPIRY_BUCKET = "none"
+
+# session.info key: {key: (delta, version)} written by the last flush, for app.dashboard.live.
+FLUSH_COUNTERS_KEY = "dashboard_counter_flush"
+
+_TRACKED_ATTRIBUTES: dict[type, tuple[str, ...]] = {
+    Equipment: ("status", "department_id", "expiry_date"),
+    IssueReport: ("status",),
+    IssueReportArchive: (),
+    DiscardEquipment: (),
+    Department: (),
+}
+
+
+def expiry_bucket(expiry_date: date | None) -> str:
+    """Return the counter bucket (``YYYY-MM`` or ``none``) for an expiry date."""
+
+    if expiry_date is None:
+        return NO_EXPIRY_BUCKET
+    return f"{expiry_date.year:04d}-{expiry_date.month:02d}"
+
+
+def _bucket(value: Any) -> str:
+    return str(getattr(value, "value", value))
+
+
+def equipment_keys(status: Any, department_id: int, expiry_date: date | None) -> list[CounterKey]:
+    """Counter keys an equipment row with the given attributes contributes to."""
+
+    return [
+        (EQUIPMENT_TOTAL, ALL_BUCKET),
+        (EQUIPMENT_STATUS, _bucket(status)),
+        (EQUIPMENT_DEPARTMENT, _bucket(department_id)),
+        (EQUIPMENT_EXPIRY_MONTH, expiry_bucket(expiry_date)),
+    ]
+
+
+def issue_keys(status: Any) -> list[CounterKey]:
+    """Counter keys an issue report with the given status contributes to."""
+
+    return [(ISSUE_TOTAL, ALL_BUCKET), (ISSUE_STATUS, _bucket(status))]
+
+
+def _keys_for(obj: Any, values: dict[str, Any]) -> list[CounterKey]:
+    if isinstance(obj, Equipment):
+        return equipment_keys(values["status"], values["department_id"], values["expiry_date"])
+    if isinstance(obj, IssueReport):
+        return issue_keys(values["status"])
+    if isinstance(obj, IssueReportArchive):
+        return [(ISSUE_ARCHIVED, ALL_BUCKET)]
+    if isinstance(obj, DiscardEquipment):
+        return [(DISCARD_TOTAL, ALL_BUCKET)]
+    return [(DEPARTMENT_TOTAL, ALL_BUCKET)]
+
+
+def attribute_values(obj: Any, attributes: Iterable[str], *, previous: bool) -> dict[str, Any]:
+    """Values of ``attributes`` on ``obj`` before (``previous``) or after the pending flush."""
+
+    state = inspect(obj)
+    values: dict[str, Any] = {}
+    for name in attributes:
+        history = state.attrs[name].history
+        if previous and history.deleted:
+            values[name] = history.deleted[0]
+        elif previous and history.unchanged:
+            values[name] = history.unchanged[0]
+        elif previous and history.added:
+            # Scalar history records no deleted value when the attribute was None.
+            values[name] = None
+        else:
+            values[name] = getattr(obj, name)
+    return values
+
+
+def collect_flush_deltas(session: Session) -> Counter[CounterKey]:
+    """Compute counter deltas for the pending flush of ``session``.
+
+    Must run while the session still reports its pre-flush state, i.e. in ``after_flush``.
+    """
+
+    deltas: Counter[CounterKey] = Counter()
+    for obj in session.new:
+        attributes = _TRACKED_ATTRIBUTES.get(type(obj))
+        if attributes is not None:
+            deltas.update(_keys_for(obj, attribute_values(obj, attributes, previous=False)))
+    for obj in session.deleted:
+        attributes = _TRACKED_ATTRIBUTES.get(type(obj))
+        if attributes is not None:
+            deltas.subtract(_keys_for(obj, attribute_values(obj, attributes, previous=True)))
+    for obj in session.dirty:
+        attributes = _TRACKED_ATTRIBUTES.get(type(obj))
+        if not attributes or not session.is_modified(obj, include_collections=False):
+            continue
+        deltas.subtract(_keys_for(obj, attribute_values(obj, attributes, previous=True)))
+        deltas.update(_keys_for(obj, attribute_values(obj, attributes, previous=False)))
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+def apply_counter_deltas(
+    connection: Connection, deltas: Counter[CounterKey] | dict[CounterKey, int]
+) -> dict[CounterKey, int]:
+    """Add ``deltas`` to the stored counters with a single multi-row upsert.
+
+    Bulk Core statements bypass the ORM flush listener, so code issuing them must call this
+    directly inside the same transaction. Returns the new ``version`` of every updated row.
+    """
+
+    rows = [
+        {"metric": metric, "bucket": bucket, "value": delta, "version": 1}
+        for (metric, bucket), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return {}
+    table = DashboardCounter.__table__
+    statement = dialect_insert(connection.dialect.name)(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.metric, table.c.bucket],
+        set_={
+            "value": table.c.value + statement.excluded.value,
+            "version": table.c.version + 1,
+            "updated_at": func.now(),
+        },
+    ).returning(table.c.metric, table.c.bucket, table.c.version)
+    return {(metric, bucket): version for metric, bucket, version in connection.execute(statement)}
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_dashboard_counters(session: Session, flush_context: Any) -> None:
+    deltas = collect_flush_deltas(session)
+    versions = apply_counter_deltas(session.connection(), deltas) if deltas else {}
+    session.info[FLUSH_COUNTERS_KEY] = {key: (delta, versions[key]) for key, delta in deltas.items()}
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.dashboard.counters import FLUSH_COUNTERS_KEY, CounterKey
+from app.dashboard.stats import read_counter_versions
+from app.db.session import AsyncSessionLocal
+from app.jobs.expiry import EXPIRY_ALERTS_JOB
+from app.jobs.state import load_job_state
+from app.models.issue_report import IssueReport
+
+logger = logging.getLogger("app.dashboard.live")
+
+_PENDING_KEY = "live_dashboard"
+# Queued in place of a dropped backlog; real frames are never empty.
+_RESYNC = b""
+_MAX_ISSUES_PER_FRAME = 50
+_RECENT_ISSUE_IDS = 1024
+
+
+def issue_event(issue: Any) -> dict[str, Any]:
+    """The fields of a new issue report pushed to dashboards."""
+
+    return {
+        "issue_id": issue.issue_id,
+        "equipment_id": issue.equipment_id,
+        "issue_type": str(getattr(issue.issue_type, "value", issue.issue_type)),
+        "status": str(getattr(issue.status, "value", issue.status)),
+        "date_raised": issue.date_raised.isoformat() if issue.date_raised else None,
+    }
+
+
+def expiry_totals(alerts: dict[str, Any]) -> dict[str, Any]:
+    """Reduce stored expiry alert sets to the per-window totals pushed to dashboards."""
+
+    windows = alerts.get("windows") or {}
+    return {
+        "computed_for": alerts.get("computed_for"),
+        "windows": {window: alert["total"] for window, alert in windows.items()},
+    }
+
+
+def _nested(counters: dict[CounterKey, int]) -> dict[str, dict[str, int]]:
+    nested: dict[str, dict[str, int]] = {}
+    for (metric, bucket), value in sorted(counters.items()):
+        nested.setdefault(metric, {})[bucket] = value
+    return nested
+
+
+@dataclass(eq=False, slots=True)
+class _Client:
+    queue: asyncio.Queue[bytes]
+
+
+class DashboardBroker:
+    """Fan dashboard changes out to Server-Sent Events subscribers of this worker.
+
+    Committed ORM writes report their counter deltas and new issue reports through
+    :meth:`publish`. Changes are coalesced for ``coalesce_seconds`` and sent as one
+    ``delta`` frame carrying the *new values* of the changed counters, so a client that
+    misses frames is repaired by the next one that touches the same bucket.
+
+    Every ``reconcile_seconds`` the broker re-reads ``dashboard_counter``, the expiry alert
+    totals and issue reports newer than the last one seen, and pushes whatever differs. That
+    covers writes no listener sees: Core bulk statements, background jobs and other workers.
+    Each delta carries the row version its commit produced; one at or below the version
+    the last read saw is already part of that read and is dropped, however late it arrives.
+
+    Each client has a queue of ``queue_size`` frames. A client that falls that far behind
+    (slow network, suspended tab) has its backlog dropped and gets a fresh ``snapshot``
+    instead, so one slow reader never holds memory or delays the others. Clients are plain
+    coroutines waiting on their queue; idle connections cost no thread and no polling.
+    """
+
+    def __init__(
+        self,
+        *,
+        coalesce_seconds: float,
+        reconcile_seconds: float,
+        queue_size: int,
+        max_clients: int,
+    ) -> None:
+        self.coalesce_seconds = coalesce_seconds
+        self.reconcile_seconds = reconcile_seconds
+        self.queue_size = queue_size
+        self.max_clients = max_clients
+        self.frames = 0
+        self.resyncs = 0
+        self.reconciles = 0
+        self._clients: set[_Client] = set()
+        self._counters: dict[CounterKey, int] | None = None
+        self._expiry: dict[str, Any] | None = None
+        self._issue_cursor = 0
+        self._recent_issues: deque[int] = deque(maxlen=_RECENT_ISSUE_IDS)
+        self._versions: dict[CounterKey, int] = {}
+        self._pending_counters: list[tuple[CounterKey, int, int]] = []
+        self._pending_values: dict[CounterKey, int] = {}
+        self._pending_issues: list[dict[str, Any]] = []
+        self._pending_expiry: dict[str, Any] | None = None
+        self._sequence = 0
+        self._reconciled_at = 0.0
+        self._reconcile_lock = asyncio.Lock()
+        self._changed: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self._clients)
+
+    # -- lifecycle -----------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the coalescing loop on the running event loop (application startup)."""
+
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name="dashboard-live")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Wakes every subscriber; seeing the broker stopped, they end their streams.
+        for client in self._clients:
+            self._drop_backlog(client)
+        self._clients.clear()
+
+    # -- producers -----------------------------------------------------------------------
+
+    def publish(
+        self,
+        *,
+        counters: dict[CounterKey, tuple[int, int]] | None = None,
+        issues: Iterable[dict[str, Any]] = (),
+        expiry: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue committed changes for the next frame; safe to call from any thread.
+
+        ``counters`` maps each changed counter to ``(delta, version)``, the row version the
+        committing transaction left behind.
+        """
+
+        if self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        issues = list(issues)
+        if running is self._loop:
+            self._merge(counters, issues, expiry)
+        else:
+            self._loop.call_soon_threadsafe(self._merge, counters, issues, expiry)
+
+    def _merge(
+        self,
+        counters: dict[CounterKey, tuple[int, int]] | None,
+        issues: list[dict[str, Any]],
+        expiry: dict[str, Any] | None,
+    ) -> None:
+        if counters:
+            self._pending_counters.extend((key, delta, version) for key, (delta, version) in counters.items())
+        for issue in issues:
+            self._recent_issues.append(issue["issue_id"])
+        self._pending_issues.extend(issues)
+        if expiry is not None:
+            self._pending_expiry = expiry
+        if self._changed is not None:
+            self._changed.set()
+
+    # -- loop ----------------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        assert self._changed is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), self.reconcile_seconds)
+                # Let a burst of commits land before sending one frame for all of them.
+                await asyncio.sleep(self.coalesce_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            try:
+                if self._clients and time.monotonic() - self._reconciled_at >= self.reconcile_seconds:
+                    await self._reconcile()
+                self._flush()
+            except Exception:  # noqa: BLE001 - keep pushing after a transient database error
+                logger.exception("dashboard push cycle failed")
+
+    async def _reconcile(self) -> None:
+        async with self._reconcile_lock:
+            # The primary, like every read behind the dashboard counters.
+            async with AsyncSessionLocal() as session:
+                stored = await read_counter_versions(session)
+                alerts = await load_job_state(session, EXPIRY_ALERTS_JOB)
+                if self._counters is None:
+                    self._issue_cursor = await session.scalar(select(func.coalesce(func.max(IssueReport.issue_id), 0)))
+                    issues = []
+                else:
+                    issues = (
+                        await session.scalars(
+                            select(IssueReport)
+                            .where(IssueReport.issue_id > self._issue_cursor)
+                            .order_by(IssueReport.issue_id)
+                            .limit(_MAX_ISSUES_PER_FRAME)
+                        )
+                    ).all()
+            self.reconciles += 1
+            self._reconciled_at = time.monotonic()
+            counters = {key: value for key, (value, _) in stored.items()}
+            # Pending deltas at or below these versions are part of the read; _flush drops them.
+            self._versions = {key: version for key, (_, version) in stored.items()}
+            if self._counters is None:
+                self._counters = counters
+                self._expiry = expiry_totals(alerts)
+                return
+            for key in set(self._counters) | set(counters):
+                value = counters.get(key, 0)
+                if self._counters.get(key, 0) != value:
+                    self._pending_values[key] = value
+            expiry = expiry_totals(alerts)
+            if expiry != self._expiry:
+                self._pending_expiry = expiry
+            if issues:
+                self._issue_cursor = issues[-1].issue_id
+                seen = set(self._recent_issues)
+                self._pending_issues.extend(issue_event(issue) for issue in issues if issue.issue_id not in seen)
+
+    def _flush(self) -> None:
+        if self._reconcile_lock.locked():
+            # A read is in flight; which pending deltas it includes is known once it returns.
+            if self._changed is not None:
+                self._changed.set()
+            return
+        counters, self._pending_counters = self._pending_counters, []
+        values, self._pending_values = self._pending_values, {}
+        issues, self._pending_issues = self._pending_issues, []
+        expiry, self._pending_expiry = self._pending_expiry, None
+        if not self._clients or self._counters is None:
+            return
+        changed: dict[CounterKey, int] = {}
+        for key, value in values.items():
+            changed[key] = self._counters[key] = value
+        for key, delta, version in counters:
+            if delta and version > self._versions.get(key, 0):
+                changed[key] = self._counters[key] = self._counters.get(key, 0) + delta
+        payload: dict[str, Any] = {}
+        if changed:
+            payload["counters"] = _nested(changed)
+        if issues:
+            payload["issues"] = issues[-_MAX_ISSUES_PER_FRAME:]
+            if len(issues) > _MAX_ISSUES_PER_FRAME:
+                payload["issues_omitted"] = len(issues) - _MAX_ISSUES_PER_FRAME
+        if expiry is not None and expiry != self._expiry:
+            payload["expiry"] = self._expiry = expiry
+        if payload:
+            self._broadcast(self._frame("delta", payload))
+
+    # -- consumers -----------------------------------------------------------------------
+
+    def _frame(self, name: str, payload: dict[str, Any]) -> bytes:
+        self._sequence += 1
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (self._sequence, name.encode(), orjson.dumps(payload))
+
+    def _snapshot(self) -> bytes:
+        return self._frame("snapshot", {"counters": _nested(self._counters or {}), "expiry": self._expiry})
+
+    def _broadcast(self, frame: bytes) -> None:
+        self.frames += 1
+        for client in self._clients:
+            try:
+                client.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop_backlog(client)
+
+    def _drop_backlog(self, client: _Client) -> None:
+        while not client.queue.empty():
+            client.queue.get_nowait()
+        client.queue.put_nowait(_RESYNC)
+        self.resyncs += 1
+
+    def has_capacity(self) -> bool:
+        return len(self._clients) < self.max_clients
+
+    async def subscribe(self, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+        """Yield SSE frames for one client: a ``snapshot``, then ``delta`` frames and heartbeats."""
+
+        if self._counters is None or time.monotonic() - self._reconciled_at >= self.reconcile_seconds:
+            await self._reconcile()
+        client = _Client(queue=asyncio.Queue(maxsize=self.queue_size))
+        self._clients.add(client)
+        try:
+            yield b"retry: %d\n\n" % int(self.reconcile_seconds * 1000)
+            yield self._snapshot()
+            while True:
+                try:
+                    frame = await asyncio.wait_for(client.queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing idle connections and surfaces dead peers.
+                    yield b": ping\n\n"
+                    continue
+                if frame == _RESYNC:
+                    if self._task is None:
+                        return
+                    yield self._snapshot()
+                else:
+                    yield frame
+        finally:
+            self._clients.discard(client)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "frames": self.frames,
+            "resyncs": self.resyncs,
+            "reconciles": self.reconciles,
+            "coalesce_seconds": self.coalesce_seconds,
+            "reconcile_seconds": self.reconcile_seconds,
+        }
+
+
+dashboard_broker = DashboardBroker(
+    coalesce_seconds=settings.dashboard_push_coalesce_seconds,
+    reconcile_seconds=settings.dashboard_push_reconcile_seconds,
+    queue_size=settings.dashboard_push_client_queue,
+    max_clients=settings.dashboard_push_max_clients,
+)
+
+
+# Registered after app.dashboard.counters' listener (imported above), which leaves the
+# flush's deltas and their row versions in session.info.
+@event.listens_for(Session, "after_flush")
+def _collect_live_changes(session: Session, flush_context: Any) -> None:
+    counters = session.info.pop(FLUSH_COUNTERS_KEY, None) or {}
+    if not dashboard_broker.active:
+        return
+    issues = [issue_event(obj) for obj in session.new if type(obj) is IssueReport]
+    if counters or issues:
+        pending = session.info.setdefault(_PENDING_KEY, ({}, []))
+        for key, (delta, version) in counters.items():
+            # Row locks are held to commit, so the transaction's last version covers every flush.
+            previous = pending[0].get(key, (0, 0))[0]
+            pending[0][key] = (previous + delta, version)
+        pending[1].extend(issues)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_live_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        dashboard_broker.publish(counters=pending[0], issues=pending[1])
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_live_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import event, func, select, union_all
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.dashboard.counters import attribute_values
+from app.db.engine import dialect_insert
+from app.models.equipment import Equipment
+from app.models.issue_daily_rollup import IssueDailyRollup
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.models.job_state import JobState
+
+RollupKey = tuple[date, str, str, int]
+RollupDeltas = Counter[tuple[RollupKey, str]]
+
+RAISED = "raised"
+RESOLVED = "resolved"
+RESOLUTION_SECONDS = "resolution_seconds"
+ROLLUP_FIELDS = (RAISED, RESOLVED, RESOLUTION_SECONDS)
+
+ROLLUP_BACKFILL_JOB = "issue_rollup_backfill"
+
+_ISSUE_ATTRIBUTES = ("equipment_id", "issue_type", "status", "date_raised", "resolved_at")
+_ISSUE_MODELS = (IssueReport, IssueReportArchive)
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns; values are stored in UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _bucket(value: Any) -> str:
+    return str(getattr(value, "value", value))
+
+
+def issue_contributions(
+    department_id: int,
+    issue_type: Any,
+    status: Any,
+    date_raised: datetime | None,
+    resolved_at: datetime | None,
+) -> RollupDeltas:
+    """Rollup cells one issue report with these values adds to."""
+
+    contributions: RollupDeltas = Counter()
+    raised = _utc(date_raised) if date_raised is not None else datetime.now(timezone.utc)
+    issue_type, status = _bucket(issue_type), _bucket(status)
+    contributions[((raised.date(), issue_type, status, department_id), RAISED)] += 1
+    if resolved_at is not None:
+        resolved = _utc(resolved_at)
+        key = (resolved.date(), issue_type, status, department_id)
+        contributions[(key, RESOLVED)] += 1
+        contributions[(key, RESOLUTION_SECONDS)] += max(0, int((resolved - raised).total_seconds()))
+    return contributions
+
+
+def apply_rollup_deltas(connection: Connection, deltas: RollupDeltas) -> None:
+    """Add ``deltas`` to the stored rollups with one executemany upsert.
+
+    A backfill batch touches thousands of cells, so the rows are passed as parameter sets
+    to a single cached statement rather than compiled into one ``VALUES`` list. Like
+    :func:`app.dashboard.counters.apply_counter_deltas`, code that writes issue reports with
+    Core statements must call this itself inside the same transaction.
+    """
+
+    cells: dict[RollupKey, dict[str, int]] = {}
+    for (key, field), delta in deltas.items():
+        if delta:
+            cells.setdefault(key, dict.fromkeys(ROLLUP_FIELDS, 0))[field] = delta
+    if not cells:
+        return
+    rows = [
+        {"day": day, "issue_type": issue_type, "status": status, "department_id": department_id, **values}
+        for (day, issue_type, status, department_id), values in sorted(cells.items())
+    ]
+    table = IssueDailyRollup.__table__
+    statement = dialect_insert(connection.dialect.name)(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.day, table.c.issue_type, table.c.status, table.c.department_id],
+        set_={
+            **{field: table.c[field] + statement.excluded[field] for field in ROLLUP_FIELDS},
+            "updated_at": func.now(),
+        },
+    )
+    connection.execute(statement, rows)
+
+
+def backfill_window(connection: Connection) -> tuple[int, int] | None:
+    """``(cursor, upper)`` while a backfill is in progress, else ``None``.
+
+    Issues with ids in ``(cursor, upper]`` are not rolled up yet: the backfill will read their
+    state when it gets there, so writes to them must not be applied as deltas meanwhile.
+    """
+
+    state = connection.scalar(select(JobState.state).where(JobState.job_name == ROLLUP_BACKFILL_JOB))
+    if not state or state.get("complete") or "upper" not in state:
+        return None
+    return int(state.get("cursor", 0)), int(state["upper"])
+
+
+def _equipment_departments(session: Session, equipment_ids: set[int]) -> tuple[dict[int, int], dict[int, int]]:
+    """Department of each equipment id before and after the flush."""
+
+    after: dict[int, int] = {}
+    if equipment_ids:
+        after = dict(
+            session.connection()
+            .execute(
+                select(Equipment.equipment_id, Equipment.department_id).where(Equipment.equipment_id.in_(equipment_ids))
+            )
+            .all()
+        )
+    before = dict(after)
+    for obj in (*session.deleted, *session.dirty):
+        if isinstance(obj, Equipment):
+            before[obj.equipment_id] = attribute_values(obj, ("department_id",), previous=True)["department_id"]
+    return before, after
+
+
+def department_move_deltas(
+    connection: Connection,
+    moves: dict[int, tuple[int, int]],
+    *,
+    exclude_issue_ids: Iterable[int] = (),
+) -> RollupDeltas:
+    """Deltas moving the issues of equipment ``{equipment_id: (old, new department)}`` over.
+
+    Issues the backfill has not reached yet are left alone. Code that reassigns departments
+    with Core statements must apply these itself.
+    """
+
+    moves = {equipment_id: (old, new) for equipment_id, (old, new) in moves.items() if old != new}
+    deltas: RollupDeltas = Counter()
+    if not moves:
+        return deltas
+    window = backfill_window(connection)
+    excluded = list(exclude_issue_ids)
+    branches = []
+    # Archived issues still count towards the rollups of their equipment's department.
+    for model in _ISSUE_MODELS:
+        branch = select(
+            model.issue_id, model.equipment_id, model.issue_type, model.status, model.date_raised, model.resolved_at
+        ).where(model.equipment_id.in_(moves))
+        if excluded:
+            branch = branch.where(model.issue_id.not_in(excluded))
+        branches.append(branch)
+    statement = union_all(*branches)
+    for row in connection.execute(statement):
+        if window and window[0] < row.issue_id <= window[1]:
+            continue
+        old, new = moves[row.equipment_id]
+        deltas.subtract(issue_contributions(old, row.issue_type, row.status, row.date_raised, row.resolved_at))
+        deltas.update(issue_contributions(new, row.issue_type, row.status, row.date_raised, row.resolved_at))
+    return deltas
+
+
+def collect_rollup_deltas(session: Session) -> RollupDeltas:
+    """Compute rollup deltas for the flush that just ran on ``session`` (call in ``after_flush``).
+
+    Besides inserted, deleted and edited issue reports (hot or archived), equipment moved to
+    another department carries its untouched issues' cells over with it.
+    """
+
+    changes: list[tuple[Any, dict[str, Any] | None, dict[str, Any] | None]] = []
+    for obj in session.new:
+        if isinstance(obj, _ISSUE_MODELS):
+            changes.append((obj, None, attribute_values(obj, _ISSUE_ATTRIBUTES, previous=False)))
+    for obj in session.deleted:
+        if isinstance(obj, _ISSUE_MODELS):
+            changes.append((obj, attribute_values(obj, _ISSUE_ATTRIBUTES, previous=True), None))
+    for obj in session.dirty:
+        if isinstance(obj, _ISSUE_MODELS) and session.is_modified(obj, include_collections=False):
+            before = attribute_values(obj, _ISSUE_ATTRIBUTES, previous=True)
+            after = attribute_values(obj, _ISSUE_ATTRIBUTES, previous=False)
+            if before != after:
+                changes.append((obj, before, after))
+    moved = [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, Equipment)
+        and session.is_modified(obj, include_collections=False)
+        and attribute_values(obj, ("department_id",), previous=True) != {"department_id": obj.department_id}
+    ]
+    if not changes and not moved:
+        return Counter()
+
+    connection = session.connection()
+    window = backfill_window(connection)
+
+    def rolled_up(issue_id: int) -> bool:
+        return window is None or issue_id <= window[0] or issue_id > window[1]
+
+    equipment_ids = {values["equipment_id"] for _, *states in changes for values in states if values is not None}
+    equipment_ids.update(obj.equipment_id for obj in moved)
+    departments_before, departments_after = _equipment_departments(session, equipment_ids)
+
+    deltas: RollupDeltas = Counter()
+    for obj, before, after in changes:
+        if not rolled_up(obj.issue_id):
+            continue
+        if before is not None and before["equipment_id"] in departments_before:
+            department_id = departments_before[before["equipment_id"]]
+            deltas.subtract(
+                issue_contributions(
+                    department_id, before["issue_type"], before["status"], before["date_raised"], before["resolved_at"]
+                )
+            )
+        if after is not None:
+            department_id = departments_after[after["equipment_id"]]
+            deltas.update(
+                issue_contributions(
+                    department_id, after["issue_type"], after["status"], after["date_raised"], after["resolved_at"]
+                )
+            )
+
+    moves = {
+        obj.equipment_id: (departments_before[obj.equipment_id], departments_after[obj.equipment_id]) for obj in moved
+    }
+    changed_ids = [obj.issue_id for obj, _, _ in changes]
+    deltas.update(department_move_deltas(connection, moves, exclude_issue_ids=changed_ids))
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+def _keep_previous_value(target: Any, value: Any, oldvalue: Any, initiator: Any) -> None:
+    pass
+
+
+# Assigning to an unloaded attribute (e.g. ``resolved_at`` right after the insert flushed)
+# normally records no previous value; active history loads it first so the delta can be
+# subtracted from the right cell.
+for _attribute in (*(getattr(IssueReport, name) for name in _ISSUE_ATTRIBUTES), Equipment.department_id):
+    event.listen(_attribute, "set", _keep_previous_value, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_issue_rollups(session: Session, flush_context: Any) -> None:
+    deltas = collect_rollup_deltas(session)
+    if deltas:
+        apply_rollup_deltas(session.connection(), deltas)
+
+
+def verify_issue_rollups(connection: Connection) -> dict[tuple[str, str, int, str], tuple[int, int]]:
+    """Compare rollup totals per issue type, status and department with the issue tables.
+
+    Returns ``{(issue_type, status, department_id, field): (stored, actual)}`` for ``raised``
+    and ``resolved`` totals that disagree. Day placement is not checked, which keeps this a
+    pair of grouped scans instead of a full recomputation.
+    """
+
+    stored: Counter[tuple[str, str, int, str]] = Counter()
+    for issue_type, status, department_id, raised, resolved in connection.execute(
+        select(
+            IssueDailyRollup.issue_type,
+            IssueDailyRollup.status,
+            IssueDailyRollup.department_id,
+            func.sum(IssueDailyRollup.raised),
+            func.sum(IssueDailyRollup.resolved),
+        ).group_by(IssueDailyRollup.issue_type, IssueDailyRollup.status, IssueDailyRollup.department_id)
+    ):
+        stored[(issue_type, status, department_id, RAISED)] += int(raised)
+        stored[(issue_type, status, department_id, RESOLVED)] += int(resolved)
+
+    issues = union_all(
+        *(
+            select(model.equipment_id, model.issue_type, model.status, model.resolved_at)
+            for model in _ISSUE_MODELS
+        )
+    ).subquery()
+    actual: Counter[tuple[str, str, int, str]] = Counter()
+    for issue_type, status, department_id, raised, resolved in connection.execute(
+        select(
+            issues.c.issue_type,
+            issues.c.status,
+            Equipment.department_id,
+            func.count(),
+            func.count(issues.c.resolved_at),
+        )
+        .join(Equipment, Equipment.equipment_id == issues.c.equipment_id)
+        .group_by(issues.c.issue_type, issues.c.status, Equipment.department_id)
+    ):
+        actual[(_bucket(issue_type), _bucket(status), department_id, RAISED)] += raised
+        actual[(_bucket(issue_type), _bucket(status), department_id, RESOLVED)] += resolved
+
+    return {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(set(stored) | set(actual))
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
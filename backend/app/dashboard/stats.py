@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dashboard.counters import (
+    ALL_BUCKET,
+    DEPARTMENT_TOTAL,
+    DISCARD_TOTAL,
+    EQUIPMENT_DEPARTMENT,
+    EQUIPMENT_EXPIRY_MONTH,
+    EQUIPMENT_STATUS,
+    EQUIPMENT_TOTAL,
+    ISSUE_ARCHIVED,
+    ISSUE_STATUS,
+    ISSUE_TOTAL,
+    NO_EXPIRY_BUCKET,
+    CounterKey,
+    expiry_bucket,
+)
+from app.db.engine import dialect_insert
+from app.models.dashboard_counter import DashboardCounter
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+
+async def read_counters(session: AsyncSession) -> dict[CounterKey, int]:
+    """Load every stored counter. The table holds one row per bucket, not per entity."""
+
+    result = await session.execute(select(DashboardCounter.metric, DashboardCounter.bucket, DashboardCounter.value))
+    return {(metric, bucket): value for metric, bucket, value in result.all()}
+
+
+async def read_counter_versions(session: AsyncSession) -> dict[CounterKey, tuple[int, int]]:
+    """Like :func:`read_counters`, with each value's ``version``: ``{key: (value, version)}``."""
+
+    result = await session.execute(
+        select(DashboardCounter.metric, DashboardCounter.bucket, DashboardCounter.value, DashboardCounter.version)
+    )
+    return {(metric, bucket): (value, version) for metric, bucket, value, version in result.all()}
+
+
+async def get_dashboard_stats(session: AsyncSession, today: date | None = None) -> dict[str, object]:
+    """Return dashboard metrics from the maintained counters.
+
+    Only the current month's expired equipment needs a row count; it is a bounded range
+    scan on ``ix_equipment_expiry_date``.
+    """
+
+    today = today or date.today()
+    counters = await read_counters(session)
+
+    def metric(name: str) -> dict[str, int]:
+        return {bucket: value for (key, bucket), value in counters.items() if key == name and value}
+
+    current_month = expiry_bucket(today)
+    expired = sum(
+        value
+        for bucket, value in metric(EQUIPMENT_EXPIRY_MONTH).items()
+        if bucket != NO_EXPIRY_BUCKET and bucket < current_month
+    )
+    expired += await session.scalar(
+        select(func.count())
+        .select_from(Equipment)
+        .where(Equipment.expiry_date >= today.replace(day=1), Equipment.expiry_date <= today)
+    )
+
+    return {
+        "total_equipment": counters.get((EQUIPMENT_TOTAL, ALL_BUCKET), 0),
+        "equipment_by_status": metric(EQUIPMENT_STATUS),
+        "equipment_by_department": metric(EQUIPMENT_DEPARTMENT),
+        "equipment_by_expiry_month": metric(EQUIPMENT_EXPIRY_MONTH),
+        "expired_equipment": expired,
+        "total_issues": counters.get((ISSUE_TOTAL, ALL_BUCKET), 0),
+        "issues_by_status": metric(ISSUE_STATUS),
+        "archived_issues": counters.get((ISSUE_ARCHIVED, ALL_BUCKET), 0),
+        "discarded_equipment": counters.get((DISCARD_TOTAL, ALL_BUCKET), 0),
+        "departments": counters.get((DEPARTMENT_TOTAL, ALL_BUCKET), 0),
+    }
+
+
+def recount(connection: Connection) -> Counter[CounterKey]:
+    """Compute every counter from scratch with grouped scans of the source tables."""
+
+    counts: Counter[CounterKey] = Counter()
+
+    counts[(EQUIPMENT_TOTAL, ALL_BUCKET)] = connection.scalar(select(func.count()).select_from(Equipment)) or 0
+    for status, total in connection.execute(select(Equipment.status, func.count()).group_by(Equipment.status)):
+        counts[(EQUIPMENT_STATUS, str(status.value))] += total
+    for department_id, total in connection.execute(
+        select(Equipment.department_id, func.count()).group_by(Equipment.department_id)
+    ):
+        counts[(EQUIPMENT_DEPARTMENT, str(department_id))] += total
+    for expiry_date, total in connection.execute(
+        select(Equipment.expiry_date, func.count()).group_by(Equipment.expiry_date)
+    ):
+        counts[(EQUIPMENT_EXPIRY_MONTH, expiry_bucket(expiry_date))] += total
+
+    counts[(ISSUE_TOTAL, ALL_BUCKET)] = connection.scalar(select(func.count()).select_from(IssueReport)) or 0
+    for status, total in connection.execute(select(IssueReport.status, func.count()).group_by(IssueReport.status)):
+        counts[(ISSUE_STATUS, str(status.value))] += total
+    counts[(ISSUE_ARCHIVED, ALL_BUCKET)] = connection.scalar(select(func.count()).select_from(IssueReportArchive)) or 0
+
+    counts[(DISCARD_TOTAL, ALL_BUCKET)] = connection.scalar(select(func.count()).select_from(DiscardEquipment)) or 0
+    counts[(DEPARTMENT_TOTAL, ALL_BUCKET)] = connection.scalar(select(func.count()).select_from(Department)) or 0
+    return counts
+
+
+def _stored(connection: Connection) -> Counter[CounterKey]:
+    rows = connection.execute(select(DashboardCounter.metric, DashboardCounter.bucket, DashboardCounter.value))
+    return Counter({(metric, bucket): value for metric, bucket, value in rows})
+
+
+def verify_counters(connection: Connection) -> dict[CounterKey, tuple[int, int]]:
+    """Compare stored counters with a full recount.
+
+    Returns ``{key: (stored, actual)}`` for every bucket that disagrees; empty when consistent.
+    """
+
+    stored = _stored(connection)
+    actual = recount(connection)
+    return {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(set(stored) | set(actual))
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+
+
+def rebuild_counters(connection: Connection) -> Counter[CounterKey]:
+    """Replace the stored counters with a full recount inside the caller's transaction.
+
+    Rows are overwritten, and zeroed rather than deleted when their bucket is gone, so row
+    versions keep increasing; live dashboards compare them with the versions of deltas.
+    """
+
+    counts = recount(connection)
+    keys = sorted(set(counts) | set(_stored(connection)))
+    rows = [
+        {"metric": metric, "bucket": bucket, "value": counts.get((metric, bucket), 0), "version": 1}
+        for metric, bucket in keys
+    ]
+    if rows:
+        table = DashboardCounter.__table__
+        statement = dialect_insert(connection.dialect.name)(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.metric, table.c.bucket],
+            set_={"value": statement.excluded.value, "version": table.c.version + 1, "updated_at": func.now()},
+        )
+        connection.execute(statement, rows)
+    return counts
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dashboard.rollups import ROLLUP_BACKFILL_JOB
+from app.jobs.state import load_job_state
+from app.models.issue_daily_rollup import IssueDailyRollup
+
+Granularity = Literal["day", "week", "month"]
+TrendGroup = Literal["issue_type", "status", "department_id"]
+
+_TOTAL = "total"
+
+
+def period_start(day: date, granularity: Granularity) -> date:
+    """First day of the ``granularity`` period containing ``day`` (weeks start on Monday)."""
+
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _periods(start: date, end: date, granularity: Granularity) -> list[date]:
+    periods: list[date] = []
+    current = period_start(start, granularity)
+    while current <= end:
+        periods.append(current)
+        if granularity == "day":
+            current += timedelta(days=1)
+        elif granularity == "week":
+            current += timedelta(days=7)
+        else:
+            current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return periods
+
+
+async def issue_trend(
+    session: AsyncSession,
+    start: date,
+    end: date,
+    *,
+    granularity: Granularity = "day",
+    group_by: TrendGroup | None = None,
+    issue_type: str | None = None,
+    status: str | None = None,
+    department_id: int | None = None,
+) -> dict[str, Any]:
+    """Raised and resolved issue counts per period between ``start`` and ``end`` (inclusive).
+
+    Reads only the ``issue_daily_rollup`` rows in the date range, so the cost follows the
+    number of days requested rather than the size of the issue table. Periods without any
+    issues are filled with zeros; ``complete`` is false while a backfill is still running.
+    """
+
+    day = IssueDailyRollup.day
+    groups = [getattr(IssueDailyRollup, group_by)] if group_by else []
+    statement = select(
+        day,
+        func.sum(IssueDailyRollup.raised),
+        func.sum(IssueDailyRollup.resolved),
+        func.sum(IssueDailyRollup.resolution_seconds),
+        *groups,
+    ).where(day >= start, day <= end)
+    if issue_type is not None:
+        statement = statement.where(IssueDailyRollup.issue_type == issue_type)
+    if status is not None:
+        statement = statement.where(IssueDailyRollup.status == status)
+    if department_id is not None:
+        statement = statement.where(IssueDailyRollup.department_id == department_id)
+    statement = statement.group_by(day, *groups)
+
+    totals: dict[str, dict[date, list[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0, 0]))
+    for row_day, raised, resolved, seconds, *group in (await session.execute(statement)).all():
+        cell = totals[str(group[0]) if group else _TOTAL][period_start(row_day, granularity)]
+        cell[0] += int(raised)
+        cell[1] += int(resolved)
+        cell[2] += int(seconds)
+
+    periods = _periods(start, end, granularity)
+
+    def points(cells: dict[date, list[int]]) -> list[dict[str, Any]]:
+        result = []
+        for period in periods:
+            raised, resolved, seconds = cells.get(period, (0, 0, 0))
+            result.append(
+                {
+                    "period": period.isoformat(),
+                    "raised": raised,
+                    "resolved": resolved,
+                    "mean_resolution_hours": round(seconds / resolved / 3600, 2) if resolved else None,
+                }
+            )
+        return result
+
+    state = await load_job_state(session, ROLLUP_BACKFILL_JOB)
+    series = {key: points(cells) for key, cells in sorted(totals.items())}
+    if not group_by:
+        series = {_TOTAL: series.get(_TOTAL) or points({})}
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "granularity": granularity,
+        "group_by": group_by,
+        "complete": not state or bool(state.get("complete")),
+        "series": series,
+    }
@@ -1,5 +1,43 @@
 from __future__ import annotations
 
-from app.db.session import AsyncSessionLocal, Base, engine, get_db
+from app.db.instrumentation import QueryBudgetExceeded, QueryStats, collect_queries, query_budget
+from app.db.engine import build_engine, dialect_insert, pool_status
+from app.db.routing import ReplicaSet, must_read_primary, record_write, route_request
+from app.db.session import (
+    AsyncSessionLocal,
+    Base,
+    engine,
+    get_db,
+    get_primary_db,
+    get_write_db,
+    primary_session,
+    read_session,
+    replicas,
+    write_session,
+    writer_queue,
+)
 
-__all__ = ["AsyncSessionLocal", "Base", "engine", "get_db"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "QueryBudgetExceeded",
+    "QueryStats",
+    "ReplicaSet",
+    "build_engine",
+    "collect_queries",
+    "dialect_insert",
+    "engine",
+    "get_db",
+    "get_primary_db",
+    "get_write_db",
+    "must_read_primary",
+    "pool_status",
+    "primary_session",
+    "query_budget",
+    "read_session",
+    "record_write",
+    "replicas",
+    "route_request",
+    "write_session",
+    "writer_queue",
+]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import Settings
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def _sqlite_pragmas(settings: Settings, memory: bool) -> list[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}",
+        "PRAGMA synchronous = NORMAL",
+        f"PRAGMA mmap_size = {settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size = -{settings.sqlite_cache_size_kib}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if not memory:
+        # WAL lets readers proceed while a writer commits; it is persistent but cheap to reassert.
+        pragmas.insert(0, "PRAGMA journal_mode = WAL")
+    return pragmas
+
+
+def engine_options(settings: Settings, url: str | None = None) -> tuple[URL, dict[str, Any]]:
+    """Return the URL and ``create_async_engine`` keyword arguments for ``url``.
+
+    ``url`` defaults to the primary ``settings.database_url``; replicas share its pool profile.
+    """
+
+    url = make_url(str(url or settings.database_url))
+    options: dict[str, Any] = {"echo": settings.sql_echo}
+    backend = url.get_backend_name()
+    if backend == "sqlite" and _is_memory_sqlite(url):
+        # In-memory databases use a single shared connection; pool sizing does not apply.
+        return url, options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if url.get_driver_name() == "asyncpg":
+        # Per-connection LRU of prepared statements, so repeated queries skip parse/plan.
+        url = url.update_query_dict({"prepared_statement_cache_size": str(settings.db_statement_cache_size)})
+    return url, options
+
+
+def build_engine(settings: Settings, url: str | None = None) -> AsyncEngine:
+    """Create an engine for ``url`` (default: the primary) using the profile from ``settings``."""
+
+    url, options = engine_options(settings, url)
+    engine = create_async_engine(url, **options)
+    if url.get_backend_name() == "sqlite":
+        pragmas = _sqlite_pragmas(settings, _is_memory_sqlite(url))
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return engine
+
+
+def dialect_insert(dialect_name: str):
+    """Return the dialect's ``insert`` construct, which adds ``on_conflict_do_*`` upserts.
+
+    Both supported backends (PostgreSQL and SQLite 3.24+) accept ``ON CONFLICT``.
+    """
+
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    """Snapshot of connection pool usage for the health endpoint."""
+
+    pool = engine.sync_engine.pool
+    status: dict[str, Any] = {"dialect": engine.dialect.name, "pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if method is not None:
+            status[name] = method()
+    return status
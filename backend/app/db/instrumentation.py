@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import heapq
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOWEST_KEPT = 5
+
+# Collectors active in the current task: the request's, plus any query_budget() nested in it.
+_collectors: ContextVar[tuple[QueryStats, ...]] = ContextVar("sql_query_collectors", default=())
+
+_IN_LIST_RE = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a statement so executions differing only in IN-list length compare equal."""
+
+    return _IN_LIST_RE.sub("(?)", _WHITESPACE_RE.sub(" ", statement).strip())
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statements executed while a collector was active."""
+
+    n_plus_one_threshold: int = 5
+    count: int = 0
+    total_ms: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+        if len(self.slowest) < SLOWEST_KEPT:
+            heapq.heappush(self.slowest, (elapsed_ms, statement))
+        elif elapsed_ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (elapsed_ms, statement))
+
+    @property
+    def repeated(self) -> dict[str, int]:
+        """Statement shapes executed at least ``n_plus_one_threshold`` times (likely N+1)."""
+
+        return {shape: n for shape, n in self.shapes.items() if n >= self.n_plus_one_threshold}
+
+    def slowest_statements(self) -> list[tuple[float, str]]:
+        return sorted(self.slowest, reverse=True)
+
+
+@contextmanager
+def collect_queries(n_plus_one_threshold: int = 5) -> Iterator[QueryStats]:
+    """Record every statement the current task executes until the block exits."""
+
+    stats = QueryStats(n_plus_one_threshold=n_plus_one_threshold)
+    token = _collectors.set((*_collectors.get(), stats))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by :func:`query_budget` when a block runs more statements than allowed."""
+
+
+@contextmanager
+def query_budget(max_queries: int, *, allow_repeated: bool = False, n_plus_one_threshold: int = 2) -> Iterator[QueryStats]:
+    """Fail if the block executes more than ``max_queries`` statements.
+
+    Unless ``allow_repeated`` is set it also fails when any statement shape runs
+    ``n_plus_one_threshold`` or more times. Intended for tests::
+
+        with query_budget(2):
+            await client.get("/api/v1/equipment")
+    """
+
+    with collect_queries(n_plus_one_threshold) as stats:
+        yield stats
+    problems = []
+    if stats.count > max_queries:
+        problems.append(f"{stats.count} statements executed, budget is {max_queries}")
+    if not allow_repeated:
+        problems.extend(f"repeated {n}x: {shape}" for shape, n in stats.repeated.items())
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _collectors.get():
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    collectors = _collectors.get()
+    started = conn.info.get("query_started")
+    if not collectors or not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    for stats in collectors:
+        stats.record(statement, elapsed_ms)
+
+
+def _handle_error(context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    connection = context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Attach the statement timing listeners to ``engine`` (pass ``AsyncEngine.sync_engine``).
+
+    Listeners return immediately when no collector is active, so unobserved work such as
+    background jobs pays only a context variable lookup per statement.
+    """
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
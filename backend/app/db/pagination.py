@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import enum
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, Literal, Sequence, TypeVar
+
+from sqlalchemy import ColumnElement, Select, and_, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+SortOrder = Literal["asc", "desc"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the query."""
+
+
+@dataclass(frozen=True, slots=True)
+class SortKey:
+    """A sortable column paired with the primary key used as a tie-breaker.
+
+    Every sort key must be backed by a composite ``(column, primary key)`` index so that
+    seeking to a cursor position is an index range scan regardless of page depth. Columns
+    of a subquery (e.g. a ``UNION ALL`` of tables that each have the index) work as well.
+    """
+
+    column: InstrumentedAttribute[Any] | ColumnElement[Any]
+    primary_key: InstrumentedAttribute[Any] | ColumnElement[Any]
+
+    @property
+    def nullable(self) -> bool:
+        prop = getattr(self.column, "property", None)
+        return bool((prop.columns[0] if prop is not None else self.column).nullable)
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Decoded cursor position: the last seen ``(value, primary key)`` pair."""
+
+    sort_by: str
+    sort_order: SortOrder
+    value: Any
+    primary_key: Any
+    backwards: bool = False
+
+
+@dataclass(slots=True)
+class KeysetPage(Generic[T]):
+    """A single page of keyset-paginated results."""
+
+    items: list[T]
+    page_size: int
+    next_cursor: str | None
+    prev_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise InvalidCursorError("Unsupported cursor value")
+    if value is not None and not isinstance(value, (str, int, float)):
+        raise InvalidCursorError("Unsupported cursor value")
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Serialize a cursor into an opaque, URL-safe token."""
+
+    payload = [
+        cursor.sort_by,
+        cursor.sort_order,
+        _encode_value(cursor.value),
+        _encode_value(cursor.primary_key),
+        int(cursor.backwards),
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Parse an opaque cursor token produced by :func:`encode_cursor`."""
+
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort_by, sort_order, value, primary_key, backwards = json.loads(raw)
+        cursor = Cursor(
+            sort_by=sort_by,
+            sort_order=sort_order,
+            value=_decode_value(value),
+            primary_key=primary_key,
+            backwards=bool(backwards),
+        )
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    # Every sort key breaks ties on an integer primary key.
+    if (
+        not isinstance(cursor.sort_by, str)
+        or cursor.sort_order not in ("asc", "desc")
+        or not isinstance(cursor.primary_key, int)
+        or isinstance(cursor.primary_key, bool)
+    ):
+        raise InvalidCursorError("Malformed cursor")
+    return cursor
+
+
+def _seek_condition(key: SortKey, value: Any, primary_key: Any, ascending: bool):
+    """Build the predicate selecting rows strictly after ``(value, primary_key)``.
+
+    NULL sort values are always ordered last, matching ``NULLS LAST`` in :func:`_ordering`.
+    """
+
+    column, pk = key.column, key.primary_key
+    if not key.nullable:
+        if ascending:
+            return tuple_(column, pk) > tuple_(value, primary_key)
+        return tuple_(column, pk) < tuple_(value, primary_key)
+
+    pk_after = pk > primary_key if ascending else pk < primary_key
+    if value is None:
+        return and_(column.is_(None), pk_after)
+    value_after = column > value if ascending else column < value
+    return or_(value_after, and_(column == value, pk_after), column.is_(None))
+
+
+def _seek_before_condition(key: SortKey, value: Any, primary_key: Any, ascending: bool):
+    """Build the predicate selecting rows strictly before ``(value, primary_key)``."""
+
+    column, pk = key.column, key.primary_key
+    if not key.nullable:
+        if ascending:
+            return tuple_(column, pk) < tuple_(value, primary_key)
+        return tuple_(column, pk) > tuple_(value, primary_key)
+
+    pk_before = pk < primary_key if ascending else pk > primary_key
+    if value is None:
+        return or_(column.is_not(None), and_(column.is_(None), pk_before))
+    value_before = column < value if ascending else column > value
+    return and_(column.is_not(None), or_(value_before, and_(column == value, pk_before)))
+
+
+def _ordering(key: SortKey, ascending: bool, reverse: bool) -> list[Any]:
+    effective = ascending != reverse
+    column = key.column.asc() if effective else key.column.desc()
+    pk = key.primary_key.asc() if effective else key.primary_key.desc()
+    # NULLs stay at the end of the logical ordering, so a reversed scan visits them first.
+    column = column.nulls_first() if reverse else column.nulls_last()
+    return [column, pk]
+
+
+async def paginate_keyset(
+    session: AsyncSession,
+    statement: Select[Any],
+    *,
+    sort_keys: dict[str, SortKey],
+    sort_by: str,
+    sort_order: SortOrder = "asc",
+    cursor: str | None = None,
+    page_size: int = 50,
+    scalars: bool = True,
+) -> KeysetPage[Any]:
+    """Execute ``statement`` as a keyset-paginated query.
+
+    ``statement`` must already carry its filters; ordering and seeking are applied here.
+    Only ``page_size + 1`` rows are ever read, so latency does not depend on page depth.
+    """
+
+    if sort_by not in sort_keys:
+        raise InvalidCursorError(f"Unsupported sort field: {sort_by}")
+    key = sort_keys[sort_by]
+    ascending = sort_order == "asc"
+
+    position: Cursor | None = None
+    if cursor:
+        position = decode_cursor(cursor)
+        if position.sort_by != sort_by or position.sort_order != sort_order:
+            raise InvalidCursorError("Cursor does not match the requested sort")
+
+    backwards = position.backwards if position else False
+    if position is not None:
+        seek = _seek_before_condition if backwards else _seek_condition
+        statement = statement.where(seek(key, position.value, position.primary_key, ascending))
+
+    statement = statement.order_by(None).order_by(*_ordering(key, ascending, backwards)).limit(page_size + 1)
+    result = await session.execute(statement)
+    rows: Sequence[Any] = result.scalars().all() if scalars else result.all()
+
+    overflow = len(rows) > page_size
+    items = list(rows[:page_size])
+    if backwards:
+        items.reverse()
+
+    def _cursor_for(item: Any, is_backwards: bool) -> str:
+        return encode_cursor(
+            Cursor(
+                sort_by=sort_by,
+                sort_order=sort_order,
+                value=getattr(item, key.column.key),
+                primary_key=getattr(item, key.primary_key.key),
+                backwards=is_backwards,
+            )
+        )
+
+    has_next = overflow if not backwards else position is not None
+    has_prev = position is not None if not backwards else overflow
+
+    return KeysetPage(
+        items=items,
+        page_size=page_size,
+        next_cursor=_cursor_for(items[-1], False) if items and has_next else None,
+        prev_cursor=_cursor_for(items[0], True) if items and has_prev else None,
+    )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.engine import pool_status
+
+logger = logging.getLogger("app.db.routing")
+
+
+class ReplicaSet:
+    """Round-robin over read replicas, skipping ones that recently failed to connect.
+
+    A replica is ejected for ``eject_seconds`` after a failed checkout and then tried again
+    on its next turn. ``choose`` returns ``None`` when there are no healthy replicas, and
+    callers fall back to the primary.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine], eject_seconds: float) -> None:
+        self.engines = list(engines)
+        self.eject_seconds = eject_seconds
+        self._turn = itertools.count()
+        self._ejected_until: dict[int, float] = {}
+        self._errors: dict[int, str] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine | None:
+        if not self.engines:
+            return None
+        now = time.monotonic()
+        start = next(self._turn)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._ejected_until.get(index, 0.0) <= now:
+                return self.engines[index]
+        return None
+
+    def eject(self, engine: AsyncEngine, error: BaseException) -> None:
+        index = self.engines.index(engine)
+        self._ejected_until[index] = time.monotonic() + self.eject_seconds
+        message = str(error).splitlines()[0] if str(error) else type(error).__name__
+        self._errors[index] = message
+        logger.warning("ejecting replica %s for %.0fs: %s", engine.url.render_as_string(), self.eject_seconds, message)
+
+    def status(self) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                "url": engine.url.render_as_string(),
+                "healthy": self._ejected_until.get(index, 0.0) <= now,
+                "last_error": self._errors.get(index),
+                **pool_status(engine),
+            }
+            for index, engine in enumerate(self.engines)
+        ]
+
+
+@dataclass(slots=True)
+class RequestRouting:
+    """Per-request routing state: whether reads must see the primary and whether it wrote."""
+
+    read_primary: bool = False
+    wrote: bool = False
+
+
+_routing: ContextVar[RequestRouting | None] = ContextVar("db_request_routing", default=None)
+
+
+@contextmanager
+def route_request(read_primary: bool = False) -> Iterator[RequestRouting]:
+    """Track routing state for the statements run inside the block (one HTTP request)."""
+
+    routing = RequestRouting(read_primary=read_primary)
+    token = _routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _routing.reset(token)
+
+
+def must_read_primary() -> bool:
+    """Whether reads in the current context should skip replicas (read-your-writes)."""
+
+    routing = _routing.get()
+    return routing is not None and (routing.read_primary or routing.wrote)
+
+
+def record_write() -> None:
+    """Note a committed write, so later reads in this request and client go to the primary."""
+
+    routing = _routing.get()
+    if routing is not None:
+        routing.wrote = True
@@ -1,22 +1,156 @@
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.core.config import settings
+from app.db.engine import build_engine
+from app.db.instrumentation import install_query_instrumentation
+from app.db.routing import ReplicaSet, must_read_primary, record_write
 
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
 
 
-engine = create_async_engine(str(settings.database_url), echo=settings.debug)
+engine = build_engine(settings)
+replicas = ReplicaSet(
+    [build_engine(settings, url) for url in settings.database_replica_urls],
+    eject_seconds=settings.db_replica_eject_seconds,
+)
+if settings.sql_instrumentation:
+    for _engine in (engine, *replicas.engines):
+        install_query_instrumentation(_engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 
+class WriterQueue:
+    """FIFO gate admitting one write transaction at a time on SQLite.
+
+    SQLite allows a single writer; without the gate concurrent writers in this process
+    race for the lock and fail with "database is locked" once busy_timeout runs out.
+    Other backends pass straight through.
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait_ms = 0.0
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        if not self.enabled:
+            yield
+            return
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            await self._lock.acquire()
+        finally:
+            self.waiting -= 1
+        self.acquired += 1
+        self.total_wait_ms += (time.perf_counter() - started) * 1000
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    def status(self) -> dict[str, float | int | bool]:
+        return {
+            "enabled": self.enabled,
+            "held": self._lock.locked(),
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "total_wait_ms": round(self.total_wait_ms, 1),
+        }
+
+
+writer_queue = WriterQueue(enabled=engine.dialect.name == "sqlite")
+
+
+async def _replica_session() -> AsyncSession | None:
+    """Open a session on the next healthy replica, ejecting replicas that fail to connect."""
+
+    while (replica := replicas.choose()) is not None:
+        session = AsyncSessionLocal(bind=replica)
+        try:
+            await session.connection()
+        except (DBAPIError, OSError) as exc:
+            await session.close()
+            replicas.eject(replica, exc)
+            continue
+        return session
+    return None
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Session for read-only work, on a replica when one is configured and healthy.
+
+    Falls back to the primary when no replica is available and inside the read-your-writes
+    window of the current request or client (see :mod:`app.db.routing`).
+    """
+
+    session = None if must_read_primary() else await _replica_session()
+    if session is None:
+        session = AsyncSessionLocal()
+    async with session:
+        yield session
+
+
 async def get_db() -> AsyncSession:
-    """Yield an asynchronous database session."""
+    """Yield a read session; see :func:`read_session`."""
+
+    async with read_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def primary_session() -> AsyncIterator[AsyncSession]:
+    """Session on the primary for reads that must not lag behind writes."""
 
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_primary_db() -> AsyncSession:
+    """Yield a session on the primary for reads that must not lag behind writes.
+
+    Used for auth token lookups: a replica that has not caught up would report a
+    freshly issued refresh token as missing, i.e. revoked.
+    """
+
+    async with primary_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def write_session() -> AsyncIterator[AsyncSession]:
+    """Session for a write transaction on the primary, serialised through :data:`writer_queue` on SQLite."""
+
+    async with writer_queue.hold():
+        async with AsyncSessionLocal(info={"writer": True}) as session:
+            yield session
+
+
+@event.listens_for(Session, "after_commit")
+def _record_write(session: Session) -> None:
+    if session.info.get("writer"):
+        record_write()
+
+
+async def get_write_db() -> AsyncSession:
+    """Yield a session for endpoints that write; see :func:`write_session`."""
+
+    async with write_session() as session:
+        yield session
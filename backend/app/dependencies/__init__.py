@@ -1,5 +1,6 @@
 from __future__ import annotations
 
-from app.db.session import get_db
+from app.auth.dependencies import AuthenticatedUser, get_current_user
+from app.db.session import get_db, get_primary_db, get_write_db
 
-__all__ = ["get_db"]
+__all__ = ["AuthenticatedUser", "get_current_user", "get_db", "get_primary_db", "get_write_db"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.export.stream import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    encode_csv,
+    encode_jsonl,
+    export_equipment,
+    export_filename,
+    export_issues,
+    export_response,
+    export_stream,
+    gzip_chunks,
+    iter_row_batches,
+)
+
+__all__ = [
+    "EXPORT_MEDIA_TYPES",
+    "ExportFormat",
+    "encode_csv",
+    "encode_jsonl",
+    "export_equipment",
+    "export_filename",
+    "export_issues",
+    "export_response",
+    "export_stream",
+    "gzip_chunks",
+    "iter_row_batches",
+]
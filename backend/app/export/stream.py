@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import date, datetime
+from typing import Any, Literal
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, Select
+
+from app.core.config import settings
+from app.crud.equipment import equipment_row_payload, equipment_rows_statement
+from app.crud.issue_report import issue_row_payload, issue_rows_statement
+from app.db.session import engine, read_session
+from app.models.equipment import Equipment
+
+ExportFormat = Literal["csv", "jsonl"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {"csv": "text/csv; charset=utf-8", "jsonl": "application/x-ndjson"}
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+async def iter_row_batches(statement: Select, *, batch_size: int | None = None) -> AsyncIterator[Sequence[Row]]:
+    """Yield the rows of ``statement`` in batches read from a server-side cursor.
+
+    The generator owns its (replica, when configured) session, so it can outlive the request
+    dependency that started it (the body of a streaming response runs after the endpoint
+    returns). At most one batch is held in memory at a time.
+    """
+
+    batch_size = batch_size or settings.export_batch_size
+    async with read_session() as session:
+        result = await session.stream(statement.execution_options(yield_per=batch_size))
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def encode_csv(columns: Sequence[str], batches: AsyncIterator[Sequence[Row]]) -> AsyncIterator[bytes]:
+    """Encode row batches as CSV, one chunk per batch after the header line."""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode()
+
+
+async def encode_jsonl(
+    payload: Callable[[Row], dict[str, Any]], batches: AsyncIterator[Sequence[Row]]
+) -> AsyncIterator[bytes]:
+    """Encode row batches as JSON lines shaped like the list endpoint items."""
+
+    option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+    async for batch in batches:
+        yield b"".join(orjson.dumps(payload(row), option=option) for row in batch)
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int | None = None) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+
+    compressor = zlib.compressobj(level or settings.export_gzip_level, zlib.DEFLATED, _GZIP_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(
+    statement: Select,
+    fmt: ExportFormat,
+    *,
+    payload: Callable[[Row], dict[str, Any]],
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Stream ``statement`` encoded as ``fmt``; CSV columns are the statement's column labels."""
+
+    batches = iter_row_batches(statement)
+    if fmt == "csv":
+        chunks = encode_csv(list(statement.selected_columns.keys()), batches)
+    else:
+        chunks = encode_jsonl(payload, batches)
+    return gzip_chunks(chunks) if compress else chunks
+
+
+def export_equipment(fmt: ExportFormat, *, compress: bool = False, **filters: Any) -> AsyncIterator[bytes]:
+    """Stream every equipment row matching ``filters`` in ``equipment_id`` order."""
+
+    statement = equipment_rows_statement(engine.dialect.name, **filters).order_by(Equipment.equipment_id)
+    return export_stream(statement, fmt, payload=equipment_row_payload, compress=compress)
+
+
+def export_issues(fmt: ExportFormat, *, compress: bool = False, **filters: Any) -> AsyncIterator[bytes]:
+    """Stream every issue report matching ``filters`` in ``issue_id`` order."""
+
+    statement = issue_rows_statement(engine.dialect.name, **filters)
+    statement = statement.order_by(statement.selected_columns.issue_id)
+    return export_stream(statement, fmt, payload=issue_row_payload, compress=compress)
+
+
+def export_filename(name: str, fmt: ExportFormat, *, compress: bool = False) -> str:
+    return f"{name}-{date.today():%Y%m%d}.{fmt}{'.gz' if compress else ''}"
+
+
+def export_response(
+    body: AsyncIterator[bytes], name: str, fmt: ExportFormat, *, compress: bool = False
+) -> StreamingResponse:
+    """Wrap an export stream as a file download.
+
+    Compressed exports are served as ``application/gzip`` files rather than with
+    ``Content-Encoding``, so clients save the ``.gz`` as-is instead of inflating it.
+    """
+
+    filename = export_filename(name, fmt, compress=compress)
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if compress else EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.jobs.archive import IssueArchiveResult, run_issue_archive
+from app.jobs.change_log import ChangeLogPruneResult, run_change_log_prune
+from app.jobs.expiry import (
+    ExpiryScanResult,
+    compute_expiry_alerts,
+    get_expiry_alerts,
+    refresh_expiry_alerts,
+    run_expiry_scan,
+)
+from app.jobs.media_gc import MediaGcResult, run_media_gc
+from app.jobs.rollups import RollupBackfillResult, backfill_issue_rollups, restart_issue_rollup_backfill
+from app.jobs.scheduler import shutdown_scheduler, start_scheduler
+from app.jobs.state import load_job_state, save_job_state
+
+__all__ = [
+    "ChangeLogPruneResult",
+    "ExpiryScanResult",
+    "IssueArchiveResult",
+    "MediaGcResult",
+    "RollupBackfillResult",
+    "backfill_issue_rollups",
+    "compute_expiry_alerts",
+    "get_expiry_alerts",
+    "load_job_state",
+    "refresh_expiry_alerts",
+    "restart_issue_rollup_backfill",
+    "run_change_log_prune",
+    "run_expiry_scan",
+    "run_issue_archive",
+    "run_media_gc",
+    "save_job_state",
+    "shutdown_scheduler",
+    "start_scheduler",
+]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import calendar
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.dashboard.counters import ALL_BUCKET, ISSUE_ARCHIVED, CounterKey, apply_counter_deltas, issue_keys
+from app.db.session import write_session
+from app.jobs.state import save_job_state
+from app.models.enums import IssueStatus
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.sync.changes import forget_changes
+
+logger = logging.getLogger("app.jobs.archive")
+
+ISSUE_ARCHIVE_JOB = "issue_archive"
+
+_ARCHIVED_COLUMNS = (
+    "issue_id",
+    "equipment_id",
+    "issue_type",
+    "problem_description",
+    "media_url",
+    "date_raised",
+    "status",
+    "technician",
+    "resolved_at",
+    "created_at",
+    "updated_at",
+)
+
+
+@dataclass(slots=True)
+class IssueArchiveResult:
+    cutoff: datetime
+    archived: int
+    batches: int
+    complete: bool
+    duration_ms: float
+
+
+def months_before(moment: datetime, months: int) -> datetime:
+    """``moment`` shifted back by calendar months, clamping the day to the target month."""
+
+    years, month_index = divmod(moment.month - 1 - months, 12)
+    year, month = moment.year + years, month_index + 1
+    return moment.replace(year=year, month=month, day=min(moment.day, calendar.monthrange(year, month)[1]))
+
+
+async def _archive_batch(session: AsyncSession, ids: list[int]) -> int:
+    """Copy ``ids`` to the archive, delete them from ``issue_report`` and adjust the counters."""
+
+    columns = [getattr(IssueReport, name) for name in _ARCHIVED_COLUMNS]
+    await session.execute(
+        insert(IssueReportArchive).from_select(
+            [*_ARCHIVED_COLUMNS, "archived_at"],
+            select(*columns, func.now()).where(IssueReport.issue_id.in_(ids)),
+        )
+    )
+    moved = (
+        await session.execute(
+            delete(IssueReport).where(IssueReport.issue_id.in_(ids)).execution_options(synchronize_session=False)
+        )
+    ).rowcount
+    # Core statements bypass the flush listeners. The daily rollups deliberately keep
+    # archived reports, so only the counters change. Archived reports leave the sync set
+    # without a tombstone: clients keep their copy, new clients never download it.
+    deltas: Counter[CounterKey] = Counter({(ISSUE_ARCHIVED, ALL_BUCKET): moved})
+    deltas.subtract({key: moved for key in issue_keys(IssueStatus.CLOSED)})
+    await session.run_sync(lambda sync_session: apply_counter_deltas(sync_session.connection(), deltas))
+    await session.run_sync(lambda sync_session: forget_changes(sync_session.connection(), IssueReport, ids))
+    return moved
+
+
+async def run_issue_archive(now: datetime | None = None, *, max_batches: int | None = None) -> IssueArchiveResult:
+    """Move issue reports closed more than ``ISSUE_ARCHIVE_AFTER_MONTHS`` ago to the archive.
+
+    Candidates are read in ``issue_id`` order from ``ix_issue_report_status_issue_id``.
+    A report counts as closed at ``resolved_at``, or at ``updated_at`` if it has none.
+    Each batch of ``ISSUE_ARCHIVE_BATCH_SIZE`` is its own short write transaction. Between
+    batches the job sleeps ``ISSUE_ARCHIVE_PAUSE_SECONDS``, so request writes queued behind
+    it are not delayed by more than one batch. A run stops after ``max_batches`` (default
+    ``ISSUE_ARCHIVE_MAX_BATCHES``). The next run picks up the rest.
+    """
+
+    started = time.perf_counter()
+    now = now or datetime.now(timezone.utc)
+    cutoff = months_before(now, settings.issue_archive_after_months)
+    max_batches = max_batches or settings.issue_archive_max_batches
+    closed_at = func.coalesce(IssueReport.resolved_at, IssueReport.updated_at)
+
+    archived = batches = 0
+    position = 0
+    complete = False
+    while batches < max_batches:
+        statement = (
+            select(IssueReport.issue_id)
+            .where(IssueReport.status == IssueStatus.CLOSED, IssueReport.issue_id > position, closed_at < cutoff)
+            .order_by(IssueReport.issue_id)
+            .limit(settings.issue_archive_batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with write_session() as session:
+            ids = list((await session.scalars(statement)).all())
+            if not ids:
+                complete = True
+                break
+            archived += await _archive_batch(session, ids)
+            await session.commit()
+        batches += 1
+        position = ids[-1]
+        if settings.issue_archive_pause_seconds:
+            await asyncio.sleep(settings.issue_archive_pause_seconds)
+
+    duration_ms = (time.perf_counter() - started) * 1000
+    async with write_session() as session:
+        await save_job_state(
+            session,
+            ISSUE_ARCHIVE_JOB,
+            {
+                "cutoff": cutoff.isoformat(timespec="seconds"),
+                "last_archived": archived,
+                "last_complete": complete,
+                "last_duration_ms": round(duration_ms, 1),
+            },
+        )
+        await session.commit()
+    logger.info("issue archive before %s: %d moved in %d batches (%.0f ms)", cutoff, archived, batches, duration_ms)
+    return IssueArchiveResult(
+        cutoff=cutoff, archived=archived, batches=batches, complete=complete, duration_ms=duration_ms
+    )
+
+
+async def issue_archive_job() -> None:
+    """Scheduled entry point: archive the next share of old closed issue reports."""
+
+    await run_issue_archive()
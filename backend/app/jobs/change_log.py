@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from app.core.config import settings
+from app.db.session import write_session
+from app.jobs.state import load_job_state, save_job_state
+from app.models.change_log import ChangeLog
+
+logger = logging.getLogger("app.jobs.change_log")
+
+CHANGE_LOG_PRUNE_JOB = "change_log_prune"
+
+
+@dataclass(slots=True)
+class ChangeLogPruneResult:
+    cutoff: datetime
+    pruned: int
+    horizon: int
+    duration_ms: float
+
+
+async def run_change_log_prune(now: datetime | None = None) -> ChangeLogPruneResult:
+    """Delete tombstones older than ``SYNC_TOMBSTONE_RETENTION_DAYS`` and advance the sync horizon.
+
+    Live rows keep their single change entry forever, so a client starting from 0 still gets
+    every row. The highest pruned ``seq`` is saved as the horizon in the same transaction;
+    clients whose cursor is below it are told to start over, because they may have missed a
+    deletion.
+    """
+
+    started = time.perf_counter()
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=settings.sync_tombstone_retention_days)
+    async with write_session() as session:
+        state = await load_job_state(session, CHANGE_LOG_PRUNE_JOB)
+        horizon = state.get("horizon", 0)
+        last = await session.scalar(
+            select(func.max(ChangeLog.seq)).where(ChangeLog.deleted.is_(True), ChangeLog.changed_at < cutoff)
+        )
+        pruned = 0
+        if last is not None:
+            pruned = (
+                await session.execute(delete(ChangeLog).where(ChangeLog.deleted.is_(True), ChangeLog.seq <= last))
+            ).rowcount
+            horizon = max(horizon, last)
+        duration_ms = (time.perf_counter() - started) * 1000
+        await save_job_state(
+            session,
+            CHANGE_LOG_PRUNE_JOB,
+            {
+                "horizon": horizon,
+                "cutoff": cutoff.isoformat(timespec="seconds"),
+                "last_pruned": pruned,
+                "last_duration_ms": round(duration_ms, 1),
+            },
+        )
+        await session.commit()
+    logger.info("change log prune before %s: %d tombstones removed, horizon %d", cutoff, pruned, horizon)
+    return ChangeLogPruneResult(cutoff=cutoff, pruned=pruned, horizon=horizon, duration_ms=duration_ms)
+
+
+async def change_log_prune_job() -> None:
+    """Scheduled entry point: prune expired sync tombstones."""
+
+    await run_change_log_prune()
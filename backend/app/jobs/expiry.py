@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.dashboard.counters import EQUIPMENT_STATUS, CounterKey, apply_counter_deltas
+from app.db.session import AsyncSessionLocal, write_session
+from app.jobs.state import load_job_state, save_job_state
+from app.models.department import Department
+from app.models.enums import EquipmentStatus
+from app.models.equipment import Equipment
+from app.sync.changes import record_changes
+
+logger = logging.getLogger("app.jobs.expiry")
+
+EXPIRY_JOB = "equipment_expiry"
+EXPIRY_ALERTS_JOB = "equipment_expiry_alerts"
+
+# Statuses an item can expire from; DECOMMISSIONED equipment is left alone.
+EXPIRABLE_STATUSES = (EquipmentStatus.WORKING, EquipmentStatus.UNDER_REPAIR)
+
+_alerts_cache = TTLCache(max_entries=4)
+
+
+@dataclass(slots=True)
+class ExpiryScanResult:
+    scanned_from: date | None
+    scanned_to: date
+    expired: int
+    chunks: int
+    duration_ms: float
+
+
+async def _expire_chunk(session: AsyncSession, rows: list[Any]) -> int:
+    """Move one chunk to EXPIRED with one UPDATE per previous status and adjust the counters."""
+
+    by_status: dict[EquipmentStatus, list[int]] = {}
+    for row in rows:
+        by_status.setdefault(row.status, []).append(row.equipment_id)
+    deltas: Counter[CounterKey] = Counter()
+    for status, ids in by_status.items():
+        # Re-checking the status makes concurrent edits win and keeps the deltas exact.
+        result = await session.execute(
+            update(Equipment)
+            .where(Equipment.equipment_id.in_(ids), Equipment.status == status)
+            .values(status=EquipmentStatus.EXPIRED, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        deltas[(EQUIPMENT_STATUS, str(status))] -= result.rowcount
+        deltas[(EQUIPMENT_STATUS, str(EquipmentStatus.EXPIRED))] += result.rowcount
+    # Core UPDATEs bypass the flush listeners that normally maintain the counters and change log.
+    await session.run_sync(lambda sync_session: apply_counter_deltas(sync_session.connection(), deltas))
+    expired = [row.equipment_id for row in rows]
+    await session.run_sync(lambda sync_session: record_changes(sync_session.connection(), Equipment, expired))
+    return deltas[(EQUIPMENT_STATUS, str(EquipmentStatus.EXPIRED))]
+
+
+async def run_expiry_scan(today: date | None = None, *, full: bool = False) -> ExpiryScanResult:
+    """Mark equipment whose expiry date has passed as EXPIRED.
+
+    Only rows with ``expiry_date`` between the saved high-water mark (minus
+    ``settings.expiry_lookback_days``) and ``today`` are read, walking
+    ``ix_equipment_expiry_date_equipment_id`` in keyset order. Each chunk is its own short
+    write transaction; a crash mid-scan is safe to rerun because already expired rows no
+    longer match. ``full`` ignores the high-water mark.
+
+    Rows imported, bulk-inserted or edited with an expiry date older than the lookback are
+    invisible to the incremental range, so a full scan also runs whenever the last one is
+    more than ``settings.expiry_full_scan_interval_hours`` old.
+    """
+
+    started = time.perf_counter()
+    today = today or date.today()
+    async with AsyncSessionLocal() as session:
+        state = await load_job_state(session, EXPIRY_JOB)
+    last_full_scan = state.get("last_full_scan")
+    full = (
+        full
+        or "high_water_mark" not in state
+        or last_full_scan is None
+        or time.time() - last_full_scan >= settings.expiry_full_scan_interval_hours * 3600
+    )
+    high_water = None if full else date.fromisoformat(state["high_water_mark"])
+    lower = high_water - timedelta(days=settings.expiry_lookback_days) if high_water else None
+
+    expired = chunks = 0
+    position: tuple[date, int] | None = None
+    while True:
+        statement = (
+            select(Equipment.equipment_id, Equipment.status, Equipment.expiry_date)
+            .where(Equipment.expiry_date <= today, Equipment.status.in_(EXPIRABLE_STATUSES))
+            .order_by(Equipment.expiry_date, Equipment.equipment_id)
+            .limit(settings.expiry_scan_chunk_size)
+        )
+        if lower is not None:
+            statement = statement.where(Equipment.expiry_date > lower)
+        if position is not None:
+            statement = statement.where(tuple_(Equipment.expiry_date, Equipment.equipment_id) > position)
+        async with write_session() as session:
+            rows = (await session.execute(statement)).all()
+            if not rows:
+                break
+            expired += await _expire_chunk(session, rows)
+            await session.commit()
+        chunks += 1
+        position = (rows[-1].expiry_date, rows[-1].equipment_id)
+
+    duration_ms = (time.perf_counter() - started) * 1000
+    async with write_session() as session:
+        await save_job_state(
+            session,
+            EXPIRY_JOB,
+            {
+                "high_water_mark": today.isoformat(),
+                "last_full_scan": time.time() if full else last_full_scan,
+                "last_expired": expired,
+                "last_duration_ms": round(duration_ms, 1),
+            },
+        )
+        await session.commit()
+    logger.info("expiry scan %s..%s: %d expired in %d chunks (%.0f ms)", lower, today, expired, chunks, duration_ms)
+    return ExpiryScanResult(scanned_from=lower, scanned_to=today, expired=expired, chunks=chunks, duration_ms=duration_ms)
+
+
+async def compute_expiry_alerts(session: AsyncSession, today: date) -> dict[str, Any]:
+    """Build the "expiring within N days" sets for every configured window.
+
+    One ordered range scan over the widest window supplies the items (nearest first) and
+    one aggregate gives the per-window totals.
+    """
+
+    windows = sorted(set(settings.expiry_alert_windows))
+    horizon = today + timedelta(days=windows[-1])
+    in_range = (
+        Equipment.expiry_date > today,
+        Equipment.expiry_date <= horizon,
+        Equipment.status.in_(EXPIRABLE_STATUSES),
+    )
+    totals = (
+        await session.execute(
+            select(
+                *(
+                    func.coalesce(func.sum(case((Equipment.expiry_date <= today + timedelta(days=window), 1), else_=0)), 0)
+                    for window in windows
+                )
+            ).where(*in_range)
+        )
+    ).one()
+    rows = (
+        await session.execute(
+            select(
+                Equipment.equipment_id,
+                Equipment.equipment_name,
+                Equipment.serial_number,
+                Equipment.status,
+                Equipment.expiry_date,
+                Department.department_name,
+            )
+            .join(Department, Department.department_id == Equipment.department_id)
+            .where(*in_range)
+            .order_by(Equipment.expiry_date, Equipment.equipment_id)
+            .limit(settings.expiry_alert_limit)
+        )
+    ).all()
+    items = [
+        {
+            "equipment_id": row.equipment_id,
+            "equipment_name": row.equipment_name,
+            "serial_number": row.serial_number,
+            "status": str(row.status),
+            "department_name": row.department_name,
+            "expiry_date": row.expiry_date.isoformat(),
+            "days_left": (row.expiry_date - today).days,
+        }
+        for row in rows
+    ]
+    return {
+        "computed_for": today.isoformat(),
+        "windows": {
+            str(window): {"total": int(total), "items": [item for item in items if item["days_left"] <= window]}
+            for window, total in zip(windows, totals)
+        },
+    }
+
+
+async def refresh_expiry_alerts(today: date | None = None) -> dict[str, Any]:
+    """Recompute the alert sets, store them in ``job_state`` and refresh this process's cache."""
+
+    today = today or date.today()
+    async with AsyncSessionLocal() as session:
+        alerts = await compute_expiry_alerts(session, today)
+    async with write_session() as session:
+        await save_job_state(session, EXPIRY_ALERTS_JOB, alerts)
+        await session.commit()
+    _alerts_cache.set(EXPIRY_ALERTS_JOB, alerts, time.time() + settings.expiry_alert_cache_seconds)
+    return alerts
+
+
+async def get_expiry_alerts(session: AsyncSession, today: date | None = None) -> dict[str, Any]:
+    """Return the precomputed alert sets, from memory when possible.
+
+    Sets stored for an earlier day (the job has not run yet today) are recomputed on read.
+    """
+
+    today = today or date.today()
+    alerts = _alerts_cache.get(EXPIRY_ALERTS_JOB)
+    if alerts is None or alerts.get("computed_for") != today.isoformat():
+        alerts = await load_job_state(session, EXPIRY_ALERTS_JOB)
+        if alerts.get("computed_for") != today.isoformat():
+            return await refresh_expiry_alerts(today)
+        _alerts_cache.set(EXPIRY_ALERTS_JOB, alerts, time.time() + settings.expiry_alert_cache_seconds)
+    return alerts
+
+
+async def expiry_job() -> None:
+    """Scheduled entry point: expire equipment, then rebuild the alert sets."""
+
+    await run_expiry_scan()
+    await refresh_expiry_alerts()
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, dataclass
+from itertools import islice
+
+from sqlalchemy import Select, func, select, union
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, engine, write_session
+from app.jobs.state import save_job_state
+from app.models.discard_equipment import DiscardEquipment
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.storage.local import FILE_URL_PREFIX, LocalFileStore, StoredEntry, get_file_store
+
+logger = logging.getLogger("app.jobs.media_gc")
+
+MEDIA_GC_JOB = "media_gc"
+
+_MEDIA_MODELS = (IssueReport, IssueReportArchive, DiscardEquipment)
+_SCAN_CHUNK = 1000
+
+
+@dataclass(slots=True)
+class MediaGcResult:
+    scanned: int = 0
+    referenced: int = 0
+    recent: int = 0
+    missing: int = 0
+    orphaned: int = 0
+    orphaned_bytes: int = 0
+    deleted: int = 0
+    bytes_reclaimed: int = 0
+    stale_uploads: int = 0
+    dry_run: bool = False
+    duration_ms: float = 0.0
+
+
+def _referenced_keys_statement(dialect_name: str) -> Select:
+    keys = union(
+        *(
+            select(func.substr(model.media_url, len(FILE_URL_PREFIX) + 1).label("key")).where(
+                model.media_url.startswith(FILE_URL_PREFIX)
+            )
+            for model in _MEDIA_MODELS
+        )
+    ).subquery("media_keys")
+    # Keys must come back in the byte order the directory walk uses; SQLite's default
+    # BINARY collation already does, PostgreSQL's locale collation does not.
+    order = keys.c.key.collate("C") if dialect_name == "postgresql" else keys.c.key
+    return select(keys.c.key).order_by(order)
+
+
+async def _referenced_keys() -> AsyncIterator[str]:
+    """Distinct file keys referenced by any media URL, ascending, from a server-side cursor."""
+
+    async with AsyncSessionLocal() as session:
+        statement = _referenced_keys_statement(engine.dialect.name)
+        result = await session.stream(statement.execution_options(yield_per=settings.media_gc_batch_size))
+        try:
+            async for batch in result.partitions():
+                for (key,) in batch:
+                    yield key
+        finally:
+            await result.close()
+
+
+async def _in_thread(entries: Iterator[StoredEntry]) -> AsyncIterator[StoredEntry]:
+    """Advance a blocking directory walk in worker threads, ``_SCAN_CHUNK`` entries at a time."""
+
+    while chunk := await asyncio.to_thread(lambda: list(islice(entries, _SCAN_CHUNK))):
+        for entry in chunk:
+            yield entry
+
+
+async def _still_referenced(keys: list[str]) -> set[str]:
+    """Keys among ``keys`` referenced right now on the primary (rows saved since the sweep read them)."""
+
+    urls = [FILE_URL_PREFIX + key for key in keys]
+    async with AsyncSessionLocal() as session:
+        statement = union(*(select(model.media_url).where(model.media_url.in_(urls)) for model in _MEDIA_MODELS))
+        return {url[len(FILE_URL_PREFIX):] for url in (await session.scalars(statement)).all()}
+
+
+def _unlink_unchanged(store: LocalFileStore, entries: list[StoredEntry], grace_cutoff: float) -> tuple[int, int]:
+    deleted = reclaimed = 0
+    for entry in entries:
+        path = store.root / entry.key
+        try:
+            # Reusing a deduplicated object refreshes its mtime; such a file is in use again.
+            if path.stat().st_mtime >= grace_cutoff:
+                continue
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        deleted += 1
+        reclaimed += entry.size
+    return deleted, reclaimed
+
+
+async def _collect(store: LocalFileStore, batch: list[StoredEntry], grace_cutoff: float, result: MediaGcResult) -> None:
+    referenced = await _still_referenced([entry.key for entry in batch])
+    orphans = [entry for entry in batch if entry.key not in referenced]
+    result.referenced += len(batch) - len(orphans)
+    result.orphaned += len(orphans)
+    result.orphaned_bytes += sum(entry.size for entry in orphans)
+    if result.dry_run or not orphans:
+        return
+    deleted, reclaimed = await asyncio.to_thread(_unlink_unchanged, store, orphans, grace_cutoff)
+    result.deleted += deleted
+    result.bytes_reclaimed += reclaimed
+    if settings.media_gc_pause_seconds:
+        await asyncio.sleep(settings.media_gc_pause_seconds)
+
+
+def _remove_stale_uploads(store: LocalFileStore, session_cutoff: float, tmp_cutoff: float) -> tuple[int, int]:
+    removed = reclaimed = 0
+    for path in store.stale_work_paths(session_cutoff, tmp_cutoff):
+        # An upload may finish or be cancelled between the scan and here; skip what is gone.
+        try:
+            if path.is_dir():
+                size = sum(child.stat().st_size for child in path.iterdir() if child.is_file())
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                size = path.stat().st_size
+                path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            continue
+        removed += 1
+        reclaimed += size
+    return removed, reclaimed
+
+
+async def run_media_gc(*, dry_run: bool = False, store: LocalFileStore | None = None) -> MediaGcResult:
+    """Delete uploaded files that no issue report, archived report or discard record references.
+
+    The upload directory is walked in key order (:meth:`LocalFileStore.scan`) and merge-joined
+    against the referenced keys, read in the same order from a server-side cursor. Memory
+    stays bounded by one directory listing, one cursor batch and one delete batch, however
+    many files the store holds.
+
+    Files modified within ``MEDIA_GC_GRACE_HOURS`` are kept: an upload completes before the
+    row that references it is saved. Each batch of ``MEDIA_GC_BATCH_SIZE`` candidates is
+    checked against the primary again right before deletion. The job sleeps
+    ``MEDIA_GC_PAUSE_SECONDS`` between batches. Resumable uploads idle for
+    ``UPLOAD_SESSION_TTL_HOURS`` and leftover ``tmp`` files are removed as well.
+    ``dry_run`` only counts.
+    """
+
+    started = time.perf_counter()
+    store = store or get_file_store()
+    now = time.time()
+    grace_cutoff = now - settings.media_gc_grace_hours * 3600
+    result = MediaGcResult(dry_run=dry_run)
+
+    references = _referenced_keys()
+    reference = await anext(references, None)
+    batch: list[StoredEntry] = []
+    try:
+        async for entry in _in_thread(store.scan()):
+            result.scanned += 1
+            while reference is not None and reference < entry.key:
+                result.missing += 1
+                reference = await anext(references, None)
+            if reference == entry.key:
+                result.referenced += 1
+                reference = await anext(references, None)
+                continue
+            if entry.mtime >= grace_cutoff:
+                result.recent += 1
+                continue
+            batch.append(entry)
+            if len(batch) >= settings.media_gc_batch_size:
+                await _collect(store, batch, grace_cutoff, result)
+                batch = []
+        if batch:
+            await _collect(store, batch, grace_cutoff, result)
+        while reference is not None:
+            result.missing += 1
+            reference = await anext(references, None)
+    finally:
+        await references.aclose()
+
+    if not dry_run:
+        session_cutoff = now - settings.upload_session_ttl_hours * 3600
+        removed, reclaimed = await asyncio.to_thread(_remove_stale_uploads, store, session_cutoff, grace_cutoff)
+        result.stale_uploads = removed
+        result.bytes_reclaimed += reclaimed
+
+    result.duration_ms = (time.perf_counter() - started) * 1000
+    if not dry_run:
+        async with write_session() as session:
+            await save_job_state(session, MEDIA_GC_JOB, {**asdict(result), "duration_ms": round(result.duration_ms, 1)})
+            await session.commit()
+    logger.info(
+        "media gc%s: %d files scanned, %d orphaned, %d deleted, %d stale uploads, %d bytes reclaimed (%.0f ms)",
+        " (dry run)" if dry_run else "",
+        result.scanned,
+        result.orphaned,
+        result.deleted,
+        result.stale_uploads,
+        result.bytes_reclaimed,
+        result.duration_ms,
+    )
+    return result
+
+
+async def media_gc_job() -> None:
+    """Scheduled entry point: collect orphaned media."""
+
+    await run_media_gc()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.dashboard.rollups import ROLLUP_BACKFILL_JOB, RollupDeltas, apply_rollup_deltas, issue_contributions
+from app.db.session import AsyncSessionLocal, write_session
+from app.jobs.state import load_job_state, save_job_state
+from app.models.equipment import Equipment
+from app.models.issue_daily_rollup import IssueDailyRollup
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+logger = logging.getLogger("app.jobs.rollups")
+
+_ISSUE_MODELS = (IssueReport, IssueReportArchive)
+
+
+@dataclass(slots=True)
+class RollupBackfillResult:
+    cursor: int
+    upper: int
+    issues: int
+    batches: int
+    complete: bool
+    duration_ms: float
+
+
+async def restart_issue_rollup_backfill() -> int:
+    """Clear the rollups and schedule every existing issue for backfilling.
+
+    Issues created after this commits are maintained by the flush listener; returns the
+    highest issue id the backfill will cover.
+    """
+
+    async with write_session() as session:
+        upper = max(
+            [await session.scalar(select(func.coalesce(func.max(model.issue_id), 0))) for model in _ISSUE_MODELS]
+        )
+        await session.execute(delete(IssueDailyRollup))
+        await save_job_state(session, ROLLUP_BACKFILL_JOB, {"cursor": 0, "upper": upper})
+        await session.commit()
+    return upper
+
+
+async def backfill_issue_rollups(
+    *, batch_size: int | None = None, max_batches: int | None = None
+) -> RollupBackfillResult:
+    """Roll up issues not yet covered by the stored rollups, in batches of consecutive ids.
+
+    Each batch covers the next ``batch_size`` issue ids after the saved cursor in both the
+    hot and the archive table, adds their cells and moves the cursor in one short write
+    transaction. Hot rows are read first and locked (on PostgreSQL), so a concurrent edit
+    either lands before the read or sees the advanced cursor and applies its own delta, and
+    a row being archived concurrently is seen in exactly one of the two tables. Interrupted
+    runs resume from the cursor. A no-op once complete.
+    """
+
+    started = time.perf_counter()
+    batch_size = batch_size or settings.issue_rollup_batch_size
+    async with AsyncSessionLocal() as session:
+        state = await load_job_state(session, ROLLUP_BACKFILL_JOB)
+    cursor, upper = int(state.get("cursor", 0)), int(state.get("upper", 0))
+    issues = batches = 0
+    complete = bool(state.get("complete")) or "upper" not in state
+    while not complete and (max_batches is None or batches < max_batches):
+        end = min(cursor + batch_size, upper)
+        async with write_session() as session:
+            deltas: RollupDeltas = Counter()
+            for model in _ISSUE_MODELS:
+                rows = await _issue_batch(session, model, cursor, end)
+                for row in rows:
+                    deltas.update(
+                        issue_contributions(
+                            row.department_id, row.issue_type, row.status, row.date_raised, row.resolved_at
+                        )
+                    )
+                issues += len(rows)
+            await session.run_sync(lambda sync_session: apply_rollup_deltas(sync_session.connection(), deltas))
+            cursor, complete = end, end >= upper
+            state = {"cursor": cursor, "upper": upper}
+            if complete:
+                state.update(complete=True, completed_at=datetime.now(timezone.utc).isoformat(timespec="seconds"))
+            await save_job_state(session, ROLLUP_BACKFILL_JOB, state)
+            await session.commit()
+        batches += 1
+
+    duration_ms = (time.perf_counter() - started) * 1000
+    if batches:
+        logger.info(
+            "issue rollup backfill: %d issues in %d batches, cursor %d/%d (%.0f ms)",
+            issues,
+            batches,
+            cursor,
+            upper,
+            duration_ms,
+        )
+    return RollupBackfillResult(
+        cursor=cursor, upper=upper, issues=issues, batches=batches, complete=complete, duration_ms=duration_ms
+    )
+
+
+async def _issue_batch(session: AsyncSession, model: Any, lower: int, upper: int) -> list[Any]:
+    statement = (
+        select(
+            model.issue_id,
+            Equipment.department_id,
+            model.issue_type,
+            model.status,
+            model.date_raised,
+            model.resolved_at,
+        )
+        .join(Equipment, Equipment.equipment_id == model.equipment_id)
+        .where(model.issue_id > lower, model.issue_id <= upper)
+    )
+    if model is IssueReport:
+        statement = statement.with_for_update(of=IssueReport)
+    return list((await session.execute(statement)).all())
+
+
+async def issue_rollup_job() -> None:
+    """Scheduler entry point: continue a pending backfill, if any."""
+
+    await backfill_issue_rollups()
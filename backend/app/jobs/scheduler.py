@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.core.config import settings
+from app.jobs.archive import issue_archive_job
+from app.jobs.change_log import change_log_prune_job
+from app.jobs.expiry import expiry_job
+from app.jobs.media_gc import media_gc_job
+from app.jobs.rollups import issue_rollup_job
+
+_scheduler: AsyncIOScheduler | None = None
+
+
+def start_scheduler() -> AsyncIOScheduler | None:
+    """Start the background job scheduler if ``settings.scheduler_enabled``.
+
+    Jobs run on the application's event loop. With several workers, enable the scheduler on
+    one of them only; the jobs are idempotent, but duplicate runs waste writer-queue time.
+    """
+
+    global _scheduler
+    if not settings.scheduler_enabled or _scheduler is not None:
+        return _scheduler
+    _scheduler = AsyncIOScheduler()
+    _scheduler.add_job(
+        expiry_job,
+        "interval",
+        minutes=settings.expiry_scan_interval_minutes,
+        id="equipment_expiry",
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.add_job(
+        issue_archive_job,
+        "interval",
+        minutes=settings.issue_archive_interval_minutes,
+        id="issue_archive",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.add_job(
+        media_gc_job,
+        "interval",
+        hours=settings.media_gc_interval_hours,
+        id="media_gc",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.add_job(
+        change_log_prune_job,
+        "interval",
+        hours=settings.sync_prune_interval_hours,
+        id="change_log_prune",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.add_job(
+        issue_rollup_job,
+        "interval",
+        minutes=5,
+        id="issue_rollup_backfill",
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.start()
+    return _scheduler
+
+
+def shutdown_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+    _scheduler = None
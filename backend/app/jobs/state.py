@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job_state import JobState
+
+
+async def load_job_state(session: AsyncSession, job_name: str) -> dict[str, Any]:
+    """Return the saved state of ``job_name``, or an empty dict if it never ran."""
+
+    state = await session.scalar(select(JobState.state).where(JobState.job_name == job_name))
+    return dict(state or {})
+
+
+async def save_job_state(session: AsyncSession, job_name: str, state: dict[str, Any]) -> None:
+    """Insert or replace the state of ``job_name``; the caller commits."""
+
+    await session.merge(JobState(job_name=job_name, state=state))
@@ -1,12 +1,45 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.auth.passwords import shutdown_password_pool
 from app.core.config import settings
-from app.routers import health
+from app.core.middleware import QueryStatsMiddleware, ReadYourWritesMiddleware
+from app.dashboard.live import dashboard_broker
+from app.jobs.scheduler import shutdown_scheduler, start_scheduler
+from app.routers import (
+    analytics,
+    auth,
+    dashboard,
+    discards,
+    equipment,
+    files,
+    health,
+    issues,
+    reference,
+    search,
+    sync,
+    vendors,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop process-wide resources."""
 
-app = FastAPI(title=settings.app_name, version="0.1.0")
+    start_scheduler()
+    dashboard_broker.start()
+    yield
+    await dashboard_broker.stop()
+    shutdown_scheduler()
+    shutdown_password_pool()
+
+
+app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
 
 origins = (
     [settings.backend_cors_origins]
@@ -22,7 +55,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.sql_instrumentation:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        slow_query_ms=settings.sql_slow_query_ms,
+        n_plus_one_threshold=settings.sql_n_plus_one_threshold,
+    )
+
+if settings.database_replica_urls:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.db_read_your_writes_seconds)
+
 app.include_router(health.router)
+app.include_router(auth.router)
+app.include_router(equipment.router)
+app.include_router(issues.router)
+app.include_router(discards.router)
+app.include_router(vendors.router)
+app.include_router(reference.router)
+app.include_router(dashboard.router)
+app.include_router(analytics.router)
+app.include_router(search.router)
+app.include_router(files.router)
+app.include_router(sync.router)
 
 
 @app.get("/", include_in_schema=False)
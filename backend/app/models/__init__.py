@@ -1,21 +1,47 @@
 from __future__ import annotations
 
 from app.db.session import Base
+from app.models.cache_tag import CacheTag
+from app.models.change_log import ChangeLog
+from app.models.dashboard_counter import DashboardCounter
 from app.models.department import Department
 from app.models.discard_equipment import DiscardEquipment
 from app.models.equipment import Equipment
+from app.models.issue_daily_rollup import IssueDailyRollup
 from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.models.job_state import JobState
 from app.models.refresh_token import RefreshToken
+from app.models.sync_receipt import SyncReceipt
 from app.models.user import User
 from app.models.vendor import Vendor
 
 __all__ = [
     "Base",
+    "CacheTag",
+    "ChangeLog",
+    "DashboardCounter",
     "Department",
     "DiscardEquipment",
     "Equipment",
+    "IssueDailyRollup",
     "IssueReport",
+    "IssueReportArchive",
+    "JobState",
     "RefreshToken",
+    "SyncReceipt",
     "User",
     "Vendor",
 ]
+
+# Registers the flush listener that keeps dashboard counters in step with model writes.
+from app.dashboard import counters as _dashboard_counters  # noqa: E402,F401
+
+# Registers the flush listener that keeps the daily issue rollups in step with issue writes.
+from app.dashboard import rollups as _issue_rollups  # noqa: E402,F401
+
+# Registers the flush/commit listeners that invalidate response-cache tags on reference data writes.
+from app.cache import tags as _cache_tags  # noqa: E402,F401
+
+# Registers the flush listener that records changed rows in the delta-sync change log.
+from app.sync import changes as _change_log  # noqa: E402,F401
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class CacheTag(Base):
+    """Version of a response-cache tag, shared by every worker when ``CACHE_TAG_BACKEND=database``."""
+
+    __tablename__ = "cache_tag"
+
+    tag: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
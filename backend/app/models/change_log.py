@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ChangeLog(Base):
+    """Latest change of every synced row, ordered by ``seq`` for delta sync.
+
+    A row has at most one entry: each change deletes the previous one and inserts a new
+    ``seq``, so the log stays as large as the synced tables plus their tombstones.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ux_change_log_entity_entity_id", "entity", "entity_id", unique=True),
+        Index("ix_change_log_deleted_changed_at", "deleted", "changed_at"),
+        # A reused seq could sit behind a client's cursor; SQLite must never hand one out again.
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(40), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    changed_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Date, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -8,6 +8,10 @@ from app.db.session import Base
 
 class DiscardEquipment(Base):
     __tablename__ = "discard_equipment"
+    __table_args__ = (
+        Index("ix_discard_equipment_date_discard_id", "date", "discard_id"),
+        Index("ix_discard_equipment_updated_at", "updated_at"),
+    )
 
     discard_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     equipment_id: Mapped[int] = mapped_column(ForeignKey("equipment.equipment_id", ondelete="CASCADE"), nullable=False, unique=True)
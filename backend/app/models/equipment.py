@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import CheckConstraint, Date, DateTime, Enum, ForeignKey, Integer, String, func
+from sqlalchemy import CheckConstraint, Date, DateTime, Enum, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -9,7 +9,13 @@ from app.models.enums import EquipmentStatus
 
 class Equipment(Base):
     __tablename__ = "equipment"
-    __table_args__ = (CheckConstraint("quantity >= 0", name="ck_equipment_quantity_non_negative"),)
+    __table_args__ = (
+        CheckConstraint("quantity >= 0", name="ck_equipment_quantity_non_negative"),
+        Index("ix_equipment_status_equipment_id", "status", "equipment_id"),
+        Index("ix_equipment_expiry_date_equipment_id", "expiry_date", "equipment_id"),
+        Index("ix_equipment_equipment_name_equipment_id", "equipment_name", "equipment_id"),
+        Index("ix_equipment_updated_at", "updated_at"),
+    )
 
     equipment_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     equipment_name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -32,6 +38,9 @@ class Equipment(Base):
     department = relationship("Department", back_populates="equipment")
     vendor = relationship("Vendor", back_populates="equipment")
     issue_reports = relationship("IssueReport", back_populates="equipment", cascade="all, delete-orphan")
+    archived_issue_reports = relationship(
+        "IssueReportArchive", back_populates="equipment", cascade="all, delete-orphan"
+    )
     discard_record = relationship(
         "DiscardEquipment",
         back_populates="equipment",
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class IssueDailyRollup(Base):
+    """Issue report totals per UTC day, issue type, current status and department.
+
+    ``raised`` counts issues by the day they were raised; ``resolved`` and
+    ``resolution_seconds`` (raised-to-resolved time, summed) count them by the day
+    ``resolved_at`` falls on. Maintained by :mod:`app.dashboard.rollups`.
+    """
+
+    __tablename__ = "issue_daily_rollup"
+
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    issue_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    department_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    raised: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    resolved: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    resolution_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
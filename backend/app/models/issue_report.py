@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -9,6 +9,14 @@ from app.models.enums import IssueStatus, IssueType
 
 class IssueReport(Base):
     __tablename__ = "issue_report"
+    __table_args__ = (
+        Index("ix_issue_report_status_issue_id", "status", "issue_id"),
+        Index("ix_issue_report_date_raised_issue_id", "date_raised", "issue_id"),
+        Index("ix_issue_report_equipment_id", "equipment_id"),
+        Index("ix_issue_report_updated_at", "updated_at"),
+        # Archived reports keep their ids; SQLite must never hand them out again.
+        {"sqlite_autoincrement": True},
+    )
 
     issue_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     equipment_id: Mapped[int] = mapped_column(ForeignKey("equipment.equipment_id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.session import Base
+from app.models.enums import IssueStatus, IssueType
+
+
+class IssueReportArchive(Base):
+    """Closed issue reports moved out of ``issue_report`` by :mod:`app.jobs.archive`.
+
+    Rows keep their ``issue_id`` and columns unchanged, so hot and archived reports can be
+    combined with ``UNION ALL``. Lists and search only include them when asked to.
+    """
+
+    __tablename__ = "issue_report_archive"
+    __table_args__ = (
+        Index("ix_issue_report_archive_status_issue_id", "status", "issue_id"),
+        Index("ix_issue_report_archive_date_raised_issue_id", "date_raised", "issue_id"),
+        Index("ix_issue_report_archive_equipment_id", "equipment_id"),
+        Index("ix_issue_report_archive_updated_at", "updated_at"),
+    )
+
+    issue_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    equipment_id: Mapped[int] = mapped_column(ForeignKey("equipment.equipment_id", ondelete="CASCADE"), nullable=False)
+    issue_type: Mapped[IssueType] = mapped_column(Enum(IssueType, name="issue_type"), nullable=False)
+    problem_description: Mapped[str] = mapped_column(Text, nullable=False)
+    media_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    date_raised: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    status: Mapped[IssueStatus] = mapped_column(Enum(IssueStatus, name="issue_status"), nullable=False)
+    technician: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    resolved_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    equipment = relationship("Equipment", back_populates="archived_issue_reports")
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class JobState(Base):
+    """Persistent progress (high-water marks, precomputed results) of a background job."""
+
+    __tablename__ = "job_state"
+
+    job_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    state: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
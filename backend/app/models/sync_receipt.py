@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class SyncReceipt(Base):
+    """Server id given to a row pushed by a sync client, so a retried push is not applied twice."""
+
+    __tablename__ = "sync_receipt"
+
+    client_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    entity: Mapped[str] = mapped_column(String(40), primary_key=True)
+    client_row_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    server_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy import DateTime, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -8,6 +8,7 @@ from app.db.session import Base
 
 class Vendor(Base):
     __tablename__ = "vendor"
+    __table_args__ = (Index("ix_vendor_vendor_name_vendor_id", "vendor_name", "vendor_id"),)
 
     vendor_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     vendor_name: Mapped[str] = mapped_column(String(200), nullable=False)
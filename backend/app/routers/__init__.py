@@ -1,5 +1,31 @@
 from __future__ import annotations
 
-from app.routers import health
+from app.routers import (
+    analytics,
+    auth,
+    dashboard,
+    discards,
+    equipment,
+    files,
+    health,
+    issues,
+    reference,
+    search,
+    sync,
+    vendors,
+)
 
-__all__ = ["health"]
+__all__ = [
+    "analytics",
+    "auth",
+    "dashboard",
+    "discards",
+    "equipment",
+    "files",
+    "health",
+    "issues",
+    "reference",
+    "search",
+    "sync",
+    "vendors",
+]
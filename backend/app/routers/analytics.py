@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics.reliability import DEFAULT_MIN_EXPOSURE_DAYS, ReliabilityGroup, ReliabilitySort, get_reliability
+from app.db.session import get_db
+
+router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
+
+
+@router.get("/reliability", summary="Equipment reliability ranking")
+async def reliability(
+    group_by: ReliabilityGroup = Query(default="equipment"),
+    sort: ReliabilitySort = Query(default="failure_rate", description="Least reliable first"),
+    department_id: int | None = Query(default=None),
+    min_failures: int = Query(default=1, ge=0, description="Skip groups with fewer failures"),
+    min_exposure_days: float = Query(
+        default=DEFAULT_MIN_EXPOSURE_DAYS,
+        ge=0,
+        description="Skip groups with less combined time in service, whose rates are mostly noise",
+    ),
+    limit: int = Query(default=50, ge=1, le=500),
+    session: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Return MTBF, MTTR and failure rate per unit, model or manufacturer, least reliable first."""
+
+    return await get_reliability(
+        session,
+        group_by=group_by,
+        sort=sort,
+        department_id=department_id,
+        min_failures=min_failures,
+        min_exposure_days=min_exposure_days,
+        limit=limit,
+    )
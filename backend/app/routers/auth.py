@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import AuthenticatedUser, get_current_user, unauthorized
+from app.auth.passwords import verify_password
+from app.auth.revocation import mark_session_revoked
+from app.auth.tokens import create_access_token, hash_refresh_token, new_refresh_token
+from app.db.session import get_db, get_primary_db, write_session
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.schemas.auth import CurrentUserRead, RefreshRequest, TokenPair
+
+router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
+
+
+async def _issue_tokens(user_id: int, username: str, role: str, revoke_token_id: int | None = None) -> TokenPair:
+    """Store a new refresh token (revoking ``revoke_token_id`` atomically) and sign an access token."""
+
+    refresh_token, token_hash, expires_at = new_refresh_token()
+    async with write_session() as session:
+        if revoke_token_id is not None:
+            result = await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.token_id == revoke_token_id, RefreshToken.revoked.is_(False))
+                .values(revoked=True)
+            )
+            if result.rowcount != 1:
+                # Lost a race with a concurrent refresh or logout using the same token.
+                raise unauthorized("Invalid refresh token")
+        record = RefreshToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
+        session.add(record)
+        if revoke_token_id is None:
+            await session.execute(
+                update(User).where(User.user_id == user_id).values(last_login=datetime.now(timezone.utc))
+            )
+        await session.flush()
+        access_token, expires_in = create_access_token(user_id, username, role, record.token_id)
+        await session.commit()
+    if revoke_token_id is not None:
+        mark_session_revoked(revoke_token_id)
+    return TokenPair(access_token=access_token, refresh_token=refresh_token, expires_in=expires_in)
+
+
+@router.post("/login", summary="Log in with username and password", response_model=TokenPair)
+async def login(
+    form: OAuth2PasswordRequestForm = Depends(),
+    session: AsyncSession = Depends(get_db),
+) -> TokenPair:
+    """Exchange credentials for an access token and a refresh token.
+
+    bcrypt runs in the auth process pool, and the SQLite writer queue is only entered after
+    the password has been checked.
+    """
+
+    user = (await session.execute(select(User).where(User.username == form.username))).scalar_one_or_none()
+    valid = await verify_password(form.password, user.password_hash if user is not None else None)
+    if user is None or not valid or not user.is_active:
+        raise unauthorized("Incorrect username or password")
+    return await _issue_tokens(user.user_id, user.username, str(user.role))
+
+
+@router.post("/refresh", summary="Rotate a refresh token", response_model=TokenPair)
+async def refresh(payload: RefreshRequest, session: AsyncSession = Depends(get_primary_db)) -> TokenPair:
+    """Revoke the presented refresh token and return a new token pair."""
+
+    row = (
+        await session.execute(
+            select(RefreshToken, User)
+            .join(User, User.user_id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == hash_refresh_token(payload.refresh_token))
+        )
+    ).one_or_none()
+    if row is None:
+        raise unauthorized("Invalid refresh token")
+    token, user = row
+    expires_at = token.expires_at if token.expires_at.tzinfo else token.expires_at.replace(tzinfo=timezone.utc)
+    if token.revoked or expires_at <= datetime.now(timezone.utc) or not user.is_active:
+        raise unauthorized("Invalid refresh token")
+    return await _issue_tokens(user.user_id, user.username, str(user.role), revoke_token_id=token.token_id)
+
+
+@router.post("/logout", summary="Revoke a refresh token", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: RefreshRequest) -> Response:
+    """Revoke the refresh token and, with it, access tokens issued from it.
+
+    Other workers notice within ``AUTH_REVOCATION_CACHE_SECONDS``.
+    """
+
+    async with write_session() as session:
+        token_id = (
+            await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.token_hash == hash_refresh_token(payload.refresh_token))
+                .values(revoked=True)
+                .returning(RefreshToken.token_id)
+            )
+        ).scalar_one_or_none()
+        await session.commit()
+    if token_id is not None:
+        mark_session_revoked(token_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/me", summary="Current user", response_model=CurrentUserRead)
+async def read_current_user(user: AuthenticatedUser = Depends(get_current_user)) -> CurrentUserRead:
+    """Return the caller's identity from the access token."""
+
+    return CurrentUserRead.model_validate(user)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.dashboard.live import dashboard_broker
+from app.dashboard.stats import get_dashboard_stats
+from app.dashboard.trends import Granularity, TrendGroup, issue_trend
+from app.db.session import get_db
+from app.jobs.expiry import get_expiry_alerts
+from app.models.enums import IssueStatus, IssueType
+
+router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
+
+
+@router.get("/stats", summary="Dashboard statistics")
+async def dashboard_stats(session: AsyncSession = Depends(get_db)) -> dict[str, object]:
+    """Return aggregated dashboard metrics from the maintained counters."""
+
+    return await get_dashboard_stats(session)
+
+
+@router.get("/stream", summary="Live dashboard updates (Server-Sent Events)", response_class=StreamingResponse)
+async def dashboard_stream() -> StreamingResponse:
+    """Push dashboard changes instead of having screens poll ``/stats``.
+
+    The stream starts with a ``snapshot`` event (every counter as ``{metric: {bucket: value}}``
+    plus the expiry alert totals). Then ``delta`` events follow, at most one per coalescing
+    window. They carry the new values of changed counters, new issue reports and changed
+    expiry totals. A client that falls behind receives a fresh ``snapshot``. Comment lines
+    are sent as heartbeats.
+    """
+
+    if not dashboard_broker.has_capacity():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live dashboard connections",
+            headers={"Retry-After": "30"},
+        )
+    return StreamingResponse(
+        dashboard_broker.subscribe(settings.dashboard_push_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/expiring", summary="Equipment expiring soon")
+async def expiring_equipment(
+    within_days: int = Query(default=30, description="One of the configured EXPIRY_ALERT_WINDOWS"),
+    session: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Return the precomputed "expiring within N days" alert set, nearest expiry first."""
+
+    if within_days not in settings.expiry_alert_windows:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"within_days must be one of {sorted(settings.expiry_alert_windows)}",
+        )
+    alerts = await get_expiry_alerts(session)
+    window = alerts["windows"][str(within_days)]
+    return {"computed_for": alerts["computed_for"], "within_days": within_days, **window}
+
+
+@router.get("/issue-trend", summary="Issue trend over time")
+async def issue_trend_chart(
+    start: date | None = Query(default=None, description="First day (UTC); defaults to 90 days before end"),
+    end: date | None = Query(default=None, description="Last day (UTC), inclusive; defaults to today"),
+    granularity: Granularity = Query(default="day"),
+    group_by: TrendGroup | None = Query(default=None),
+    issue_type: IssueType | None = Query(default=None),
+    issue_status: IssueStatus | None = Query(default=None, alias="status"),
+    department_id: int | None = Query(default=None),
+    session: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Return raised/resolved issue counts per period from the daily rollups."""
+
+    end = end or date.today()
+    start = start or end - timedelta(days=89)
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end")
+    if (end - start).days + 1 > settings.issue_trend_max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"date range must not exceed {settings.issue_trend_max_days} days",
+        )
+    return await issue_trend(
+        session,
+        start,
+        end,
+        granularity=granularity,
+        group_by=group_by,
+        issue_type=issue_type.value if issue_type else None,
+        status=issue_status.value if issue_status else None,
+        department_id=department_id,
+    )
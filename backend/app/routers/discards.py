@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conditional import is_not_modified, make_validators, not_modified, request_variant
+from app.core.responses import FastJSONResponse
+from app.crud.discard import discard_detail_fingerprint, discard_list_fingerprint, get_discard, list_discard_rows
+from app.crud.fingerprint import fetch_fingerprint
+from app.db.pagination import InvalidCursorError
+from app.db.session import get_db
+from app.schemas.common import Page, page_payload
+from app.schemas.discard import DiscardRead
+
+router = APIRouter(prefix="/api/v1/discards", tags=["discards"], default_response_class=FastJSONResponse)
+
+
+@router.get("", summary="List discarded equipment", response_model=Page[DiscardRead])
+async def read_discards(
+    request: Request,
+    department_id: int | None = Query(default=None),
+    sort_by: Literal["discard_id", "date"] = Query(default="discard_id"),
+    sort_order: Literal["asc", "desc"] = Query(default="asc"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page"),
+    page_size: int = Query(default=50, ge=1, le=200),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return discard records with their equipment using keyset pagination; supports conditional GET."""
+
+    fingerprint = await fetch_fingerprint(session, discard_list_fingerprint(department_id=department_id))
+    validators = make_validators(request.url.path, fingerprint, variant=request_variant(request))
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    try:
+        page = await list_discard_rows(
+            session,
+            department_id=department_id,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            page_size=page_size,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return FastJSONResponse(page_payload(page), headers=validators.headers() if validators else None)
+
+
+@router.get("/{discard_id}", summary="Get discard record", response_model=DiscardRead)
+async def read_discard(
+    discard_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_db),
+) -> DiscardRead | Response:
+    """Return one discard record with its equipment and department."""
+
+    fingerprint = await fetch_fingerprint(session, discard_detail_fingerprint(discard_id))
+    if fingerprint is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Discard record not found")
+    validators = make_validators(request.url.path, fingerprint)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    discard = await get_discard(session, discard_id)
+    if discard is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Discard record not found")
+    if validators is not None:
+        response.headers.update(validators.headers())
+    return DiscardRead.model_validate(discard)
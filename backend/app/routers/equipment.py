@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import AuthenticatedUser, get_current_user
+from app.core.conditional import is_not_modified, make_validators, not_modified, request_variant
+from app.core.responses import FastJSONResponse
+from app.crud.equipment import (
+    equipment_detail_fingerprint,
+    equipment_list_fingerprint,
+    get_equipment,
+    list_equipment_rows,
+)
+from app.crud.equipment_bulk import bulk_write_equipment
+from app.crud.equipment_facets import get_equipment_facets
+from app.crud.fingerprint import fetch_fingerprint
+from app.db.pagination import InvalidCursorError
+from app.db.session import get_db, write_session
+from app.export import export_equipment, export_response
+from app.models.enums import EquipmentStatus
+from app.schemas.common import page_payload
+from app.schemas.equipment import EquipmentBulkRequest, EquipmentBulkResult, EquipmentDetailRead, EquipmentPage
+
+router = APIRouter(prefix="/api/v1/equipment", tags=["equipment"], default_response_class=FastJSONResponse)
+
+
+@router.get("", summary="List equipment", response_model=EquipmentPage)
+async def read_equipment(
+    request: Request,
+    status_filter: EquipmentStatus | None = Query(default=None, alias="status"),
+    department_id: int | None = Query(default=None),
+    vendor_id: int | None = Query(default=None),
+    purchased_from: date | None = Query(default=None),
+    purchased_to: date | None = Query(default=None),
+    expires_from: date | None = Query(default=None),
+    expires_to: date | None = Query(default=None),
+    expired: bool | None = Query(default=None, description="Expiry date on or before today"),
+    search: str | None = Query(default=None, max_length=200, description="Full-text filter; terms match as prefixes"),
+    sort_by: Literal["equipment_id", "equipment_name", "status", "expiry_date"] = Query(default="equipment_id"),
+    sort_order: Literal["asc", "desc"] = Query(default="asc"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page"),
+    page_size: int = Query(default=50, ge=1, le=200),
+    facets: bool = Query(default=False, description="Also return counts per filter option"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return equipment with department and vendor names using keyset pagination.
+
+    Supports ``If-None-Match``/``If-Modified-Since``; a match returns 304 after one
+    fingerprint query over the filtered rows, without fetching or serialising the page.
+    Facet counts are cached per filter set and version, so paging through one listing
+    counts once.
+    """
+
+    today = date.today()
+    filters = {
+        "status": status_filter,
+        "department_id": department_id,
+        "vendor_id": vendor_id,
+        "purchased_from": purchased_from,
+        "purchased_to": purchased_to,
+        "expires_from": expires_from,
+        "expires_to": expires_to,
+        "expired": expired,
+        "search": search,
+    }
+    dialect_name = session.get_bind().dialect.name
+    # Each facet counts options with its own filter left out, so with facets the version must
+    # cover every row the search matches, not only the filtered page.
+    scope = {"search": search} if facets else {**filters, "today": today}
+    fingerprint = await fetch_fingerprint(session, equipment_list_fingerprint(dialect_name, **scope))
+    if expired is not None or facets:
+        # ``expired`` and the expiry facet change at midnight without any write.
+        fingerprint = (*fingerprint, datetime.combine(today, time()).astimezone())
+    validators = make_validators(request.url.path, fingerprint, variant=request_variant(request))
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    try:
+        page = await list_equipment_rows(
+            session, sort_by=sort_by, sort_order=sort_order, cursor=cursor, page_size=page_size, today=today, **filters
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    payload = page_payload(page)
+    if facets:
+        payload["facets"] = await get_equipment_facets(session, version=fingerprint, today=today, **filters)
+    return FastJSONResponse(payload, headers=validators.headers() if validators else None)
+
+
+@router.get("/export", summary="Export equipment", response_class=StreamingResponse)
+async def export_equipment_inventory(
+    fmt: Literal["csv", "jsonl"] = Query(default="csv", alias="format"),
+    gzip: bool = Query(default=False, description="Return a gzip-compressed file"),
+    status_filter: EquipmentStatus | None = Query(default=None, alias="status"),
+    department_id: int | None = Query(default=None),
+    vendor_id: int | None = Query(default=None),
+    purchased_from: date | None = Query(default=None),
+    purchased_to: date | None = Query(default=None),
+    expires_from: date | None = Query(default=None),
+    expires_to: date | None = Query(default=None),
+    expired: bool | None = Query(default=None),
+    search: str | None = Query(default=None, max_length=200),
+) -> StreamingResponse:
+    """Stream every matching equipment row as CSV or JSON lines.
+
+    Rows are read from a server-side cursor and encoded batch by batch, so memory stays flat
+    regardless of the inventory size.
+    """
+
+    body = export_equipment(
+        fmt,
+        compress=gzip,
+        status=status_filter,
+        department_id=department_id,
+        vendor_id=vendor_id,
+        purchased_from=purchased_from,
+        purchased_to=purchased_to,
+        expires_from=expires_from,
+        expires_to=expires_to,
+        expired=expired,
+        search=search,
+    )
+    return export_response(body, "equipment", fmt, compress=gzip)
+
+
+@router.post("/bulk", summary="Create or upsert equipment in bulk", response_model=EquipmentBulkResult)
+async def bulk_write(
+    payload: EquipmentBulkRequest,
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> EquipmentBulkResult:
+    """Write a batch of equipment in one transaction and report the outcome of every row.
+
+    Rows are validated together and written with one multi-row ``INSERT ... RETURNING``;
+    rejected rows carry the reason and do not stop the rest unless ``atomic`` is set.
+    """
+
+    async with write_session() as session:
+        result = await bulk_write_equipment(session, payload.items, mode=payload.mode, atomic=payload.atomic)
+        await session.commit()
+    return EquipmentBulkResult.model_validate(result)
+
+
+@router.get("/{equipment_id}", summary="Get equipment", response_model=EquipmentDetailRead)
+async def read_equipment_item(
+    equipment_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_db),
+) -> EquipmentDetailRead | Response:
+    """Return one equipment item with its department, vendor, discard record and open issues."""
+
+    fingerprint = await fetch_fingerprint(session, equipment_detail_fingerprint(equipment_id))
+    if fingerprint is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
+    validators = make_validators(request.url.path, fingerprint)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    equipment = await get_equipment(session, equipment_id)
+    if equipment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Equipment not found")
+    if validators is not None:
+        response.headers.update(validators.headers())
+    return EquipmentDetailRead.model_validate(equipment)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.auth.dependencies import AuthenticatedUser, get_current_user
+from app.schemas.file import StoredFileRead, UploadSessionCreate, UploadSessionRead
+from app.storage.local import (
+    OBJECTS_DIR,
+    LocalFileStore,
+    StorageError,
+    UnsupportedMediaTypeError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+    get_file_store,
+)
+
+router = APIRouter(prefix="/api/v1/files", tags=["files"])
+
+# Starlette renamed HTTP_413_REQUEST_ENTITY_TOO_LARGE; the number is stable across versions.
+_CONTENT_TOO_LARGE = 413
+
+
+def _http_error(exc: StorageError) -> HTTPException:
+    if isinstance(exc, UploadTooLargeError):
+        return HTTPException(status_code=_CONTENT_TOO_LARGE, detail=str(exc))
+    if isinstance(exc, UnsupportedMediaTypeError):
+        return HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(exc))
+    if isinstance(exc, UploadNotFoundError):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if isinstance(exc, UploadOffsetMismatchError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+            headers={"Upload-Offset": str(exc.offset)},
+        )
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def _content_length(request: Request, limit: int) -> int | None:
+    declared = request.headers.get("content-length")
+    if declared is None or not declared.isdigit():
+        return None
+    if int(declared) > limit:
+        raise HTTPException(status_code=_CONTENT_TOO_LARGE, detail=f"Upload exceeds {limit} bytes")
+    return int(declared)
+
+
+@router.post("", summary="Upload a media file", status_code=status.HTTP_201_CREATED, response_model=StoredFileRead)
+async def upload_file(
+    request: Request,
+    store: LocalFileStore = Depends(get_file_store),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> StoredFileRead:
+    """Stream the raw request body into content-addressed storage.
+
+    Send the file bytes as the body (not multipart). Identical files return the same key.
+    """
+
+    _content_length(request, store.max_bytes)
+    try:
+        stored = await store.save_stream(request.stream())
+    except StorageError as exc:
+        raise _http_error(exc) from exc
+    return StoredFileRead.model_validate(stored)
+
+
+@router.post(
+    "/uploads",
+    summary="Start a resumable upload",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UploadSessionRead,
+)
+async def create_upload(
+    payload: UploadSessionCreate,
+    store: LocalFileStore = Depends(get_file_store),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> UploadSessionRead:
+    """Create an upload session that accepts the file in sequential parts."""
+
+    try:
+        session = await store.create_session(payload.size, payload.filename)
+    except StorageError as exc:
+        raise _http_error(exc) from exc
+    return UploadSessionRead.model_validate(session)
+
+
+@router.get("/uploads/{upload_id}", summary="Get resumable upload progress", response_model=UploadSessionRead)
+async def read_upload(
+    upload_id: str,
+    store: LocalFileStore = Depends(get_file_store),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> UploadSessionRead:
+    """Return the offset to resume from after an interrupted part."""
+
+    try:
+        session = await store.get_session(upload_id)
+    except StorageError as exc:
+        raise _http_error(exc) from exc
+    return UploadSessionRead.model_validate(session)
+
+
+@router.patch("/uploads/{upload_id}", summary="Append a part to a resumable upload", response_model=UploadSessionRead)
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(alias="Upload-Offset", ge=0),
+    store: LocalFileStore = Depends(get_file_store),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> UploadSessionRead:
+    """Append the body at ``Upload-Offset``; ``file`` is set once the last byte arrives."""
+
+    length = _content_length(request, store.max_bytes)
+    try:
+        session, stored = await store.append(upload_id, upload_offset, request.stream(), length=length)
+    except StorageError as exc:
+        raise _http_error(exc) from exc
+    result = UploadSessionRead.model_validate(session)
+    if stored is not None:
+        result.file = StoredFileRead.model_validate(stored)
+    return result
+
+
+@router.delete("/uploads/{upload_id}", summary="Abort a resumable upload", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_upload(
+    upload_id: str,
+    store: LocalFileStore = Depends(get_file_store),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> Response:
+    """Discard an unfinished upload and its received parts."""
+
+    try:
+        await store.delete_session(upload_id)
+    except StorageError as exc:
+        raise _http_error(exc) from exc
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/{key:path}", summary="Download a stored file")
+async def download_file(key: str, store: LocalFileStore = Depends(get_file_store)) -> FileResponse:
+    """Serve a stored file from disk without loading it into memory.
+
+    Public, like the media URLs stored on issue and discard rows that point here.
+    """
+
+    path = store.path_for(key)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    headers = {}
+    if key.startswith(f"{OBJECTS_DIR}/"):
+        # Content-addressed keys never change content.
+        headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return FileResponse(path, headers=headers)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+import time
+from typing import Any
+
 from fastapi import APIRouter
+from sqlalchemy import text
+
+from app.cache import response_cache
+from app.dashboard.live import dashboard_broker
+from app.db.engine import pool_status
+from app.db.session import engine, replicas, writer_queue
 
 router = APIRouter(prefix="/api/v1/health", tags=["health"])
 
@@ -10,3 +19,33 @@ async def health_check() -> dict[str, str]:
     """Return basic service health information."""
 
     return {"status": "healthy"}
+
+
+@router.get("/db", summary="Database and connection pool health")
+async def database_health() -> dict[str, Any]:
+    """Ping the primary and report pool, replica and SQLite writer queue status."""
+
+    started = time.perf_counter()
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    return {
+        "status": "healthy",
+        "ping_ms": round((time.perf_counter() - started) * 1000, 2),
+        "pool": pool_status(engine),
+        "writer_queue": writer_queue.status(),
+        "replicas": replicas.status(),
+    }
+
+
+@router.get("/cache", summary="Response cache statistics")
+async def cache_health() -> dict[str, Any]:
+    """Report response cache hits, misses, tag invalidations, expirations, evictions and tag versions."""
+
+    return response_cache.stats()
+
+
+@router.get("/live", summary="Live dashboard push statistics")
+async def live_health() -> dict[str, Any]:
+    """Report connected dashboard streams, frames sent, snapshot resyncs and reconciliations."""
+
+    return dashboard_broker.status()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.conditional import is_not_modified, make_validators, not_modified, request_variant
+from app.core.responses import FastJSONResponse
+from app.crud.fingerprint import fetch_fingerprint
+from app.crud.issue_report import get_issue, issue_detail_fingerprint, issue_list_fingerprint, list_issue_rows
+from app.db.pagination import InvalidCursorError
+from app.db.session import get_db
+from app.export import export_issues, export_response
+from app.models.enums import IssueStatus, IssueType
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+from app.schemas.common import Page, page_payload
+from app.schemas.issue_report import IssueReportRead
+
+router = APIRouter(prefix="/api/v1/issues", tags=["issues"], default_response_class=FastJSONResponse)
+
+
+@router.get("", summary="List issue reports", response_model=Page[IssueReportRead])
+async def read_issues(
+    request: Request,
+    status_filter: IssueStatus | None = Query(default=None, alias="status"),
+    issue_type: IssueType | None = Query(default=None),
+    equipment_id: int | None = Query(default=None),
+    search: str | None = Query(default=None, max_length=200, description="Full-text filter; terms match as prefixes"),
+    sort_by: Literal["issue_id", "status", "date_raised"] = Query(default="issue_id"),
+    sort_order: Literal["asc", "desc"] = Query(default="asc"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page"),
+    page_size: int = Query(default=50, ge=1, le=200),
+    include_archived: bool = Query(default=False, description="Also return closed reports moved to the archive"),
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return issue reports with their equipment using keyset pagination; supports conditional GET."""
+
+    filters = {
+        "status": status_filter,
+        "issue_type": issue_type,
+        "equipment_id": equipment_id,
+        "search": search,
+        "include_archived": include_archived,
+    }
+    fingerprint = await fetch_fingerprint(session, issue_list_fingerprint(session.get_bind().dialect.name, **filters))
+    validators = make_validators(request.url.path, fingerprint, variant=request_variant(request))
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    try:
+        page = await list_issue_rows(
+            session, sort_by=sort_by, sort_order=sort_order, cursor=cursor, page_size=page_size, **filters
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return FastJSONResponse(page_payload(page), headers=validators.headers() if validators else None)
+
+
+@router.get("/export", summary="Export issue reports", response_class=StreamingResponse)
+async def export_issue_reports(
+    fmt: Literal["csv", "jsonl"] = Query(default="csv", alias="format"),
+    gzip: bool = Query(default=False, description="Return a gzip-compressed file"),
+    status_filter: IssueStatus | None = Query(default=None, alias="status"),
+    issue_type: IssueType | None = Query(default=None),
+    equipment_id: int | None = Query(default=None),
+    search: str | None = Query(default=None, max_length=200),
+    include_archived: bool = Query(default=False, description="Also export archived reports"),
+) -> StreamingResponse:
+    """Stream every matching issue report as CSV or JSON lines from a server-side cursor."""
+
+    body = export_issues(
+        fmt,
+        compress=gzip,
+        status=status_filter,
+        issue_type=issue_type,
+        equipment_id=equipment_id,
+        search=search,
+        include_archived=include_archived,
+    )
+    return export_response(body, "issues", fmt, compress=gzip)
+
+
+@router.get("/{issue_id}", summary="Get issue report", response_model=IssueReportRead)
+async def read_issue(
+    issue_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_db),
+) -> IssueReportRead | Response:
+    """Return one issue report with its equipment and department.
+
+    Archived reports keep their ids, so links to them still resolve.
+    """
+
+    model = IssueReport
+    fingerprint = await fetch_fingerprint(session, issue_detail_fingerprint(issue_id))
+    if fingerprint is None:
+        model = IssueReportArchive
+        fingerprint = await fetch_fingerprint(session, issue_detail_fingerprint(issue_id, model))
+    if fingerprint is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Issue report not found")
+    validators = make_validators(request.url.path, fingerprint)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    issue = await get_issue(session, issue_id, model)
+    if issue is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Issue report not found")
+    if validators is not None:
+        response.headers.update(validators.headers())
+    return IssueReportRead.model_validate(issue)
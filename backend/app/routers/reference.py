@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
+
+from app.cache import DEPARTMENTS_TAG, VENDORS_TAG, cached_json_response
+from app.crud.department import list_departments
+from app.crud.vendor import list_vendor_refs
+from app.db.session import primary_session
+from app.models.enums import EquipmentStatus, IssueStatus, IssueType, UserRole
+
+router = APIRouter(prefix="/api/v1/reference", tags=["reference"])
+
+_ENUMS = {
+    "equipment_status": [member.value for member in EquipmentStatus],
+    "issue_type": [member.value for member in IssueType],
+    "issue_status": [member.value for member in IssueStatus],
+    "user_role": [member.value for member in UserRole],
+}
+
+
+@router.get("", summary="Departments, vendors and enum values for forms and filter panels")
+async def read_reference(request: Request) -> Response:
+    """Everything an equipment form needs in one cached response.
+
+    Cache fills read the primary: a lagging replica would store pre-write rows under the
+    post-write tag version.
+    """
+
+    async def build() -> dict[str, Any]:
+        async with primary_session() as session:
+            return {
+                "departments": await list_departments(session),
+                "vendors": await list_vendor_refs(session),
+                "enums": _ENUMS,
+            }
+
+    return await cached_json_response(request, [DEPARTMENTS_TAG, VENDORS_TAG], build)
+
+
+@router.get("/departments", summary="List departments")
+async def read_departments(request: Request) -> Response:
+    """Return every department, ordered by name."""
+
+    async def build() -> list[dict[str, Any]]:
+        async with primary_session() as session:
+            return await list_departments(session)
+
+    return await cached_json_response(request, [DEPARTMENTS_TAG], build)
+
+
+@router.get("/enums", summary="Allowed enum values")
+async def read_enums(request: Request) -> Response:
+    """Return the allowed values of every enum field."""
+
+    async def build() -> dict[str, list[str]]:
+        return _ENUMS
+
+    return await cached_json_response(request, [], build)
+
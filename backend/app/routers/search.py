@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.schemas.search import SearchHitRead, SearchResults
+from app.search.service import SearchScope, search
+
+router = APIRouter(prefix="/api/v1/search", tags=["search"])
+
+
+@router.get("", summary="Full-text search", response_model=SearchResults)
+async def full_text_search(
+    q: str = Query(min_length=1, max_length=200, description="Search terms; each term matches as a prefix"),
+    scope: SearchScope = Query(default="all"),
+    limit: int = Query(default=20, ge=1, le=100),
+    include_archived: bool = Query(default=False, description="Also search closed issue reports in the archive"),
+    session: AsyncSession = Depends(get_db),
+) -> SearchResults:
+    """Return ranked equipment and issue matches; titles and snippets are escaped HTML with ``<mark>`` matches."""
+
+    hits = await search(session, q, scope=scope, limit=limit, include_archived=include_archived)
+    return SearchResults(data=[SearchHitRead.model_validate(hit) for hit in hits])
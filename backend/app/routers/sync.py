@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import AuthenticatedUser, get_current_user
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.db.session import get_db, write_session
+from app.schemas.sync import SyncChangesRead, SyncPushRequest, SyncPushResult
+from app.sync.feed import CursorExpiredError, read_changes
+from app.sync.push import apply_push
+
+router = APIRouter(prefix="/api/v1/sync", tags=["sync"], default_response_class=FastJSONResponse)
+
+
+@router.get("/changes", summary="Read changes since a cursor", response_model=SyncChangesRead)
+async def read_sync_changes(
+    since: int = Query(default=0, ge=0, description="`cursor` of the previous call; 0 downloads every row"),
+    limit: int = Query(default=settings.sync_batch_size, ge=1, le=5000),
+    session: AsyncSession = Depends(get_db),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> Response:
+    """Return the rows changed after ``since``, including tombstones, in change-sequence order.
+
+    Each row appears once per batch with its current values; call again with ``cursor``
+    while ``has_more`` is true. 410 means the cursor predates pruned deletions.
+    """
+
+    try:
+        batch = await read_changes(session, since, limit)
+    except CursorExpiredError as exc:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(exc)) from exc
+    return FastJSONResponse(batch.payload(), headers={"Cache-Control": "no-store"})
+
+
+@router.post("/changes", summary="Push rows created offline", response_model=SyncPushResult)
+async def push_sync_changes(
+    payload: SyncPushRequest,
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> SyncPushResult:
+    """Create a client's offline rows in one transaction and return their server ids.
+
+    Retrying a push is safe: rows already received from the same ``client_id`` are
+    reported as ``matched`` with the id they got the first time.
+    """
+
+    async with write_session() as session:
+        try:
+            result = await apply_push(session, payload)
+            await session.commit()
+        except IntegrityError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Conflicting concurrent write; retry the push"
+            ) from exc
+    return SyncPushResult.model_validate(result)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+
+from app.cache import VENDORS_TAG, cached_json_response
+from app.crud.vendor import list_vendors
+from app.db.pagination import InvalidCursorError
+from app.db.session import primary_session
+from app.schemas.common import Page
+from app.schemas.vendor import VendorRead
+
+router = APIRouter(prefix="/api/v1/vendors", tags=["vendors"])
+
+
+@router.get("", summary="List vendors", response_model=Page[VendorRead])
+async def read_vendors(
+    request: Request,
+    category: str | None = Query(default=None),
+    sort_by: Literal["vendor_id", "vendor_name"] = Query(default="vendor_id"),
+    sort_order: Literal["asc", "desc"] = Query(default="asc"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page"),
+    page_size: int = Query(default=50, ge=1, le=200),
+) -> Response:
+    """Return vendors using keyset pagination, from the response cache while the vendor table is unchanged."""
+
+    async def build() -> dict[str, Any]:
+        # Cache fills read the primary: a lagging replica would store pre-write rows under
+        # the post-write tag version.
+        async with primary_session() as session:
+            try:
+                page = await list_vendors(
+                    session,
+                    category=category,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    cursor=cursor,
+                    page_size=page_size,
+                )
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+            return Page[VendorRead].from_keyset(page).model_dump(mode="json")
+
+    return await cached_json_response(request, [VENDORS_TAG], build)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from app.schemas.auth import CurrentUserRead, RefreshRequest, TokenPair
+from app.schemas.common import Page, PageMeta, page_payload
+from app.schemas.discard import DiscardRead
+from app.schemas.equipment import (
+    BulkRowResult,
+    DiscardSummary,
+    EquipmentBulkRequest,
+    EquipmentBulkResult,
+    EquipmentCreate,
+    EquipmentDetailRead,
+    EquipmentFacetsRead,
+    EquipmentPage,
+    EquipmentRead,
+    FacetRead,
+    FacetValueRead,
+    OpenIssueSummary,
+)
+from app.schemas.file import StoredFileRead, UploadSessionCreate, UploadSessionRead
+from app.schemas.issue_report import IssueReportRead
+from app.schemas.refs import DepartmentRef, EquipmentRef, VendorRef
+from app.schemas.search import SearchHitRead, SearchResults
+from app.schemas.sync import (
+    SyncChangesRead,
+    SyncDepartmentRow,
+    SyncDiscardRow,
+    SyncEntityChanges,
+    SyncEquipmentRow,
+    SyncIssueRow,
+    SyncPushRequest,
+    SyncPushResult,
+    SyncPushRowResult,
+    SyncVendorRow,
+)
+from app.schemas.vendor import VendorRead
+
+__all__ = [
+    "BulkRowResult",
+    "CurrentUserRead",
+    "DepartmentRef",
+    "DiscardRead",
+    "DiscardSummary",
+    "EquipmentBulkRequest",
+    "EquipmentBulkResult",
+    "EquipmentCreate",
+    "EquipmentDetailRead",
+    "EquipmentFacetsRead",
+    "EquipmentPage",
+    "EquipmentRead",
+    "EquipmentRef",
+    "FacetRead",
+    "FacetValueRead",
+    "IssueReportRead",
+    "OpenIssueSummary",
+    "Page",
+    "PageMeta",
+    "RefreshRequest",
+    "SearchHitRead",
+    "SearchResults",
+    "StoredFileRead",
+    "SyncChangesRead",
+    "SyncDepartmentRow",
+    "SyncDiscardRow",
+    "SyncEntityChanges",
+    "SyncEquipmentRow",
+    "SyncIssueRow",
+    "SyncPushRequest",
+    "SyncPushResult",
+    "SyncPushRowResult",
+    "SyncVendorRow",
+    "TokenPair",
+    "UploadSessionCreate",
+    "UploadSessionRead",
+    "VendorRead",
+    "VendorRef",
+    "page_payload",
+]
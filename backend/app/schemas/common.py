@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from app.db.pagination import KeysetPage
+
+T = TypeVar("T")
+
+
+class PageMeta(BaseModel):
+    """Cursor pagination metadata returned alongside list results."""
+
+    page_size: int
+    has_more: bool
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class Page(BaseModel, Generic[T]):
+    """Standard list response envelope."""
+
+    data: list[T]
+    pagination: PageMeta
+
+    @classmethod
+    def from_keyset(cls, page: KeysetPage) -> "Page[T]":
+        return cls(
+            data=page.items,
+            pagination=PageMeta(
+                page_size=page.page_size,
+                has_more=page.has_more,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            ),
+        )
+
+
+def page_payload(page: KeysetPage[dict[str, Any]]) -> dict[str, Any]:
+    """Build the :class:`Page` envelope as plain data for responses that skip model validation."""
+
+    return {
+        "data": page.items,
+        "pagination": {
+            "page_size": page.page_size,
+            "has_more": page.has_more,
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor,
+        },
+    }
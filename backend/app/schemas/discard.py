@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.refs import EquipmentRef
+
+
+class DiscardRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    discard_id: int
+    equipment_id: int
+    reason: str
+    media_url: str | None
+    date: date
+    created_at: datetime
+    updated_at: datetime
+    equipment: EquipmentRef
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.config import settings
+from app.models.enums import EquipmentStatus, IssueStatus, IssueType
+from app.schemas.common import Page
+from app.schemas.refs import DepartmentRef, VendorRef
+
+
+class EquipmentRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    equipment_id: int
+    equipment_name: str
+    serial_number: str | None
+    model_no: str | None
+    manufacturer: str | None
+    department_id: int
+    purchase_date: date | None
+    expiry_date: date | None
+    status: EquipmentStatus
+    vendor_id: int | None
+    quantity: int
+    created_at: datetime
+    updated_at: datetime
+    department: DepartmentRef
+    vendor: VendorRef | None
+
+
+class DiscardSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    discard_id: int
+    reason: str
+    date: date
+    media_url: str | None
+
+
+class OpenIssueSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    issue_id: int
+    issue_type: IssueType
+    status: IssueStatus
+    date_raised: datetime
+    technician: str | None
+
+
+class EquipmentDetailRead(EquipmentRead):
+    discard_record: DiscardSummary | None
+    # Loaded from ``Equipment.issue_reports`` filtered to unresolved statuses.
+    open_issues: list[OpenIssueSummary] = Field(validation_alias="issue_reports")
+
+
+class EquipmentCreate(BaseModel):
+    equipment_name: str = Field(min_length=1, max_length=200)
+    serial_number: str | None = Field(default=None, min_length=1, max_length=100)
+    model_no: str | None = Field(default=None, max_length=100)
+    manufacturer: str | None = Field(default=None, max_length=200)
+    department_id: int
+    purchase_date: date | None = None
+    expiry_date: date | None = None
+    status: EquipmentStatus = EquipmentStatus.WORKING
+    vendor_id: int | None = None
+    quantity: int = Field(default=1, ge=0)
+
+
+class EquipmentBulkRequest(BaseModel):
+    items: list[EquipmentCreate] = Field(min_length=1, max_length=settings.equipment_bulk_max_rows)
+    mode: Literal["insert", "upsert"] = Field(
+        default="insert",
+        description="``upsert`` updates rows whose serial_number already exists instead of rejecting them",
+    )
+    atomic: bool = Field(default=False, description="Write nothing if any row is rejected")
+
+
+class BulkRowResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    index: int
+    status: Literal["created", "updated", "rejected"]
+    equipment_id: int | None = None
+    error: str | None = None
+
+
+class EquipmentBulkResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    created: int
+    updated: int
+    rejected: int
+    results: list[BulkRowResult]
+
+
+class FacetValueRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    value: Any = Field(description="Filter value this option selects; null for rows without one")
+    count: int
+    label: str | None = Field(default=None, description="Department or vendor name")
+
+
+class FacetRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    values: list[FacetValueRead]
+    omitted: int = Field(description="Options with matching rows beyond EQUIPMENT_FACET_LIMIT")
+
+
+class EquipmentFacetsRead(BaseModel):
+    """Counts per filter option; each facet applies every filter except its own."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    total: int = Field(description="Rows matching every filter")
+    status: FacetRead
+    department: FacetRead
+    vendor: FacetRead
+    purchase_year: FacetRead
+    expiry: FacetRead = Field(description="Disjoint windows: expired, due_30_days, ..., later, no_expiry")
+
+
+class EquipmentPage(Page[EquipmentRead]):
+    facets: EquipmentFacetsRead | None = Field(default=None, description="Present when requested with `facets=true`")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StoredFileRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    key: str
+    url: str
+    sha256: str
+    size: int
+    content_type: str
+    deduplicated: bool
+
+
+class UploadSessionCreate(BaseModel):
+    size: int = Field(gt=0, description="Total size of the file in bytes")
+    filename: str | None = Field(default=None, max_length=255)
+
+
+class UploadSessionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    upload_id: str
+    size: int
+    offset: int
+    filename: str | None = None
+    content_type: str | None = None
+    file: StoredFileRead | None = None
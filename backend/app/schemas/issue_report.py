@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.models.enums import IssueStatus, IssueType
+from app.schemas.refs import EquipmentRef
+
+
+class IssueReportRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    issue_id: int
+    equipment_id: int
+    issue_type: IssueType
+    problem_description: str
+    media_url: str | None
+    date_raised: datetime
+    status: IssueStatus
+    technician: str | None
+    resolved_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+    equipment: EquipmentRef
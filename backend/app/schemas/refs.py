@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DepartmentRef(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    department_id: int
+    department_name: str
+
+
+class VendorRef(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    vendor_id: int
+    vendor_name: str
+
+
+class EquipmentRef(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    equipment_id: int
+    equipment_name: str
+    serial_number: str | None
+    department: DepartmentRef
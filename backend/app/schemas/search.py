@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchHitRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    entity: Literal["equipment", "issue"]
+    id: int
+    score: float
+    title: str
+    snippet: str
+    equipment_id: int | None = None
+    status: str | None = None
+    archived: bool = False
+
+
+class SearchResults(BaseModel):
+    data: list[SearchHitRead]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.core.config import settings
+from app.models.enums import IssueStatus, IssueType
+from app.schemas.equipment import EquipmentCreate
+
+
+class SyncEntityChanges(BaseModel):
+    columns: list[str]
+    rows: list[list[Any]] = Field(description="Current values of changed rows, in `columns` order")
+    deleted: list[int] = Field(description="Primary keys of deleted rows")
+
+
+class SyncChangesRead(BaseModel):
+    since: int
+    cursor: int = Field(description="Pass as `since` on the next call")
+    has_more: bool
+    changes: dict[str, SyncEntityChanges] = Field(description="Changed rows per entity, parents before children")
+
+
+class SyncPushRow(BaseModel):
+    client_row_id: int = Field(description="Id in the client database; a retried push of it is not applied again")
+
+
+class SyncDepartmentRow(SyncPushRow):
+    department_name: str = Field(min_length=1, max_length=100)
+
+
+class SyncVendorRow(SyncPushRow):
+    vendor_name: str = Field(min_length=1, max_length=200)
+    phone: str | None = Field(default=None, max_length=20)
+    email: str | None = Field(default=None, max_length=100)
+    address: str | None = None
+    category: str | None = Field(default=None, max_length=100)
+
+
+class SyncEquipmentRow(EquipmentCreate, SyncPushRow):
+    pass
+
+
+class SyncIssueRow(SyncPushRow):
+    equipment_id: int
+    issue_type: IssueType
+    problem_description: str = Field(min_length=1)
+    date_raised: datetime | None = None
+    status: IssueStatus = IssueStatus.OPEN
+    technician: str | None = Field(default=None, max_length=100)
+
+
+class SyncDiscardRow(SyncPushRow):
+    equipment_id: int
+    reason: str = Field(min_length=1)
+    date: date
+
+
+class SyncPushRequest(BaseModel):
+    """Rows created on a client while offline, per entity; references use server ids."""
+
+    client_id: str = Field(min_length=1, max_length=64, description="Stable id of the client database")
+    department: list[SyncDepartmentRow] = Field(default_factory=list)
+    vendor: list[SyncVendorRow] = Field(default_factory=list)
+    equipment: list[SyncEquipmentRow] = Field(default_factory=list)
+    issue_report: list[SyncIssueRow] = Field(default_factory=list)
+    discard_equipment: list[SyncDiscardRow] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_rows(self) -> SyncPushRequest:
+        groups = (self.department, self.vendor, self.equipment, self.issue_report, self.discard_equipment)
+        if sum(len(group) for group in groups) > settings.sync_push_max_rows:
+            raise ValueError(f"At most {settings.sync_push_max_rows} rows per push")
+        for group in groups:
+            if len({row.client_row_id for row in group}) != len(group):
+                raise ValueError("client_row_id values must be unique per entity")
+        return self
+
+
+class SyncPushRowResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    entity: str
+    client_row_id: int
+    status: Literal["created", "matched", "rejected"]
+    id: int | None = Field(default=None, description="Server id; `matched` rows already existed on the server")
+    error: str | None = None
+
+
+class SyncPushResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    created: int
+    matched: int
+    rejected: int
+    results: list[SyncPushRowResult]
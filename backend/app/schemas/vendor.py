@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class VendorRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    vendor_id: int
+    vendor_name: str
+    phone: str | None
+    email: str | None
+    address: str | None
+    category: str | None
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from app.search.fts import ensure_sqlite_fts, equipment_match_clause, issue_match_clause
+from app.search.service import SearchHit, search, search_equipment, search_issues
+
+__all__ = [
+    "SearchHit",
+    "ensure_sqlite_fts",
+    "equipment_match_clause",
+    "issue_match_clause",
+    "search",
+    "search_equipment",
+    "search_issues",
+]
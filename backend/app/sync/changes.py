@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import delete, event, exists, insert, literal, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.change_log import ChangeLog
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.vendor import Vendor
+
+# Models served by the delta sync, keyed by entity (table) name, parents before children.
+SYNC_MODELS: dict[str, Any] = {
+    model.__tablename__: model for model in (Department, Vendor, Equipment, IssueReport, DiscardEquipment)
+}
+_SYNCED = frozenset(SYNC_MODELS.values())
+
+# pg_advisory_xact_lock key shared by every transaction that writes the change log.
+_CHANGE_LOG_LOCK = 0x5359_4E43
+
+
+def primary_key(model: Any) -> Any:
+    return model.__table__.primary_key.columns[0]
+
+
+def _lock_change_log(connection: Connection) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _CHANGE_LOG_LOCK})
+
+
+def record_changes(connection: Connection, model: Any, ids: Iterable[int], *, deleted: bool = False) -> None:
+    """Give rows ``ids`` of ``model`` a new change ``seq``; ``deleted`` records tombstones.
+
+    The ORM listener below calls this for session writes; code that changes synced tables
+    with Core statements must call it itself in the same transaction. On PostgreSQL the
+    transaction first takes an advisory lock that it holds until it ends, so ``seq`` values
+    become visible in order and a client that has read up to ``seq`` N can never miss a
+    lower one committed later. SQLite's single writer gives the same guarantee.
+    """
+
+    ids = sorted(set(ids))
+    if not ids:
+        return
+    _lock_change_log(connection)
+    entity = model.__tablename__
+    connection.execute(delete(ChangeLog).where(ChangeLog.entity == entity, ChangeLog.entity_id.in_(ids)))
+    connection.execute(
+        insert(ChangeLog), [{"entity": entity, "entity_id": entity_id, "deleted": deleted} for entity_id in ids]
+    )
+
+
+def forget_changes(connection: Connection, model: Any, ids: Iterable[int]) -> None:
+    """Drop the change entries of rows that leave the synced set without being deleted (archiving)."""
+
+    ids = sorted(set(ids))
+    if ids:
+        connection.execute(
+            delete(ChangeLog).where(ChangeLog.entity == model.__tablename__, ChangeLog.entity_id.in_(ids))
+        )
+
+
+def seed_change_log(connection: Connection) -> int:
+    """Add a change entry for every synced row that has none, e.g. after a bulk import.
+
+    Rows are numbered in primary-key order per table; rows already logged keep their ``seq``.
+    """
+
+    _lock_change_log(connection)
+    seeded = 0
+    for entity, model in SYNC_MODELS.items():
+        key = primary_key(model)
+        logged = exists().where(ChangeLog.entity == entity, ChangeLog.entity_id == key)
+        rows = select(literal(entity), key, literal(False)).where(~logged).order_by(key)
+        seeded += connection.execute(insert(ChangeLog).from_select(["entity", "entity_id", "deleted"], rows)).rowcount
+    return seeded
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_changes(session: Session, flush_context: Any) -> None:
+    changed: dict[Any, set[int]] = {}
+    removed: dict[Any, set[int]] = {}
+    for obj in (*session.new, *session.dirty):
+        model = type(obj)
+        if model not in _SYNCED or (obj in session.dirty and not session.is_modified(obj, include_collections=False)):
+            continue
+        changed.setdefault(model, set()).add(getattr(obj, primary_key(model).key))
+    for obj in session.deleted:
+        model = type(obj)
+        if model in _SYNCED:
+            removed.setdefault(model, set()).add(getattr(obj, primary_key(model).key))
+    if not changed and not removed:
+        return
+    connection = session.connection()
+    for model, ids in changed.items():
+        record_changes(connection, model, ids)
+    for model, ids in removed.items():
+        record_changes(connection, model, ids, deleted=True)
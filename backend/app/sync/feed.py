@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.jobs.change_log import CHANGE_LOG_PRUNE_JOB
+from app.jobs.state import load_job_state
+from app.models.change_log import ChangeLog
+from app.sync.changes import SYNC_MODELS, primary_key
+
+
+class CursorExpiredError(ValueError):
+    """The cursor predates pruned tombstones; the client must sync again from 0."""
+
+
+@dataclass(slots=True)
+class EntityChanges:
+    columns: list[str]
+    rows: list[list[Any]] = field(default_factory=list)
+    deleted: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ChangeBatch:
+    since: int
+    cursor: int
+    has_more: bool
+    changes: dict[str, EntityChanges]
+
+    def payload(self) -> dict[str, Any]:
+        return {
+            "since": self.since,
+            "cursor": self.cursor,
+            "has_more": self.has_more,
+            "changes": {
+                entity: {"columns": changes.columns, "rows": changes.rows, "deleted": changes.deleted}
+                for entity, changes in self.changes.items()
+            },
+        }
+
+
+async def read_changes(session: AsyncSession, since: int, limit: int) -> ChangeBatch:
+    """Return the next ``limit`` changes after ``since`` with the current values of changed rows.
+
+    Changes are read in ``seq`` order, then the live rows of each entity are fetched with one
+    ``IN`` query. Rows come back as value lists under a shared column list. A row that
+    disappeared since it was logged is reported as deleted (its tombstone follows later).
+    Entities are keyed in foreign-key order, so applying them in order is safe. ``cursor`` is
+    the ``since`` for the next call.
+    """
+
+    if since:
+        horizon = (await load_job_state(session, CHANGE_LOG_PRUNE_JOB)).get("horizon", 0)
+        if since < horizon:
+            raise CursorExpiredError(f"Changes up to {horizon} were pruned; sync again from since=0")
+
+    entries = (
+        await session.execute(
+            select(ChangeLog.seq, ChangeLog.entity, ChangeLog.entity_id, ChangeLog.deleted)
+            .where(ChangeLog.seq > since)
+            .order_by(ChangeLog.seq)
+            .limit(limit + 1)
+        )
+    ).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    live: dict[str, list[int]] = {}
+    deleted: dict[str, list[int]] = {}
+    for entry in entries:
+        (deleted if entry.deleted else live).setdefault(entry.entity, []).append(entry.entity_id)
+
+    changes: dict[str, EntityChanges] = {}
+    for entity, model in SYNC_MODELS.items():
+        ids, gone = live.get(entity, []), deleted.get(entity, [])
+        if not ids and not gone:
+            continue
+        table = model.__table__
+        result = EntityChanges(columns=list(table.columns.keys()), deleted=sorted(gone))
+        if ids:
+            key = primary_key(model)
+            rows = (await session.execute(select(table).where(key.in_(ids)).order_by(key))).all()
+            result.rows = [list(row) for row in rows]
+            found = {getattr(row, key.key) for row in rows}
+            result.deleted = sorted([*gone, *(entity_id for entity_id in ids if entity_id not in found)])
+        changes[entity] = result
+    return ChangeBatch(since=since, cursor=entries[-1].seq if entries else since, has_more=has_more, changes=changes)
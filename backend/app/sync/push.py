@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.sync_receipt import SyncReceipt
+from app.models.vendor import Vendor
+from app.schemas.sync import SyncPushRequest, SyncPushRow
+from app.sync.changes import SYNC_MODELS, primary_key
+
+
+@dataclass(slots=True)
+class PushRow:
+    entity: str
+    client_row_id: int
+    status: Literal["created", "matched", "rejected"]
+    id: int | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class PushResult:
+    results: list[PushRow] = field(default_factory=list)
+
+    def _count(self, status: str) -> int:
+        return sum(1 for row in self.results if row.status == status)
+
+    @property
+    def created(self) -> int:
+        return self._count("created")
+
+    @property
+    def matched(self) -> int:
+        return self._count("matched")
+
+    @property
+    def rejected(self) -> int:
+        return self._count("rejected")
+
+
+class _Batch:
+    """Outcomes of one entity's rows; created rows get their ids after the flush."""
+
+    def __init__(self, entity: str) -> None:
+        self.entity = entity
+        self.rows: dict[int, PushRow] = {}
+        self.pending: list[tuple[int, Any]] = []
+
+    def matched(self, row: SyncPushRow, server_id: int) -> None:
+        self.rows[row.client_row_id] = PushRow(self.entity, row.client_row_id, "matched", server_id)
+
+    def rejected(self, row: SyncPushRow, error: str) -> None:
+        self.rows[row.client_row_id] = PushRow(self.entity, row.client_row_id, "rejected", error=error)
+
+    def create(self, session: AsyncSession, row: SyncPushRow, obj: Any) -> Any:
+        session.add(obj)
+        self.pending.append((row.client_row_id, obj))
+        return obj
+
+    def follow(self, row: SyncPushRow, obj: Any) -> None:
+        """``row`` duplicates one created earlier in this batch and gets the same id."""
+
+        self.pending.append((row.client_row_id, obj))
+        self.rows[row.client_row_id] = PushRow(self.entity, row.client_row_id, "matched")
+
+    async def finish(self, session: AsyncSession) -> None:
+        if not self.pending:
+            return
+        await session.flush()
+        key = primary_key(SYNC_MODELS[self.entity]).key
+        for client_row_id, obj in self.pending:
+            row = self.rows.setdefault(client_row_id, PushRow(self.entity, client_row_id, "created"))
+            row.id = getattr(obj, key)
+
+
+def _fields(row: SyncPushRow) -> dict[str, Any]:
+    return row.model_dump(exclude={"client_row_id"}, exclude_none=True)
+
+
+async def _known(session: AsyncSession, column: Any, wanted: set[Any]) -> dict[Any, int]:
+    """Map the values of ``wanted`` present in ``column`` to the primary key of their row."""
+
+    wanted.discard(None)
+    if not wanted:
+        return {}
+    key = primary_key(column.class_)
+    return dict((await session.execute(select(column, key).where(column.in_(wanted)))).all())
+
+
+async def _push_departments(session: AsyncSession, batch: _Batch, rows: Sequence[Any]) -> None:
+    existing = await _known(session, Department.department_name, {row.department_name for row in rows})
+    created: dict[str, Department] = {}
+    for row in rows:
+        if row.department_name in existing:
+            batch.matched(row, existing[row.department_name])
+        elif row.department_name in created:
+            batch.follow(row, created[row.department_name])
+        else:
+            created[row.department_name] = batch.create(session, row, Department(**_fields(row)))
+
+
+async def _push_vendors(session: AsyncSession, batch: _Batch, rows: Sequence[Any]) -> None:
+    for row in rows:
+        batch.create(session, row, Vendor(**_fields(row)))
+
+
+async def _push_equipment(session: AsyncSession, batch: _Batch, rows: Sequence[Any]) -> None:
+    departments = await _known(session, Department.department_id, {row.department_id for row in rows})
+    vendors = await _known(session, Vendor.vendor_id, {row.vendor_id for row in rows})
+    existing = await _known(session, Equipment.serial_number, {row.serial_number for row in rows})
+    created: dict[str, Equipment] = {}
+    for row in rows:
+        if row.department_id not in departments:
+            batch.rejected(row, f"Unknown department_id {row.department_id}")
+        elif row.vendor_id is not None and row.vendor_id not in vendors:
+            batch.rejected(row, f"Unknown vendor_id {row.vendor_id}")
+        elif row.serial_number in existing:
+            batch.matched(row, existing[row.serial_number])
+        elif row.serial_number in created:
+            batch.follow(row, created[row.serial_number])
+        else:
+            equipment = batch.create(session, row, Equipment(**_fields(row)))
+            if row.serial_number:
+                created[row.serial_number] = equipment
+
+
+async def _push_issues(session: AsyncSession, batch: _Batch, rows: Sequence[Any]) -> None:
+    equipment = await _known(session, Equipment.equipment_id, {row.equipment_id for row in rows})
+    for row in rows:
+        if row.equipment_id not in equipment:
+            batch.rejected(row, f"Unknown equipment_id {row.equipment_id}")
+        else:
+            batch.create(session, row, IssueReport(**_fields(row)))
+
+
+async def _push_discards(session: AsyncSession, batch: _Batch, rows: Sequence[Any]) -> None:
+    equipment_ids = {row.equipment_id for row in rows}
+    equipment = await _known(session, Equipment.equipment_id, set(equipment_ids))
+    existing = await _known(session, DiscardEquipment.equipment_id, set(equipment_ids))
+    created: dict[int, DiscardEquipment] = {}
+    for row in rows:
+        if row.equipment_id not in equipment:
+            batch.rejected(row, f"Unknown equipment_id {row.equipment_id}")
+        elif row.equipment_id in existing:
+            batch.matched(row, existing[row.equipment_id])
+        elif row.equipment_id in created:
+            batch.follow(row, created[row.equipment_id])
+        else:
+            created[row.equipment_id] = batch.create(session, row, DiscardEquipment(**_fields(row)))
+
+
+_PUSHERS = {
+    "department": _push_departments,
+    "vendor": _push_vendors,
+    "equipment": _push_equipment,
+    "issue_report": _push_issues,
+    "discard_equipment": _push_discards,
+}
+
+
+async def apply_push(session: AsyncSession, request: SyncPushRequest) -> PushResult:
+    """Create the rows a client made offline, entity by entity in foreign-key order.
+
+    Rows already pushed by this client (per ``sync_receipt``) and rows that exist on the
+    server under a natural key (department name, equipment serial number, the discard
+    record of an equipment item) are ``matched`` to the existing id instead of duplicated.
+    Inserts go through the ORM, so counters, rollups, cache tags and the change log follow
+    as for any other write. Every created or matched row gets a receipt; the caller commits.
+    """
+
+    result = PushResult()
+    for entity, push in _PUSHERS.items():
+        rows = getattr(request, entity)
+        if not rows:
+            continue
+        batch = _Batch(entity)
+        receipts = dict(
+            (
+                await session.execute(
+                    select(SyncReceipt.client_row_id, SyncReceipt.server_id).where(
+                        SyncReceipt.client_id == request.client_id,
+                        SyncReceipt.entity == entity,
+                        SyncReceipt.client_row_id.in_([row.client_row_id for row in rows]),
+                    )
+                )
+            ).all()
+        )
+        fresh = []
+        for row in rows:
+            if row.client_row_id in receipts:
+                batch.matched(row, receipts[row.client_row_id])
+            else:
+                fresh.append(row)
+        await push(session, batch, fresh)
+        await batch.finish(session)
+
+        session.add_all(
+            SyncReceipt(client_id=request.client_id, entity=entity, client_row_id=row.client_row_id, server_id=row.id)
+            for row in batch.rows.values()
+            if row.status != "rejected" and row.client_row_id not in receipts
+        )
+        result.results.extend(batch.rows[row.client_row_id] for row in rows)
+    await session.flush()
+    return result
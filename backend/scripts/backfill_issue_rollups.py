@@ -0,0 +1,53 @@
+"""Build or verify the daily issue rollups behind the issue trend chart.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.backfill_issue_rollups            # continue a pending backfill
+    python -m scripts.backfill_issue_rollups --restart  # clear and rebuild from scratch
+    python -m scripts.backfill_issue_rollups --check    # report drift only
+
+The backfill commits one batch of ``ISSUE_ROLLUP_BATCH_SIZE`` issues at a time and
+resumes where it stopped if interrupted; the API keeps serving (and maintaining new
+changes) meanwhile.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.dashboard.rollups import verify_issue_rollups
+from app.db.session import engine
+from app.jobs.rollups import backfill_issue_rollups, restart_issue_rollup_backfill
+
+
+async def main(args: argparse.Namespace) -> int:
+    try:
+        if args.check:
+            async with engine.connect() as connection:
+                mismatches = await connection.run_sync(verify_issue_rollups)
+            for (issue_type, status, department_id, field), (stored, actual) in mismatches.items():
+                print(f"{issue_type}/{status}/department {department_id} {field}: stored={stored} actual={actual}")
+            print("rollups consistent" if not mismatches else f"{len(mismatches)} rollup totals drifted")
+            return 1 if mismatches else 0
+        if args.restart:
+            upper = await restart_issue_rollup_backfill()
+            print(f"rollups cleared; backfilling issues up to id {upper}")
+        result = await backfill_issue_rollups(batch_size=args.batch_size)
+        print(
+            f"{result.issues} issues in {result.batches} batches, cursor {result.cursor}/{result.upper}"
+            f" ({result.duration_ms:.0f} ms){'' if result.complete else ' - incomplete'}"
+        )
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--restart", action="store_true", help="clear the rollups and backfill every issue again")
+    parser.add_argument("--check", action="store_true", help="only compare rollup totals with the issue table")
+    parser.add_argument("--batch-size", type=int, default=None, help="issues per transaction")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args)))
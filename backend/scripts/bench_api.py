@@ -0,0 +1,381 @@
+"""Load-test the API in-process through ASGI and compare runs against stored baselines.
+
+Usage (from the ``backend`` directory)::
+
+    export DATABASE_URL=sqlite+aiosqlite:////tmp/bench.db   # e.g. filled by scripts.generate_dataset
+    python -m scripts.bench_api                                         # every scenario
+    python -m scripts.bench_api --groups list,search --requests 500 --concurrency 16
+    python -m scripts.bench_api --save-baseline sqlite-1m               # store as a baseline
+    python -m scripts.bench_api --compare sqlite-1m --tolerance 0.2     # exit 1 on regressions
+
+Requests go through ``httpx.ASGITransport`` straight into :data:`app.main.app`, so the
+numbers cover routing, validation, the database and serialisation without any network or
+server overhead. Each scenario runs ``--warmup`` unmeasured requests and then ``--requests``
+requests from ``--concurrency`` concurrent clients. The report shows p50/p95/p99/max
+latency, throughput and errors (any status >= 400).
+
+Scenario groups:
+
+* ``list``: first pages of equipment, issue and vendor lists, with and without filters;
+* ``detail``: equipment detail for random ids;
+* ``search``: full-text search with typical one- and two-word queries;
+* ``dashboard``: counter-backed stats, the expiring-equipment alerts, the issue trend and the
+  reliability ranking;
+* ``export``: streamed CSV and gzipped JSONL exports of one department;
+* ``write``: 20-row bulk equipment inserts. These add rows with ``BENCH-`` serial numbers
+  and log in as (and, if missing, create) the user ``bench``.
+
+Request parameters come from a seeded RNG, so runs against the same dataset (same
+``scripts.generate_dataset`` seed and scale) issue the same requests. Baselines are JSON
+files under ``--baseline-dir`` that record results together with the dataset row counts,
+database dialect, git commit and run parameters. ``--compare`` flags a scenario when its
+p95 is more than ``--tolerance`` (and ``--min-delta-ms``) above the baseline, and warns
+when row counts differ. Settings are read from the environment as for the server; set
+``SQL_INSTRUMENTATION=false`` to leave query logging out of the measurements.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import func, select
+
+from app.auth.passwords import hash_password, shutdown_password_pool
+from app.db.session import engine, write_session
+from app.main import app
+from app.models.department import Department
+from app.models.enums import UserRole
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.user import User
+from app.models.vendor import Vendor
+
+GROUPS = ("list", "detail", "search", "dashboard", "export", "write")
+SEARCH_TERMS = ["pump", "battery", "calibration failed", "monitor", "alarm", "sn-2019", "leak", "display flicker"]
+BENCH_USER = "bench"
+BENCH_PASSWORD = "bench-password"
+
+Request = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+@dataclass(slots=True)
+class Scenario:
+    name: str
+    group: str
+    request: Request
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    throughput_rps: float
+    mean_bytes: int
+
+
+@dataclass(slots=True)
+class Dataset:
+    dialect: str
+    departments: int
+    vendors: int
+    equipment: int
+    issues: int
+    max_equipment_id: int
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "departments": self.departments,
+            "vendors": self.vendors,
+            "equipment": self.equipment,
+            "issues": self.issues,
+        }
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def describe_dataset() -> Dataset:
+    async with engine.connect() as connection:
+
+        async def count(model: Any) -> int:
+            return (await connection.execute(select(func.count()).select_from(model))).scalar_one()
+
+        return Dataset(
+            dialect=engine.dialect.name,
+            departments=await count(Department),
+            vendors=await count(Vendor),
+            equipment=await count(Equipment),
+            issues=await count(IssueReport),
+            max_equipment_id=(await connection.execute(select(func.max(Equipment.equipment_id)))).scalar_one() or 0,
+        )
+
+
+async def bench_token(client: httpx.AsyncClient) -> str:
+    """Log in as the benchmark user, creating it on first use."""
+
+    async with write_session() as session:
+        exists = (await session.execute(select(User.user_id).where(User.username == BENCH_USER))).first()
+        if exists is None:
+            session.add(
+                User(
+                    username=BENCH_USER,
+                    email="bench@example.org",
+                    role=UserRole.TECHNICIAN,
+                    password_hash=await hash_password(BENCH_PASSWORD),
+                )
+            )
+            await session.commit()
+    response = await client.post("/api/v1/auth/login", data={"username": BENCH_USER, "password": BENCH_PASSWORD})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def build_scenarios(dataset: Dataset, token: str | None) -> list[Scenario]:
+    departments = max(1, dataset.departments)
+    max_equipment_id = max(1, dataset.max_equipment_id)
+    run_id = uuid.uuid4().hex[:8]
+    written = iter(range(1, 10**9))
+
+    def get(path: str, params: Callable[[random.Random], dict[str, Any]] | None = None) -> Request:
+        async def request(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+            return await client.get(path, params=params(rng) if params else None)
+
+        return request
+
+    async def export(client: httpx.AsyncClient, rng: random.Random, params: dict[str, Any]) -> httpx.Response:
+        # Read the whole streamed body, so the timing covers the full export.
+        async with client.stream("GET", "/api/v1/equipment/export", params=params) as response:
+            await response.aread()
+        return response
+
+    async def bulk_insert(client: httpx.AsyncClient, rng: random.Random) -> httpx.Response:
+        items = [
+            {
+                "equipment_name": "Bench Device",
+                "serial_number": f"BENCH-{run_id}-{next(written)}",
+                "department_id": rng.randint(1, departments),
+            }
+            for _ in range(20)
+        ]
+        return await client.post(
+            "/api/v1/equipment/bulk", json={"items": items}, headers={"Authorization": f"Bearer {token}"}
+        )
+
+    scenarios = [
+        Scenario("equipment_list", "list", get("/api/v1/equipment", lambda rng: {"page_size": 50})),
+        Scenario(
+            "equipment_list_filtered",
+            "list",
+            get(
+                "/api/v1/equipment",
+                lambda rng: {"status": "WORKING", "department_id": rng.randint(1, departments), "page_size": 50},
+            ),
+        ),
+        Scenario(
+            "equipment_list_sorted",
+            "list",
+            get("/api/v1/equipment", lambda rng: {"sort_by": "expiry_date", "sort_order": "desc", "page_size": 50}),
+        ),
+        Scenario("issue_list_open", "list", get("/api/v1/issues", lambda rng: {"status": "OPEN", "page_size": 50})),
+        Scenario("vendor_list", "list", get("/api/v1/vendors", lambda rng: {"page_size": 50})),
+        Scenario("reference", "list", get("/api/v1/reference")),
+        Scenario(
+            "equipment_detail",
+            "detail",
+            lambda client, rng: client.get(f"/api/v1/equipment/{rng.randint(1, max_equipment_id)}"),
+        ),
+        Scenario("search", "search", get("/api/v1/search", lambda rng: {"q": rng.choice(SEARCH_TERMS)})),
+        Scenario("dashboard_stats", "dashboard", get("/api/v1/dashboard/stats")),
+        Scenario("dashboard_expiring", "dashboard", get("/api/v1/dashboard/expiring", lambda rng: {"within_days": 30})),
+        Scenario(
+            "dashboard_issue_trend",
+            "dashboard",
+            get("/api/v1/dashboard/issue-trend", lambda rng: {"granularity": "week", "group_by": "issue_type"}),
+        ),
+        Scenario(
+            "analytics_reliability",
+            "dashboard",
+            get("/api/v1/analytics/reliability", lambda rng: {"group_by": rng.choice(["model", "manufacturer"])}),
+        ),
+        Scenario(
+            "export_csv_department",
+            "export",
+            lambda client, rng: export(client, rng, {"department_id": rng.randint(1, departments)}),
+        ),
+        Scenario(
+            "export_jsonl_gzip_department",
+            "export",
+            lambda client, rng: export(
+                client, rng, {"department_id": rng.randint(1, departments), "format": "jsonl", "gzip": "true"}
+            ),
+        ),
+    ]
+    if token is not None:
+        scenarios.append(Scenario("equipment_bulk_insert", "write", bulk_insert))
+    return scenarios
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, *, requests: int, concurrency: int, warmup: int, seed: int
+) -> ScenarioResult:
+    rng = random.Random(f"{seed}:{scenario.name}")
+    for _ in range(warmup):
+        await scenario.request(client, rng)
+
+    timings: list[float] = []
+    sizes: list[int] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await scenario.request(client, rng)
+            timings.append((time.perf_counter() - started) * 1000)
+            sizes.append(len(response.content))
+            errors += response.status_code >= 400
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return ScenarioResult(
+        requests=requests,
+        errors=errors,
+        p50_ms=round(percentile(timings, 0.50), 2),
+        p95_ms=round(percentile(timings, 0.95), 2),
+        p99_ms=round(percentile(timings, 0.99), 2),
+        max_ms=round(timings[-1], 2),
+        throughput_rps=round(requests / elapsed, 1),
+        mean_bytes=sum(sizes) // len(sizes),
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(
+    results: dict[str, ScenarioResult], baseline: dict[str, Any] | None, tolerance: float, min_delta_ms: float
+) -> bool:
+    """Print the result table; returns whether any scenario regressed against ``baseline``."""
+
+    previous = baseline["results"] if baseline else {}
+    regressed = False
+    header = f"{'scenario':<30} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'req/s':>8} {'errors':>6}"
+    print(header + ("  vs baseline p95" if baseline else ""))
+    for name, result in results.items():
+        line = (
+            f"{name:<30} {result.p50_ms:>8.1f} {result.p95_ms:>8.1f} {result.p99_ms:>8.1f} "
+            f"{result.max_ms:>8.1f} {result.throughput_rps:>8.1f} {result.errors:>6}"
+        )
+        if name in previous:
+            reference = previous[name]["p95_ms"]
+            change = (result.p95_ms - reference) / reference if reference else 0.0
+            flag = change > tolerance and result.p95_ms - reference > min_delta_ms
+            regressed |= flag
+            line += f"  {change:+7.1%}{'  REGRESSION' if flag else ''}"
+        elif baseline:
+            line += "  (new)"
+        print(line)
+    return regressed
+
+
+async def main(args: argparse.Namespace) -> int:
+    groups = [group.strip() for group in args.groups.split(",")] if args.groups else list(GROUPS)
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        print(f"unknown groups: {', '.join(sorted(unknown))} (choose from {', '.join(GROUPS)})", file=sys.stderr)
+        return 2
+    baseline_dir = Path(args.baseline_dir)
+    baseline = None
+    if args.compare:
+        baseline = json.loads((baseline_dir / f"{args.compare}.json").read_text())
+
+    dataset = await describe_dataset()
+    print(f"{dataset.dialect}: " + ", ".join(f"{count} {name}" for name, count in dataset.counts().items()))
+    if baseline and baseline["dataset"] != dataset.counts():
+        print(f"warning: baseline {args.compare!r} was recorded on a different dataset {baseline['dataset']}")
+
+    results: dict[str, ScenarioResult] = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            token = await bench_token(client) if "write" in groups else None
+            for scenario in build_scenarios(dataset, token):
+                if scenario.group in groups:
+                    results[scenario.name] = await run_scenario(
+                        client,
+                        scenario,
+                        requests=args.requests,
+                        concurrency=args.concurrency,
+                        warmup=args.warmup,
+                        seed=args.seed,
+                    )
+    finally:
+        shutdown_password_pool()
+        await engine.dispose()
+
+    regressed = print_results(results, baseline, args.tolerance, args.min_delta_ms)
+    if args.save_baseline:
+        baseline_dir.mkdir(parents=True, exist_ok=True)
+        path = baseline_dir / f"{args.save_baseline}.json"
+        record = {
+            "name": args.save_baseline,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dialect": dataset.dialect,
+            "dataset": dataset.counts(),
+            "parameters": {"requests": args.requests, "concurrency": args.concurrency, "seed": args.seed},
+            "results": {name: asdict(result) for name, result in results.items()},
+        }
+        path.write_text(json.dumps(record, indent=2) + "\n")
+        print(f"saved baseline {path}")
+    if regressed:
+        print(f"p95 regressed by more than {args.tolerance:.0%} against baseline {args.compare!r}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", default=None, help=f"Comma-separated subset of: {', '.join(GROUPS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline-dir", default="benchmarks/baselines")
+    parser.add_argument("--save-baseline", default=None, metavar="NAME")
+    parser.add_argument("--compare", default=None, metavar="NAME")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative p95 increase before flagging")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0, help="Ignore p95 increases smaller than this (timer noise)"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
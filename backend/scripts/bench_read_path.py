@@ -0,0 +1,149 @@
+"""Compare the projected/orjson list read path with ORM instances serialised by Pydantic.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.bench_read_path --rows 20000 --page-size 1000
+
+A temporary SQLite database is generated unless ``--db`` points at an existing one. For
+equipment and issue lists the script times fetching one page and encoding it to JSON bytes:
+
+* ``orm+pydantic``: ``list_equipment``/``list_issues`` (ORM instances with eager-loaded
+  relations) validated into ``Page[...]`` and dumped with ``model_dump_json``;
+* ``rows+orjson``: ``list_equipment_rows``/``list_issue_rows`` (column projection into dicts)
+  encoded by :class:`app.core.responses.FastJSONResponse`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.responses import FastJSONResponse
+from app.crud.equipment import list_equipment, list_equipment_rows
+from app.crud.issue_report import list_issue_rows, list_issues
+from app.db.session import Base
+from app.models import *  # noqa: F401,F403
+from app.schemas.common import Page, page_payload
+from app.schemas.equipment import EquipmentRead
+from app.schemas.issue_report import IssueReportRead
+
+STATUSES = ["WORKING", "UNDER_REPAIR", "EXPIRED"]
+ISSUE_STATUSES = ["OPEN", "IN_PROGRESS", "RESOLVED", "CLOSED"]
+
+
+def generate(path: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    now = datetime.now(timezone.utc).isoformat(sep=" ")
+    connection.executemany(
+        "INSERT INTO department (department_name, created_at, updated_at) VALUES (?, ?, ?)",
+        ((f"Department {n}", now, now) for n in range(40)),
+    )
+    connection.executemany(
+        "INSERT INTO vendor (vendor_name, phone, created_at, updated_at) VALUES (?, ?, ?, ?)",
+        ((f"Vendor {n}", f"555-{n:04d}", now, now) for n in range(200)),
+    )
+    connection.executemany(
+        "INSERT INTO equipment (equipment_name, serial_number, model_no, manufacturer, department_id, "
+        "purchase_date, expiry_date, status, vendor_id, quantity, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)",
+        (
+            (
+                f"Device {n}",
+                f"SN-{n:07d}",
+                f"M-{rng.randint(1, 500)}",
+                f"Maker {rng.randint(1, 60)}",
+                rng.randint(1, 40),
+                (date(2015, 1, 1) + timedelta(days=rng.randint(0, 3000))).isoformat(),
+                (date(2024, 1, 1) + timedelta(days=rng.randint(0, 2000))).isoformat(),
+                rng.choice(STATUSES),
+                rng.choice([None, *range(1, 201)]),
+                now,
+                now,
+            )
+            for n in range(rows)
+        ),
+    )
+    connection.executemany(
+        "INSERT INTO issue_report (equipment_id, issue_type, problem_description, date_raised, status, "
+        "technician, created_at, updated_at) VALUES (?, 'TECHNICAL', ?, ?, ?, ?, ?, ?)",
+        (
+            (rng.randint(1, rows), f"Problem report {n}", now, rng.choice(ISSUE_STATUSES), "tech", now, now)
+            for n in range(rows)
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+
+async def _time(repeat: int, run: Callable[[], Awaitable[bytes]]) -> tuple[float, int]:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(await run())
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), size
+
+
+async def main(args: argparse.Namespace) -> int:
+    path = Path(args.db) if args.db else Path(tempfile.mkdtemp()) / "read-path-bench.sqlite3"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    if not path.exists():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        generate(path, args.rows, args.seed)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def orm_equipment() -> bytes:
+        async with session_factory() as session:
+            page = await list_equipment(session, page_size=args.page_size)
+            return Page[EquipmentRead].from_keyset(page).model_dump_json().encode()
+
+    async def rows_equipment() -> bytes:
+        async with session_factory() as session:
+            page = await list_equipment_rows(session, page_size=args.page_size)
+            return FastJSONResponse(page_payload(page)).body
+
+    async def orm_issues() -> bytes:
+        async with session_factory() as session:
+            page = await list_issues(session, page_size=args.page_size)
+            return Page[IssueReportRead].from_keyset(page).model_dump_json().encode()
+
+    async def rows_issues() -> bytes:
+        async with session_factory() as session:
+            page = await list_issue_rows(session, page_size=args.page_size)
+            return FastJSONResponse(page_payload(page)).body
+
+    print(f"{args.page_size}-row pages, median of {args.repeat}")
+    print(f"{'endpoint':<12} {'path':<14} {'ms':>8} {'bytes':>9}")
+    for name, baseline, fast in (("equipment", orm_equipment, rows_equipment), ("issues", orm_issues, rows_issues)):
+        await baseline()  # warm caches and compiled statements
+        await fast()
+        slow_ms, slow_size = await _time(args.repeat, baseline)
+        fast_ms, fast_size = await _time(args.repeat, fast)
+        print(f"{name:<12} {'orm+pydantic':<14} {slow_ms:>8.2f} {slow_size:>9}")
+        print(f"{name:<12} {'rows+orjson':<14} {fast_ms:>8.2f} {fast_size:>9}  ({slow_ms / fast_ms:.1f}x)")
+    await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=None, help="Reuse or create this SQLite file instead of a temporary one")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,123 @@
+"""Benchmark full-text issue search against a synthetic SQLite database.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.bench_search --rows 1000000 --db /tmp/search-bench.db
+
+The database is generated once and reused on later runs with the same ``--db`` path.
+Each query is run ``--repeat`` times through :func:`app.search.service.search_issues`;
+the command exits non-zero when any query's p95 exceeds ``--budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.session import Base
+from app.models import *  # noqa: F401,F403
+from app.search.fts import ensure_sqlite_fts
+from app.search.service import search_issues
+
+FUNCTION_WORDS = ["the", "is", "and", "not", "a", "of", "to", "when", "on", "after", "during", "with"]
+DOMAIN_TERMS = [
+    "alarm", "battery", "display", "pump", "sensor", "cable", "error", "screen", "power", "monitor",
+    "calibration", "pressure", "leak", "noise", "filter", "valve", "motor", "fan", "button", "software",
+    "drift", "charging", "intermittent", "failure", "probe", "tubing", "occlusion", "flow", "reading",
+]
+# Descriptions draw from a Zipf-distributed vocabulary so term frequencies resemble free text:
+# function words appear in most rows, common domain words in a few percent, codes rarely.
+VOCABULARY = FUNCTION_WORDS + DOMAIN_TERMS + [f"code{n:05d}" for n in range(20000)]
+CUMULATIVE_WEIGHTS = list(itertools.accumulate(1 / (rank ** 1.07) for rank in range(1, len(VOCABULARY) + 1)))
+
+QUERIES = [
+    "alarm",
+    "calibration drift",
+    "calib",
+    "battery not charging",
+    "code00042",
+    "sn-10",
+    "pressure valve leak",
+]
+
+
+def _description(rng: random.Random) -> str:
+    words = rng.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=rng.randint(8, 20))
+    if rng.random() < 0.05:
+        words.append(f"sn-{rng.randint(1, 99999)}")
+    return " ".join(words)
+
+
+def generate(path: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    now = datetime.now(timezone.utc).isoformat(sep=" ")
+    connection.execute("INSERT INTO department (department_name, created_at, updated_at) VALUES ('Bench', ?, ?)", (now, now))
+    connection.executemany(
+        "INSERT INTO equipment (equipment_name, department_id, status, quantity, created_at, updated_at) "
+        "VALUES (?, 1, 'WORKING', 1, ?, ?)",
+        ((f"Device {n}", now, now) for n in range(1000)),
+    )
+    batch = 50_000
+    for start in range(0, rows, batch):
+        connection.executemany(
+            "INSERT INTO issue_report (equipment_id, issue_type, problem_description, date_raised, status, "
+            "created_at, updated_at) VALUES (?, 'TECHNICAL', ?, ?, 'OPEN', ?, ?)",
+            ((rng.randint(1, 1000), _description(rng), now, now, now) for _ in range(min(batch, rows - start))),
+        )
+        connection.commit()
+    connection.close()
+
+
+async def main(args: argparse.Namespace) -> int:
+    path = Path(args.db)
+    fresh = not path.exists()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    if fresh:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        started = time.perf_counter()
+        generate(path, args.rows, args.seed)
+        async with engine.begin() as connection:
+            await connection.run_sync(ensure_sqlite_fts)
+        print(f"generated {args.rows} issues in {time.perf_counter() - started:.1f}s")
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    failed = False
+    print(f"{'query':<24} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    async with session_factory() as session:
+        for query in QUERIES:
+            timings = []
+            hits = 0
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                hits = len(await search_issues(session, query, limit=args.limit))
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            failed |= p95 > args.budget_ms
+            print(f"{query:<24} {hits:>5} {statistics.median(timings):>8.1f} {p95:>8.1f} {timings[-1]:>8.1f}")
+    await engine.dispose()
+    print(f"budget {args.budget_ms} ms: {'EXCEEDED' if failed else 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="search-bench.sqlite3")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=7)
+    sys.exit(asyncio.run(main(parser.parse_args())))
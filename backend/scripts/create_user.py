@@ -0,0 +1,51 @@
+"""Create an API user.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.create_user admin admin@example.org --role ADMIN
+
+The password is read from the terminal (or ``--password`` for automation).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import getpass
+import sys
+
+from app.auth.passwords import hash_password, shutdown_password_pool
+from app.db.session import write_session
+from app.models.enums import UserRole
+from app.models.user import User
+
+
+async def main(args: argparse.Namespace) -> int:
+    password = args.password or getpass.getpass("Password: ")
+    try:
+        password_hash = await hash_password(password)
+    finally:
+        shutdown_password_pool()
+    async with write_session() as session:
+        session.add(
+            User(
+                username=args.username,
+                email=args.email,
+                full_name=args.full_name,
+                role=UserRole(args.role),
+                password_hash=password_hash,
+            )
+        )
+        await session.commit()
+    print(f"created user {args.username}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("username")
+    parser.add_argument("email")
+    parser.add_argument("--full-name", default=None)
+    parser.add_argument("--role", choices=[role.value for role in UserRole], default=UserRole.VIEWER.value)
+    parser.add_argument("--password", default=None)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,56 @@
+"""Export the equipment or issue inventory straight from the database.
+
+Uses the same server-side cursor and encoders as ``/api/v1/equipment/export`` and
+``/api/v1/issues/export``, so memory stays flat for any table size.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.export_inventory equipment -o equipment.csv
+    python -m scripts.export_inventory issues --format jsonl --gzip -o issues.jsonl.gz
+    python -m scripts.export_inventory equipment --status EXPIRED > expired.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from app.db.session import engine
+from app.export import export_equipment, export_issues
+from app.models.enums import EquipmentStatus, IssueStatus
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.dataset == "equipment":
+        status = EquipmentStatus(args.status) if args.status else None
+        body = export_equipment(args.format, compress=args.gzip, status=status, search=args.search)
+    else:
+        status = IssueStatus(args.status) if args.status else None
+        body = export_issues(args.format, compress=args.gzip, status=status, search=args.search)
+
+    started = time.perf_counter()
+    written = 0
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        async for chunk in body:
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+        await engine.dispose()
+    print(f"{args.dataset}: {written} bytes in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dataset", choices=["equipment", "issues"])
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip")
+    parser.add_argument("--status", default=None, help="Only export rows with this status")
+    parser.add_argument("--search", default=None, help="Full-text filter, as on the list endpoints")
+    parser.add_argument("-o", "--output", default=None, help="Output file (default: stdout)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,346 @@
+"""Bulk-load a synthetic hospital-network dataset for load testing and benchmarks.
+
+Usage (from the ``backend`` directory)::
+
+    export DATABASE_URL=sqlite+aiosqlite:////tmp/bench.db
+    python -m scripts.generate_dataset                 # 500 departments, 5k vendors, 1M equipment, 5M issues
+    python -m scripts.generate_dataset --scale 0.01    # 1% of every table, for quick runs
+
+The target tables must be empty. Missing tables are created from the models, so a scratch
+database needs no migrations. Runs with the same ``--seed``, ``--today`` and sizes produce
+the same data, which is what makes :mod:`scripts.bench_api` baselines comparable. Dates are
+generated relative to ``--today`` (a fixed date by default), never the wall clock.
+
+The distributions are skewed the way real inventories are:
+
+* department sizes and vendor market share are Zipf-distributed;
+* device types are drawn from a weighted catalogue, so pumps and monitors are common and
+  scanners rare, and lifespans depend on the type;
+* status follows expiry: most devices past expiry are EXPIRED or DECOMMISSIONED, and
+  decommissioned ones usually have a discard record;
+* issues are spread over a heavy-tailed share of devices, raised after purchase, and
+  mostly closed unless recent.
+
+Rows are written with explicit primary keys, in ``--batch-size`` executemany batches,
+one transaction per batch. On SQLite the full-text triggers are dropped during the load
+and the indexes are rebuilt once at the end. Dashboard counters are rebuilt afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+import time
+from array import array
+from collections.abc import Iterator
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any
+
+from faker import Faker
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.dashboard.stats import rebuild_counters
+from app.db.session import Base, engine
+from app.jobs.rollups import backfill_issue_rollups, restart_issue_rollup_backfill
+from app.models import *  # noqa: F401,F403
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.enums import EquipmentStatus, IssueStatus, IssueType
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.vendor import Vendor
+from app.search.fts import ensure_sqlite_fts
+from app.sync.changes import seed_change_log
+
+SPECIALTIES = [
+    "Cardiology", "Radiology", "Intensive Care", "Emergency", "Oncology", "Neurology", "Pediatrics",
+    "Neonatal ICU", "Orthopedics", "Surgery", "Anesthesiology", "Nephrology", "Pathology", "Laboratory",
+    "Maternity", "Pulmonology", "Gastroenterology", "Urology", "Dermatology", "Ophthalmology", "ENT",
+    "Physiotherapy", "Pharmacy", "Outpatient", "Dialysis", "Endoscopy", "Sterile Services", "Burns Unit",
+]
+VENDOR_CATEGORIES = [
+    "Imaging", "Patient Monitoring", "Infusion", "Laboratory", "Surgical", "Respiratory", "Sterilization",
+    "Furniture", "Rehabilitation", "Service Contractor",
+]
+# (device type, relative frequency, lifespan in years, issue proneness)
+DEVICE_TYPES = [
+    ("Infusion Pump", 120, 8, 1.6), ("Syringe Pump", 80, 8, 1.4), ("Patient Monitor", 110, 9, 1.2),
+    ("Pulse Oximeter", 90, 5, 0.6), ("Hospital Bed", 150, 12, 0.5), ("Wheelchair", 70, 8, 0.4),
+    ("Suction Unit", 40, 8, 0.9), ("ECG Machine", 35, 10, 1.0), ("Defibrillator", 30, 10, 0.8),
+    ("Ventilator", 25, 10, 2.0), ("Anesthesia Machine", 12, 12, 1.8), ("Ultrasound Scanner", 15, 9, 1.1),
+    ("X-Ray Unit", 8, 12, 1.5), ("CT Scanner", 2, 10, 3.0), ("MRI Scanner", 1, 12, 3.5),
+    ("Autoclave", 10, 15, 1.7), ("Centrifuge", 20, 10, 0.7), ("Blood Gas Analyzer", 8, 8, 1.9),
+    ("Dialysis Machine", 12, 10, 2.2), ("Infant Incubator", 10, 10, 1.3), ("Electrosurgical Unit", 10, 10, 1.2),
+    ("Vital Signs Monitor", 60, 7, 0.9), ("Nebulizer", 30, 5, 0.5), ("Feeding Pump", 25, 7, 1.1),
+]
+SYMPTOMS = [
+    "alarm sounding without cause", "no power", "display flickering", "error code on startup", "reading drift",
+    "battery not charging", "intermittent shutdown", "loud noise", "occlusion alarm", "calibration failed",
+    "leak detected", "button unresponsive", "overheating", "self-test failed", "software freeze",
+    "wheel lock broken", "pressure out of range", "sensor disconnected", "print head jammed", "fan failure",
+]
+COMPONENTS = [
+    "battery", "power supply", "display", "sensor", "probe", "tubing", "valve", "motor", "fan", "keypad",
+    "cable", "pressure transducer", "printer", "wheel", "main board", "pump head", "filter", "door latch",
+]
+CONTEXTS = [
+    "during night shift", "after transport", "after software update", "in use on patient", "during cleaning",
+    "on power-up", "after drop", "since last service", "when on battery", "intermittently over several days",
+]
+DISCARD_REASONS = [
+    "Beyond economic repair", "End of service life", "Manufacturer support ended", "Failed safety inspection",
+    "Replaced by newer model", "Damaged beyond repair", "Recalled by manufacturer",
+]
+ISSUE_TYPES = [IssueType.TECHNICAL, IssueType.MECHANICAL, IssueType.ELECTRICAL, IssueType.USER_OPERATION]
+ISSUE_TYPE_WEIGHTS = [40, 25, 20, 15]
+
+FIRST_PURCHASE = date(2008, 1, 1)
+# Default "today" of the generated data; fixed so a dataset does not change from day to day.
+DATASET_TODAY = date(2026, 1, 1)
+
+
+def zipf_cum_weights(n: int, exponent: float = 1.1) -> list[float]:
+    """Cumulative weights for ``random.choices`` giving rank ``k`` probability ~ 1/k**exponent."""
+
+    return list(itertools.accumulate(1 / (rank**exponent) for rank in range(1, n + 1)))
+
+
+class DatasetGenerator:
+    """Deterministic row generator; every table is produced as a stream of row batches."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.rng = random.Random(args.seed)
+        self.faker = Faker()
+        self.faker.seed_instance(args.seed)
+        self.departments = max(1, round(args.departments * args.scale))
+        self.vendors = max(1, round(args.vendors * args.scale))
+        self.equipment = max(1, round(args.equipment * args.scale))
+        self.issues = round(args.issues * args.scale)
+        self.today: date = args.today
+        # End of ``today``: nothing is resolved after it.
+        self.now = datetime.combine(self.today + timedelta(days=1), dt_time(), tzinfo=timezone.utc)
+        # Per-device attributes the issue generator needs, kept compact (a few bytes per device).
+        self.purchase_ordinals = array("i")
+        self.proneness = array("f")
+        self.discarded = 0
+
+    def department_rows(self) -> Iterator[dict[str, Any]]:
+        cities = [self.faker.unique.city() for _ in range(max(1, self.departments // len(SPECIALTIES) + 1))]
+        names = (f"{specialty} - {city}" for city in cities for specialty in SPECIALTIES)
+        for department_id, name in zip(range(1, self.departments + 1), names):
+            yield {"department_id": department_id, "department_name": name}
+
+    def vendor_rows(self) -> Iterator[dict[str, Any]]:
+        for vendor_id in range(1, self.vendors + 1):
+            yield {
+                "vendor_id": vendor_id,
+                "vendor_name": self.faker.company(),
+                "phone": self.faker.numerify("###-###-####"),
+                "email": self.faker.company_email(),
+                "address": self.faker.address().replace("\n", ", "),
+                "category": self.rng.choice(VENDOR_CATEGORIES),
+            }
+
+    def _status(self, expiry: date) -> EquipmentStatus:
+        roll = self.rng.random()
+        if expiry < self.today:
+            if roll < 0.65:
+                return EquipmentStatus.EXPIRED
+            return EquipmentStatus.DECOMMISSIONED if roll < 0.9 else EquipmentStatus.WORKING
+        if roll < 0.88:
+            return EquipmentStatus.WORKING
+        return EquipmentStatus.UNDER_REPAIR if roll < 0.97 else EquipmentStatus.DECOMMISSIONED
+
+    def equipment_and_discard_rows(self) -> Iterator[tuple[dict[str, Any], dict[str, Any] | None]]:
+        rng = self.rng
+        type_weights = list(itertools.accumulate(weight for _, weight, _, _ in DEVICE_TYPES))
+        department_weights = zipf_cum_weights(self.departments, 0.9)
+        vendor_weights = zipf_cum_weights(self.vendors, 1.1)
+        manufacturers = [self.faker.company() for _ in range(80)]
+        manufacturer_weights = zipf_cum_weights(len(manufacturers), 1.2)
+        span_days = (self.today - FIRST_PURCHASE).days
+        for equipment_id in range(1, self.equipment + 1):
+            name, _, lifespan, proneness = rng.choices(DEVICE_TYPES, cum_weights=type_weights)[0]
+            # Triangular towards the present: inventories grow, so recent purchases dominate.
+            purchase = FIRST_PURCHASE + timedelta(days=int(rng.triangular(0, span_days, span_days)))
+            expiry = purchase + timedelta(days=int(365 * lifespan * rng.uniform(0.8, 1.2)))
+            status = self._status(expiry)
+            manufacturer = rng.choices(manufacturers, cum_weights=manufacturer_weights)[0]
+            self.purchase_ordinals.append(purchase.toordinal())
+            self.proneness.append(proneness * rng.lognormvariate(0, 0.8))
+            equipment = {
+                "equipment_id": equipment_id,
+                "equipment_name": name,
+                "serial_number": f"SN-{purchase.year}/{equipment_id:07d}",
+                "model_no": f"{manufacturer[:3].upper()}-{rng.randint(100, 999)}",
+                "manufacturer": manufacturer,
+                "department_id": rng.choices(range(1, self.departments + 1), cum_weights=department_weights)[0],
+                "purchase_date": purchase,
+                "expiry_date": expiry,
+                "status": status,
+                "vendor_id": None
+                if rng.random() < 0.08
+                else rng.choices(range(1, self.vendors + 1), cum_weights=vendor_weights)[0],
+                "quantity": rng.randint(1, 4) if name == "Hospital Bed" else 1,
+            }
+            discard = None
+            if status == EquipmentStatus.DECOMMISSIONED and rng.random() < 0.6:
+                self.discarded += 1
+                discard = {
+                    "discard_id": self.discarded,
+                    "equipment_id": equipment_id,
+                    "reason": rng.choice(DISCARD_REASONS),
+                    "date": min(self.today, max(purchase, expiry + timedelta(days=rng.randint(-180, 180)))),
+                }
+            yield equipment, discard
+
+    def issue_rows(self) -> Iterator[dict[str, Any]]:
+        rng = self.rng
+        device_weights = list(itertools.accumulate(self.proneness))
+        devices = range(1, len(self.proneness) + 1)
+        technicians = [self.faker.name() for _ in range(300)]
+        type_weights = list(itertools.accumulate(ISSUE_TYPE_WEIGHTS))
+        today = self.today.toordinal()
+        for issue_id in range(1, self.issues + 1):
+            equipment_id = rng.choices(devices, cum_weights=device_weights)[0]
+            purchased = self.purchase_ordinals[equipment_id - 1]
+            raised_day = purchased + int((today - purchased) * rng.random() ** 0.6)
+            raised = datetime.combine(date.fromordinal(raised_day), dt_time(rng.randint(0, 23), rng.randint(0, 59)))
+            raised = raised.replace(tzinfo=timezone.utc)
+            age_days = today - raised_day
+            roll = rng.random()
+            if age_days > 60:
+                status = IssueStatus.CLOSED if roll < 0.85 else IssueStatus.RESOLVED if roll < 0.97 else IssueStatus.IN_PROGRESS
+            else:
+                status = IssueStatus.OPEN if roll < 0.45 else IssueStatus.IN_PROGRESS if roll < 0.75 else IssueStatus.RESOLVED
+            resolved_at = None
+            if status in (IssueStatus.RESOLVED, IssueStatus.CLOSED):
+                resolved_at = min(self.now, raised + timedelta(hours=rng.expovariate(1 / 72)))
+            description = f"{rng.choice(COMPONENTS).capitalize()}: {rng.choice(SYMPTOMS)} {rng.choice(CONTEXTS)}"
+            if rng.random() < 0.2:
+                description += f", error E{rng.randint(100, 999)}"
+            yield {
+                "issue_id": issue_id,
+                "equipment_id": equipment_id,
+                "issue_type": rng.choices(ISSUE_TYPES, cum_weights=type_weights)[0],
+                "problem_description": description,
+                "date_raised": raised,
+                "status": status,
+                "technician": None if status == IssueStatus.OPEN else rng.choice(technicians),
+                "resolved_at": resolved_at,
+            }
+
+
+def _batches(rows: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+async def _write(connection: AsyncConnection, model: Any, rows: list[dict[str, Any]]) -> None:
+    if rows:
+        await connection.execute(insert(model), rows)
+
+
+async def _drop_sqlite_fts_triggers(connection: AsyncConnection) -> None:
+    names = (
+        await connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%\\_fts\\_%' ESCAPE '\\'")
+        )
+    ).scalars().all()
+    for name in names:
+        await connection.execute(text(f'DROP TRIGGER "{name}"'))
+    await connection.commit()
+
+
+async def _reset_sequences(connection: AsyncConnection) -> None:
+    for table, column in (
+        ("vendor", "vendor_id"),
+        ("department", "department_id"),
+        ("equipment", "equipment_id"),
+        ("issue_report", "issue_id"),
+        ("discard_equipment", "discard_id"),
+    ):
+        await connection.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+                f"COALESCE((SELECT MAX({column}) FROM {table}), 1))"
+            )
+        )
+    await connection.commit()
+
+
+async def main(args: argparse.Namespace) -> int:
+    generator = DatasetGenerator(args)
+    started = time.perf_counter()
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.commit()
+            for model in (Department, Vendor, Equipment, IssueReport, DiscardEquipment):
+                if (await connection.execute(select(func.count()).select_from(model))).scalar_one():
+                    print(f"{model.__tablename__} is not empty; generate into a fresh database", file=sys.stderr)
+                    return 1
+            sqlite = connection.dialect.name == "sqlite"
+            if sqlite:
+                await _drop_sqlite_fts_triggers(connection)
+
+            for batch in _batches(generator.department_rows(), args.batch_size):
+                await _write(connection, Department, batch)
+                await connection.commit()
+            for batch in _batches(generator.vendor_rows(), args.batch_size):
+                await _write(connection, Vendor, batch)
+                await connection.commit()
+            print(f"{generator.departments} departments, {generator.vendors} vendors")
+
+            for batch in _batches(generator.equipment_and_discard_rows(), args.batch_size):
+                await _write(connection, Equipment, [equipment for equipment, _ in batch])
+                await _write(connection, DiscardEquipment, [discard for _, discard in batch if discard is not None])
+                await connection.commit()
+            print(f"{generator.equipment} equipment, {generator.discarded} discards ({time.perf_counter() - started:.0f}s)")
+
+            for written, batch in enumerate(_batches(generator.issue_rows(), args.batch_size), start=1):
+                await _write(connection, IssueReport, batch)
+                await connection.commit()
+                if written % 50 == 0:
+                    print(f"  {written * args.batch_size} issues ({time.perf_counter() - started:.0f}s)")
+            print(f"{generator.issues} issues ({time.perf_counter() - started:.0f}s)")
+
+            if sqlite:
+                await connection.run_sync(ensure_sqlite_fts)
+            else:
+                await _reset_sequences(connection)
+            counters = await connection.run_sync(rebuild_counters)
+            await connection.run_sync(seed_change_log)
+            await connection.commit()
+            print(
+                f"search index, {len(counters)} dashboard counters and sync change log rebuilt "
+                f"({time.perf_counter() - started:.0f}s)"
+            )
+        await restart_issue_rollup_backfill()
+        rollups = await backfill_issue_rollups()
+        print(f"issue rollups built in {rollups.batches} batches ({time.perf_counter() - started:.0f}s)")
+    finally:
+        await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--departments", type=int, default=500)
+    parser.add_argument("--vendors", type=int, default=5_000)
+    parser.add_argument("--equipment", type=int, default=1_000_000)
+    parser.add_argument("--issues", type=int, default=5_000_000)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every table size (e.g. 0.01 for a quick run)")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=DATASET_TODAY,
+        help=f"Date the data is generated relative to (default {DATASET_TODAY.isoformat()})",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,530 @@
+"""Import the legacy ``hospital_equipment.db`` file into the normalized schema.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.import_sqlite ../hospital_equipment.db --media-root .. --checkpoint import.checkpoint.json
+
+Legacy tables are streamed in primary-key order with ``fetchmany`` so memory stays flat,
+rows are mapped to foreign keys through in-memory lookup dictionaries and written with one
+executemany ``INSERT`` per batch. After every committed batch the last legacy id is saved to
+the checkpoint file; re-running the command resumes after it. Legacy primary keys are kept,
+which makes the equipment/vendor mapping an identity and re-imported batches detectable.
+Media files of each batch are copied into the content-addressed file store by a bounded
+thread pool before the batch is written, and rows reference the resulting object keys; a
+file referenced by several rows is stored once. Issue reports without a valid
+``date_raised`` are skipped and reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.dashboard.stats import rebuild_counters
+from app.db.session import engine
+from app.jobs.rollups import backfill_issue_rollups, restart_issue_rollup_backfill
+from app.models.department import Department
+from app.models.discard_equipment import DiscardEquipment
+from app.models.enums import EquipmentStatus, IssueStatus, IssueType
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.models.vendor import Vendor
+from app.storage.local import LocalFileStore, StorageError, StoredFile, get_file_store
+from app.sync.changes import seed_change_log
+
+logger = logging.getLogger("import_sqlite")
+
+UNASSIGNED_DEPARTMENT = "Unassigned"
+
+EQUIPMENT_STATUS_MAP = {
+    "working": EquipmentStatus.WORKING,
+    "under repair": EquipmentStatus.UNDER_REPAIR,
+    "under maintenance": EquipmentStatus.UNDER_REPAIR,
+    "expired": EquipmentStatus.EXPIRED,
+    "decommissioned": EquipmentStatus.DECOMMISSIONED,
+    "discarded": EquipmentStatus.DECOMMISSIONED,
+}
+
+ISSUE_TYPE_MAP = {
+    "technical issue": IssueType.TECHNICAL,
+    "mechanical issue": IssueType.MECHANICAL,
+    "electrical issue": IssueType.ELECTRICAL,
+    "user operation": IssueType.USER_OPERATION,
+}
+
+ISSUE_STATUS_MAP = {
+    "open": IssueStatus.OPEN,
+    "in progress": IssueStatus.IN_PROGRESS,
+    "resolved": IssueStatus.RESOLVED,
+    "closed": IssueStatus.CLOSED,
+}
+
+
+@dataclass
+class TableStats:
+    imported: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+
+
+@dataclass
+class ImportSummary:
+    tables: dict[str, TableStats] = field(default_factory=dict)
+    coerced_values: int = 0
+
+    def table(self, name: str) -> TableStats:
+        return self.tables.setdefault(name, TableStats())
+
+
+class Checkpoint:
+    """Last committed legacy primary key per table, persisted as JSON."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.state: dict[str, int] = {}
+        if path is not None and path.exists():
+            self.state = json.loads(path.read_text())
+
+    def last_id(self, table: str) -> int:
+        return int(self.state.get(table, 0))
+
+    def save(self, table: str, last_id: int) -> None:
+        self.state[table] = last_id
+        if self.path is None:
+            return
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.state, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
+
+
+class MediaCopier:
+    """Copy legacy media files into the file store with a bounded worker pool."""
+
+    def __init__(self, media_root: Path, store: LocalFileStore, workers: int) -> None:
+        self.media_root = media_root
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media-copy")
+        self.copied = 0
+        self.deduplicated = 0
+        self.missing = 0
+        self.failed = 0
+
+    def _resolve(self, media_path: str) -> Path | None:
+        candidate = Path(media_path)
+        if not candidate.is_absolute():
+            candidate = self.media_root / candidate
+        return candidate if candidate.is_file() else None
+
+    def store_batch(self, media_paths: dict[int, str | None]) -> dict[int, str | None]:
+        """Store the media of one batch (legacy id -> path) and return the URL each row should reference.
+
+        Rows whose file is missing or cannot be stored reference no media.
+        """
+
+        futures: dict[int, Future[StoredFile]] = {}
+        for row_id, media_path in media_paths.items():
+            if not media_path or not media_path.strip():
+                continue
+            source = self._resolve(media_path.strip())
+            if source is None:
+                self.missing += 1
+                logger.warning("media file not found: %s", media_path)
+                continue
+            futures[row_id] = self._executor.submit(self.store.import_file, source)
+
+        urls: dict[int, str | None] = dict.fromkeys(media_paths)
+        for row_id, future in futures.items():
+            try:
+                stored = future.result()
+            except (OSError, StorageError) as exc:
+                self.failed += 1
+                logger.error("media copy failed for %s: %s", media_paths[row_id], exc)
+                continue
+            if stored.deduplicated:
+                self.deduplicated += 1
+            else:
+                self.copied += 1
+            urls[row_id] = stored.url
+        return urls
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+
+class Lookups:
+    """In-memory maps from legacy free-text values to target foreign keys."""
+
+    def __init__(self) -> None:
+        self.departments: dict[str, int] = {}
+        self.vendor_ids: set[int] = set()
+        self.equipment_by_serial: dict[str, int] = {}
+        self.equipment_by_name: dict[str, int] = {}
+        self.discarded: set[int] = set()
+
+    async def load(self, connection: AsyncConnection) -> None:
+        """Prime the maps from rows already present in the target (resume support)."""
+
+        for department_id, name in await connection.execute(select(Department.department_id, Department.department_name)):
+            self.departments[_key(name)] = department_id
+        self.vendor_ids.update((await connection.execute(select(Vendor.vendor_id))).scalars())
+        result = await connection.stream(
+            select(Equipment.equipment_id, Equipment.serial_number, Equipment.equipment_name).order_by(
+                Equipment.equipment_id
+            )
+        )
+        async for equipment_id, serial_number, name in result:
+            self.remember_equipment(equipment_id, serial_number, name)
+        self.discarded.update((await connection.execute(select(DiscardEquipment.equipment_id))).scalars())
+
+    def remember_equipment(self, equipment_id: int, serial_number: str | None, name: str | None) -> None:
+        if serial_number:
+            self.equipment_by_serial.setdefault(_key(serial_number), equipment_id)
+        if name:
+            self.equipment_by_name.setdefault(_key(name), equipment_id)
+
+    def find_equipment(self, serial_number: str | None, name: str | None) -> int | None:
+        if serial_number and _key(serial_number) in self.equipment_by_serial:
+            return self.equipment_by_serial[_key(serial_number)]
+        if name:
+            return self.equipment_by_name.get(_key(name))
+        return None
+
+
+def _key(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def _clean(value: Any, length: int | None = None) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    return value[:length] if length else value
+
+
+def _parse_date(value: Any) -> date | None:
+    value = _clean(value)
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _parse_int(value: Any) -> int | None:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_batches(source: sqlite3.Connection, table: str, pk: str, after: int, size: int) -> Iterator[list[sqlite3.Row]]:
+    """Stream ``table`` in primary-key order starting after ``after``."""
+
+    cursor = source.execute(f"SELECT * FROM {table} WHERE {pk} > ? ORDER BY {pk}", (after,))
+    try:
+        while batch := cursor.fetchmany(size):
+            yield batch
+    finally:
+        cursor.close()
+
+
+async def _existing_ids(connection: AsyncConnection, column: Any, ids: list[int]) -> set[int]:
+    if not ids:
+        return set()
+    return set((await connection.execute(select(column).where(column.in_(ids)))).scalars())
+
+
+class LegacyImporter:
+    def __init__(
+        self,
+        source: sqlite3.Connection,
+        *,
+        batch_size: int,
+        checkpoint: Checkpoint,
+        media: MediaCopier,
+    ) -> None:
+        self.source = source
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.media = media
+        self.lookups = Lookups()
+        self.summary = ImportSummary()
+
+    async def run(self) -> ImportSummary:
+        async with engine.connect() as connection:
+            await self.lookups.load(connection)
+        await self._import_vendors()
+        await self._import_equipment()
+        await self._import_issues()
+        await self._import_discards()
+        async with engine.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                await self._reset_sequences(connection)
+            await connection.run_sync(rebuild_counters)
+            # Imported rows were written with Core INSERTs; give them change entries for delta sync.
+            await connection.run_sync(seed_change_log)
+        await restart_issue_rollup_backfill()
+        await backfill_issue_rollups()
+        return self.summary
+
+    async def _commit_batch(self, table: str, last_id: int, write) -> None:
+        async with engine.begin() as connection:
+            await write(connection)
+        self.checkpoint.save(table, last_id)
+        stats = self.summary.table(table)
+        logger.info("%s: through legacy id %s (%s imported)", table, last_id, stats.imported)
+
+    async def _import_vendors(self) -> None:
+        stats = self.summary.table("vendor")
+        for batch in iter_batches(self.source, "vendor", "vendor_id", self.checkpoint.last_id("vendor"), self.batch_size):
+            rows = [
+                {
+                    "vendor_id": row["vendor_id"],
+                    "vendor_name": _clean(row["vendor_name"], 200) or f"Vendor {row['vendor_id']}",
+                    "phone": _clean(row["phone"], 20),
+                    "email": _clean(row["email"], 100),
+                    "address": _clean(row["address"]),
+                    "category": _clean(row["category"], 100),
+                }
+                for row in batch
+            ]
+
+            async def write(connection: AsyncConnection) -> None:
+                existing = await _existing_ids(connection, Vendor.vendor_id, [row["vendor_id"] for row in rows])
+                fresh = [row for row in rows if row["vendor_id"] not in existing]
+                stats.duplicates += len(rows) - len(fresh)
+                if fresh:
+                    await connection.execute(insert(Vendor), fresh)
+                stats.imported += len(fresh)
+
+            await self._commit_batch("vendor", batch[-1]["vendor_id"], write)
+            self.lookups.vendor_ids.update(row["vendor_id"] for row in rows)
+
+    async def _ensure_departments(self, connection: AsyncConnection, names: dict[str, str]) -> None:
+        missing = [{"department_name": name} for key, name in names.items() if key not in self.lookups.departments]
+        if not missing:
+            return
+        result = await connection.execute(
+            insert(Department).returning(Department.department_id, Department.department_name), missing
+        )
+        for department_id, name in result:
+            self.lookups.departments[_key(name)] = department_id
+
+    def _equipment_status(self, value: Any) -> EquipmentStatus:
+        status = EQUIPMENT_STATUS_MAP.get(_key(value or ""))
+        if status is None:
+            self.summary.coerced_values += 1
+            return EquipmentStatus.WORKING
+        return status
+
+    async def _import_equipment(self) -> None:
+        stats = self.summary.table("equipment")
+        after = self.checkpoint.last_id("equipment")
+        for batch in iter_batches(self.source, "equipment", "equipment_id", after, self.batch_size):
+            department_names = {}
+            for row in batch:
+                name = _clean(row["department"], 100) or UNASSIGNED_DEPARTMENT
+                department_names.setdefault(_key(name), name)
+
+            async def write(connection: AsyncConnection) -> None:
+                await self._ensure_departments(connection, department_names)
+                existing = await _existing_ids(connection, Equipment.equipment_id, [row["equipment_id"] for row in batch])
+                rows = []
+                for row in batch:
+                    equipment_id = row["equipment_id"]
+                    if equipment_id in existing:
+                        stats.duplicates += 1
+                        continue
+                    serial_number = _clean(row["serial_number"], 100)
+                    if serial_number and _key(serial_number) in self.lookups.equipment_by_serial:
+                        logger.warning("equipment %s: duplicate serial %r, serial dropped", equipment_id, serial_number)
+                        stats.duplicates += 1
+                        serial_number = None
+                    vendor_id = _parse_int(row["vendor_id"])
+                    if vendor_id is not None and vendor_id not in self.lookups.vendor_ids:
+                        logger.warning("equipment %s: unknown vendor %r", equipment_id, row["vendor_id"])
+                        self.summary.coerced_values += 1
+                        vendor_id = None
+                    quantity = _parse_int(row["quantity"])
+                    name = _clean(row["equipment_name"], 200) or f"Equipment {equipment_id}"
+                    department = _clean(row["department"], 100) or UNASSIGNED_DEPARTMENT
+                    rows.append(
+                        {
+                            "equipment_id": equipment_id,
+                            "equipment_name": name,
+                            "serial_number": serial_number,
+                            "model_no": _clean(row["model_no"], 100),
+                            "manufacturer": _clean(row["manufacturer"], 200),
+                            "department_id": self.lookups.departments[_key(department)],
+                            "purchase_date": _parse_date(row["purchase_date"]),
+                            "expiry_date": _parse_date(row["expiry_date"]),
+                            "status": self._equipment_status(row["status"]),
+                            "vendor_id": vendor_id,
+                            "quantity": max(quantity, 0) if quantity is not None else 1,
+                        }
+                    )
+                    self.lookups.remember_equipment(equipment_id, serial_number, name)
+                if rows:
+                    await connection.execute(insert(Equipment), rows)
+                stats.imported += len(rows)
+
+            await self._commit_batch("equipment", batch[-1]["equipment_id"], write)
+
+    async def _import_issues(self) -> None:
+        stats = self.summary.table("issue_report")
+        after = self.checkpoint.last_id("issue_report")
+        for batch in iter_batches(self.source, "issue_report", "issue_id", after, self.batch_size):
+            media_urls = self.media.store_batch({row["issue_id"]: row["media_path"] for row in batch})
+
+            async def write(connection: AsyncConnection) -> None:
+                existing = await _existing_ids(connection, IssueReport.issue_id, [row["issue_id"] for row in batch])
+                rows = []
+                for row in batch:
+                    issue_id = row["issue_id"]
+                    if issue_id in existing:
+                        stats.duplicates += 1
+                        continue
+                    equipment_id = self.lookups.find_equipment(row["serial_number"], row["equipment_name"])
+                    if equipment_id is None:
+                        logger.warning("issue %s: no equipment matches %r", issue_id, row["serial_number"] or row["equipment_name"])
+                        stats.skipped += 1
+                        continue
+                    raised = _parse_date(row["date_raised"])
+                    if raised is None:
+                        logger.warning("issue %s: missing or invalid date_raised %r", issue_id, row["date_raised"])
+                        stats.skipped += 1
+                        continue
+                    issue_type = ISSUE_TYPE_MAP.get(_key(row["issue_type"] or ""))
+                    status = ISSUE_STATUS_MAP.get(_key(row["status"] or ""))
+                    if issue_type is None or status is None:
+                        self.summary.coerced_values += 1
+                    rows.append(
+                        {
+                            "issue_id": issue_id,
+                            "equipment_id": equipment_id,
+                            "issue_type": issue_type or IssueType.TECHNICAL,
+                            "problem_description": _clean(row["problem_description"]) or "(no description)",
+                            "media_url": media_urls[issue_id],
+                            "date_raised": datetime.combine(raised, datetime.min.time(), timezone.utc),
+                            "status": status or IssueStatus.OPEN,
+                            "technician": _clean(row["technician"], 100),
+                        }
+                    )
+                if rows:
+                    await connection.execute(insert(IssueReport), rows)
+                stats.imported += len(rows)
+
+            await self._commit_batch("issue_report", batch[-1]["issue_id"], write)
+
+    async def _import_discards(self) -> None:
+        stats = self.summary.table("discard_equipment")
+        after = self.checkpoint.last_id("discard_equipment")
+        for batch in iter_batches(self.source, "discard_equipment", "discard_id", after, self.batch_size):
+            media_urls = self.media.store_batch({row["discard_id"]: row["media_path"] for row in batch})
+
+            async def write(connection: AsyncConnection) -> None:
+                existing = await _existing_ids(
+                    connection, DiscardEquipment.discard_id, [row["discard_id"] for row in batch]
+                )
+                rows = []
+                for row in batch:
+                    discard_id = row["discard_id"]
+                    if discard_id in existing:
+                        stats.duplicates += 1
+                        continue
+                    equipment_id = self.lookups.find_equipment(row["serial_number"], row["equipment_name"])
+                    if equipment_id is None:
+                        logger.warning("discard %s: no equipment matches %r", discard_id, row["serial_number"] or row["equipment_name"])
+                        stats.skipped += 1
+                        continue
+                    if equipment_id in self.lookups.discarded:
+                        stats.duplicates += 1
+                        continue
+                    self.lookups.discarded.add(equipment_id)
+                    rows.append(
+                        {
+                            "discard_id": discard_id,
+                            "equipment_id": equipment_id,
+                            "reason": _clean(row["reason"]) or "(no reason given)",
+                            "media_url": media_urls[discard_id],
+                            "date": _parse_date(row["date"]) or date.today(),
+                        }
+                    )
+                if rows:
+                    await connection.execute(insert(DiscardEquipment), rows)
+                    await connection.execute(
+                        update(Equipment)
+                        .where(Equipment.equipment_id.in_([row["equipment_id"] for row in rows]))
+                        .values(status=EquipmentStatus.DECOMMISSIONED)
+                    )
+                stats.imported += len(rows)
+
+            await self._commit_batch("discard_equipment", batch[-1]["discard_id"], write)
+
+    async def _reset_sequences(self, connection: AsyncConnection) -> None:
+        for table, column in (
+            ("vendor", "vendor_id"),
+            ("department", "department_id"),
+            ("equipment", "equipment_id"),
+            ("issue_report", "issue_id"),
+            ("discard_equipment", "discard_id"),
+        ):
+            await connection.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+                    f"COALESCE((SELECT MAX({column}) FROM {table}), 1))"
+                )
+            )
+
+
+async def main(args: argparse.Namespace) -> None:
+    source = sqlite3.connect(f"file:{args.source}?mode=ro", uri=True)
+    source.row_factory = sqlite3.Row
+    media = MediaCopier(Path(args.media_root), get_file_store(), args.workers)
+    importer = LegacyImporter(
+        source,
+        batch_size=args.batch_size,
+        checkpoint=Checkpoint(Path(args.checkpoint) if args.checkpoint else None),
+        media=media,
+    )
+    try:
+        summary = await importer.run()
+    finally:
+        media.close()
+        source.close()
+        await engine.dispose()
+
+    for table, stats in summary.tables.items():
+        print(f"{table:<18} imported={stats.imported} skipped={stats.skipped} duplicates={stats.duplicates}")
+    print(f"coerced values: {summary.coerced_values}")
+    print(
+        f"media: copied={media.copied} deduplicated={media.deduplicated} missing={media.missing} failed={media.failed}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="path to the legacy hospital_equipment.db")
+    parser.add_argument("--media-root", default=".", help="directory relative media paths are resolved against")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=8, help="parallel media copy workers")
+    parser.add_argument("--checkpoint", help="checkpoint file used to resume an interrupted import")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if arguments.verbose else logging.WARNING, format="%(levelname)s %(message)s")
+    asyncio.run(main(arguments))
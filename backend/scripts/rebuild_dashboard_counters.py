@@ -0,0 +1,39 @@
+"""Rebuild or verify the maintained dashboard counters.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.rebuild_dashboard_counters          # recount and replace
+    python -m scripts.rebuild_dashboard_counters --check  # report drift only
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.dashboard.stats import rebuild_counters, verify_counters
+from app.db.session import engine
+
+
+async def main(check_only: bool) -> int:
+    try:
+        async with engine.begin() as connection:
+            mismatches = await connection.run_sync(verify_counters)
+            for (metric, bucket), (stored, actual) in mismatches.items():
+                print(f"{metric}[{bucket}]: stored={stored} actual={actual}")
+            if check_only:
+                print("counters consistent" if not mismatches else f"{len(mismatches)} counters drifted")
+                return 1 if mismatches else 0
+            counts = await connection.run_sync(rebuild_counters)
+        print(f"rebuilt {len(counts)} counters")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="only compare stored counters with a recount")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.check)))
@@ -0,0 +1,36 @@
+"""Run the equipment expiry scan once, outside the scheduler.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.run_expiry_scan            # incremental from the saved high-water mark, full when due
+    python -m scripts.run_expiry_scan --full     # rescan every expiry date up to today
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+
+from app.db.session import engine
+from app.jobs.expiry import refresh_expiry_alerts, run_expiry_scan
+
+
+async def main(args: argparse.Namespace) -> int:
+    today = date.fromisoformat(args.today) if args.today else None
+    result = await run_expiry_scan(today, full=args.full)
+    alerts = await refresh_expiry_alerts(today)
+    await engine.dispose()
+    print(f"scanned {result.scanned_from or 'start'}..{result.scanned_to}: {result.expired} expired "
+          f"in {result.chunks} chunks ({result.duration_ms:.0f} ms)")
+    for window, alert in alerts["windows"].items():
+        print(f"expiring within {window} days: {alert['total']}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full", action="store_true", help="Ignore the high-water mark")
+    parser.add_argument("--today", default=None, help="Scan as of this ISO date instead of today")
+    sys.exit(asyncio.run(main(parser.parse_args())))
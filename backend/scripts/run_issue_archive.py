@@ -0,0 +1,46 @@
+"""Move old closed issue reports to ``issue_report_archive`` once, outside the scheduler.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.run_issue_archive                   # up to ISSUE_ARCHIVE_MAX_BATCHES batches
+    python -m scripts.run_issue_archive --all             # keep going until nothing is left
+    python -m scripts.run_issue_archive --months 24       # override ISSUE_ARCHIVE_AFTER_MONTHS
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.core.config import settings
+from app.db.session import engine
+from app.jobs.archive import run_issue_archive
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.months is not None:
+        settings.issue_archive_after_months = args.months
+    try:
+        archived = batches = 0
+        while True:
+            result = await run_issue_archive()
+            archived += result.archived
+            batches += result.batches
+            if result.complete or not args.all:
+                break
+    finally:
+        await engine.dispose()
+    print(
+        f"{archived} issue reports closed before {result.cutoff:%Y-%m-%d} archived in {batches} batches"
+        f"{'' if result.complete else ' - more remain'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--all", action="store_true", help="repeat runs until every eligible report is archived")
+    parser.add_argument("--months", type=int, default=None, help="archive reports closed more than this many months ago")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args)))
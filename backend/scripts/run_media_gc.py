@@ -0,0 +1,41 @@
+"""Delete uploaded media that no issue report or discard record references.
+
+Usage (from the ``backend`` directory)::
+
+    python -m scripts.run_media_gc              # delete orphans and stale resumable uploads
+    python -m scripts.run_media_gc --dry-run    # only report what would be deleted
+
+Files newer than ``MEDIA_GC_GRACE_HOURS`` are always kept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.db.session import engine
+from app.jobs.media_gc import run_media_gc
+
+
+async def main(args: argparse.Namespace) -> int:
+    try:
+        result = await run_media_gc(dry_run=args.dry_run)
+    finally:
+        await engine.dispose()
+    print(
+        f"scanned {result.scanned} files: {result.referenced} referenced, {result.recent} within the grace period, "
+        f"{result.orphaned} orphaned ({result.orphaned_bytes} bytes); {result.missing} referenced keys have no file"
+    )
+    if not args.dry_run:
+        print(
+            f"deleted {result.deleted} files and {result.stale_uploads} stale uploads, "
+            f"{result.bytes_reclaimed} bytes reclaimed ({result.duration_ms:.0f} ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="count orphans without deleting anything")
+    sys.exit(asyncio.run(main(parser.parse_args())))
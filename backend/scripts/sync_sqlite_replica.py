@@ -0,0 +1,68 @@
+"""Keep SQLite stand-in replicas in sync with the primary for local replica-routing tests.
+
+SQLite has no replication; this copies the primary into each replica file with the online
+backup API, once or every ``--interval`` seconds (which also simulates replication lag).
+
+Usage (from the ``backend`` directory)::
+
+    export DATABASE_URL=sqlite+aiosqlite:///./hospital.db
+    export DATABASE_REPLICA_URLS='["sqlite+aiosqlite:///./replica1.db"]'
+    python -m scripts.sync_sqlite_replica                 # copy once
+    python -m scripts.sync_sqlite_replica --interval 2    # keep copying, ~2s of lag
+
+For PostgreSQL stand-ins use streaming replication, or point ``DATABASE_REPLICA_URLS`` at
+a second database restored from ``pg_dump``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import time
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+
+def _sqlite_path(url: str) -> str:
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or not parsed.database or parsed.database == ":memory:":
+        raise SystemExit(f"not a file-backed SQLite URL: {url}")
+    return parsed.database
+
+
+def sync_once(primary: str, replicas: list[str]) -> float:
+    started = time.perf_counter()
+    source = sqlite3.connect(primary)
+    try:
+        for replica in replicas:
+            target = sqlite3.connect(replica)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+    finally:
+        source.close()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(args: argparse.Namespace) -> int:
+    primary = _sqlite_path(str(settings.database_url))
+    replicas = [_sqlite_path(url) for url in settings.database_replica_urls]
+    if not replicas:
+        print("DATABASE_REPLICA_URLS is empty", file=sys.stderr)
+        return 1
+    while True:
+        duration_ms = sync_once(primary, replicas)
+        print(f"copied {primary} -> {', '.join(replicas)} ({duration_ms:.0f} ms)")
+        if not args.interval:
+            return 0
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=0, help="Repeat every N seconds (default: once)")
+    sys.exit(main(parser.parse_args()))
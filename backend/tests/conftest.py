@@ -0,0 +1,217 @@
+"""Shared fixtures: the app on a throwaway SQLite database, called through httpx's ASGI transport.
+
+Settings and the engine are built when :mod:`app` is imported, so the environment is set
+before any app import. Every test starts from empty tables and empty in-process caches.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="hospital-tests-"))
+os.environ.update(
+    {
+        "DATABASE_URL": f"sqlite+aiosqlite:///{_TMP_DIR / 'test.db'}",
+        "DATABASE_REPLICA_URLS": "[]",
+        "SCHEDULER_ENABLED": "false",
+        "SQL_INSTRUMENTATION": "true",
+        "CACHE_TAG_BACKEND": "local",
+        "UPLOAD_DIR": str(_TMP_DIR / "uploads"),
+        "ISSUE_ARCHIVE_PAUSE_SECONDS": "0",
+    }
+)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.analytics import reliability  # noqa: E402
+from app.auth import revocation, tokens  # noqa: E402
+from app.cache.responses import response_cache  # noqa: E402
+from app.crud import equipment_bulk, equipment_facets  # noqa: E402
+from app.dashboard import verify_counters, verify_issue_rollups  # noqa: E402
+from app.db.session import Base, engine, write_session  # noqa: E402
+from app.jobs import expiry  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.department import Department  # noqa: E402
+from app.models.discard_equipment import DiscardEquipment  # noqa: E402
+from app.models.enums import EquipmentStatus, IssueStatus, IssueType, UserRole  # noqa: E402
+from app.models.equipment import Equipment  # noqa: E402
+from app.models.issue_report import IssueReport  # noqa: E402
+from app.models.refresh_token import RefreshToken  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.vendor import Vendor  # noqa: E402
+from app.search.fts import ensure_sqlite_fts  # noqa: E402
+
+_CACHES = (
+    equipment_facets._cache,
+    reliability._cache,
+    expiry._alerts_cache,
+    equipment_bulk._reference_ids,
+    tokens._claims_cache,
+    revocation._not_revoked,
+    revocation._revoked,
+    response_cache,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def database() -> AsyncIterator[None]:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(ensure_sqlite_fts)
+    yield
+    await engine.dispose()
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+async def _empty_tables() -> AsyncIterator[None]:
+    yield
+    async with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            await connection.execute(table.delete())
+    for cache in _CACHES:
+        cache.clear()
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def auth_headers() -> dict[str, str]:
+    """Bearer header of an admin session, issued without going through bcrypt."""
+
+    refresh_token, token_hash, expires_at = tokens.new_refresh_token()
+    async with write_session() as session:
+        user = User(username="tester", email="tester@example.org", password_hash="!", role=UserRole.ADMIN)
+        session.add(user)
+        await session.flush()
+        record = RefreshToken(user_id=user.user_id, token_hash=token_hash, expires_at=expires_at)
+        session.add(record)
+        await session.flush()
+        access_token, _ = tokens.create_access_token(user.user_id, user.username, str(user.role), record.token_id)
+        await session.commit()
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+@dataclass(slots=True)
+class Inventory:
+    """Ids of the rows created by :func:`seed_inventory`."""
+
+    departments: list[int] = field(default_factory=list)
+    vendors: list[int] = field(default_factory=list)
+    equipment: list[int] = field(default_factory=list)
+    issues: list[int] = field(default_factory=list)
+    discards: list[int] = field(default_factory=list)
+
+
+async def seed_inventory(equipment_count: int = 12, *, today: date | None = None) -> Inventory:
+    """Create departments, vendors and equipment with a spread of statuses, expiry dates,
+    issue reports and discards, through the ORM so counters, rollups and the change log follow.
+    """
+
+    today = today or date.today()
+    statuses = list(EquipmentStatus)
+    issue_types = list(IssueType)
+    inventory = Inventory()
+    async with write_session() as session:
+        departments = [Department(department_name=name) for name in ("Radiology", "Cardiology", "Surgery")]
+        vendors = [Vendor(vendor_name=name) for name in ("Acme Medical", "Globex Devices")]
+        session.add_all([*departments, *vendors])
+        await session.flush()
+
+        equipment = [
+            Equipment(
+                equipment_name=f"Monitor {index:02d}",
+                serial_number=f"SN-{index:04d}",
+                department_id=departments[index % len(departments)].department_id,
+                vendor_id=vendors[index % len(vendors)].vendor_id if index % 4 else None,
+                status=statuses[index % len(statuses)],
+                purchase_date=today - timedelta(days=400 + index),
+                expiry_date=today + timedelta(days=45 * (index % 5) - 60) if index % 3 else None,
+            )
+            for index in range(equipment_count)
+        ]
+        session.add_all(equipment)
+        await session.flush()
+
+        raised = datetime.now(timezone.utc) - timedelta(days=30)
+        issues = [
+            IssueReport(
+                equipment_id=item.equipment_id,
+                issue_type=issue_types[index % len(issue_types)],
+                problem_description=f"Display flickers on unit {index}",
+                date_raised=raised + timedelta(hours=index),
+                status=IssueStatus.OPEN if index % 2 else IssueStatus.IN_PROGRESS,
+            )
+            for index, item in enumerate(equipment)
+            for _ in range(2)
+        ]
+        discards = [
+            DiscardEquipment(equipment_id=item.equipment_id, reason="Beyond repair", date=today - timedelta(days=index))
+            for index, item in enumerate(equipment)
+            if item.status is EquipmentStatus.DECOMMISSIONED
+        ]
+        session.add_all([*issues, *discards])
+        await session.flush()
+
+        inventory.departments = [row.department_id for row in departments]
+        inventory.vendors = [row.vendor_id for row in vendors]
+        inventory.equipment = [row.equipment_id for row in equipment]
+        inventory.issues = [row.issue_id for row in issues]
+        inventory.discards = [row.discard_id for row in discards]
+        await session.commit()
+    return inventory
+
+
+@pytest.fixture
+async def inventory() -> Inventory:
+    return await seed_inventory()
+
+
+@pytest.fixture
+def seed() -> Callable[..., Awaitable[Inventory]]:
+    """:func:`seed_inventory`, for tests that need another number of rows."""
+
+    return seed_inventory
+
+
+@pytest.fixture
+def drift() -> Callable[[], Awaitable[tuple[dict, dict]]]:
+    """Compare the stored counters and issue rollups with a recount; both dicts are empty when consistent."""
+
+    async def check() -> tuple[dict, dict]:
+        async with engine.connect() as connection:
+            return await connection.run_sync(verify_counters), await connection.run_sync(verify_issue_rollups)
+
+    return check
+
+
+@pytest.fixture
+def png() -> Callable[[bytes], bytes]:
+    """Build a 1x1 PNG carrying the given text in a tEXt chunk, so different texts hash differently."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    def build(text: bytes) -> bytes:
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+            + chunk(b"tEXt", b"Comment\x00" + text)
+            + chunk(b"IDAT", zlib.compress(b"\x00\x00"))
+            + chunk(b"IEND", b"")
+        )
+
+    return build
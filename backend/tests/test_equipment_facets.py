@@ -0,0 +1,124 @@
+"""Facet counts equal a brute-force count over every row, with each facet ignoring its own filter."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.equipment_facets import count_equipment_facets, get_equipment_facets
+from app.db.session import AsyncSessionLocal, write_session
+from app.models.equipment import Equipment
+
+
+def _expiry(expiry_date: date | None, today: date) -> str:
+    if expiry_date is None:
+        return "no_expiry"
+    for bucket, days in (("expired", 0), ("due_30_days", 30), ("due_90_days", 90), ("due_365_days", 365)):
+        if expiry_date <= today + timedelta(days=days):
+            return bucket
+    return "later"
+
+
+def _options(row: Any, today: date) -> dict[str, Any]:
+    return {
+        "status": row.status.value,
+        "department": row.department_id,
+        "vendor": row.vendor_id,
+        "purchase_year": row.purchase_date.year if row.purchase_date else None,
+        "expiry": _expiry(row.expiry_date, today),
+    }
+
+
+def _passes(row: Any, filters: dict[str, Any], today: date) -> dict[str, bool]:
+    """Whether ``row`` passes the filters of each facet group."""
+
+    expired = filters.get("expired")
+    return {
+        "status": filters.get("status") in (None, row.status.value),
+        "department": filters.get("department_id") in (None, row.department_id),
+        "vendor": filters.get("vendor_id") in (None, row.vendor_id),
+        "purchase_year": True,
+        "expiry": expired is None or expired == (row.expiry_date is not None and row.expiry_date <= today),
+    }
+
+
+async def _brute_force(filters: dict[str, Any], today: date) -> tuple[int, dict[str, Counter]]:
+    async with AsyncSessionLocal() as session:
+        rows = (await session.execute(select(Equipment))).scalars().all()
+    counts: dict[str, Counter] = {}
+    total = 0
+    for row in rows:
+        options, passes = _options(row, today), _passes(row, filters, today)
+        total += all(passes.values())
+        for group, value in options.items():
+            if all(passed for other, passed in passes.items() if other != group):
+                counts.setdefault(group, Counter())[value] += 1
+    return total, counts
+
+
+def _counts(facet: dict[str, Any]) -> Counter:
+    return Counter({option["value"]: option["count"] for option in facet["values"] if option["count"]})
+
+
+@pytest.fixture
+async def inventory(seed):
+    return await seed(40)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"status": "WORKING"},
+        {"department": 0, "vendor": 1},
+        {"department": 1, "expired": True},
+        {"status": "UNDER_REPAIR", "expired": False, "vendor": 0},
+    ],
+)
+async def test_facet_counts_match_brute_force(client, inventory, filters):
+    filters = dict(filters)
+    if "department" in filters:
+        filters["department_id"] = inventory.departments[filters.pop("department")]
+    if "vendor" in filters:
+        filters["vendor_id"] = inventory.vendors[filters.pop("vendor")]
+    params = {key: str(value).lower() if isinstance(value, bool) else value for key, value in filters.items()}
+
+    response = await client.get("/api/v1/equipment", params={**params, "facets": "true", "page_size": 200})
+    assert response.status_code == 200
+    payload = response.json()
+    total, expected = await _brute_force(filters, date.today())
+
+    assert payload["facets"]["total"] == total == len(payload["data"])
+    for group in ("status", "department", "vendor", "purchase_year", "expiry"):
+        assert _counts(payload["facets"][group]) == expected.get(group, Counter()), group
+
+
+async def test_department_labels(client, inventory):
+    payload = (await client.get("/api/v1/equipment", params={"facets": "true"})).json()
+    labels = {option["value"]: option["label"] for option in payload["facets"]["department"]["values"]}
+    assert labels == dict(zip(inventory.departments, ("Radiology", "Cardiology", "Surgery")))
+
+
+async def test_cached_counts_follow_writes(client, inventory):
+    before = _counts((await client.get("/api/v1/equipment", params={"facets": "true"})).json()["facets"]["status"])
+    async with write_session() as session:
+        await session.delete(await session.get(Equipment, inventory.equipment[0]))
+        await session.commit()
+    after = _counts((await client.get("/api/v1/equipment", params={"facets": "true"})).json()["facets"]["status"])
+    assert sum(before.values()) - sum(after.values()) == 1
+
+
+async def test_cache_is_per_day(inventory):
+    today = date.today()
+    later = today + timedelta(days=100)
+    async with AsyncSessionLocal() as session:
+        now = await get_equipment_facets(session, version=("fixed",), today=today)
+        then = await get_equipment_facets(session, version=("fixed",), today=later)
+        assert then == await count_equipment_facets(session, today=later)
+    assert now != then
+    _, expected = await _brute_force({}, later)
+    assert {value.value: value.count for value in then.expiry.values if value.count} == expected["expiry"]
@@ -0,0 +1,79 @@
+"""The expiry scan: chunked transitions to EXPIRED, the high-water mark, periodic full scans and alert sets."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, write_session
+from app.jobs.expiry import EXPIRABLE_STATUSES, EXPIRY_JOB, run_expiry_scan
+from app.jobs.state import load_job_state, save_job_state
+from app.models.enums import EquipmentStatus
+from app.models.equipment import Equipment
+
+NO_DRIFT = ({}, {})
+
+
+async def _lapsed() -> list[int]:
+    async with AsyncSessionLocal() as session:
+        lapsed = await session.scalars(
+            select(Equipment.equipment_id).where(
+                Equipment.expiry_date <= date.today(), Equipment.status.in_(EXPIRABLE_STATUSES)
+            )
+        )
+        return lapsed.all()
+
+
+async def test_expiry_scan(inventory, drift, monkeypatch):
+    monkeypatch.setattr(settings, "expiry_scan_chunk_size", 1)
+    result = await run_expiry_scan(full=True)
+    assert result.expired > 0
+    assert result.chunks > 1
+    assert await drift() == NO_DRIFT
+    assert await _lapsed() == []
+    assert (await run_expiry_scan(full=True)).expired == 0
+
+
+async def test_incremental_scan_until_a_full_scan_is_due(inventory):
+    await run_expiry_scan(full=True)
+    # An expiry date far behind the high-water mark is outside the incremental range.
+    old = date.today() - timedelta(days=settings.expiry_lookback_days + 30)
+    async with write_session() as session:
+        equipment = await session.get(Equipment, inventory.equipment[0])
+        equipment.status = EquipmentStatus.WORKING
+        equipment.expiry_date = old
+        await session.commit()
+
+    result = await run_expiry_scan()
+    assert result.scanned_from is not None
+    assert result.expired == 0
+    assert await _lapsed() == [inventory.equipment[0]]
+
+    async with write_session() as session:
+        state = await load_job_state(session, EXPIRY_JOB)
+        state["last_full_scan"] = time.time() - settings.expiry_full_scan_interval_hours * 3600
+        await save_job_state(session, EXPIRY_JOB, state)
+        await session.commit()
+    result = await run_expiry_scan()
+    assert result.scanned_from is None
+    assert result.expired == 1
+    assert await _lapsed() == []
+
+
+async def test_expiring_alerts(client, inventory):
+    windows = {}
+    for within_days in settings.expiry_alert_windows:
+        response = await client.get("/api/v1/dashboard/expiring", params={"within_days": within_days})
+        assert response.status_code == 200
+        windows[within_days] = response.json()
+        days_left = [item["days_left"] for item in windows[within_days]["items"]]
+        assert days_left == sorted(days_left)
+        assert all(0 < days <= within_days for days in days_left)
+    totals = [windows[within_days]["total"] for within_days in sorted(windows)]
+    assert totals == sorted(totals)
+
+    response = await client.get("/api/v1/dashboard/expiring", params={"within_days": 5})
+    assert response.status_code == 400
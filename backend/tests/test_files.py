@@ -0,0 +1,61 @@
+"""Media uploads: writes need a session, and deduplication survives a concurrent media GC."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.storage import local
+from app.storage.local import FILE_URL_PREFIX, get_file_store
+
+UPLOAD_ID = "0" * 32
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("POST", "/api/v1/files"),
+        ("POST", "/api/v1/files/uploads"),
+        ("GET", f"/api/v1/files/uploads/{UPLOAD_ID}"),
+        ("PATCH", f"/api/v1/files/uploads/{UPLOAD_ID}"),
+        ("DELETE", f"/api/v1/files/uploads/{UPLOAD_ID}"),
+    ],
+)
+async def test_uploads_require_authentication(client, method, path):
+    response = await client.request(method, path, content=b"", headers={"Upload-Offset": "0"})
+    assert response.status_code == 401
+
+
+async def test_upload_and_download(client, auth_headers, png):
+    body = png(b"upload")
+    first = await client.post("/api/v1/files", content=body, headers=auth_headers)
+    assert first.status_code == 201
+    again = await client.post("/api/v1/files", content=body, headers=auth_headers)
+    assert again.json()["key"] == first.json()["key"]
+    assert again.json()["deduplicated"] is True
+
+    # Downloads stay public: stored media URLs are embedded in list and detail responses.
+    download = await client.get(FILE_URL_PREFIX + first.json()["key"])
+    assert download.status_code == 200
+    assert download.content == body
+
+
+async def test_deduplication_racing_the_media_gc(client, auth_headers, png, monkeypatch):
+    body = png(b"collected")
+    key = (await client.post("/api/v1/files", content=body, headers=auth_headers)).json()["key"]
+    utime = os.utime
+
+    def collected_first(path, *args, **kwargs):
+        # The media GC unlinks the orphaned object between the existence check and the touch.
+        os.remove(path)
+        return utime(path, *args, **kwargs)
+
+    monkeypatch.setattr(local.os, "utime", collected_first)
+    response = await client.post("/api/v1/files", content=body, headers=auth_headers)
+    monkeypatch.undo()
+    assert response.status_code == 201
+    assert response.json()["key"] == key
+    assert response.json()["deduplicated"] is False
+    assert (await client.get(FILE_URL_PREFIX + key)).content == body
+    assert get_file_store().path_for(key) is not None
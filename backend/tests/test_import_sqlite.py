@@ -0,0 +1,73 @@
+"""Legacy import: media lands in the content-addressed store and undated issue reports are skipped."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from sqlalchemy import select
+
+from app.db.session import AsyncSessionLocal
+from app.models.discard_equipment import DiscardEquipment
+from app.models.issue_report import IssueReport
+from app.storage.local import FILE_URL_PREFIX, LocalFileStore
+from scripts.import_sqlite import Checkpoint, LegacyImporter, MediaCopier
+
+_LEGACY_SCHEMA = """
+CREATE TABLE vendor (vendor_id INTEGER PRIMARY KEY, vendor_name TEXT, phone TEXT, email TEXT, address TEXT,
+    category TEXT);
+CREATE TABLE equipment (equipment_id INTEGER PRIMARY KEY, equipment_name TEXT, serial_number TEXT, model_no TEXT,
+    manufacturer TEXT, department TEXT, purchase_date TEXT, expiry_date TEXT, status TEXT, vendor_id INTEGER,
+    vendor_contact TEXT, vendor_email TEXT, quantity INTEGER);
+CREATE TABLE issue_report (issue_id INTEGER PRIMARY KEY, equipment_name TEXT, serial_number TEXT, manufacturer TEXT,
+    issue_type TEXT, problem_description TEXT, media_path TEXT, date_raised TEXT, status TEXT, technician TEXT);
+CREATE TABLE discard_equipment (discard_id INTEGER PRIMARY KEY, equipment_name TEXT, serial_number TEXT,
+    model_no TEXT, reason TEXT, media_path TEXT, date TEXT);
+"""
+
+
+async def test_import_stores_media_by_content(tmp_path, png):
+    # Same file name and size in two folders, different content; the third file repeats the first.
+    for folder, body in (("a", b"first-image"), ("b", b"other-image"), ("c", b"first-image")):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "photo.png").write_bytes(png(body))
+
+    source = sqlite3.connect(":memory:")
+    source.row_factory = sqlite3.Row
+    source.executescript(_LEGACY_SCHEMA)
+    source.execute(
+        "INSERT INTO equipment (equipment_id, equipment_name, serial_number, department, status) "
+        "VALUES (1, 'Monitor', 'SN-1', 'Radiology', 'Working')"
+    )
+    source.executemany(
+        "INSERT INTO issue_report (issue_id, serial_number, issue_type, problem_description, media_path, date_raised,"
+        " status) VALUES (?, 'SN-1', 'Technical', 'Flicker', ?, ?, 'Open')",
+        [(1, "a/photo.png", "2024-03-01"), (2, "b/photo.png", "2024-03-02"), (3, None, None)],
+    )
+    source.execute(
+        "INSERT INTO discard_equipment (discard_id, serial_number, reason, media_path, date) "
+        "VALUES (1, 'SN-1', 'Broken', 'c/photo.png', '2024-04-01')"
+    )
+
+    store = LocalFileStore(tmp_path / "uploads", chunk_size=1024, max_bytes=1 << 20)
+    media = MediaCopier(tmp_path, store, workers=2)
+    importer = LegacyImporter(source, batch_size=10, checkpoint=Checkpoint(None), media=media)
+    try:
+        summary = await importer.run()
+    finally:
+        media.close()
+        source.close()
+
+    assert summary.table("issue_report").imported == 2
+    assert summary.table("issue_report").skipped == 1
+    assert (media.copied, media.deduplicated, media.missing, media.failed) == (2, 1, 0, 0)
+
+    async with AsyncSessionLocal() as session:
+        issues = dict((await session.execute(select(IssueReport.issue_id, IssueReport.media_url))).all())
+        discard_url = await session.scalar(select(DiscardEquipment.media_url))
+    assert set(issues) == {1, 2}
+    assert issues[1] != issues[2]
+    assert discard_url == issues[1]
+    for url in issues.values():
+        key = url.removeprefix(FILE_URL_PREFIX)
+        assert key.startswith("objects/") and key.endswith(".png")
+        assert store.path_for(key) is not None
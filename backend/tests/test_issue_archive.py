@@ -0,0 +1,80 @@
+"""Archiving moves old closed reports out of ``issue_report`` without losing or reusing ids."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.db import query_budget
+from app.db.session import write_session
+from app.jobs.archive import run_issue_archive
+from app.models.enums import IssueStatus, IssueType
+from app.models.issue_report import IssueReport
+from app.models.issue_report_archive import IssueReportArchive
+
+
+async def _close(issue_ids: list[int], resolved_at: datetime) -> None:
+    async with write_session() as session:
+        for issue_id in issue_ids:
+            issue = await session.get(IssueReport, issue_id)
+            issue.status = IssueStatus.CLOSED
+            issue.resolved_at = resolved_at
+        await session.commit()
+
+
+async def _ids(model) -> list[int]:
+    async with write_session() as session:
+        return list((await session.scalars(select(model.issue_id).order_by(model.issue_id))).all())
+
+
+async def test_archive_moves_old_closed_reports(client, inventory, drift, monkeypatch):
+    monkeypatch.setattr(settings, "issue_archive_batch_size", 2)
+    now = datetime.now(timezone.utc)
+    # The newest report is archived too, so a reused rowid would show up below.
+    old = [*inventory.issues[:5], inventory.issues[-1]]
+    recent = inventory.issues[5:7]
+    await _close(old, now - timedelta(days=800))
+    await _close(recent, now - timedelta(days=10))
+
+    result = await run_issue_archive(now)
+    assert (result.archived, result.batches, result.complete) == (len(old), 3, True)
+    assert await _ids(IssueReportArchive) == sorted(old)
+    assert set(await _ids(IssueReport)) == set(inventory.issues) - set(old)
+    assert await drift() == ({}, {})
+
+    stats = (await client.get("/api/v1/dashboard/stats")).json()
+    assert stats["archived_issues"] == len(old)
+    assert stats["total_issues"] == len(inventory.issues) - len(old)
+
+    listed = (await client.get("/api/v1/issues", params={"page_size": 200})).json()["data"]
+    assert not {row["issue_id"] for row in listed} & set(old)
+    listed = (await client.get("/api/v1/issues", params={"page_size": 200, "include_archived": "true"})).json()["data"]
+    assert sorted(row["issue_id"] for row in listed) == sorted(inventory.issues)
+
+    with query_budget(3):
+        archived = await client.get(f"/api/v1/issues/{old[0]}")
+    assert archived.status_code == 200
+    assert archived.json()["status"] == "CLOSED"
+
+    assert (await run_issue_archive(now)).archived == 0
+
+
+async def test_new_reports_never_reuse_archived_ids(inventory):
+    newest = inventory.issues[-1]
+    await _close([newest], datetime.now(timezone.utc) - timedelta(days=800))
+    await run_issue_archive()
+
+    async with write_session() as session:
+        issue = IssueReport(
+            equipment_id=inventory.equipment[0], issue_type=IssueType.TECHNICAL, problem_description="x"
+        )
+        session.add(issue)
+        await session.commit()
+    assert issue.issue_id > newest
+
+    async with write_session() as session:
+        archived = select(IssueReportArchive.issue_id)
+        clash = await session.scalar(select(func.count()).where(IssueReport.issue_id.in_(archived)))
+    assert clash == 0
@@ -0,0 +1,53 @@
+"""Per-department issue rollups follow issue edits and equipment moving between departments."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.db.session import write_session
+from app.models.enums import IssueStatus, IssueType
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+
+NO_DRIFT = ({}, {})
+
+
+async def test_issue_updates(inventory, drift):
+    async with write_session() as session:
+        issues = [await session.get(IssueReport, issue_id) for issue_id in inventory.issues[:4]]
+        issues[0].status = IssueStatus.RESOLVED
+        issues[0].resolved_at = datetime.now(timezone.utc)
+        issues[1].status = IssueStatus.CLOSED
+        issues[2].issue_type = IssueType.ELECTRICAL
+        # Moving a report to equipment of another department moves its rollup contribution too.
+        issues[3].equipment_id = inventory.equipment[-1]
+        await session.commit()
+    assert await drift() == NO_DRIFT
+
+    async with write_session() as session:
+        equipment = await session.get(Equipment, inventory.equipment[0])
+        equipment.department_id = inventory.departments[-1]
+        await session.commit()
+    assert await drift() == NO_DRIFT
+
+
+async def test_trend_follows_the_rollups(client, inventory):
+    async def trend(**params) -> dict:
+        response = await client.get("/api/v1/dashboard/issue-trend", params={"granularity": "month", **params})
+        assert response.status_code == 200
+        return response.json()["series"]
+
+    def total(points: list[dict], key: str) -> int:
+        return sum(point[key] for point in points)
+
+    assert total((await trend())["total"], "raised") == len(inventory.issues)
+    by_department = await trend(group_by="department_id")
+    assert sum(total(points, "raised") for points in by_department.values()) == len(inventory.issues)
+
+    async with write_session() as session:
+        issue = await session.get(IssueReport, inventory.issues[0])
+        issue.status = IssueStatus.RESOLVED
+        issue.resolved_at = datetime.now(timezone.utc)
+        await session.commit()
+    assert total((await trend())["total"], "resolved") == 1
+    assert total((await trend(status="RESOLVED"))["total"], "raised") == 1
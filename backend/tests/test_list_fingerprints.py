@@ -0,0 +1,65 @@
+"""List validators follow the rows a filter selects, not every write to the table."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import delete
+
+from app.core import conditional
+from app.db.session import write_session
+from app.models.enums import EquipmentStatus, IssueStatus
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+
+
+@pytest.fixture(autouse=True)
+def _no_settle_window(monkeypatch):
+    # Rows written a moment ago are still inside the settle window, which withholds validators.
+    monkeypatch.setattr(conditional, "SETTLE_SECONDS", 0)
+
+
+async def _revalidate(client, path: str, params: dict) -> int:
+    etag = (await client.get(path, params=params)).headers["ETag"]
+    return (await client.get(path, params=params, headers={"If-None-Match": etag})).status_code
+
+
+async def test_writes_outside_the_filter_keep_the_list_valid(client, inventory):
+    params = {"status": "OPEN"}
+    etag = (await client.get("/api/v1/issues", params=params)).headers["ETag"]
+    async with write_session() as session:
+        issue = await session.get(IssueReport, inventory.issues[0])
+        assert issue.status is IssueStatus.IN_PROGRESS
+        issue.technician = "Someone else"
+        await session.commit()
+    response = await client.get("/api/v1/issues", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+async def test_core_deletes_invalidate_the_list(client, inventory):
+    # Core statements skip the counters, so the version must not come from them.
+    etag = (await client.get("/api/v1/issues")).headers["ETag"]
+    async with write_session() as session:
+        await session.execute(delete(IssueReport).where(IssueReport.issue_id == inventory.issues[-1]))
+        await session.commit()
+    response = await client.get("/api/v1/issues", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert inventory.issues[-1] not in [item["issue_id"] for item in response.json()["data"]]
+
+
+async def test_facets_are_versioned_over_every_searched_row(client, inventory):
+    params = {"status": "WORKING", "facets": "true"}
+    etag = (await client.get("/api/v1/equipment", params=params)).headers["ETag"]
+    async with write_session() as session:
+        session.add(
+            Equipment(
+                equipment_name="Ventilator",
+                serial_number="SN-9999",
+                department_id=inventory.departments[0],
+                status=EquipmentStatus.UNDER_REPAIR,
+            )
+        )
+        await session.commit()
+    # The new row is outside the status filter but counts towards the status facet.
+    response = await client.get("/api/v1/equipment", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert await _revalidate(client, "/api/v1/equipment", {"status": "WORKING"}) == 304
@@ -0,0 +1,50 @@
+"""Statement budgets of the list and detail endpoints; they must not grow with the row count."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core import conditional
+from app.db import query_budget
+
+
+def _paths(inventory) -> list[tuple[str, int]]:
+    return [
+        ("/api/v1/equipment", 2),
+        ("/api/v1/equipment?status=WORKING&sort_by=expiry_date&sort_order=desc", 2),
+        ("/api/v1/equipment?facets=true", 5),
+        (f"/api/v1/equipment/{inventory.equipment[-1]}", 3),
+        ("/api/v1/issues", 2),
+        ("/api/v1/issues?include_archived=true&sort_by=date_raised", 2),
+        (f"/api/v1/issues/{inventory.issues[-1]}", 2),
+        ("/api/v1/discards", 2),
+        (f"/api/v1/discards/{inventory.discards[-1]}", 2),
+    ]
+
+
+@pytest.mark.parametrize("equipment_count", [4, 40])
+async def test_list_and_detail_budgets(client, seed, equipment_count):
+    inventory = await seed(equipment_count)
+    for path, budget in _paths(inventory):
+        with query_budget(budget):
+            response = await client.get(path)
+        assert response.status_code == 200, path
+
+
+async def test_next_page_keeps_budget(client, inventory):
+    first = (await client.get("/api/v1/equipment", params={"page_size": 5})).json()
+    with query_budget(2):
+        response = await client.get(
+            "/api/v1/equipment", params={"page_size": 5, "cursor": first["pagination"]["next_cursor"]}
+        )
+    assert response.status_code == 200
+
+
+async def test_not_modified_reads_only_the_fingerprint(client, inventory, monkeypatch):
+    # Rows written a moment ago are still inside the settle window, which withholds validators.
+    monkeypatch.setattr(conditional, "SETTLE_SECONDS", 0)
+    for path, _ in _paths(inventory):
+        etag = (await client.get(path)).headers["ETag"]
+        with query_budget(1):
+            response = await client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304, path
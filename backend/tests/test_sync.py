@@ -0,0 +1,140 @@
+"""Delta sync: pushes are idempotent per client row, deletions arrive as tombstones until pruned."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.db.session import write_session
+from app.jobs.change_log import run_change_log_prune
+from app.models.equipment import Equipment
+from app.models.issue_report import IssueReport
+from app.sync.changes import SYNC_MODELS, primary_key
+
+
+async def _changes(client, headers: dict[str, str], since: int, **params) -> dict:
+    response = await client.get("/api/v1/sync/changes", params={"since": since, **params}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _row_ids(batch: dict, entity: str) -> set[int]:
+    changes = batch["changes"].get(entity)
+    if changes is None:
+        return set()
+    key = changes["columns"].index(primary_key(SYNC_MODELS[entity]).key)
+    return {row[key] for row in changes["rows"]}
+
+
+def _push(inventory, client_id: str = "tablet-1") -> dict:
+    return {
+        "client_id": client_id,
+        "department": [{"client_row_id": 1, "department_name": "Oncology"}],
+        "equipment": [
+            {
+                "client_row_id": 1,
+                "equipment_name": "Infusion pump",
+                "serial_number": "OFF-1",
+                "department_id": inventory.departments[0],
+            },
+            # Same serial number as a seeded row: matched, not duplicated.
+            {
+                "client_row_id": 2,
+                "equipment_name": "Monitor",
+                "serial_number": "SN-0000",
+                "department_id": inventory.departments[0],
+            },
+            {"client_row_id": 3, "equipment_name": "Orphan", "department_id": 999_999},
+        ],
+        "issue_report": [
+            {
+                "client_row_id": 1,
+                "equipment_id": inventory.equipment[1],
+                "issue_type": "TECHNICAL",
+                "problem_description": "Alarm silent",
+            },
+        ],
+    }
+
+
+async def test_full_download_pages(client, inventory, auth_headers):
+    seen: set[int] = set()
+    since = 0
+    while True:
+        batch = await _changes(client, auth_headers, since, limit=7)
+        seen |= _row_ids(batch, "equipment")
+        since = batch["cursor"]
+        if not batch["has_more"]:
+            break
+    assert seen == set(inventory.equipment)
+    assert (await _changes(client, auth_headers, since))["changes"] == {}
+
+
+async def test_push_is_idempotent(client, inventory, auth_headers, drift):
+    first = await client.post("/api/v1/sync/changes", json=_push(inventory), headers=auth_headers)
+    assert first.status_code == 200
+    first = first.json()
+    assert (first["created"], first["matched"], first["rejected"]) == (3, 1, 1)
+    statuses = {(row["entity"], row["client_row_id"]): row for row in first["results"]}
+    assert statuses[("equipment", 2)]["id"] == inventory.equipment[0]
+    assert statuses[("equipment", 3)]["status"] == "rejected"
+
+    async with write_session() as session:
+        counts = (
+            await session.scalar(select(func.count()).select_from(Equipment)),
+            await session.scalar(select(func.count()).select_from(IssueReport)),
+        )
+
+    retry = await client.post("/api/v1/sync/changes", json=_push(inventory), headers=auth_headers)
+    assert retry.status_code == 200
+    retry = retry.json()
+    assert (retry["created"], retry["matched"], retry["rejected"]) == (0, 4, 1)
+    for row in retry["results"]:
+        if row["status"] == "matched":
+            assert row["id"] == statuses[(row["entity"], row["client_row_id"])]["id"]
+
+    async with write_session() as session:
+        assert counts == (
+            await session.scalar(select(func.count()).select_from(Equipment)),
+            await session.scalar(select(func.count()).select_from(IssueReport)),
+        )
+    assert await drift() == ({}, {})
+
+    # Another client's rows are its own; only natural keys match across clients.
+    other = (await client.post("/api/v1/sync/changes", json=_push(inventory, "tablet-2"), headers=auth_headers)).json()
+    assert (other["created"], other["matched"]) == (1, 3)
+
+
+async def test_sync_requires_authentication(client, inventory):
+    assert (await client.get("/api/v1/sync/changes", params={"since": 0})).status_code == 401
+    assert (await client.post("/api/v1/sync/changes", json=_push(inventory))).status_code == 401
+
+
+async def test_deletions_are_tombstones_until_pruned(client, inventory, auth_headers):
+    cursor = (await _changes(client, auth_headers, 0, limit=5000))["cursor"]
+    gone = inventory.equipment[0]
+    async with write_session() as session:
+        equipment = await session.get(Equipment, gone)
+        issues = (await session.scalars(select(IssueReport.issue_id).where(IssueReport.equipment_id == gone))).all()
+        await session.delete(equipment)
+        (await session.get(Equipment, inventory.equipment[1])).equipment_name = "Renamed"
+        await session.commit()
+
+    delta = await _changes(client, auth_headers, cursor)
+    assert delta["changes"]["equipment"]["deleted"] == [gone]
+    assert _row_ids(delta, "equipment") == {inventory.equipment[1]}
+    assert set(delta["changes"]["issue_report"]["deleted"]) == set(issues)
+
+    # Not yet expired: the prune keeps the tombstones and the cursor stays valid.
+    assert (await run_change_log_prune()).pruned == 0
+    assert (await _changes(client, auth_headers, cursor))["changes"]["equipment"]["deleted"] == [gone]
+
+    pruned = await run_change_log_prune(datetime.now(timezone.utc) + timedelta(days=365))
+    assert pruned.pruned == 1 + len(issues)
+    response = await client.get("/api/v1/sync/changes", params={"since": cursor}, headers=auth_headers)
+    assert response.status_code == 410
+
+    fresh = await _changes(client, auth_headers, 0, limit=5000)
+    assert _row_ids(fresh, "equipment") == set(inventory.equipment) - {gone}
+    assert fresh["changes"]["equipment"]["deleted"] == []
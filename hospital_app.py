@@ -2,80 +2,1025 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sqlite3
 import os
-from datetime import datetime
+import json
+import queue
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from datetime import date, datetime
+from functools import partial
 
 # ---------------- DATABASE SETUP ----------------
-conn = sqlite3.connect("hospital_equipment.db")
-cursor = conn.cursor()
-
-# Create tables if they don't exist
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS department (
-    department_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    department_name TEXT NOT NULL
-)
-""")
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS vendor (
-    vendor_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    vendor_name TEXT,
-    phone TEXT,
-    email TEXT,
-    address TEXT,
-    category TEXT
-)
-""")
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS equipment (
-    equipment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    equipment_name TEXT,
-    serial_number TEXT,
-    model_no TEXT,
-    manufacturer TEXT,
-    department TEXT,
-    purchase_date TEXT,
-    expiry_date TEXT,
-    status TEXT,
-    vendor_id INTEGER,
-    vendor_contact TEXT,
-    vendor_email TEXT,
-    quantity INTEGER,
-    FOREIGN KEY(vendor_id) REFERENCES vendor(vendor_id)
-)
-""")
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS issue_report (
-    issue_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    equipment_name TEXT,
-    serial_number TEXT,
-    manufacturer TEXT,
-    issue_type TEXT,
-    problem_description TEXT,
-    media_path TEXT,
-    date_raised TEXT,
-    status TEXT,
-    technician TEXT
-)
-""")
-
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS discard_equipment (
-    discard_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    equipment_name TEXT,
-    serial_number TEXT,
-    model_no TEXT,
-    reason TEXT,
-    media_path TEXT,
-    date TEXT
-)
-""")
-
-conn.commit()
+DATABASE_PATH = "hospital_equipment.db"
+
+
+class DatabaseWorker(threading.Thread):
+    """Owns the SQLite connection and runs every query off the Tk main loop.
+
+    Jobs are callables that receive the connection. Whatever is queued runs in one transaction,
+    each job under a savepoint so a failure only undoes that job, so a burst of inserts costs a
+    single commit. Results come back on the Tk thread through ``poll``, which re-arms itself with
+    ``root.after``, so callbacks may touch widgets. Other threads use ``call`` instead, which
+    blocks until the job has committed.
+    """
+
+    BATCH_SIZE = 500
+    POLL_MS = 20
+
+    def __init__(self, path):
+        super().__init__(name="database-worker", daemon=True)
+        self.path = path
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+
+    def submit(self, job, callback=None, errback=None):
+        """Queue ``job(conn)``; ``callback(result)`` or ``errback(exc)`` later runs on the Tk thread."""
+        self.requests.put((job, callback, errback, None))
+
+    def call(self, job):
+        """Run ``job(conn)``, wait for its commit and return its result; never call from the Tk thread."""
+        reply = queue.Queue(maxsize=1)
+        self.requests.put((job, None, None, reply))
+        ok, value = reply.get()
+        if not ok:
+            raise value
+        return value
+
+    def notify(self, callback, value):
+        """Run ``callback(value)`` on the Tk thread; lets other threads hand results to widgets."""
+        self.results.put((callback, True, value))
+
+    def stop(self):
+        """Finish the queued jobs, commit them and close the connection."""
+        self.requests.put(None)
+
+    def connect(self):
+        # Autocommit mode: the worker issues BEGIN/COMMIT itself.
+        conn = sqlite3.connect(self.path, isolation_level=None)
+        # WAL lets readers (the API server, a second client) proceed during our writes, and
+        # synchronous=NORMAL is crash-safe under WAL while skipping an fsync per commit.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def next_batch(self):
+        batch = [self.requests.get()]
+        while batch[-1] is not None and len(batch) < self.BATCH_SIZE:
+            try:
+                batch.append(self.requests.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def run_batch(self, conn, batch):
+        done = []
+        conn.execute("BEGIN")
+        for job, callback, errback, reply in batch:
+            conn.execute("SAVEPOINT job")
+            try:
+                result = job(conn)
+            except Exception as exc:
+                conn.execute("ROLLBACK TO job")
+                conn.execute("RELEASE job")
+                done.append((errback, False, exc, reply))
+            else:
+                conn.execute("RELEASE job")
+                done.append((callback, True, result, reply))
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            conn.execute("ROLLBACK")
+            done = [(errback, False, exc, reply) for _, _, errback, reply in batch]
+        return done
+
+    def reset(self, conn):
+        """Close a connection left in an unknown transaction state; ``run`` reconnects on demand."""
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        return None
+
+    def run(self):
+        conn = self.connect()
+        try:
+            while True:
+                batch = self.next_batch()
+                stopping = batch[-1] is None
+                jobs = batch[:-1] if stopping else batch
+                if jobs:
+                    try:
+                        if conn is None:
+                            conn = self.connect()
+                        done = self.run_batch(conn, jobs)
+                    except Exception as exc:
+                        # BEGIN, ROLLBACK TO or RELEASE itself failed: fail the whole batch so no
+                        # caller of ``call`` waits forever, and start the next one on a new connection.
+                        done = [(errback, False, exc, reply) for _, _, errback, reply in jobs]
+                        conn = self.reset(conn)
+                    for handler, ok, value, reply in done:
+                        if reply is not None:
+                            reply.put((ok, value))
+                        else:
+                            self.results.put((handler, ok, value))
+                if stopping:
+                    return
+        finally:
+            self.reset(conn)
+
+    def poll(self, root):
+        """Run the callbacks of finished jobs; call once from the Tk thread after the root exists."""
+        while True:
+            try:
+                handler, ok, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if handler is not None:
+                handler(value)
+            elif not ok:
+                messagebox.showerror("Database Error", str(value))
+        root.after(self.POLL_MS, self.poll, root)
+
+
+# Columns the list views may sort by through an index; sorting by any other column still works,
+# it just reads the table in order. Indexes are only created here, never from a click.
+SORT_INDEXES = {
+    "equipment": ("equipment_id", ("equipment_name", "serial_number", "department", "status", "expiry_date")),
+    "issue_report": ("issue_id", ("equipment_name", "issue_type", "status", "date_raised")),
+    "vendor": ("vendor_id", ("vendor_name", "category")),
+    "discard_equipment": ("discard_id", ("equipment_name", "date")),
+}
+
+
+def sort_expression(column):
+    """Sort key of a non-key column; NULLs sort as empty strings, matching the sort indexes."""
+    return f"IFNULL({column}, '')"
+
+
+def create_schema(conn):
+    """Create tables if they don't exist."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS department (
+        department_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        department_name TEXT NOT NULL
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS vendor (
+        vendor_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        vendor_name TEXT,
+        phone TEXT,
+        email TEXT,
+        address TEXT,
+        category TEXT
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS equipment (
+        equipment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_name TEXT,
+        serial_number TEXT,
+        model_no TEXT,
+        manufacturer TEXT,
+        department TEXT,
+        purchase_date TEXT,
+        expiry_date TEXT,
+        status TEXT,
+        vendor_id INTEGER,
+        vendor_contact TEXT,
+        vendor_email TEXT,
+        quantity INTEGER,
+        FOREIGN KEY(vendor_id) REFERENCES vendor(vendor_id)
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS issue_report (
+        issue_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_name TEXT,
+        serial_number TEXT,
+        manufacturer TEXT,
+        issue_type TEXT,
+        problem_description TEXT,
+        media_path TEXT,
+        date_raised TEXT,
+        status TEXT,
+        technician TEXT
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS discard_equipment (
+        discard_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_name TEXT,
+        serial_number TEXT,
+        model_no TEXT,
+        reason TEXT,
+        media_path TEXT,
+        date TEXT
+    )
+    """)
+
+    # Sync bookkeeping: the server cursor and client id, and rows added here that the server
+    # has not accepted yet.
+    conn.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS sync_outbox (
+        table_name TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        PRIMARY KEY (table_name, row_id)
+    )
+    """)
+    # Ids of the rows the free-text columns name; filled in by sync, empty until then.
+    for table, column in (("equipment", "department_id"), ("issue_report", "equipment_id"),
+                          ("discard_equipment", "equipment_id")):
+        if column not in {info[1] for info in conn.execute(f"PRAGMA table_info({table})")}:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER")
+    wanted = set()
+    for table, (primary_key, columns) in SORT_INDEXES.items():
+        for column in columns:
+            wanted.add(f"ix_{table}_sort_{column}")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_sort_{column} "
+                         f"ON {table}({sort_expression(column)}, {primary_key})")
+    # Earlier versions created a sort index for whatever column was clicked.
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%_sort_%'"):
+        if name not in wanted:
+            conn.execute(f'DROP INDEX "{name}"')
+
+
+db = DatabaseWorker(DATABASE_PATH)
+db.start()
+db.submit(create_schema)
+
+# ---------------- VIRTUAL TABLE ----------------
+class VirtualTable:
+    """Treeview that only holds the rows currently on screen.
+
+    Rows are read from SQLite in windows of ``visible + 2 * buffer`` rows. Scrolling within
+    the window is served from memory, scrolling next to it extends the window with a keyset
+    query on (sort key, primary key), and jumps seek with OFFSET over the sort index (see
+    ``SORT_INDEXES``). Queries run on the database worker; at most one is in flight, and
+    scrolling while it runs only moves ``first``, so the next query fetches wherever the user
+    ended up.
+    """
+
+    ROW_HEIGHT = 20
+    HEADER_HEIGHT = 25
+
+    def __init__(self, parent, table, primary_key, headings, buffer=100):
+        self.table = table
+        self.primary_key = primary_key
+        self.headings = headings
+        self.buffer = buffer
+        self.sort_column = primary_key
+        self.sort_desc = False
+
+        self.total = 0
+        self.first = 0
+        self.visible = 20
+        self.rows = []
+        self.rows_start = 0
+        self.loading = False
+        # Bumped whenever the cached window stops matching the table; stale results are dropped.
+        self.generation = 0
+
+        self.tree = ttk.Treeview(parent, columns=headings, show="headings")
+        for heading in headings:
+            self.tree.heading(heading, text=heading)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_to(self.first - int(e.delta / 120) * 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.first - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.first + 3))
+
+        db.submit(lambda conn: [info[1] for info in conn.execute(f"PRAGMA table_info({table})")], self.bind_columns)
+
+    def bind_columns(self, db_columns):
+        for heading, column in zip(self.headings, db_columns):
+            self.tree.heading(heading, command=lambda c=column: self.sort_by(c))
+
+    # -- queries (run on the database worker) --
+    def sort_expr(self):
+        if self.sort_column == self.primary_key:
+            return self.primary_key
+        return sort_expression(self.sort_column)
+
+    def order_by(self, reverse=False):
+        direction = "DESC" if self.sort_desc != reverse else "ASC"
+        return f"ORDER BY {self.sort_expr()} {direction}, {self.primary_key} {direction}"
+
+    def fetch_at(self, offset, limit):
+        sql = f"SELECT {self.sort_expr()}, * FROM {self.table} {self.order_by()} LIMIT ? OFFSET ?"
+        return lambda conn: conn.execute(sql, (limit, offset)).fetchall()
+
+    def fetch_after(self, row, limit, reverse=False):
+        ahead = self.sort_desc == reverse
+        op = ">" if ahead else "<"
+        sql = (f"SELECT {self.sort_expr()}, * FROM {self.table} "
+               f"WHERE ({self.sort_expr()}, {self.primary_key}) {op} (?, ?) "
+               f"{self.order_by(reverse)} LIMIT ?")
+
+        def fetch(conn):
+            rows = conn.execute(sql, (row[0], row[1], limit)).fetchall()
+            if reverse:
+                rows.reverse()
+            return rows
+        return fetch
+
+    def request(self, fetch, apply):
+        """Run ``fetch`` on the worker and ``apply`` its rows, unless the window changed meanwhile."""
+        self.loading = True
+        generation = self.generation
+
+        def done(rows):
+            self.loading = False
+            if generation == self.generation:
+                apply(rows)
+            self.scroll_to(self.first)
+
+        def failed(exc):
+            self.loading = False
+            messagebox.showerror("Database Error", str(exc))
+
+        db.submit(fetch, done, failed)
+
+    # -- window management --
+    def reload(self):
+        self.generation += 1
+        self.rows = []
+        self.rows_start = 0
+        count_sql = f"SELECT COUNT(*) FROM {self.table}"
+
+        def count(conn):
+            return conn.execute(count_sql).fetchone()[0]
+
+        def counted(total):
+            self.total = total
+            self.scroll_to(self.first)
+
+        db.submit(count, counted)
+
+    def window_size(self):
+        return self.visible + 2 * self.buffer
+
+    def covers(self, first):
+        wanted_end = min(self.total, first + self.visible)
+        return self.rows_start <= first and wanted_end <= self.rows_start + len(self.rows)
+
+    def load_window(self, first):
+        rows_end = self.rows_start + len(self.rows)
+        if self.covers(first):
+            return
+        if self.rows and self.rows_start <= first < rows_end + self.buffer:
+            self.request(self.fetch_after(self.rows[-1], self.window_size()), self.extend_after)
+        elif self.rows and self.rows_start - self.buffer <= first < self.rows_start:
+            self.request(self.fetch_after(self.rows[0], self.window_size(), reverse=True), self.extend_before)
+        else:
+            offset = max(0, first - self.buffer)
+            self.request(self.fetch_at(offset, self.window_size()), lambda rows: self.replace_window(offset, rows))
+
+    def replace_window(self, offset, rows):
+        self.rows_start = offset
+        self.rows = rows
+        if len(rows) < self.window_size():
+            # Short read: the table ends here (rows may have been deleted by another client).
+            self.total = self.rows_start + len(rows)
+
+    def extend_after(self, rows):
+        self.rows += rows
+        if len(rows) < self.window_size():
+            self.total = self.rows_start + len(self.rows)
+        self.trim()
+
+    def extend_before(self, rows):
+        self.rows = rows + self.rows
+        self.rows_start = 0 if len(rows) < self.window_size() else self.rows_start - len(rows)
+        self.trim()
+
+    def trim(self):
+        # Keep the cache bounded around the visible rows.
+        keep_from = max(0, self.first - self.buffer - self.rows_start)
+        self.rows = self.rows[keep_from:keep_from + self.window_size()]
+        self.rows_start += keep_from
+
+    def scroll_to(self, first):
+        self.first = max(0, min(first, self.total - self.visible))
+        if not self.loading:
+            self.load_window(self.first)
+        self.render()
+
+    def render(self):
+        if self.covers(self.first):
+            # Otherwise keep showing the previous rows until the worker delivers the new window.
+            self.tree.delete(*self.tree.get_children())
+            start = self.first - self.rows_start
+            for row in self.rows[start:start + self.visible]:
+                self.tree.insert("", "end", values=row[1:])
+        if self.total:
+            self.scrollbar.set(self.first / self.total, min(1.0, (self.first + self.visible) / self.total))
+        else:
+            self.scrollbar.set(0, 1)
+
+    # -- events --
+    def on_resize(self, event):
+        visible = max(1, (event.height - self.HEADER_HEIGHT) // self.ROW_HEIGHT)
+        if visible != self.visible:
+            self.visible = visible
+            self.scroll_to(self.first)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.total))
+        elif unit == "pages":
+            self.scroll_to(self.first + int(amount) * self.visible)
+        else:
+            self.scroll_to(self.first + int(amount))
+
+    def sort_by(self, column):
+        self.sort_desc = not self.sort_desc if column == self.sort_column else False
+        self.sort_column = column
+        self.first = 0
+        self.reload()
+
+    def append(self, rowid):
+        """Apply a single-row insert without re-reading the table."""
+        self.total += 1
+        rows_end = self.rows_start + len(self.rows)
+        at_end = rows_end == self.total - 1
+        if self.sort_column == self.primary_key and not self.sort_desc and at_end and not self.loading:
+            sql = f"SELECT {self.primary_key}, * FROM {self.table} WHERE {self.primary_key} = ?"
+            self.request(lambda conn: conn.execute(sql, (rowid,)).fetchall(), self.extend_inserted)
+        else:
+            # The new row lands somewhere inside the ordering; drop the cached window only.
+            self.generation += 1
+            self.rows = []
+            self.scroll_to(self.first)
+
+    def extend_inserted(self, rows):
+        self.rows += rows
+
+
+# ---------------- SYNC ----------------
+SYNC_URL = os.environ.get("HOSPITAL_SYNC_URL", "").rstrip("/")
+SYNC_USER = os.environ.get("HOSPITAL_SYNC_USER", "")
+SYNC_PASSWORD = os.environ.get("HOSPITAL_SYNC_PASSWORD", "")
+SYNC_INTERVAL_SECONDS = int(os.environ.get("HOSPITAL_SYNC_INTERVAL", "300"))
+SYNC_PULL_LIMIT = 1000
+SYNC_PUSH_ROWS = 500
+
+# Tables in foreign-key order with their primary keys, and the columns that point at each.
+SYNC_TABLES = {
+    "department": "department_id",
+    "vendor": "vendor_id",
+    "equipment": "equipment_id",
+    "issue_report": "issue_id",
+    "discard_equipment": "discard_id",
+}
+SYNC_REFERENCES = {
+    "department": [("equipment", "department_id")],
+    "vendor": [("equipment", "vendor_id")],
+    "equipment": [("issue_report", "equipment_id"), ("discard_equipment", "equipment_id")],
+    "issue_report": [],
+    "discard_equipment": [],
+}
+
+# Server enum values and the text this client has always stored for them.
+EQUIPMENT_STATUSES = {"WORKING": "Working", "UNDER_REPAIR": "Under repair", "EXPIRED": "Expired",
+                      "DECOMMISSIONED": "Decommissioned"}
+EQUIPMENT_STATUS_ALIASES = {"under maintenance": "UNDER_REPAIR", "discarded": "DECOMMISSIONED"}
+ISSUE_TYPES = {"TECHNICAL": "Technical Issue", "MECHANICAL": "Mechanical Issue", "ELECTRICAL": "Electrical Issue",
+               "USER_OPERATION": "User Operation"}
+ISSUE_STATUSES = {"OPEN": "Open", "IN_PROGRESS": "In progress", "RESOLVED": "Resolved", "CLOSED": "Closed"}
+
+
+def server_value(labels, text, aliases=None):
+    """Map free text onto a server enum value, or None when it names none of them."""
+    key = " ".join((text or "").split()).casefold()
+    for value, label in labels.items():
+        if key in (label.casefold(), value.casefold().replace("_", " ")):
+            return value
+    return (aliases or {}).get(key)
+
+
+def clip(text, length):
+    return (text or "").strip()[:length] or None
+
+
+def parse_date(text):
+    try:
+        return date.fromisoformat((text or "").strip()[:10])
+    except ValueError:
+        return None
+
+
+def fetch_dicts(conn, sql, params=()):
+    cursor = conn.execute(sql, params)
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
+
+
+def get_sync_state(conn, key, default=None):
+    row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_sync_state(conn, key, value):
+    if value is None:
+        conn.execute("DELETE FROM sync_state WHERE key = ?", (key,))
+    else:
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, str(value)))
+
+
+def sync_client_id(conn):
+    """This database's id on the server; its pushes are deduplicated by it."""
+    client_id = get_sync_state(conn, "client_id")
+    if client_id is None:
+        client_id = uuid.uuid4().hex
+        set_sync_state(conn, "client_id", client_id)
+    return client_id
+
+
+def is_pending(conn, table, row_id):
+    return conn.execute("SELECT 1 FROM sync_outbox WHERE table_name = ? AND row_id = ?", (table, row_id)).fetchone()
+
+
+def count_pending(conn):
+    return conn.execute("SELECT COUNT(*) FROM sync_outbox").fetchone()[0]
+
+
+def repoint(conn, table, old_id, new_id):
+    for child, column in SYNC_REFERENCES[table]:
+        conn.execute(f"UPDATE {child} SET {column} = ? WHERE {column} = ?", (new_id, old_id))
+
+
+def move_row(conn, table, old_id, new_id):
+    """Renumber a row, its outbox entry and the rows pointing at it."""
+    key = SYNC_TABLES[table]
+    conn.execute(f"UPDATE {table} SET {key} = ? WHERE {key} = ?", (new_id, old_id))
+    conn.execute("UPDATE sync_outbox SET row_id = ? WHERE table_name = ? AND row_id = ?", (new_id, table, old_id))
+    repoint(conn, table, old_id, new_id)
+
+
+def make_room(conn, table, row_id):
+    """Free ``row_id`` for a server row by moving a pending local row that holds it."""
+    if not is_pending(conn, table, row_id):
+        return
+    key = SYNC_TABLES[table]
+    # Past the AUTOINCREMENT counter, so the id was never pushed before: the server
+    # deduplicates retried pushes by id and would take it for an earlier row.
+    free = conn.execute(
+        f"SELECT MAX(IFNULL((SELECT seq FROM sqlite_sequence WHERE name = ?), 0), IFNULL(MAX({key}), 0)) + 1 "
+        f"FROM {table}", (table,)
+    ).fetchone()[0]
+    conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = ?", (free, table))
+    move_row(conn, table, row_id, free)
+
+
+# -- push: local rows -> server rows (None skips a row until it can be sent) --
+def ensure_departments(conn):
+    """Point pending equipment at a department row, adding one for each new free-text name."""
+    departments = {
+        name.strip().casefold(): department_id
+        for department_id, name in conn.execute("SELECT department_id, department_name FROM department")
+        if name
+    }
+    pending = conn.execute("""
+        SELECT equipment_id, department FROM equipment
+        WHERE department_id IS NULL
+          AND equipment_id IN (SELECT row_id FROM sync_outbox WHERE table_name = 'equipment')
+    """).fetchall()
+    for equipment_id, name in pending:
+        name = clip(name, 100) or "Unassigned"
+        if name.casefold() not in departments:
+            department_id = conn.execute("INSERT INTO department (department_name) VALUES (?)", (name,)).lastrowid
+            conn.execute("INSERT INTO sync_outbox VALUES ('department', ?)", (department_id,))
+            departments[name.casefold()] = department_id
+        conn.execute("UPDATE equipment SET department_id = ? WHERE equipment_id = ?",
+                     (departments[name.casefold()], equipment_id))
+
+
+def synced_id(conn, table, value):
+    """``value`` as the id of a row of ``table`` the server already has, else None."""
+    try:
+        row_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    key = SYNC_TABLES[table]
+    if is_pending(conn, table, row_id):
+        return None
+    if not conn.execute(f"SELECT 1 FROM {table} WHERE {key} = ?", (row_id,)).fetchone():
+        return None
+    return row_id
+
+
+def resolve_equipment(conn, table, row):
+    """The server id of the equipment a free-text issue or discard names, by serial then by name."""
+    equipment_id = synced_id(conn, "equipment", row["equipment_id"])
+    if equipment_id is None:
+        for column in ("serial_number", "equipment_name"):
+            if not (row[column] or "").strip():
+                continue
+            for (candidate,) in conn.execute(
+                f"SELECT equipment_id FROM equipment WHERE {column} = ? COLLATE NOCASE ORDER BY equipment_id",
+                (row[column].strip(),),
+            ):
+                if not is_pending(conn, "equipment", candidate):
+                    equipment_id = candidate
+                    break
+            if equipment_id is not None:
+                break
+        if equipment_id is not None:
+            key = SYNC_TABLES[table]
+            conn.execute(f"UPDATE {table} SET equipment_id = ? WHERE {key} = ?", (equipment_id, row[key]))
+    return equipment_id
+
+
+def push_department(conn, row):
+    name = clip(row["department_name"], 100)
+    return name and {"client_row_id": row["department_id"], "department_name": name}
+
+
+def push_vendor(conn, row):
+    return {
+        "client_row_id": row["vendor_id"],
+        "vendor_name": clip(row["vendor_name"], 200) or f"Vendor {row['vendor_id']}",
+        "phone": clip(row["phone"], 20),
+        "email": clip(row["email"], 100),
+        "address": clip(row["address"], 10000),
+        "category": clip(row["category"], 100),
+    }
+
+
+def push_equipment(conn, row):
+    department_id = synced_id(conn, "department", row["department_id"])
+    if department_id is None:
+        return None
+    purchase_date, expiry_date = parse_date(row["purchase_date"]), parse_date(row["expiry_date"])
+    try:
+        quantity = max(int(row["quantity"]), 0)
+    except (TypeError, ValueError):
+        quantity = 1
+    return {
+        "client_row_id": row["equipment_id"],
+        "equipment_name": clip(row["equipment_name"], 200) or f"Equipment {row['equipment_id']}",
+        "serial_number": clip(row["serial_number"], 100),
+        "model_no": clip(row["model_no"], 100),
+        "manufacturer": clip(row["manufacturer"], 200),
+        "department_id": department_id,
+        "purchase_date": purchase_date and purchase_date.isoformat(),
+        "expiry_date": expiry_date and expiry_date.isoformat(),
+        "status": server_value(EQUIPMENT_STATUSES, row["status"], EQUIPMENT_STATUS_ALIASES) or "WORKING",
+        "vendor_id": synced_id(conn, "vendor", row["vendor_id"]),
+        "quantity": quantity,
+    }
+
+
+def push_issue(conn, row):
+    equipment_id = resolve_equipment(conn, "issue_report", row)
+    if equipment_id is None:
+        return None
+    raised = parse_date(row["date_raised"])
+    return {
+        "client_row_id": row["issue_id"],
+        "equipment_id": equipment_id,
+        "issue_type": server_value(ISSUE_TYPES, row["issue_type"]) or "TECHNICAL",
+        "problem_description": (row["problem_description"] or "").strip() or "(no description)",
+        "date_raised": raised and f"{raised.isoformat()}T00:00:00+00:00",
+        "status": server_value(ISSUE_STATUSES, row["status"]) or "OPEN",
+        "technician": clip(row["technician"], 100),
+    }
+
+
+def push_discard(conn, row):
+    equipment_id = resolve_equipment(conn, "discard_equipment", row)
+    if equipment_id is None:
+        return None
+    return {
+        "client_row_id": row["discard_id"],
+        "equipment_id": equipment_id,
+        "reason": (row["reason"] or "").strip() or "(no reason given)",
+        "date": (parse_date(row["date"]) or date.today()).isoformat(),
+    }
+
+
+PUSH_ROWS = {
+    "department": push_department,
+    "vendor": push_vendor,
+    "equipment": push_equipment,
+    "issue_report": push_issue,
+    "discard_equipment": push_discard,
+}
+
+
+def build_push(conn, table, after, limit):
+    """Up to ``limit`` pending rows of ``table`` after id ``after``: (last id read or None, push rows)."""
+    key = SYNC_TABLES[table]
+    rows = fetch_dicts(conn, f"""
+        SELECT * FROM {table}
+        WHERE {key} > ? AND {key} IN (SELECT row_id FROM sync_outbox WHERE table_name = ?)
+        ORDER BY {key} LIMIT ?
+    """, (after, table, limit))
+    payload = [pushed for pushed in (PUSH_ROWS[table](conn, row) for row in rows) if pushed]
+    return (rows[-1][key] if rows else None), payload
+
+
+def apply_push(conn, table, results):
+    """Give accepted rows their server ids; returns (accepted, rejected) counts."""
+    accepted = [(result["client_row_id"], result["id"]) for result in results if result["status"] != "rejected"]
+    # Park them on negative ids first: a server id can be another pushed row's local id.
+    for local_id, _ in accepted:
+        move_row(conn, table, local_id, -local_id)
+    key = SYNC_TABLES[table]
+    for local_id, server_id in accepted:
+        conn.execute("DELETE FROM sync_outbox WHERE table_name = ? AND row_id = ?", (table, -local_id))
+        make_room(conn, table, server_id)
+        if conn.execute(f"SELECT 1 FROM {table} WHERE {key} = ?", (server_id,)).fetchone():
+            # Matched a server row we already have (same serial, department name, ...): keep that one.
+            conn.execute(f"DELETE FROM {table} WHERE {key} = ?", (-local_id,))
+            repoint(conn, table, -local_id, server_id)
+        else:
+            move_row(conn, table, -local_id, server_id)
+    return len(accepted), len(results) - len(accepted)
+
+
+# -- pull: server rows -> local rows --
+def upsert(conn, table, values):
+    columns = ", ".join(values)
+    marks = ", ".join("?" for _ in values)
+    conn.execute(f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({marks})", tuple(values.values()))
+
+
+def pull_department(conn, row):
+    upsert(conn, "department", {"department_id": row["department_id"], "department_name": row["department_name"]})
+    conn.execute("UPDATE equipment SET department = ? WHERE department_id = ?",
+                 (row["department_name"], row["department_id"]))
+
+
+def pull_vendor(conn, row):
+    upsert(conn, "vendor", {column: row[column] for column in
+                            ("vendor_id", "vendor_name", "phone", "email", "address", "category")})
+    conn.execute("UPDATE equipment SET vendor_contact = ?, vendor_email = ? WHERE vendor_id = ?",
+                 (row["phone"], row["email"], row["vendor_id"]))
+
+
+def pull_equipment(conn, row):
+    department = conn.execute("SELECT department_name FROM department WHERE department_id = ?",
+                              (row["department_id"],)).fetchone()
+    vendor = conn.execute("SELECT phone, email FROM vendor WHERE vendor_id = ?", (row["vendor_id"],)).fetchone()
+    upsert(conn, "equipment", {
+        "equipment_id": row["equipment_id"],
+        "equipment_name": row["equipment_name"],
+        "serial_number": row["serial_number"],
+        "model_no": row["model_no"],
+        "manufacturer": row["manufacturer"],
+        "department": department[0] if department else None,
+        "department_id": row["department_id"],
+        "purchase_date": row["purchase_date"],
+        "expiry_date": row["expiry_date"],
+        "status": EQUIPMENT_STATUSES.get(row["status"], row["status"]),
+        "vendor_id": row["vendor_id"],
+        "vendor_contact": vendor[0] if vendor else None,
+        "vendor_email": vendor[1] if vendor else None,
+        "quantity": row["quantity"],
+    })
+    conn.execute("UPDATE issue_report SET equipment_name = ?, serial_number = ?, manufacturer = ? "
+                 "WHERE equipment_id = ?",
+                 (row["equipment_name"], row["serial_number"], row["manufacturer"], row["equipment_id"]))
+    conn.execute("UPDATE discard_equipment SET equipment_name = ?, serial_number = ?, model_no = ? "
+                 "WHERE equipment_id = ?",
+                 (row["equipment_name"], row["serial_number"], row["model_no"], row["equipment_id"]))
+
+
+def local_media(conn, table, row):
+    """The attachment path of a report made here; files are not uploaded, so the server has none."""
+    key = SYNC_TABLES[table]
+    media = conn.execute(f"SELECT media_path FROM {table} WHERE {key} = ?", (row[key],)).fetchone()
+    return media[0] if media else None
+
+
+def pull_issue(conn, row):
+    equipment = conn.execute("SELECT equipment_name, serial_number, manufacturer FROM equipment WHERE equipment_id = ?",
+                             (row["equipment_id"],)).fetchone() or (None, None, None)
+    upsert(conn, "issue_report", {
+        "issue_id": row["issue_id"],
+        "equipment_name": equipment[0],
+        "serial_number": equipment[1],
+        "manufacturer": equipment[2],
+        "issue_type": ISSUE_TYPES.get(row["issue_type"], row["issue_type"]),
+        "problem_description": row["problem_description"],
+        "media_path": row["media_url"] or local_media(conn, "issue_report", row),
+        "date_raised": (row["date_raised"] or "")[:10],
+        "status": ISSUE_STATUSES.get(row["status"], row["status"]),
+        "technician": row["technician"],
+        "equipment_id": row["equipment_id"],
+    })
+
+
+def pull_discard(conn, row):
+    equipment = conn.execute("SELECT equipment_name, serial_number, model_no FROM equipment WHERE equipment_id = ?",
+                             (row["equipment_id"],)).fetchone() or (None, None, None)
+    upsert(conn, "discard_equipment", {
+        "discard_id": row["discard_id"],
+        "equipment_name": equipment[0],
+        "serial_number": equipment[1],
+        "model_no": equipment[2],
+        "reason": row["reason"],
+        "media_path": row["media_url"] or local_media(conn, "discard_equipment", row),
+        "date": row["date"],
+        "equipment_id": row["equipment_id"],
+    })
+
+
+PULL_ROWS = {
+    "department": pull_department,
+    "vendor": pull_vendor,
+    "equipment": pull_equipment,
+    "issue_report": pull_issue,
+    "discard_equipment": pull_discard,
+}
+
+
+def read_cursor(conn):
+    return int(get_sync_state(conn, "cursor", 0)), get_sync_state(conn, "resync") is not None
+
+
+def start_resync(conn):
+    """Download everything again, remembering what arrives so rows deleted meanwhile can be dropped."""
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS sync_seen (
+        table_name TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        PRIMARY KEY (table_name, row_id)
+    ) WITHOUT ROWID
+    """)
+    conn.execute("DELETE FROM sync_seen")
+    set_sync_state(conn, "cursor", 0)
+    set_sync_state(conn, "resync", 1)
+
+
+def finish_resync(conn):
+    for table, key in SYNC_TABLES.items():
+        conn.execute(f"""
+            DELETE FROM {table}
+            WHERE {key} NOT IN (SELECT row_id FROM sync_seen WHERE table_name = ?)
+              AND {key} NOT IN (SELECT row_id FROM sync_outbox WHERE table_name = ?)
+        """, (table, table))
+    conn.execute("DROP TABLE sync_seen")
+    set_sync_state(conn, "resync", None)
+
+
+def apply_changes(conn, batch, resync):
+    """Write one page of server changes together with its cursor; returns the rows touched."""
+    touched = 0
+    for table, changes in batch["changes"].items():
+        key = SYNC_TABLES[table]
+        for values in changes["rows"]:
+            row = dict(zip(changes["columns"], values))
+            make_room(conn, table, row[key])
+            PULL_ROWS[table](conn, row)
+            if resync:
+                conn.execute("INSERT OR IGNORE INTO sync_seen VALUES (?, ?)", (table, row[key]))
+        for row_id in changes["deleted"]:
+            # A pending row on that id is a different, local row.
+            if not is_pending(conn, table, row_id):
+                conn.execute(f"DELETE FROM {table} WHERE {key} = ?", (row_id,))
+        touched += len(changes["rows"]) + len(changes["deleted"])
+    set_sync_state(conn, "cursor", batch["cursor"])
+    return touched
+
+
+class SyncClient(threading.Thread):
+    """Pushes rows added on this desktop to the API server and pulls what changed there.
+
+    Runs every SYNC_INTERVAL_SECONDS and on ``sync_now``. HTTP runs on this thread and every
+    database step on the worker through ``db.call``; the outcome goes to ``on_done`` on the Tk
+    thread. Local ids are server ids (``scripts.import_sqlite`` keeps legacy primary keys, so
+    import this database once before enabling sync); a row added offline takes the server's id
+    once its push is accepted. Media files stay local: pushed reports carry no attachment.
+    """
+
+    def __init__(self, url, username, password, on_done):
+        super().__init__(name="sync-client", daemon=True)
+        self.url = url
+        self.username = username
+        self.password = password
+        self.on_done = on_done
+        self.token = None
+        self.wake = threading.Event()
+        self.stopping = False
+
+    def sync_now(self):
+        self.wake.set()
+
+    def stop(self):
+        self.stopping = True
+        self.wake.set()
+
+    def run(self):
+        while not self.stopping:
+            try:
+                summary = self.sync()
+            except Exception as exc:
+                # Offline or the server failed: report it and try again next round.
+                summary = {"error": str(exc)}
+            db.notify(self.on_done, summary)
+            self.wake.wait(SYNC_INTERVAL_SECONDS)
+            self.wake.clear()
+
+    def request(self, method, path, body=None, form=False, retry=True):
+        headers = {"Accept": "application/json"}
+        data = None
+        if form:
+            data = urllib.parse.urlencode(body).encode()
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        request = urllib.request.Request(self.url + path, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 401 and retry and not form:
+                self.login()
+                return self.request(method, path, body, retry=False)
+            raise
+
+    def login(self):
+        credentials = {"username": self.username, "password": self.password}
+        self.token = self.request("POST", "/api/v1/auth/login", credentials, form=True)["access_token"]
+
+    def sync(self):
+        client_id = db.call(sync_client_id)
+        pushed, rejected = self.push(client_id)
+        pulled = self.pull()
+        return {"pushed": pushed, "rejected": rejected, "pulled": pulled, "pending": db.call(count_pending)}
+
+    def push(self, client_id):
+        """Send pending rows table by table, parents first, so children can use the parents' server ids."""
+        db.call(ensure_departments)
+        pushed = rejected = 0
+        for table in SYNC_TABLES:
+            after = 0
+            while True:
+                after, rows = db.call(partial(build_push, table=table, after=after, limit=SYNC_PUSH_ROWS))
+                if after is None:
+                    break
+                if rows:
+                    result = self.request("POST", "/api/v1/sync/changes", {"client_id": client_id, table: rows})
+                    accepted, refused = db.call(partial(apply_push, table=table, results=result["results"]))
+                    pushed += accepted
+                    rejected += refused
+        return pushed, rejected
+
+    def pull(self):
+        """Apply server changes page by page; a page and its cursor commit together."""
+        pulled = 0
+        while True:
+            since, resync = db.call(read_cursor)
+            try:
+                batch = self.request("GET", f"/api/v1/sync/changes?since={since}&limit={SYNC_PULL_LIMIT}")
+            except urllib.error.HTTPError as exc:
+                if exc.code != 410:
+                    raise
+                # Offline for longer than the server keeps deletions.
+                db.call(start_resync)
+                continue
+            pulled += db.call(partial(apply_changes, batch=batch, resync=resync))
+            if not batch["has_more"]:
+                if resync:
+                    db.call(finish_resync)
+                return pulled
+
 
 # ---------------- MAIN APP ----------------
+DASHBOARD_STATS = {
+    "Total Equipment": "SELECT COUNT(*) FROM equipment",
+    "Working": "SELECT COUNT(*) FROM equipment WHERE status='Working'",
+    "Under Maintenance": "SELECT COUNT(*) FROM equipment WHERE status='Under repair'",
+    "Expired": "SELECT COUNT(*) FROM equipment WHERE expiry_date <= date('now')",
+    "Discarded": "SELECT COUNT(*) FROM discard_equipment",
+    "Departments": "SELECT COUNT(*) FROM department"
+}
+DASHBOARD_REFRESH_MS = 500
+
+
+def read_dashboard_stats(conn):
+    """Read every dashboard count in one statement, i.e. one consistent snapshot."""
+    return conn.execute("SELECT " + ", ".join(f"({query})" for query in DASHBOARD_STATS.values())).fetchone()
+
+
 class HospitalApp:
     def __init__(self, root):
         self.root = root
@@ -97,6 +1042,7 @@ class HospitalApp:
         self.tab_control.add(self.vendor_tab, text="Vendors")
         self.tab_control.add(self.discard_tab, text="Discarded")
         self.tab_control.pack(expand=1, fill="both")
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         self.setup_dashboard()
         self.setup_equipment_tab()
@@ -104,24 +1050,75 @@ class HospitalApp:
         self.setup_vendor_tab()
         self.setup_discard_tab()
 
+        self.sync = None
+        if SYNC_URL:
+            self.sync = SyncClient(SYNC_URL, SYNC_USER, SYNC_PASSWORD, self.synced)
+            self.sync.start()
+
+    def close(self):
+        if self.sync is not None:
+            self.sync.stop()
+        # Let the worker commit what is still queued before the process exits.
+        db.stop()
+        db.join(timeout=10)
+        self.root.destroy()
+
+    def insert(self, sql, params, table, message):
+        """Run an INSERT on the worker and queue the row for sync, then show it in ``table``."""
+        def run(conn):
+            rowid = conn.execute(sql, params).lastrowid
+            conn.execute("INSERT INTO sync_outbox (table_name, row_id) VALUES (?, ?)", (table.table, rowid))
+            return rowid
+
+        def added(rowid):
+            table.append(rowid)
+            self.refresh_dashboard()
+            messagebox.showinfo("Success", message)
+
+        db.submit(run, added)
+
     # ---------------- DASHBOARD ----------------
     def setup_dashboard(self):
         frame = self.dashboard_tab
-        stats = {
-            "Total Equipment": "SELECT COUNT(*) FROM equipment",
-            "Working": "SELECT COUNT(*) FROM equipment WHERE status='Working'",
-            "Under Maintenance": "SELECT COUNT(*) FROM equipment WHERE status='Under repair'",
-            "Expired": "SELECT COUNT(*) FROM equipment WHERE expiry_date <= date('now')",
-            "Discarded": "SELECT COUNT(*) FROM discard_equipment",
-            "Departments": "SELECT COUNT(*) FROM department"
-        }
-        row = 0
-        for key, query in stats.items():
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            label = tk.Label(frame, text=f"{key}: {count}", font=("Arial", 14), relief="ridge", padx=10, pady=10)
+        self.dashboard_labels = {}
+        self.dashboard_refresh = None
+        for row, key in enumerate(DASHBOARD_STATS):
+            label = tk.Label(frame, text=f"{key}: ...", font=("Arial", 14), relief="ridge", padx=10, pady=10)
             label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
-            row += 1
+            self.dashboard_labels[key] = label
+        if SYNC_URL:
+            row = len(DASHBOARD_STATS)
+            self.sync_label = tk.Label(frame, text="Sync: waiting for first run", font=("Arial", 11))
+            self.sync_label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
+            tk.Button(frame, text="Sync Now", command=lambda: self.sync.sync_now()).grid(row=row, column=1, padx=5)
+        self.load_dashboard()
+
+    def refresh_dashboard(self):
+        """Schedule a dashboard reload; writes within DASHBOARD_REFRESH_MS share one reload."""
+        if self.dashboard_refresh is None:
+            self.dashboard_refresh = self.root.after(DASHBOARD_REFRESH_MS, self.load_dashboard)
+
+    def load_dashboard(self):
+        self.dashboard_refresh = None
+        db.submit(read_dashboard_stats, self.show_dashboard)
+
+    def show_dashboard(self, counts):
+        for key, count in zip(DASHBOARD_STATS, counts):
+            self.dashboard_labels[key].config(text=f"{key}: {count}")
+
+    def synced(self, summary):
+        stamp = datetime.now().strftime("%H:%M:%S")
+        if "error" in summary:
+            self.sync_label.config(text=f"Sync failed at {stamp}: {summary['error']}")
+            return
+        text = f"Synced at {stamp}: {summary['pushed']} sent, {summary['pulled']} received"
+        if summary["pending"]:
+            text += f", {summary['pending']} waiting ({summary['rejected']} rejected)"
+        self.sync_label.config(text=text)
+        if summary["pushed"] or summary["pulled"]:
+            for table in (self.equipment_table, self.issue_table, self.vendor_table, self.discard_table):
+                table.reload()
+            self.refresh_dashboard()
 
     # ---------------- EQUIPMENT TAB ----------------
     def setup_equipment_tab(self):
@@ -145,30 +1142,20 @@ class HospitalApp:
         table_frame.pack(fill="both", expand=True, padx=10, pady=10)
         columns = ("ID","Equipment Name","Serial Number","Model No","Manufacturer","Department",
                    "Purchase Date","Expiry Date","Status","Vendor ID","Vendor Contact","Vendor Email","Quantity")
-        self.equipment_table = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.equipment_table.heading(col, text=col)
-        self.equipment_table.pack(fill="both", expand=True)
+        self.equipment_table = VirtualTable(table_frame, "equipment", "equipment_id", columns)
         self.load_equipment_table()
 
     def add_equipment(self):
         values = {key: entry.get() for key, entry in self.equipment_entries.items()}
-        cursor.execute("""
+        self.insert("""
             INSERT INTO equipment (equipment_name, serial_number, model_no, manufacturer, department, purchase_date, expiry_date, status, vendor_id, vendor_contact, vendor_email, quantity)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (values["Equipment Name"], values["Serial Number"], values["Model No"], values["Manufacturer"],
               values["Department"], values["Purchase Date (YYYY-MM-DD)"], values["Expiry Date (YYYY-MM-DD)"],
-              values["Status"], values["Vendor ID"], values["Vendor Contact"], values["Vendor Email"], values["Quantity"]))
-        conn.commit()
-        messagebox.showinfo("Success", "Equipment added successfully!")
-        self.load_equipment_table()
+              values["Status"], values["Vendor ID"], values["Vendor Contact"], values["Vendor Email"], values["Quantity"]), self.equipment_table, "Equipment added successfully!")
 
     def load_equipment_table(self):
-        for row in self.equipment_table.get_children():
-            self.equipment_table.delete(row)
-        cursor.execute("SELECT * FROM equipment")
-        for row in cursor.fetchall():
-            self.equipment_table.insert("", "end", values=row)
+        self.equipment_table.reload()
 
     # ---------------- ISSUE TAB ----------------
     def setup_issue_tab(self):
@@ -220,10 +1207,7 @@ class HospitalApp:
         table_frame = tk.Frame(frame)
         table_frame.pack(fill="both", expand=True, padx=10, pady=10)
         columns = ("ID","Equipment Name","Serial Number","Manufacturer","Issue Type","Problem","Media","Date","Status","Technician")
-        self.issue_table = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.issue_table.heading(col, text=col)
-        self.issue_table.pack(fill="both", expand=True)
+        self.issue_table = VirtualTable(table_frame, "issue_report", "issue_id", columns)
         self.load_issue_table()
 
     def browse_media(self):
@@ -233,22 +1217,15 @@ class HospitalApp:
             self.issue_entries_media.insert(0, filepath)
 
     def add_issue(self):
-        cursor.execute("""
+        self.insert("""
             INSERT INTO issue_report (equipment_name, serial_number, manufacturer, issue_type, problem_description, media_path, date_raised, status, technician)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (self.issue_entries_name.get(), self.issue_entries_serial.get(), self.issue_entries_manufact.get(),
               self.issue_type_cb.get(), self.issue_entries_problem.get(), self.issue_entries_media.get(),
-              self.issue_entries_date.get(), self.issue_entries_status.get(), self.issue_entries_tech.get()))
-        conn.commit()
-        messagebox.showinfo("Success", "Issue added successfully!")
-        self.load_issue_table()
+              self.issue_entries_date.get(), self.issue_entries_status.get(), self.issue_entries_tech.get()), self.issue_table, "Issue added successfully!")
 
     def load_issue_table(self):
-        for row in self.issue_table.get_children():
-            self.issue_table.delete(row)
-        cursor.execute("SELECT * FROM issue_report")
-        for row in cursor.fetchall():
-            self.issue_table.insert("", "end", values=row)
+        self.issue_table.reload()
 
     # ---------------- VENDOR TAB ----------------
     def setup_vendor_tab(self):
@@ -269,28 +1246,18 @@ class HospitalApp:
         table_frame = tk.Frame(frame)
         table_frame.pack(fill="both", expand=True, padx=10, pady=10)
         columns = ("ID","Name","Phone","Email","Address","Category")
-        self.vendor_table = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.vendor_table.heading(col, text=col)
-        self.vendor_table.pack(fill="both", expand=True)
+        self.vendor_table = VirtualTable(table_frame, "vendor", "vendor_id", columns)
         self.load_vendor_table()
 
     def add_vendor(self):
         values = {key: entry.get() for key, entry in self.vendor_entries.items()}
-        cursor.execute("""
+        self.insert("""
             INSERT INTO vendor (vendor_name, phone, email, address, category)
             VALUES (?, ?, ?, ?, ?)
-        """, (values["Name"], values["Phone"], values["Email"], values["Address"], values["Category"]))
-        conn.commit()
-        messagebox.showinfo("Success", "Vendor added successfully!")
-        self.load_vendor_table()
+        """, (values["Name"], values["Phone"], values["Email"], values["Address"], values["Category"]), self.vendor_table, "Vendor added successfully!")
 
     def load_vendor_table(self):
-        for row in self.vendor_table.get_children():
-            self.vendor_table.delete(row)
-        cursor.execute("SELECT * FROM vendor")
-        for row in cursor.fetchall():
-            self.vendor_table.insert("", "end", values=row)
+        self.vendor_table.reload()
 
     # ---------------- DISCARD TAB ----------------
     def setup_discard_tab(self):
@@ -312,10 +1279,7 @@ class HospitalApp:
         table_frame = tk.Frame(frame)
         table_frame.pack(fill="both", expand=True, padx=10, pady=10)
         columns = ("ID","Equipment Name","Serial Number","Model No","Reason","Media Path","Date")
-        self.discard_table = ttk.Treeview(table_frame, columns=columns, show="headings")
-        for col in columns:
-            self.discard_table.heading(col, text=col)
-        self.discard_table.pack(fill="both", expand=True)
+        self.discard_table = VirtualTable(table_frame, "discard_equipment", "discard_id", columns)
         self.load_discard_table()
 
     def browse_discard_media(self):
@@ -326,23 +1290,17 @@ class HospitalApp:
 
     def add_discard(self):
         values = {key: entry.get() for key, entry in self.discard_entries.items()}
-        cursor.execute("""
+        self.insert("""
             INSERT INTO discard_equipment (equipment_name, serial_number, model_no, reason, media_path, date)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (values["Equipment Name"], values["Serial Number"], values["Model No"],
-              values["Reason"], values["Media Path"], values["Date (YYYY-MM-DD)"]))
-        conn.commit()
-        messagebox.showinfo("Success", "Equipment discarded successfully!")
-        self.load_discard_table()
+              values["Reason"], values["Media Path"], values["Date (YYYY-MM-DD)"]), self.discard_table, "Equipment discarded successfully!")
 
     def load_discard_table(self):
-        for row in self.discard_table.get_children():
-            self.discard_table.delete(row)
-        cursor.execute("SELECT * FROM discard_equipment")
-        for row in cursor.fetchall():
-            self.discard_table.insert("", "end", values=row)
+        self.discard_table.reload()
 
 # ---------------- RUN APP ----------------
 root = tk.Tk()
 app = HospitalApp(root)
+db.poll(root)
 root.mainloop()